@@ -0,0 +1,107 @@
+"""
+Benchmark of the EDB object cache
+---------------------------------
+
+Open an EDB project and run the most common layout queries (nets, signal and power
+nets, primitives by net and by layer, padstack instances by net, layout statistics) twice:
+once calling ``Edb.refresh`` before every query, which is the behavior of PyAEDT before
+nets, primitives, and padstack instances were cached, and once with the cache.
+The layout is wrapped in a counting proxy that records how many .NET objects are
+enumerated from the ``Nets``, ``Primitives``, and ``PadstackInstances`` collections:
+
+    python _benchmarks/bench_edb_object_cache.py --aedb C:/projects/board.aedb --version 2022.2
+
+The script fails when the cached run enumerates more .NET objects than the uncached one.
+"""
+import argparse
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+COLLECTIONS = ["Nets", "Primitives", "PadstackInstances"]
+
+
+class _CountingLayout(object):
+    """Proxy of an EDB layout counting the objects enumerated from its collections."""
+
+    def __init__(self, layout, counters):
+        self._layout = layout
+        self._counters = counters
+
+    def __getattr__(self, name):
+        value = getattr(self._layout, name)
+        if name in COLLECTIONS:
+            value = list(value)
+            self._counters[name] += len(value)
+        return value
+
+
+def _queries(edb):
+    layer = list(edb.stackup.signal_layers.keys())[0]
+    return [
+        ("nets", lambda: edb.core_nets.nets),
+        ("signal_nets", lambda: edb.core_nets.signal_nets),
+        ("power_nets", lambda: edb.core_nets.power_nets),
+        ("primitives_by_net", lambda: edb.core_primitives.primitives_by_net),
+        ("primitives_by_layer", lambda: edb.core_primitives.primitives_by_layer),
+        ("get_polygons_by_layer", lambda: edb.core_primitives.get_polygons_by_layer(layer)),
+        ("padstack_instances", lambda: edb.core_padstack.padstack_instances),
+        ("get_layout_statistics", lambda: edb.core_primitives.get_layout_statistics()),
+    ]
+
+
+def _run(edb, counters, refresh, repeat):
+    results = []
+    for name, query in _queries(edb):
+        for key in counters:
+            counters[key] = 0
+        start = time.time()
+        for _ in range(repeat):
+            if refresh:
+                edb.refresh()
+            query()
+        results.append((name, time.time() - start, sum(counters.values())))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aedb", required=True, help="Path to the EDB project to open.")
+    parser.add_argument("--version", default=None, help="AEDT version, for example ``2022.2``.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times every query is run.")
+    args = parser.parse_args()
+
+    from pyaedt import Edb
+
+    edb = Edb(edbpath=args.aedb, edbversion=args.version)
+    counters = dict((name, 0) for name in COLLECTIONS)
+    layout = _CountingLayout(edb.active_layout, counters)
+    active_layout = type(edb).active_layout
+    type(edb).active_layout = property(lambda self: layout)
+    try:
+        uncached = _run(edb, counters, True, args.repeat)
+        edb.refresh()
+        cached = _run(edb, counters, False, args.repeat)
+    finally:
+        type(edb).active_layout = active_layout
+        edb.close_edb()
+
+    print(
+        "{:<24} {:>12} {:>12} {:>14} {:>14}".format(
+            "query", "uncached [s]", "cached [s]", "uncached objs", "cached objs"
+        )
+    )
+    failed = False
+    for (name, t_uncached, n_uncached), (_, t_cached, n_cached) in zip(uncached, cached):
+        print("{:<24} {:>12.3f} {:>12.3f} {:>14} {:>14}".format(name, t_uncached, t_cached, n_uncached, n_cached))
+        failed = failed or n_cached > n_uncached
+    if failed:
+        print("The cached queries enumerate more .NET objects than the uncached ones.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of the overhead of pyaedt_function_handler
+----------------------------------------------------
+
+Call a trivial method decorated with ``pyaedt_function_handler`` and measure the time per call
+compared to the undecorated method, with the error handler enabled (default), with the error
+handler disabled, and with profiling enabled. The previous implementation of the wrapper, which
+set ``settings.time_tick`` on every call, is measured as a reference:
+
+    python _benchmarks/bench_function_handler.py
+    python _benchmarks/bench_function_handler.py --calls 2000000
+
+The script fails when the default mode is slower than the previous implementation.
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+
+def _legacy_function_handler(user_function):
+    from pyaedt import settings
+
+    def wrapper(*args, **kwargs):
+        if not settings.enable_error_handler:
+            return user_function(*args, **kwargs)
+        else:
+            try:
+                settings.time_tick = time.time()
+                out = user_function(*args, **kwargs)
+                if settings.enable_debug_logger:
+                    pass
+                return out
+            except TypeError:
+                return False
+            except ValueError:
+                return False
+            except BaseException:
+                return False
+
+    return wrapper
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500000, help="Number of calls for each measurement.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements. The best one is kept.")
+    args = parser.parse_args()
+
+    from pyaedt import profiling
+    from pyaedt import pyaedt_function_handler
+    from pyaedt import settings
+
+    class Object(object):
+        def method(self, value, option=None):
+            return value
+
+        legacy_method = _legacy_function_handler(method)
+        decorated_method = pyaedt_function_handler()(method)
+
+    obj = Object()
+
+    def measure(function):
+        times = timeit.repeat(lambda: function(1, option=2), number=args.calls, repeat=args.repeat)
+        return min(times) / args.calls * 1e9
+
+    base = measure(obj.method)
+    results = [("undecorated", base), ("legacy wrapper", measure(obj.legacy_method))]
+    results.append(("error handler", measure(obj.decorated_method)))
+    settings.enable_error_handler = False
+    results.append(("no error handler", measure(obj.decorated_method)))
+    settings.enable_error_handler = True
+    settings.enable_profiling = True
+    results.append(("profiling", measure(obj.decorated_method)))
+    settings.enable_profiling = False
+    profiling.reset()
+
+    print("{:<20} {:>12} {:>14}".format("mode", "ns / call", "overhead [ns]"))
+    for name, value in results:
+        print("{:<20} {:>12.1f} {:>14.1f}".format(name, value, value - base))
+    if results[2][1] > results[1][1]:
+        print("The wrapper is slower than the previous implementation.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark of the import time of PyAEDT
+--------------------------------------
+
+Import a PyAEDT module in a fresh interpreter started with ``python -X importtime`` and
+report the total import time and the slowest imported modules. Heavy optional
+dependencies (Pandas, PyVista, Matplotlib, IPython) are loaded on first use, so
+``import pyaedt`` must not import them. The script fails when one of them is imported or
+when the import time exceeds ``--max-time``, so that it can be used to catch regressions:
+
+    python _benchmarks/bench_import_time.py
+    python _benchmarks/bench_import_time.py --module pyaedt.hfss --forbid IPython --max-time 1500
+
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+DEFAULT_FORBIDDEN = ["numpy", "pandas", "pyvista", "matplotlib", "IPython"]
+
+
+def parse_importtime(output):
+    """Parse the ``-X importtime`` report.
+
+    Returns a list of ``(name, depth, self_us, cumulative_us)`` tuples in report order.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return records
+
+
+def measure(module):
+    """Import a module in a new interpreter.
+
+    Returns the ``-X importtime`` records and the names of the modules loaded at the end.
+    """
+    code = "import sys, json, {0}; print(json.dumps(sorted(sys.modules)))".format(module)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT] + [p for p in [env.get("PYTHONPATH")] if p])
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        cwd=ROOT,
+    )
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise RuntimeError("Import of {} failed:\n{}".format(module, err.decode("utf-8", "replace")))
+    loaded = json.loads(out.decode("utf-8").strip().splitlines()[-1])
+    return parse_importtime(err.decode("utf-8", "replace")), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="pyaedt", help="Module to import.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements. The median is reported.")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest top-level packages to list.")
+    parser.add_argument("--max-time", type=float, default=None, help="Maximum import time in ms.")
+    parser.add_argument(
+        "--forbid",
+        nargs="*",
+        default=DEFAULT_FORBIDDEN,
+        help="Packages that must not be imported. The default is {}.".format(" ".join(DEFAULT_FORBIDDEN)),
+    )
+    args = parser.parse_args()
+
+    totals = []
+    records = loaded = None
+    for _ in range(max(args.repeat, 1)):
+        records, loaded = measure(args.module)
+        totals.append(sum(r[3] for r in records if r[0] == args.module and r[1] == 0) / 1000.0)
+    totals.sort()
+    median = totals[len(totals) // 2]
+
+    # own import time of all the modules, grouped by top-level package
+    packages = {}
+    for name, _, self_us, _ in records:
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+    print(
+        "Import of {}: median {:.1f} ms, min {:.1f} ms, max {:.1f} ms".format(
+            args.module, median, totals[0], totals[-1]
+        )
+    )
+    print("{:<40} {:>12}".format("package", "time [ms]"))
+    for top, value in sorted(packages.items(), key=lambda x: -x[1])[: args.top]:
+        print("{:<40} {:>12.1f}".format(top, value / 1000.0))
+
+    errors = []
+    imported = sorted(set(m.split(".")[0] for m in loaded) & set(args.forbid or []))
+    if imported:
+        errors.append("Heavy packages imported by {}: {}".format(args.module, ", ".join(imported)))
+    if args.max_time is not None and median > args.max_time:
+        errors.append("Import time {:.1f} ms exceeds {:.1f} ms".format(median, args.max_time))
+    for error in errors:
+        print(error)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
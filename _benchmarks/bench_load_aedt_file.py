@@ -0,0 +1,163 @@
+"""
+Benchmark of the AEDT file parser
+---------------------------------
+
+Generate a synthetic AEDT project of the requested size, made of text design blocks
+and of binary geometry blocks, and measure the throughput and the peak memory of
+``load_entire_aedt_file``. Every measurement runs in its own process so that the peak
+resident set size is not polluted by previous runs.
+
+An older implementation of ``pyaedt/generic/LoadAEDTFile.py`` can be passed with
+``--baseline`` to compare against it, for example:
+
+    git show <rev>:pyaedt/generic/LoadAEDTFile.py > /tmp/LoadAEDTFile_old.py
+    python _benchmarks/bench_load_aedt_file.py --size 300 --baseline /tmp/LoadAEDTFile_old.py
+
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+
+def _design_block(index, n_objects):
+    lines = ["\t$begin 'HFSSModel'", "\t\tName='HFSSDesign{}'".format(index)]
+    for obj in range(n_objects):
+        lines.extend(
+            [
+                "\t\t$begin 'GeometryPart'",
+                "\t\t\t$begin 'Attributes'",
+                "\t\t\t\tName='Box{}_{}'".format(index, obj),
+                "\t\t\t\tFlags=''",
+                "\t\t\t\tColor='(143 175 143)'",
+                "\t\t\t\tTransparency=0",
+                "\t\t\t\tPartCoordinateSystem=1",
+                "\t\t\t\tMaterialValue='\"copper\"'",
+                "\t\t\t\tSolveInside=false",
+                "\t\t\t\tIsMaterialEditable=true",
+                "\t\t\t$end 'Attributes'",
+                "\t\t\t$begin 'Operation'",
+                "\t\t\t\tOperationType='Box'",
+                "\t\t\t\tID={}".format(obj),
+                "\t\t\t\tReferenceCoordSystemID=1",
+                "\t\t\t\t$begin 'BoxParameters'",
+                "\t\t\t\t\tXPosition='{}mm'".format(obj),
+                "\t\t\t\t\tYPosition='0mm'",
+                "\t\t\t\t\tZPosition='0mm'",
+                "\t\t\t\t\tXSize='1mm'",
+                "\t\t\t\t\tYSize='2mm'",
+                "\t\t\t\t\tZSize='3mm'",
+                "\t\t\t\t$end 'BoxParameters'",
+                "\t\t\t\tParentPartID={}".format(obj),
+                "\t\t\t\tBodyBoundingBox({}, 0, 0, {}, 2, 3)".format(obj, obj + 1),
+                "\t\t\t\tFaces[6: 7, 8, 9, 10, 11, 12]",
+                "\t\t\t$end 'Operation'",
+                "\t\t$end 'GeometryPart'",
+            ]
+        )
+    lines.append("\t$end 'HFSSModel'")
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(filename, size_mb, binary_ratio=0.3, seed=0):
+    """Write a synthetic AEDT project of approximately ``size_mb`` megabytes."""
+    rnd = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    text_target = target * (1 - binary_ratio)
+    with open(filename, "wb") as f:
+        f.write(b"$begin 'AnsoftProject'\n\tProduct='ElectronicsDesktop'\n")
+        index = 0
+        while f.tell() < text_target:
+            f.write(_design_block(index, 200).encode("utf-8"))
+            index += 1
+        f.write(b"$end 'AnsoftProject'\n$begin 'AllReferencedFilesForProject'\n")
+        f.write(b"$begin 'Design_0.setup/NativeGeometryFiles'\n")
+        blob_id = 0
+        while f.tell() < target:
+            blob = bytes(bytearray(rnd.getrandbits(8) for _ in range(4096))) * 64
+            f.write("$begin 'x_b'\nDesign_0.setup/NativeGeometryFiles/{:07d}.x_b\n".format(blob_id).encode("utf-8"))
+            f.write("BIN{:012d}\n".format(len(blob)).encode("utf-8"))
+            f.write(blob)
+            f.write(b"$end 'x_b'\n")
+            blob_id += 1
+        f.write(b"$end 'Design_0.setup/NativeGeometryFiles'\n$end 'AllReferencedFilesForProject'\n")
+        f.write(b"$begin 'ProjectPreview'\n\tIsEncrypted=false\n$end 'ProjectPreview'\n")
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024.0 if sys.platform != "darwin" else peak / 1024.0 / 1024.0
+    except ImportError:  # pragma: no cover
+        import psutil
+
+        return psutil.Process().memory_info().peak_wset / 1024.0 / 1024.0
+
+
+def _run_single(module_path, filename):
+    if module_path:
+        spec = importlib.util.spec_from_file_location("_baseline_load_aedt_file", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        from pyaedt.generic import LoadAEDTFile as module
+    rss_before = _peak_rss_mb()
+    start = time.time()
+    data = module.load_entire_aedt_file(filename)
+    elapsed = time.time() - start
+    print(json.dumps({"time": elapsed, "peak_rss": _peak_rss_mb(), "rss_before": rss_before, "keys": list(data)}))
+
+
+def _measure(module_path, filename):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", filename]
+    if module_path:
+        cmd += ["--baseline", module_path]
+    out = subprocess.check_output(cmd).decode("utf-8").strip().splitlines()[-1]
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=300, help="Size of the synthetic project in MB.")
+    parser.add_argument("--baseline", default=None, help="Path to another LoadAEDTFile.py to compare against.")
+    parser.add_argument("--file", default=None, help="Existing AEDT file to use instead of a synthetic one.")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _run_single(args.baseline, args.child)
+        return
+
+    filename = args.file
+    if not filename:
+        filename = os.path.join(tempfile.gettempdir(), "pyaedt_bench_{}MB.aedt".format(args.size))
+        if not os.path.exists(filename):
+            print("Generating {}".format(filename))
+            generate_project(filename, args.size)
+    size_mb = os.path.getsize(filename) / 1024.0 / 1024.0
+    runs = [("current", None)]
+    if args.baseline:
+        runs.append(("baseline", os.path.abspath(args.baseline)))
+    print("File size: {:.1f} MB".format(size_mb))
+    print("{:<10} {:>10} {:>14} {:>16}".format("parser", "time [s]", "speed [MB/s]", "peak RSS [MB]"))
+    for name, module_path in runs:
+        result = _measure(module_path, filename)
+        print(
+            "{:<10} {:>10.2f} {:>14.1f} {:>16.1f}".format(
+                name, result["time"], size_mb / result["time"], result["peak_rss"] - result["rss_before"]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
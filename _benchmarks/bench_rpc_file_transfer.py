@@ -0,0 +1,160 @@
+"""
+Benchmark of the RPyC file transfers
+------------------------------------
+
+Start a PyAEDT RPyC server (``GlobalService``) on localhost, then upload and download a
+directory of generated files with the legacy transfer, which copies every file with
+``shutil.copyfileobj`` through a remote file object, and with ``FileManagement``, which
+transfers chunks over parallel connections. The uploads are repeated to measure skipping
+of identical files, and a large file transfer is interrupted to measure the resume:
+
+    python _benchmarks/bench_rpc_file_transfer.py
+    python _benchmarks/bench_rpc_file_transfer.py --size-mb 2048 --files 200 --streams 8 --compression zlib
+
+The script fails when a transferred directory differs from the source directory.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+
+def _create_files(path, size_mb, files):
+    """Create a large file and ``files`` small files of ``size_mb`` megabytes in total."""
+    os.makedirs(os.path.join(path, "small", "sub"))
+    large_size = size_mb * 1024 * 1024 // 2
+    small_size = max(1, (size_mb * 1024 * 1024 - large_size) // max(files, 1))
+    block = os.urandom(1024 * 1024)
+    with open(os.path.join(path, "large.bin"), "wb") as f:
+        for i in range(large_size // len(block)):
+            # Half random and half repeated data, so that compression has an effect.
+            f.write(block if i % 2 else b"pyaedt" * (len(block) // 6) + b"...." * (len(block) % 6 // 4))
+    for i in range(files):
+        folder = "sub" if i % 2 else ""
+        with open(os.path.join(path, "small", folder, "file{}.txt".format(i)), "wb") as f:
+            f.write(os.urandom(small_size // 2) + b"x" * (small_size - small_size // 2))
+
+
+def _legacy_upload(client, localpath, remotepath):
+    client.root.makedirs(remotepath)
+    for name in os.listdir(localpath):
+        local_file = os.path.join(localpath, name)
+        if os.path.isdir(local_file):
+            _legacy_upload(client, local_file, remotepath + "/" + name)
+            continue
+        new_file = client.root.create(remotepath + "/" + name)
+        with open(local_file, "rb") as f:
+            shutil.copyfileobj(f, new_file)
+        new_file.close()
+
+
+def _legacy_download(client, remotepath, localpath):
+    os.makedirs(localpath)
+    for name in client.root.listdir(remotepath):
+        remote_file = remotepath + "/" + name
+        if client.root.isdir(remote_file):
+            _legacy_download(client, remote_file, os.path.join(localpath, name))
+            continue
+        remote = client.root.open(remote_file)
+        with open(os.path.join(localpath, name), "wb") as f:
+            shutil.copyfileobj(remote, f)
+        remote.close()
+
+
+def _same_tree(path1, path2):
+    from pyaedt.rpc.rpyc_services import FileTransferEndpoint
+
+    dirs1, files1 = FileTransferEndpoint.transfer_walk(path1)
+    dirs2, files2 = FileTransferEndpoint.transfer_walk(path2)
+    if sorted(dirs1) != sorted(dirs2) or sorted(files1) != sorted(files2):
+        return False
+    names = sorted(name for name, _ in files1)
+    checksums1 = FileTransferEndpoint.transfer_checksums([os.path.join(path1, i) for i in names], 1024 * 1024)
+    checksums2 = FileTransferEndpoint.transfer_checksums([os.path.join(path2, i) for i in names], 1024 * 1024)
+    return checksums1 == checksums2
+
+
+def _timed(results, name, size_mb, function, *args):
+    start = time.time()
+    function(*args)
+    elapsed = time.time() - start
+    results.append((name, elapsed, size_mb / elapsed if elapsed else float("inf")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=256, help="Total size of the files in megabytes.")
+    parser.add_argument("--files", type=int, default=100, help="Number of small files.")
+    parser.add_argument("--streams", type=int, default=4, help="Number of parallel connections.")
+    parser.add_argument("--chunk-mb", type=int, default=8, help="Size of the chunks in megabytes.")
+    parser.add_argument("--compression", default=None, choices=["zlib", "lz4"], help="Compression of the chunks.")
+    parser.add_argument("--port", type=int, default=18999, help="Port of the localhost server.")
+    args = parser.parse_args()
+
+    import rpyc
+    from rpyc.utils.server import ThreadedServer
+
+    from pyaedt.rpc.rpyc_services import FileManagement
+    from pyaedt.rpc.rpyc_services import GlobalService
+
+    config = {"allow_public_attrs": True, "sync_request_timeout": None}
+    server = ThreadedServer(GlobalService, hostname="localhost", port=args.port, protocol_config=config)
+    thread = threading.Thread(target=server.start)
+    thread.daemon = True
+    thread.start()
+    time.sleep(1)
+
+    work_dir = tempfile.mkdtemp(prefix="pyaedt_transfer_")
+    source = os.path.join(work_dir, "source")
+    _create_files(source, args.size_mb, args.files)
+    client = rpyc.connect("localhost", args.port, config=config)
+    manager = FileManagement(
+        client, chunk_size=args.chunk_mb * 1024 * 1024, streams=args.streams, compression=args.compression
+    )
+    results = []
+    failed = False
+    try:
+        remote = os.path.join(work_dir, "legacy_upload").replace("\\", "/")
+        _timed(results, "legacy upload", args.size_mb, _legacy_upload, client, source, remote)
+        local = os.path.join(work_dir, "legacy_download")
+        _timed(results, "legacy download", args.size_mb, _legacy_download, client, remote, local)
+        failed = failed or not _same_tree(source, local)
+
+        remote = os.path.join(work_dir, "upload").replace("\\", "/")
+        _timed(results, "upload", args.size_mb, manager.upload, source, remote)
+        _timed(results, "upload identical", args.size_mb, manager.upload, source, remote)
+        local = os.path.join(work_dir, "download")
+        _timed(results, "download", args.size_mb, manager.download_folder, remote, local)
+        failed = failed or not _same_tree(source, remote) or not _same_tree(source, local)
+
+        # Interrupted upload of the large file: half of the chunks are in the .part file.
+        large_file = os.path.join(source, "large.bin")
+        remote_file = os.path.join(work_dir, "resume.bin")
+        shutil.copy(large_file, remote_file + ".part")
+        with open(remote_file + ".part", "r+b") as f:
+            f.seek(os.path.getsize(large_file) // 2)
+            f.write(b"\0" * (os.path.getsize(large_file) - f.tell()))
+        _timed(results, "upload resumed", args.size_mb // 2, manager.upload, large_file, remote_file)
+        with open(large_file, "rb") as f1, open(remote_file, "rb") as f2:
+            failed = failed or f1.read() != f2.read()
+    finally:
+        client.close()
+        server.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("{:<20} {:>10} {:>12}".format("transfer", "time [s]", "MB/s"))
+    for name, elapsed, throughput in results:
+        print("{:<20} {:>10.2f} {:>12.1f}".format(name, elapsed, throughput))
+    if failed:
+        print("The transferred files differ from the source files.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
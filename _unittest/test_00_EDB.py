@@ -4,6 +4,7 @@ from pyaedt import Edb
 from pyaedt.edb_core.components import resistor_value_parser
 from pyaedt.edb_core.edb_data.simulation_configuration import SimulationConfiguration
 from pyaedt.edb_core.edb_data.sources import Source
+from pyaedt.edb_core.edb_data.utilities import ConnectivityGraph
 from pyaedt.generic.constants import RadiationBoxType
 
 # Setup paths for module imports
@@ -2111,3 +2112,95 @@ if not config["skip_edb"]:
             assert setup1.snap_length_threshold == "3.5um"
             assert not setup1.use_si_settings
             assert setup1.xtalk_threshold == "-44"
+
+        def test_132_layout_index(self):
+            edbapp = self.edbapp
+            gnd_prims = edbapp.core_primitives.get_primitives(net_name="GND")
+            assert gnd_prims
+            assert len(edbapp.core_primitives.primitives_by_net["GND"]) == len(
+                [i for i in edbapp.core_primitives.primitives if i.net_name == "GND"]
+            )
+            bbox = edbapp.core_primitives.get_polygon_bounding_box(gnd_prims[0])
+            prims = edbapp.core_primitives.get_primitives_in_bounding_box(
+                bbox, layer_name=gnd_prims[0].layer_name, net_name="GND"
+            )
+            assert gnd_prims[0].id in [i.id for i in prims]
+            center = [(bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2]
+            assert gnd_prims[0].id in [i.id for i in edbapp.core_primitives.get_primitives_at_point(center)]
+            circle = edbapp.core_primitives.create_circle(gnd_prims[0].layer_name, 1.0, 1.0, 1e-3, "GND")
+            prims = edbapp.core_primitives.get_primitives_at_point([1.0, 1.0], net_name="GND")
+            assert [i.id for i in prims] == [circle.id]
+            circle.delete()
+            assert not edbapp.core_primitives.get_primitives_at_point([1.0, 1.0], net_name="GND")
+            via = list(edbapp.core_padstack.get_padstack_instance_by_net_name("GND").values())[0]
+            position = via.position
+            vias = edbapp.core_padstack.get_padstack_instances_at_point(position, net_name="GND")
+            assert via.id in [i.id for i in vias]
+            assert not edbapp.core_padstack.get_padstack_instances_in_bounding_box([1.0, 1.0, 1.1, 1.1])
+
+        def test_133_layout_object_cache(self):
+            edbapp = self.edbapp
+            gnd = edbapp.core_nets.nets["GND"]
+            assert edbapp.core_nets.nets["GND"] is gnd
+            prims = edbapp.core_primitives.primitives
+            assert [id(i) for i in prims] == [id(i) for i in edbapp.core_primitives.primitives]
+            generation = edbapp._layout_generation
+            assert edbapp.refresh()
+            assert edbapp._layout_generation == generation + 1
+            assert edbapp.core_nets.nets["GND"] is not gnd
+            layer = prims[0].layer_name
+            circle = edbapp.core_primitives.create_circle(layer, 2.0, 2.0, 1e-3, "CACHE_NET")
+            assert circle.id in [i.id for i in edbapp.core_primitives.primitives]
+            assert "CACHE_NET" in edbapp.core_nets.nets
+            circle.delete()
+            assert circle.id not in [i.id for i in edbapp.core_primitives.primitives]
+            edbapp.core_nets.nets["CACHE_NET"].delete()
+            assert "CACHE_NET" not in edbapp.core_nets.nets
+            n_vias = len(edbapp.core_padstack.padstack_instances)
+            via = list(edbapp.core_padstack.padstack_instances.values())[0]
+            via.delete()
+            assert len(edbapp.core_padstack.padstack_instances) == n_vias - 1
+            assert via.id not in edbapp.core_padstack.padstack_instances
+
+        def test_134_connectivity_graph(self):
+            edbapp = self.edbapp
+            graph = edbapp.core_nets.connectivity_graph
+            assert graph is edbapp.core_nets.connectivity_graph
+            dc_groups = edbapp.core_nets.get_dcconnected_net_list(["GND"])
+            assert dc_groups == graph.get_dc_groups(["GND"])
+            for group in dc_groups:
+                assert not [i for i in dc_groups if i is not group and i.intersection(group)]
+            rats = edbapp.core_components.get_rats()
+            assert rats[0]["refdes"]
+            assert rats == graph.get_rats()
+            component_list, columns, net_group = edbapp.core_nets.get_powertree("BST_V1P0_S0", ["GND", "PGND"])
+            assert "BST_V1P0_S0" in net_group
+            assert len(component_list[0]) == len(columns)
+            table_file = os.path.join(self.local_scratch.path, "connectivity.csv")
+            assert graph.export_csv(table_file, ["GND"])
+            assert os.path.exists(table_file)
+            edbapp.refresh()
+            assert graph is not edbapp.core_nets.connectivity_graph
+
+        def test_135_layer_rename_invalidates_layout_cache(self):
+            edbapp = self.edbapp
+            layer_name = edbapp.core_primitives.primitives[0].layer_name
+            index = edbapp.core_primitives._layout_index
+            assert index is edbapp.core_primitives._layout_index
+            generation = edbapp._layout_generation
+            edbapp.stackup.layers[layer_name].name = "renamed_layer"
+            assert edbapp._layout_generation == generation + 1
+            assert edbapp.core_primitives._layout_index is not index
+            assert "renamed_layer" in edbapp.core_primitives.primitives_by_layer
+            edbapp.stackup.layers["renamed_layer"].name = layer_name
+
+        def test_136_connectivity_graph_unknown_resistance(self):
+            components = [
+                ("R1", "Resistor", "R0402", None, [("1", "A"), ("2", "B")]),
+                ("R2", "Resistor", "R0402", 0.0, [("1", "B"), ("2", "C")]),
+            ]
+            # a resistor without a known resistance is not a jumper
+            assert ConnectivityGraph(components).get_dc_groups() == [{"B", "C"}]
+            for comp in self.edbapp.core_components.resistors.values():
+                resistance = self.edbapp.core_nets._get_resistance(comp)
+                assert resistance is None or resistance == resistor_value_parser(comp.res_value)
@@ -4,6 +4,7 @@ from pyaedt.generic.constants import AXIS
 from pyaedt.generic.constants import PLANE
 from pyaedt.generic.constants import SWEEPDRAFT
 from pyaedt.generic.constants import unit_converter
+from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.modeler.GeometryOperators import GeometryOperators as go
 
 try:
@@ -432,6 +433,31 @@ class TestClass:
         assert not go.is_point_in_polygon([-0.5, 0], [x, y])
         assert go.is_point_in_polygon([0, 0], [x, y])
 
+    @pytest.mark.skipif(is_ironpython, reason="Requires NumPy")
+    def test_points_in_polygon(self):
+        x = [0, 1, 1, 0.5, 0]
+        y = [0, 0, 1, 0.5, 1]
+        points = [[0.5, 0.25], [0.5, -0.5], [0.5, 0], [-0.5, 0], [0, 0], [0.5, 0.75], [0.75, 0.75], [0.25, 0.75]]
+        result = go.points_in_polygon(points, [x, y])
+        assert list(result) == [go.point_in_polygon(p, [x, y]) for p in points]
+        assert list(result) == [1, -1, 0, -1, 0, -1, 0, 0]
+        assert list(go.points_in_polygon(points, [x[::-1], y[::-1]])) == list(result)
+        assert len(go.points_in_polygon([], [x, y])) == 0
+
+    @pytest.mark.skipif(is_ironpython, reason="Requires NumPy")
+    def test_bounding_boxes_in_polygon(self):
+        x = [0, 1, 1, 0.5, 0]
+        y = [0, 0, 1, 0.5, 1]
+        boxes = [
+            [[0.4, 0.1], [0.6, 0.2]],
+            [[2, 2], [3, 3]],
+            [[0.9, 0.9], [1.1, 1.1]],
+            [[-1, -1], [2, 2]],
+            [[0.45, 0.6], [0.55, 0.9]],
+            [[0.4, 0.45], [0.6, 0.7]],
+        ]
+        assert list(go.bounding_boxes_in_polygon(boxes, [x, y])) == [2, 0, 3, 1, 0, 3]
+
     def test_v_angle_sign(self):
         va = [1, 0, 0]
         vb = [0, 1, 0]
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import psutil
+
+from pyaedt.application.JobManager import BatchSolveQueue
+
+# Stand-in for ansysedt. The content of the project file sets the behavior of the solve.
+FAKE_AEDT = """import subprocess
+import sys
+import time
+
+project = sys.argv[-1]
+print(" ".join(sys.argv[1:]))
+with open(project) as f:
+    action = f.read().split()
+if action[0] == "sleep":
+    time.sleep(float(action[1]))
+elif action[0] == "spawn":
+    # stand-in for a solver process started by AEDT
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    with open(project + ".child", "w") as f:
+        f.write(str(child.pid))
+    time.sleep(30)
+elif action[0] == "fail":
+    sys.exit(3)
+elif action[0] == "flaky":
+    with open(project, "w") as f:
+        f.write("ok")
+    sys.exit(1)
+"""
+
+
+class TestClass(object):
+    def setup_class(self):
+        self.local_path = tempfile.mkdtemp(prefix="pyaedt_batch_")
+        self.fake_aedt = os.path.join(self.local_path, "fake_aedt.py")
+        with open(self.fake_aedt, "w") as f:
+            f.write(FAKE_AEDT)
+
+    def teardown_class(self):
+        shutil.rmtree(self.local_path, ignore_errors=True)
+
+    def create_project(self, name, action):
+        project = os.path.join(self.local_path, name + ".aedt")
+        with open(project, "w") as f:
+            f.write(action)
+        return project
+
+    def test_01_command(self):
+        queue = BatchSolveQueue("ansysedt")
+        job = queue.add_job(self.create_project("command", "ok"), num_cores=8, num_tasks=2, setup="D1:Nominal:S1")
+        assert job.command[:3] == ["ansysedt", "-ng", "-logfile"]
+        assert "-distributed" in job.command
+        assert "list=localhost:2:8" in job.command
+        assert job.command[-3:] == ["-BatchSolve", "D1:Nominal:S1", job.project_file]
+        job = queue.add_job(self.create_project("remote", "ok"), machine="host1:4:16")
+        assert "list=host1:4:16" in job.command
+        assert job.job_id == 2
+
+    def test_02_run_jobs(self):
+        state_file = os.path.join(self.local_path, "queue.json")
+        queue = BatchSolveQueue(
+            [sys.executable, self.fake_aedt], max_workers=2, num_cores=1, state_file=state_file, poll_interval=0.05
+        )
+        ok = queue.add_job(self.create_project("ok", "ok"))
+        failed = queue.add_job(self.create_project("failed", "fail"))
+        flaky = queue.add_job(self.create_project("flaky", "flaky"), retries=1)
+        slow = queue.add_job(self.create_project("slow", "sleep 30"), timeout=0.5)
+        assert not queue.run()
+        assert ok.status == "success"
+        assert failed.status == "failed"
+        assert failed.returncode == 3
+        assert flaky.status == "success"
+        assert flaky.attempts == 2
+        assert slow.status == "timeout"
+        with open(ok.stdout_file) as f:
+            assert "-BatchSolve" in f.read()
+        with open(state_file) as f:
+            assert [job["status"] for job in json.load(f)["jobs"]] == ["success", "failed", "success", "timeout"]
+
+        # Resume the queue from the state file.
+        queue = BatchSolveQueue([sys.executable, self.fake_aedt], state_file=state_file, poll_interval=0.05)
+        assert len(queue.jobs) == 4
+        assert queue.requeue()
+        assert queue.get_job(1).status == "success"
+        assert queue.get_job(2).status == "queued"
+        queue.cancel(4)
+        assert not queue.run()
+        assert queue.get_job(2).status == "failed"
+        assert queue.get_job(4).status == "cancelled"
+
+    def test_03_cancel_running_job(self):
+        queue = BatchSolveQueue([sys.executable, self.fake_aedt], max_workers=2, poll_interval=0.05)
+        jobs = [queue.add_job(self.create_project("cancel{}".format(i), "sleep 30")) for i in range(3)]
+        queue.start()
+        while jobs[0].status == "queued":
+            queue.wait(0.05)
+        assert jobs[0].status == "running"
+        assert queue.cancel()
+        assert not queue.wait(20)
+        assert not queue.is_running
+        assert all(job.status == "cancelled" for job in jobs)
+
+    def test_04_kill_process_tree(self):
+        queue = BatchSolveQueue([sys.executable, self.fake_aedt], poll_interval=0.05)
+        project = self.create_project("spawn", "spawn")
+        job = queue.add_job(project, timeout=2)
+        assert not queue.run()
+        assert job.status == "timeout"
+        with open(project + ".child") as f:
+            child = int(f.read())
+        # the child processes of the job are killed with it
+        start = time.time()
+        while psutil.pid_exists(child) and time.time() - start < 5:
+            try:
+                if psutil.Process(child).status() == psutil.STATUS_ZOMBIE:
+                    break
+            except psutil.NoSuchProcess:
+                break
+            time.sleep(0.05)
+        assert not psutil.pid_exists(child) or psutil.Process(child).status() == psutil.STATUS_ZOMBIE
@@ -1,4 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
+import warnings
+
+from pyaedt import profiling
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import _check_cache_directory
 from pyaedt.generic.general_methods import number_aware_string_key
+from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.generic.general_methods import settings
+
+
+class FakeAedtObject(object):
+    def GetChildObject(self, name):
+        return FakeAedtObject()
+
+    def GetName(self):
+        return "fake"
+
+    def GetChildObjects(self):
+        return FakeAedtCollection([FakeAedtObject(), FakeAedtObject()])
+
+    def IsFake(self, aedt_object=None):
+        return isinstance(aedt_object, FakeAedtObject)
+
+    def __repr__(self):
+        return "<FakeAedtObject>"
+
+
+class FakeAedtCollection(object):
+    def __init__(self, items):
+        self.items = items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+@pyaedt_function_handler()
+def _profiled_inner(aedt_object):
+    return aedt_object.GetChildObject("child").GetName()
+
+
+@pyaedt_function_handler()
+def _profiled_outer(aedt_object):
+    return [_profiled_inner(aedt_object), _profiled_inner(aedt_object)]
+
+
+@pyaedt_function_handler()
+def _profiled_error():
+    raise ValueError("error")
 
 
 class TestClass(object):
@@ -13,3 +70,101 @@ class TestClass(object):
         expected_sort_order = ["C1", "U2", "U10", "Y200", "Y1000"]
         assert sorted(component_names, key=number_aware_string_key) == expected_sort_order
         assert sorted(component_names + [""], key=number_aware_string_key) == [""] + expected_sort_order
+
+    def test_02_lazy_module(self):
+        json_module = LazyModule("json")
+        assert json_module
+        assert json_module.loads("[1, 2]") == [1, 2]
+        assert "dumps" in dir(json_module)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            missing = LazyModule("pyaedt_missing_module", "pyaedt_missing_module is needed")
+            assert not missing
+            assert not missing
+        assert len(w) == 1
+        try:
+            missing.anything
+            assert False
+        except ImportError:
+            pass
+
+    def test_03_import_pyaedt_is_light(self):
+        code = "import sys, pyaedt; pyaedt.Hfss; print(' '.join(sorted(sys.modules)))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        loaded = subprocess.check_output([sys.executable, "-c", code], cwd=root).decode("utf-8").split()
+        for module in ["numpy", "pandas", "pyvista", "matplotlib", "IPython"]:
+            assert module not in loaded
+
+    def test_04_function_handler_modes(self):
+        error_handler = settings.enable_error_handler
+        try:
+            settings.enable_error_handler = True
+            assert _profiled_error() is False
+            settings.enable_profiling = True
+            assert _profiled_error() is False
+            settings.enable_error_handler = False
+            try:
+                _profiled_error()
+                assert False
+            except ValueError:
+                pass
+            settings.enable_profiling = False
+            try:
+                _profiled_error()
+                assert False
+            except ValueError:
+                pass
+        finally:
+            settings.enable_profiling = False
+            settings.enable_error_handler = error_handler
+            profiling.reset()
+
+    def test_05_profiling(self):
+        aedt_object = profiling.wrap_aedt_object(FakeAedtObject())
+        profiling.reset()
+        settings.enable_profiling = True
+        try:
+            assert _profiled_outer(aedt_object) == ["fake", "fake"]
+        finally:
+            settings.enable_profiling = False
+        assert _profiled_outer(aedt_object) == ["fake", "fake"]
+        stats = dict((row[0].split(".")[-1], row[1:]) for row in profiling.get_stats())
+        assert stats["_profiled_outer"][0] == 1
+        assert stats["_profiled_inner"][0] == 2
+        assert stats["_profiled_inner"][3] == 4
+        assert stats["_profiled_outer"][3] == 0
+        assert stats["_profiled_outer"][4] == 4
+        assert stats["_profiled_outer"][1] >= stats["_profiled_inner"][1]
+        assert "_profiled_inner" in profiling.report()
+        local_path = tempfile.mkdtemp()
+        with open(profiling.export_csv(os.path.join(local_path, "profile.csv"))) as f:
+            assert f.readline().strip() == ",".join(profiling.columns)
+            assert len(f.readlines()) == 2
+        with open(profiling.export_flame_graph(os.path.join(local_path, "profile.folded"))) as f:
+            lines = f.readlines()
+            assert len(lines) == 2
+            assert "_profiled_outer;" in lines[1] and "_profiled_inner " in lines[1]
+        profiling.reset()
+        assert not profiling.get_stats()
+
+    def test_06_profiling_proxy(self):
+        aedt_object = profiling.wrap_aedt_object(FakeAedtObject())
+        children = aedt_object.GetChildObjects()
+        assert len(children) == 2
+        assert children[1].GetName() == "fake"
+        assert [child.GetName() for child in children] == ["fake", "fake"]
+        assert aedt_object.IsFake(children[0])
+        assert aedt_object.IsFake(aedt_object=children[0])
+        # the proxies print like the AEDT objects they wrap
+        assert repr(aedt_object) == "<FakeAedtObject>"
+        assert repr(aedt_object.GetChildObject("child")) == "<FakeAedtObject>"
+        assert repr([children[0]]) == "[<FakeAedtObject>]"
+
+    def test_07_cache_directory(self):
+        local_path = tempfile.mkdtemp()
+        cache_path = os.path.join(local_path, "cache")
+        assert _check_cache_directory(cache_path)
+        if os.name == "posix":
+            assert os.stat(cache_path).st_mode & 0o777 == 0o700
+            os.chmod(cache_path, 0o777)
+            assert not _check_cache_directory(cache_path)
@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import rpyc
+from rpyc.utils.server import ThreadedServer
+
+from pyaedt.rpc.rpyc_services import FileManagement
+from pyaedt.rpc.rpyc_services import FileTransferEndpoint
+from pyaedt.rpc.rpyc_services import GlobalService
+
+CHUNK_SIZE = 1024
+
+
+class RecordingEndpoint(FileTransferEndpoint):
+    """Endpoint that records the offsets of the written chunks."""
+
+    def __init__(self):
+        self.offsets = []
+
+    def transfer_write(self, path, offset, data, compression=None):
+        self.offsets.append(offset)
+        return FileTransferEndpoint.transfer_write(path, offset, data, compression)
+
+
+class CorruptedEndpoint(FileTransferEndpoint):
+    """Endpoint that reports a wrong checksum for every written chunk."""
+
+    @staticmethod
+    def transfer_write(path, offset, data, compression=None):
+        FileTransferEndpoint.transfer_write(path, offset, data, compression)
+        return "corrupted"
+
+    @staticmethod
+    def transfer_write_file(path, data, compression=None):
+        FileTransferEndpoint.transfer_write_file(path, data, compression)
+        return "corrupted"
+
+
+def _same_tree(path1, path2):
+    dirs1, files1 = FileTransferEndpoint.transfer_walk(path1)
+    dirs2, files2 = FileTransferEndpoint.transfer_walk(path2)
+    if sorted(dirs1) != sorted(dirs2) or sorted(files1) != sorted(files2):
+        return False
+    names = sorted(name for name, _ in files1)
+    checksums1 = FileTransferEndpoint.transfer_checksums([os.path.join(path1, i) for i in names], CHUNK_SIZE)
+    checksums2 = FileTransferEndpoint.transfer_checksums([os.path.join(path2, i) for i in names], CHUNK_SIZE)
+    return checksums1 == checksums2
+
+
+class TestClass(object):
+    def setup_class(self):
+        self.local_path = tempfile.mkdtemp(prefix="pyaedt_transfer_")
+        self.source = os.path.join(self.local_path, "source")
+        os.makedirs(os.path.join(self.source, "sub", "deep"))
+        with open(os.path.join(self.source, "large.bin"), "wb") as f:
+            f.write(os.urandom(CHUNK_SIZE * 5 + 100))
+        with open(os.path.join(self.source, "sub", "small.txt"), "wb") as f:
+            f.write(b"pyaedt" * 10)
+        with open(os.path.join(self.source, "sub", "deep", "empty.txt"), "wb") as f:
+            pass
+        config = {"allow_public_attrs": True, "sync_request_timeout": None}
+        self.server = ThreadedServer(GlobalService, hostname="localhost", port=0, protocol_config=config)
+        thread = threading.Thread(target=self.server.start)
+        thread.daemon = True
+        thread.start()
+        while not self.server.active:
+            time.sleep(0.01)
+        self.client = rpyc.connect("localhost", self.server.port, config=config)
+
+    def teardown_class(self):
+        self.client.close()
+        self.server.close()
+        shutil.rmtree(self.local_path, ignore_errors=True)
+
+    def test_01_upload_download_folder(self):
+        manager = FileManagement(self.client, chunk_size=CHUNK_SIZE, streams=2)
+        remote = os.path.join(self.local_path, "upload").replace("\\", "/")
+        assert manager.upload(self.source, remote)
+        assert _same_tree(self.source, remote)
+        local = os.path.join(self.local_path, "download")
+        assert manager.download_folder(remote, local)
+        assert _same_tree(self.source, local)
+        local_file = os.path.join(self.local_path, "large_download.bin")
+        assert manager.download_file(remote + "/large.bin", local_file)
+        with open(os.path.join(self.source, "large.bin"), "rb") as f1, open(local_file, "rb") as f2:
+            assert f1.read() == f2.read()
+        assert not manager.download_file(remote + "/missing.bin", local_file)
+
+    def test_02_skip_identical_and_overwrite(self):
+        manager = FileManagement(self.client, chunk_size=CHUNK_SIZE, streams=2)
+        remote = os.path.join(self.local_path, "skip").replace("\\", "/")
+        assert manager.upload(self.source, remote)
+        large_file = os.path.join(remote, "large.bin")
+        mtime = os.path.getmtime(large_file) - 100
+        os.utime(large_file, (mtime, mtime))
+        # identical files are not transferred again, even without overwrite
+        assert manager.upload(self.source, remote)
+        assert os.path.getmtime(large_file) == mtime
+        with open(os.path.join(remote, "sub", "small.txt"), "wb") as f:
+            f.write(b"changed")
+        # a different file is kept without overwrite
+        assert not manager.upload(self.source, remote)
+        with open(os.path.join(remote, "sub", "small.txt"), "rb") as f:
+            assert f.read() == b"changed"
+        assert manager.upload(self.source, remote, overwrite=True)
+        assert _same_tree(self.source, remote)
+        assert os.path.getmtime(large_file) == mtime
+
+    def test_03_resume_part_file(self):
+        manager = FileManagement(self.client, chunk_size=CHUNK_SIZE, streams=1)
+        manager._local = RecordingEndpoint()
+        large_file = os.path.join(self.source, "large.bin").replace("\\", "/")
+        local_file = os.path.join(self.local_path, "resume.bin")
+        # interrupted transfer: the first two chunks are in the .part file
+        shutil.copy(large_file, local_file + ".part")
+        with open(local_file + ".part", "r+b") as f:
+            f.seek(CHUNK_SIZE * 2)
+            f.write(b"\0" * (os.path.getsize(large_file) - CHUNK_SIZE * 2))
+        assert manager.download_file(large_file, local_file)
+        assert sorted(manager._local.offsets) == [CHUNK_SIZE * i for i in range(2, 6)]
+        assert not os.path.exists(local_file + ".part")
+        with open(large_file, "rb") as f1, open(local_file, "rb") as f2:
+            assert f1.read() == f2.read()
+
+    def test_04_checksum_mismatch(self):
+        manager = FileManagement(self.client, chunk_size=CHUNK_SIZE, streams=2)
+        manager._local = CorruptedEndpoint()
+        remote = self.source.replace("\\", "/")
+        # chunked and whole file transfers fail when the written data does not match the source
+        assert not manager.download_folder(remote, os.path.join(self.local_path, "corrupted"))
+        assert not manager.download_file(remote + "/sub/small.txt", os.path.join(self.local_path, "corrupted.txt"))
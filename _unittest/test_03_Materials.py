@@ -1,5 +1,6 @@
 # standard imports
 import os
+import shutil
 
 from _unittest.conftest import BasisTest
 from _unittest.conftest import desktop_version
@@ -7,8 +8,13 @@ from _unittest.conftest import local_path
 from pyaedt import Icepak
 from pyaedt import Maxwell3d
 from pyaedt import is_ironpython
+from pyaedt import settings
 from pyaedt.modules.Material import MatProperties
 from pyaedt.modules.Material import SurfMatProperties
+from pyaedt.modules.MaterialLib import _amat_material_names
+from pyaedt.modules.MaterialLib import _library_material_names
+from pyaedt.modules.MaterialLib import _MaterialDict
+from pyaedt.modules.MaterialLib import _ProjectMaterial
 
 try:
     import pytest  # noqa: F401
@@ -232,3 +238,75 @@ class TestClass(BasisTest, object):
         assert self.aedtapp.materials["Aluminum"] == self.aedtapp.materials["aluminum"]
         assert self.aedtapp.materials["Aluminum"].name == "aluminum"
         assert self.aedtapp.materials.add_material("AluMinum") == self.aedtapp.materials["aluminum"]
+
+    def test_12_material_library_index(self):
+        library = os.path.join(self.local_scratch.path, "amat_library")
+        os.makedirs(os.path.join(library, "sub"))
+        amat = os.path.join(library, "sub", "material_sample.amat")
+        shutil.copy(os.path.join(local_path, "example_models", "T13", "material_sample.amat"), amat)
+        cache_path = settings.aedt_file_cache_path
+        enable_cache = settings.enable_aedt_file_cache
+        # without the file cache, the index is not written
+        settings.enable_aedt_file_cache = False
+        settings.aedt_file_cache_path = os.path.join(self.local_scratch.path, "material_index_disabled")
+        try:
+            assert _library_material_names([library]) == _amat_material_names(amat)
+            assert not os.path.exists(settings.aedt_file_cache_path)
+            settings.enable_aedt_file_cache = True
+            settings.aedt_file_cache_path = os.path.join(self.local_scratch.path, "material_index")
+            shutil.copy(amat, os.path.join(library, "material_copy.amat"))
+            names = _library_material_names([library])
+            assert names == _amat_material_names(amat) * 2
+            assert os.path.exists(os.path.join(settings.aedt_file_cache_path, "material_library_index.json"))
+            # a replaced file changes the modification time of its directory
+            with open(amat, "r") as f:
+                content = f.read()
+            with open(amat + ".tmp", "w") as f:
+                f.write(content + "$begin 'new_material'\n$end 'new_material'\n")
+            os.remove(amat)
+            os.rename(amat + ".tmp", amat)
+            assert _library_material_names([library]) == names + ["new_material"]
+            # a file edited in place is read again, even if its directory did not change
+            with open(amat, "a") as f:
+                f.write("$begin 'edited_material'\n$end 'edited_material'\n")
+            assert _library_material_names([library]) == names + ["new_material", "edited_material"]
+            os.remove(amat)
+            assert _library_material_names([library]) == _amat_material_names(
+                os.path.join(library, "material_copy.amat")
+            )
+        finally:
+            settings.aedt_file_cache_path = cache_path
+            settings.enable_aedt_file_cache = enable_cache
+
+    def test_13_material_dict_placeholders(self):
+        class Built(object):
+            def __init__(self, name):
+                self.name = name
+
+        class Materials(object):
+            logger = self.aedtapp.logger
+            built = []
+
+            def _aedmattolibrary(self, name):
+                self.built.append(name)
+                if name == "missing":
+                    raise ValueError(name)
+                return Built(name)
+
+        materials = _MaterialDict(Materials())
+        materials["copper"] = _ProjectMaterial("copper")
+        materials["missing"] = _ProjectMaterial("missing")
+        materials["vacuum"] = _ProjectMaterial("vacuum")
+        # the names are served without building the materials
+        assert "copper" in materials
+        assert "missing" in materials
+        assert len(materials) == 3
+        assert list(materials.keys()) == ["copper", "missing", "vacuum"]
+        assert not Materials.built
+        assert materials["vacuum"].name == "vacuum"
+        assert materials.get("vacuum") is materials["vacuum"]
+        assert Materials.built == ["vacuum"]
+        assert materials.get("missing") is None
+        assert "missing" not in materials
+        assert [name for name, _ in materials.items()] == ["copper", "vacuum"]
+        assert Materials.built == ["vacuum", "missing", "copper"]
@@ -12,6 +12,8 @@ except ImportError:
 from _unittest.conftest import BasisTest
 from _unittest.conftest import config
 from _unittest.conftest import local_path
+from pyaedt import profiling
+from pyaedt import settings
 from pyaedt.generic.constants import AXIS
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.modeler.GeometryOperators import GeometryOperators
@@ -19,6 +21,7 @@ from pyaedt.modeler.Object3d import Object3d
 from pyaedt.modeler.Object3d import UserDefinedComponent
 from pyaedt.modeler.Primitives import Polyline
 from pyaedt.modeler.Primitives import PolylineSegment
+from pyaedt.modeler.Primitives import parse_sat_bounding_boxes
 
 test = sys.modules.keys()
 
@@ -1344,3 +1347,91 @@ class TestClass(BasisTest, object):
 
     def test_82_flatten_3d_components(self):
         assert self.flatten.flatten_3d_components()
+
+    def test_83_bounding_boxes(self):
+        box1 = self.aedtapp.modeler.create_box([0, 0, 0], [1, 2, 3], name="bb_box1")
+        box2 = self.aedtapp.modeler.create_box([5, 5, 5], [1, 1, 1], name="bb_box2")
+        boxes = self.aedtapp.modeler.bounding_boxes([box1, box2.name])
+        assert list(boxes.keys()) == ["bb_box1", "bb_box2"]
+        assert GeometryOperators.points_distance(boxes["bb_box1"][:3], [0, 0, 0]) < 1e-6
+        assert GeometryOperators.points_distance(boxes["bb_box1"][3:], [1, 2, 3]) < 1e-6
+        assert GeometryOperators.points_distance(boxes["bb_box2"][3:], [6, 6, 6]) < 1e-6
+        assert "bb_box1" in self.aedtapp.modeler._bounding_boxes
+        self.aedtapp.modeler.move(box1, [1, 0, 0])
+        assert GeometryOperators.points_distance(box1.bounding_box[:3], [1, 0, 0]) < 1e-6
+        # editing a parameter of an existing operation outside of PyAEDT needs a refresh
+        self.aedtapp.modeler.oeditor.GetChildObject("bb_box1").GetChildObject("CreateBox:1").SetPropValue(
+            "XSize", "4mm"
+        )
+        boxes = self.aedtapp.modeler.bounding_boxes(["bb_box1", "bb_box2"], refresh=True)
+        assert GeometryOperators.points_distance(boxes["bb_box1"][3:], [5, 2, 3]) < 1e-6
+        assert self.aedtapp.modeler.bounding_boxes([box2], refresh=True)["bb_box2"] == boxes["bb_box2"]
+        # adding an operation invalidates the cached bounding box
+        self.aedtapp.modeler.move(box1, [0, 1, 0])
+        assert GeometryOperators.points_distance(box1.bounding_box[:3], [1, 1, 0]) < 1e-6
+        self.aedtapp.modeler.oeditor.ChangeProperty(
+            [
+                "NAME:AllTabs",
+                [
+                    "NAME:Geometry3DCmdTab",
+                    ["NAME:PropServers", "bb_box1:Move:1"],
+                    ["NAME:ChangedProps", ["NAME:Move Vector", "X:=", "2mm", "Y:=", "0mm", "Z:=", "0mm"]],
+                ],
+            ]
+        )
+        boxes = self.aedtapp.modeler.bounding_boxes([box1], refresh=True)
+        assert GeometryOperators.points_distance(boxes["bb_box1"][:3], [2, 1, 0]) < 1e-6
+        # changing a variable invalidates the cached bounding boxes
+        self.aedtapp["bb_size"] = "2mm"
+        box3 = self.aedtapp.modeler.create_box([0, 0, 0], ["bb_size", 1, 1], name="bb_box3")
+        assert GeometryOperators.points_distance(box3.bounding_box[3:], [2, 1, 1]) < 1e-6
+        self.aedtapp["bb_size"] = "3mm"
+        assert GeometryOperators.points_distance(box3.bounding_box[3:], [3, 1, 1]) < 1e-6
+        box1.delete()
+        box2.delete()
+        box3.delete()
+
+    def test_83a_bounding_boxes_cached_calls(self):
+        box = self.aedtapp.modeler.create_box([0, 0, 0], [1, 2, 3], name="bb_cached")
+        expected = box.bounding_box
+        oeditor = self.aedtapp._oeditor
+        self.aedtapp._oeditor = profiling.wrap_aedt_object(oeditor)
+        profiling.reset()
+        settings.enable_profiling = True
+        try:
+            assert box.bounding_box == expected
+        finally:
+            settings.enable_profiling = False
+            self.aedtapp._oeditor = oeditor
+        stats = dict((row[0].split(".")[-1], row[1:]) for row in profiling.get_stats())
+        profiling.reset()
+        # a cached bounding box only reads the operation names of the object
+        assert "_bounding_boxes_sat" not in stats
+        assert "export_3d_model" not in stats
+        assert stats["bounding_boxes"][4] <= 2
+        box.delete()
+
+    def test_84_parse_sat_bounding_boxes(self):
+        sat = "\n".join(
+            [
+                "2100 0 2 0",
+                "@8 AEDT 22 @12 ACIS 29.0 NT @24 Mon Oct 17 10:00:00 2022",
+                "1 9.9999999999999995e-07 1e-10",
+                "body $-1 -1 -1 $-1 $2 $-1 $-1 T 0 0 0 1 2 3 #",
+                "body $-1 -1 -1 $-1 $3 $-1 $-1 T -5 5 5 6 6 6.5 #",
+                "lump $-1 -1 -1 $-1 $-1 $-1 $0 T 0 0 0 1 2 3 #",
+                "lump $-1 -1 -1 $-1 $-1 $-1 $1 T -5 5 5 6 6 6.5 #",
+                "name_attrib-gen-attrib $-1 -1 $-1 $-1 $3 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 @6 Box#1# #",
+                "name_attrib-gen-attrib $-1 -1 $-1 $-1 $0 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 @4 Box2 #",
+                "End-of-ACIS-data",
+            ]
+        )
+        boxes = parse_sat_bounding_boxes(sat, ["Box#1#", "Box2"])
+        assert boxes["Box#1#"] == [-5.0, 5.0, 5.0, 6.0, 6.0, 6.5]
+        assert boxes["Box2"] == [0.0, 0.0, 0.0, 1.0, 2.0, 3.0]
+        sat = "\n".join(i for i in sat.splitlines() if "attrib" not in i)
+        # without name attributes, the order of the bodies does not identify the objects
+        assert not parse_sat_bounding_boxes(sat, ["A", "B"])
+        assert not parse_sat_bounding_boxes(sat, ["A"])
+        sat = "\n".join(i for i in sat.splitlines() if "-5 5 5" not in i)
+        assert parse_sat_bounding_boxes(sat, ["A"])["A"] == [0.0, 0.0, 0.0, 1.0, 2.0, 3.0]
@@ -282,6 +282,17 @@ class TestClass(BasisTest, object):
         data = self.aedtapp.post.get_solution_data("S(1,1)")
         assert data.primary_sweep == "Freq"
         assert data.expressions[0] == "S(1,1)"
+        values = data.get_expression_data(formula="complex")
+        assert len(values) == len(data.primary_sweep_values)
+        assert values.real.tolist() == list(data.data_real())
+        assert data.get_expression_data(formula="db20").tolist() == list(data.data_db20())
+        assert data.get_expression_array("S(1,1)").shape[1:] == tuple(len(i) for i in data.sweep_axes.values())
+        settings.enable_lazy_solution_data = True
+        lazy_data = self.aedtapp.post.get_solution_data("S(1,1)")
+        settings.enable_lazy_solution_data = False
+        assert not lazy_data._solutions
+        assert list(lazy_data.data_db20()) == list(data.data_db20())
+        assert list(lazy_data._solutions.keys()) == ["S(1,1)"]
         assert len(self.aedtapp.post.all_report_names) > 0
 
         variations = self.field_test.available_variations.nominal_w_values_dict
@@ -856,6 +867,21 @@ class TestClass(BasisTest, object):
             coord_system_center=[-0.15, 0, 0], db_val=True, csv_dir=os.path.join(self.sbr_test.working_directory, "csv")
         )
         assert os.path.exists(frames_list)
+        t_matrix_file = os.path.join(self.sbr_test.working_directory, "t_matrix.npy")
+        t_matrix_mapped = solution_data.ifft("NearE", window=True, output_file=t_matrix_file, tile_size=100)
+        assert os.path.exists(t_matrix_file)
+        assert (t_matrix_mapped == t_matrix).all()
+        npy_list = solution_data.ifft_to_file(
+            coord_system_center=[-0.15, 0, 0],
+            db_val=True,
+            num_frames=2,
+            csv_dir=os.path.join(self.sbr_test.working_directory, "npy"),
+            file_format="npy",
+        )
+        with open(npy_list, "r") as f:
+            npy_files = f.read().split()
+        assert len(npy_files) == 2
+        assert all(os.path.exists(i) for i in npy_files)
         self.sbr_test.post.plot_scene(
             frames_list,
             os.path.join(self.sbr_test.working_directory, "animation.gif"),
@@ -919,6 +945,10 @@ class TestClass(BasisTest, object):
         assert isinstance(out[1], list)
         assert isinstance(out[2], list)
         assert isinstance(out[3], bool)
+        assert len(out[1][0]) % 4 == 0
+        assert all(len(i) == len(out[0][0]) for i in out[2][0])
+        triangles = out[1][0].reshape((-1, 4))[:, 1:]
+        assert len({frozenset(i) for i in triangles.tolist()}) == len(triangles)
         assert _parse_aedtplt(
             os.path.join(local_path, "example_models", test_subfolder, "test_vector_no_solutions.aedtplt")
         )
@@ -1128,6 +1158,17 @@ class TestClass(BasisTest, object):
             export_image_path=os.path.join(self.local_scratch.path, "contour1.jpg"),
         )
         assert os.path.exists(os.path.join(self.local_scratch.path, "contour1.jpg"))
+        results = ffdata1.beamform_many([[0, 0], [0, 30], [45, 30]])
+        assert len(results) == 3
+        assert results[1]["RealizedGain"].shape == (results[1]["nTheta"], results[1]["nPhi"])
+        single = ffdata1.beamform(phi_scan=0, theta_scan=30)
+        assert abs(single["RealizedGain"] - results[1]["RealizedGain"]).max() < 1e-12
+        assert abs(single["RealizedGain"] - results[2]["RealizedGain"]).max() > 0
+        # the cached results are read-only and the result of beamform is a copy
+        assert not results[1]["RealizedGain"].flags.writeable
+        single["RealizedGain"] *= 0
+        assert abs(ffdata1.beamform_many([[0, 30]])[0]["RealizedGain"] - results[1]["RealizedGain"]).max() < 1e-12
+        assert ffdata1.beamform_many([[0, 30]])[0]["RealizedGain"].max() > 0
 
     def test_73_ami_solution_data(self):
         self.ami_test.solution_type = "NexximAMI"
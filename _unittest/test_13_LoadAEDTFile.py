@@ -2,12 +2,19 @@
 import base64
 import filecmp
 import os
+import shutil
 import sys
+import threading
 
 from _unittest.conftest import BasisTest
 from _unittest.conftest import config
 from _unittest.conftest import local_path
+from pyaedt import settings
+from pyaedt.generic import LoadAEDTFile
+from pyaedt.generic.LoadAEDTFile import AedtFileView
+from pyaedt.generic.LoadAEDTFile import clear_aedt_file_cache
 from pyaedt.generic.LoadAEDTFile import load_entire_aedt_file
+from pyaedt.generic.LoadAEDTFile import load_keyword_in_aedt_file
 
 test_subfolder = "T13"
 if config["desktopVersion"] > "2022.2":
@@ -127,3 +134,117 @@ class TestClass(BasisTest, object):
         assert newmat.youngs_modulus.value == "195000000000"
         assert newmat.poissons_ratio.value == "0.3"
         assert newmat.thermal_expansion_coefficient.value == "1.08e-05"
+
+    def test_09_binary_blocks_are_skipped(self):
+        aedt_file = os.path.join(local_path, "example_models", test_subfolder, "assembly_231.aedt")
+        dd = load_entire_aedt_file(aedt_file)
+        assert "ProjectPreview" in dd
+        x_b = dd["AllReferencedFilesForProject"]["Design_1.setup/NativeGeometryFiles"]["x_b"]
+        assert len(x_b) == 34
+        assert x_b[0] == {"Design_1.setup/NativeGeometryFiles/0000555.x_b": None, "BIN000000014661": None}
+
+    def test_10_load_files_from_threads(self):
+        aedt_files = [
+            os.path.join(local_path, "example_models", test_subfolder, name)
+            for name in ["Coax_HFSS.aedt", "assembly.aedt", "Cassegrain.aedt", "assembly_231.aedt"]
+        ]
+        expected = [load_entire_aedt_file(aedt_file) for aedt_file in aedt_files]
+        results = {}
+
+        def load(i):
+            results[i] = load_entire_aedt_file(aedt_files[i % len(aedt_files)])
+
+        threads = [threading.Thread(target=load, args=(i,)) for i in range(4 * len(aedt_files))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i, result in results.items():
+            assert result == expected[i % len(aedt_files)]
+        assert len(results) == 4 * len(aedt_files)
+
+    def test_11_load_keyword_from_index(self):
+        aedt_file = os.path.join(local_path, "example_models", test_subfolder, "Cassegrain.aedt")
+        project_dict = load_entire_aedt_file(aedt_file)
+        preview = load_keyword_in_aedt_file(aedt_file, "ProjectPreview")
+        assert preview["ProjectPreview"] == project_dict["ProjectPreview"]
+        desktop = load_keyword_in_aedt_file(aedt_file, "Desktop")
+        assert desktop["Desktop"] == project_dict["AnsoftProject"]["Desktop"]
+        assert load_keyword_in_aedt_file(aedt_file, "NotAKeyword") == {}
+
+    def test_12_aedt_file_view(self):
+        aedt_file = os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS_231.aedt")
+        project_dict = load_entire_aedt_file(aedt_file)
+        view = AedtFileView(aedt_file)
+        assert list(view.keys()) == list(project_dict.keys())
+        assert "ProjectPreview" in view
+        assert view["ProjectPreview"]["DesignInfo"]["DesignName"] == "HFSSDesign"
+        assert view["AnsoftProject"]["Desktop"] == project_dict["AnsoftProject"]["Desktop"]
+        assert view["AnsoftProject"]["Product"] == "ElectronicsDesktop"
+        assert view.to_dict() == project_dict
+
+    def test_13_aedt_file_cache(self):
+        cache_path = os.path.join(self.local_scratch.path, "aedt_file_cache")
+        aedt_file = self.local_scratch.copyfile(
+            os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS.aedt")
+        )
+        aedt_file2 = self.local_scratch.copyfile(
+            os.path.join(local_path, "example_models", test_subfolder, "Cassegrain.aedt")
+        )
+        default_cache_path = settings.aedt_file_cache_path
+        settings.aedt_file_cache_path = cache_path
+        settings.enable_aedt_file_cache = True
+        try:
+            project_dict = load_entire_aedt_file(aedt_file, use_cache=True)
+            assert len(os.listdir(cache_path)) == 1
+            assert load_entire_aedt_file(aedt_file, use_cache=True) == project_dict
+            # a modified file is decoded again
+            shutil.copyfile(os.path.join(local_path, "example_models", test_subfolder, "Coax_HFSS_231.aedt"), aedt_file)
+            os.utime(aedt_file, (0, 1))
+            assert "ProjectPreview" in load_entire_aedt_file(aedt_file, use_cache=True)
+            assert len(os.listdir(cache_path)) == 2
+            # the least recently used files are evicted
+            settings.aedt_file_cache_size = 0
+            load_entire_aedt_file(aedt_file2, use_cache=True)
+            assert len(os.listdir(cache_path)) == 0
+            assert clear_aedt_file_cache()
+        finally:
+            settings.enable_aedt_file_cache = False
+            settings.aedt_file_cache_size = 2048
+            settings.aedt_file_cache_path = default_cache_path
+
+    def test_14_incremental_load(self):
+        aedt_file = os.path.join(self.local_scratch.path, "Cassegrain_incremental.aedt")
+        shutil.copyfile(os.path.join(local_path, "example_models", test_subfolder, "Cassegrain.aedt"), aedt_file)
+        project_dict = load_entire_aedt_file(aedt_file, incremental=True)
+        assert project_dict == load_entire_aedt_file(aedt_file)
+        # rename the second design only
+        with open(aedt_file, "rb") as f:
+            data = f.read()
+        second_design = data.index(b"$begin 'HFSSModel'", data.index(b"$begin 'HFSSModel'") + 1)
+        name = data.index(b"Name='", second_design) + len(b"Name='")
+        with open(aedt_file, "wb") as f:
+            f.write(data[:name] + b"Renamed_" + data[name:])
+        os.utime(aedt_file, (0, 1))
+        new_dict = load_entire_aedt_file(aedt_file, incremental=True)
+        assert new_dict == load_entire_aedt_file(aedt_file)
+        designs = new_dict["AnsoftProject"]["HFSSModel"]
+        assert designs[1]["Name"].startswith("Renamed_")
+        assert designs[0] == project_dict["AnsoftProject"]["HFSSModel"][0]
+        assert designs[1] != project_dict["AnsoftProject"]["HFSSModel"][1]
+        assert new_dict["AnsoftProject"]["Definitions"] == project_dict["AnsoftProject"]["Definitions"]
+        # editing the returned dictionary does not affect the next load
+        designs[0]["Name"] = "Edited"
+        del new_dict["AnsoftProject"]["Definitions"]
+        assert load_entire_aedt_file(aedt_file, incremental=True) == load_entire_aedt_file(aedt_file)
+        # the stored blocks are bounded by the size of their text and dropped on request
+        assert os.path.normpath(aedt_file) in LoadAEDTFile._incremental_states
+        LoadAEDTFile._clear_incremental_state(aedt_file)
+        assert os.path.normpath(aedt_file) not in LoadAEDTFile._incremental_states
+        max_bytes = LoadAEDTFile._incremental_states_max_bytes
+        LoadAEDTFile._incremental_states_max_bytes = 1024
+        try:
+            assert load_entire_aedt_file(aedt_file, incremental=True) == load_entire_aedt_file(aedt_file)
+            assert os.path.normpath(aedt_file) not in LoadAEDTFile._incremental_states
+        finally:
+            LoadAEDTFile._incremental_states_max_bytes = max_bytes
@@ -67,3 +67,28 @@ class TestClass(BasisTest, object):
         )
         assert len(ibis_model.components) == 6
         assert len(ibis_model.models) == 17
+
+    def test_03_read_ibis_tables(self):
+        ibis_file = os.path.join(local_path, "example_models", test_subfolder, "u26a_800_modified.ibs")
+        ibis_reader.clear_ibis_file_cache()
+        reader = ibis_reader.IbisReader(ibis_file, None)
+        reader.parse_ibis_file()
+        ibis = reader.ibis_model
+        model = ibis.models[0]
+        assert model.model_type == "I/O"
+        assert model.clamp
+        assert model.pulldown.x.shape == (100,)
+        assert model.pulldown.x[0] == -1.8
+        assert abs(model.pulldown.typ[0] + 54.93941e-3) < 1e-9
+        assert model.pullup.typ.shape == model.pullup.min.shape == model.pullup.max.shape
+        assert model.gnd_clamp.x.shape == (100,)
+        assert model.power_clamp.x.shape == (100,)
+        assert model.ramp.x == ["dV/dt_r", "dV/dt_f"]
+        assert abs(model.ramp.typ[0][0] - 804.315e-3) < 1e-9
+        assert abs(model.ramp.typ[0][1] - 156.432e-12) < 1e-18
+        assert len(model.rising_waveforms) == 2
+        assert len(model.falling_waveforms) == 2
+        assert model.rising_waveforms[0].parameters["R_fixture"] == "50.00Ohm"
+        assert ibis.model_selectors[0].model_selector_items[0].name == "NF_IN_800"
+        assert ibis_reader.load_ibis_file(ibis_file) is model._ibis_file
+        assert ibis_reader.ibis_values_to_array(["1.2mA", "NA", "-3n"])[0] == 1.2e-3
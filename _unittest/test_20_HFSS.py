@@ -1004,6 +1004,16 @@ class TestClass(BasisTest, object):
     def test_47_convert_near_field(self):
         example_project = os.path.join(local_path, "example_models", "nf_test")
         assert os.path.exists(convert_nearfield_data(example_project, output_folder=self.local_scratch.path))
+        and_files = convert_nearfield_data([example_project], [2.5], output_folder=self.local_scratch.path)
+        assert len(and_files) == 1
+        with open(and_files[0]) as f:
+            assert 'FreqData("2.5GHz"' in f.read()
+        exception_raised = False
+        try:
+            convert_nearfield_data([example_project, example_project], [2.5, 5], output_folder=self.local_scratch.path)
+        except ValueError:
+            exception_raised = True
+        assert exception_raised
 
     def test_48_traces(self):
         assert len(self.aedtapp.excitations) > 0
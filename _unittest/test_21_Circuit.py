@@ -5,9 +5,14 @@ from _unittest.conftest import BasisTest
 from _unittest.conftest import config
 from _unittest.conftest import local_path
 from pyaedt import Circuit  # Setup paths for module imports
+from pyaedt.generic.TouchstoneParser import get_fext_xtalk_from_list
+from pyaedt.generic.TouchstoneParser import get_next_xtalk
+from pyaedt.generic.TouchstoneParser import get_return_losses
+from pyaedt.generic.TouchstoneParser import get_worst_curve_from_solution_data
 from pyaedt.generic.TouchstoneParser import (
     read_touchstone,  # Setup paths for module imports
 )
+from pyaedt.generic.TouchstoneParser import write_touchstone
 
 try:
     import pytest  # noqa: F401
@@ -202,6 +207,63 @@ class TestClass(BasisTest, object):
         assert max(data_with_verbose.data_magnitude()) > 0.37
         assert max(data_with_verbose.data_magnitude()) < 0.38
 
+    def test_16a_write_touchstone(self):
+        data = read_touchstone(os.path.join(self.local_scratch.path, touchstone))
+        assert data.matrix.shape == (len(data.sweeps["Freq"]), 6, 6)
+        assert data.frequencies[-1] == data.sweeps["Freq"][-1] * 1e9
+        for version in [1, 2]:
+            for data_format in ["RI", "MA", "DB"]:
+                file_path = os.path.join(self.local_scratch.path, "written_v{}_{}.s6p".format(version, data_format))
+                assert write_touchstone(file_path, data, data_format, version)
+                written_data = read_touchstone(file_path)
+                assert written_data.ports == data.ports
+                assert abs(written_data.matrix - data.matrix).max() < 1e-12
+        renormalized_data = data.renormalize(75)
+        assert list(renormalized_data.z0) == [75] * 6
+        assert abs(renormalized_data.renormalize(50).matrix - data.matrix).max() < 1e-12
+
+    def test_16b_touchstone_si_metrics(self):
+        data = read_touchstone(os.path.join(self.local_scratch.path, touchstone))
+        table = data.get_si_metrics("U1", "U7", 1, 5)
+        assert table["Type"].count("RL") == 6
+        assert table["Type"].count("IL") == 3
+        assert table["Type"].count("NEXT") == 3
+        assert table["Type"].count("FEXT") == 6
+        insertion_loss = table["Expression"].index("S(A-MII-RXD1_30_SQFP28X28_208_U1,A-MII-RXD1_65_SQFP20X20_144_U7)")
+        magnitude = data.data_magnitude(table["Expression"][insertion_loss])
+        assert table["Worst"][insertion_loss] == min(m for m, f in zip(magnitude, data.sweeps["Freq"]) if 1 <= f <= 5)
+        worst, means = get_worst_curve_from_solution_data(data, 1, 5, curve_list=get_return_losses(data.ports))
+        assert worst in table["Expression"]
+        assert not data.check_passivity()
+        assert not data.check_causality()
+        mixed_mode = data.get_mixed_mode([[data.ports[0], data.ports[2]]], ["RXD1"])
+        assert mixed_mode.ports[:2] == ["Diff_RXD1", "Comm_RXD1"]
+        assert list(mixed_mode.z0[:2]) == [100, 25]
+        assert not mixed_mode.check_passivity()
+
+    def test_16c_touchstone_causality(self):
+        import numpy as np
+
+        from pyaedt.generic.TouchstoneParser import TouchstoneData
+
+        data = read_touchstone(os.path.join(local_path, "example_models", "TEDB", "GRM32_DC0V_25degC_series.s2p"))
+        assert not data.check_causality()
+        for npoints in [50, 201, 1001]:
+            freqs = np.linspace(0, 10, npoints)
+            thru = TouchstoneData(freqs, np.ones((npoints, 1, 1)), ["P1"])
+            assert not thru.check_causality()
+            delay = np.exp(-2j * np.pi * freqs * 0.7).reshape((npoints, 1, 1))
+            assert not TouchstoneData(freqs, delay, ["P1"]).check_causality()
+            # a time-advanced delay responds before it is excited
+            advance = np.exp(2j * np.pi * freqs * 0.3).reshape((npoints, 1, 1))
+            assert TouchstoneData(freqs, advance, ["P1"]).check_causality() == ["S(P1,P1)"]
+
+    def test_16d_touchstone_expressions(self):
+        assert get_return_losses(["1", "2"]) == ["S(1,1)", "S(2,2)"]
+        assert get_next_xtalk(["1", "2", "3"]) == ["S(1,2)", "S(1,3)", "S(2,3)"]
+        assert get_fext_xtalk_from_list(["1", "2"], ["3", "4"]) == ["S(1,4)", "S(2,3)"]
+        assert get_fext_xtalk_from_list(["1", "2"], ["3", "4"], False) == ["S(1,3)", "S(1,4)", "S(2,3)", "S(2,4)"]
+
     def test_17_create_setup(self):
         setup_name = "Dom_LNA"
         LNA_setup = self.aedtapp.create_setup(setup_name)
@@ -689,3 +751,50 @@ class TestClass(BasisTest, object):
         self.aedtapp["var_test"] = "234"
         assert "var_test" in self.aedtapp.variable_manager.design_variable_names
         assert self.aedtapp.variable_manager.design_variables["var_test"].expression == "234"
+
+    def test_42_compute_eye_diagram(self):
+        import numpy as np
+
+        unit_interval = 1e-9
+        samples_per_bit = 32
+        bits = [0, 1, 1, 0, 1, 0, 0, 1] * 50
+        levels = np.repeat(np.array(bits) * 2.0 - 1.0, samples_per_bit)
+        # linear edges of a quarter of unit interval
+        ramp = np.convolve(levels, np.ones(8) / 8)[: len(levels)]
+        sweep = np.arange(len(levels)) * unit_interval / samples_per_bit
+        eye = self.aedtapp.post.compute_eye_diagram(
+            ramp, sweep * 1e9, unit_interval, waveform_sweep_unit="ns", ignore_bits=2, chunk_size=1000
+        )
+        assert eye.histogram.shape == (200, 100)
+        assert eye.histogram.sum() == eye.n_samples
+        assert abs(eye.eye_height - 2.0) < 0.05
+        assert eye.jitter_pp < unit_interval / 20
+        assert eye.eye_width > 0.9 * unit_interval
+        height, width = eye.eye_opening(1e-12)
+        assert 0 < height <= eye.eye_height
+        assert 0 < width <= unit_interval
+        time, lower, upper = eye.ber_contour(1e-6)
+        assert len(time) == len(lower) == len(upper) == 100
+
+        clock_tics = (np.arange(len(bits)) * unit_interval).tolist()
+        sampled = self.aedtapp.post.sample_waveform(
+            ramp.tolist(), (sweep * 1e9).tolist(), waveform_sweep_unit="ns", unit_interval=1e-9, clock_tics=clock_tics
+        )
+        assert len(sampled) == len(bits)
+        assert [round(i[1]) for i in sampled[1:]] == [i * 2 - 1 for i in bits[1:]]
+
+    def test_43_compute_closed_eye_diagram(self):
+        import numpy as np
+
+        unit_interval = 1e-9
+        samples_per_bit = 32
+        bits = [0, 1, 1, 0, 1, 0, 0, 1] * 50
+        levels = np.repeat(np.array(bits) * 2.0 - 1.0, samples_per_bit)
+        noisy = levels + np.random.RandomState(0).normal(0, 0.8, len(levels))
+        sweep = np.arange(len(levels)) * unit_interval / samples_per_bit
+        eye = self.aedtapp.post.compute_eye_diagram(
+            noisy, sweep * 1e9, unit_interval, waveform_sweep_unit="ns", threshold=0.0, chunk_size=1000
+        )
+        # the noise closes the eye, so the lowest one is below the highest zero
+        assert eye.eye_height < 0
+        assert eye.eye_opening(1e-12) == (0.0, 0.0)
@@ -1,4 +1,5 @@
 import random
+import threading
 import time
 
 import numpy as np
@@ -73,3 +74,158 @@ class TestClass(BasisTest, object):
         )
         assert model.run()
         assert model.best_function
+
+    def test_03_ga_thread_pool(self):
+        def f(X):
+            time.sleep(0.3 if X[0] > 9 else 0.01)
+            return np.sum(X)
+
+        algorithm_param = {
+            "max_num_iteration": 3,
+            "population_size": 6,
+            "mutation_prob": 0.2,
+            "elite_ratio": 0.01,
+            "crossover_prob": 0.5,
+            "parents_portion": 0.5,
+            "crossover_type": "uniform",
+            "max_iteration_no_improv": None,
+        }
+        varbound = np.array([[0, 10]] * 3)
+        model = ga(
+            function=f,
+            dim=3,
+            var_type="int",
+            boundaries=varbound,
+            algorithm_parameters=algorithm_param,
+            function_timeout=0.2,
+            progress_bar=False,
+            evaluation_backend="thread",
+            max_workers=6,
+            memoize=True,
+        )
+        assert model.run()
+        assert model.best_function < 1e10
+        assert all(key[0] <= 9 for key in model.evaluated)
+        model = ga(
+            function=np.sum,
+            dim=3,
+            var_type="int",
+            boundaries=varbound,
+            algorithm_parameters=algorithm_param,
+            progress_bar=False,
+            evaluation_backend="process",
+            max_workers=2,
+        )
+        assert model.run()
+        assert model.best_function == np.sum(model.best_variable)
+
+    def test_04_ga_batch_evaluation(self):
+        calls = []
+
+        def batch(population):
+            calls.append(len(population))
+            return population.sum(axis=1)
+
+        algorithm_param = {
+            "max_num_iteration": 4,
+            "population_size": 8,
+            "mutation_prob": 0.2,
+            "elite_ratio": 0.01,
+            "crossover_prob": 0.5,
+            "parents_portion": 0.5,
+            "crossover_type": "uniform",
+            "max_iteration_no_improv": None,
+        }
+        model = ga(
+            function=None,
+            dim=2,
+            var_type="int",
+            boundaries=np.array([[0, 3]] * 2),
+            algorithm_parameters=algorithm_param,
+            progress_bar=False,
+            evaluation_backend=batch,
+            memoize=True,
+        )
+        assert model.run()
+        assert model.best_function == np.sum(model.best_variable)
+        assert len(calls) <= 5
+        # every individual is evaluated only once
+        assert sum(calls) == len(model.evaluated)
+        assert model.evaluate_population(np.array([[1, 2], [1, 2]])) == [3, 3]
+
+    def test_05_ga_pool_timeout_from_start(self):
+        def f(X):
+            time.sleep(2 if X[0] > 9 else 0.05)
+            return np.sum(X)
+
+        model = ga(
+            function=f,
+            dim=3,
+            var_type="int",
+            boundaries=np.array([[0, 10]] * 3),
+            function_timeout=0.5,
+            progress_bar=False,
+            evaluation_backend="thread",
+            max_workers=1,
+        )
+        population = np.array([[10, 0, 0], [1, 1, 1], [2, 2, 2], [3, 3, 3], [4, 4, 4]])
+        # the evaluations after the timed out one have their own timeout and are not failed
+        assert model._evaluate_in_pool(population) == [1e10, 3, 6, 9, 12]
+
+    def test_06_ga_serial_no_memoize(self):
+        calls = []
+        running = []
+        overlaps = []
+        finished = []
+
+        def f(X):
+            calls.append(threading.current_thread().name)
+            running.append(X[0])
+            overlaps.append(len(running))
+            try:
+                for _ in range(200 if X[0] > 9 else 1):
+                    time.sleep(0.01)
+            finally:
+                running.remove(X[0])
+            finished.append(X[0])
+            return np.sum(X) + len(calls)
+
+        model = ga(
+            function=f,
+            dim=3,
+            var_type="int",
+            boundaries=np.array([[0, 10]] * 3),
+            progress_bar=False,
+        )
+        population = np.array([[1, 1, 1], [1, 1, 1]])
+        # without memoization, a noisy objective is evaluated again for every individual
+        assert model.evaluate_population(population) == [4, 5]
+        assert model.evaluate_population(population) == [6, 7]
+        assert not model.evaluated
+        # without timeout, serial evaluations run in the calling thread
+        assert set(calls) == {threading.current_thread().name}
+        model.timeout = 0.5
+        assert model.evaluate_population(np.array([[10, 0, 0], [2, 2, 2]])) == [1e10, 12]
+        # the timed out evaluation is stopped before the next one starts
+        assert 10 not in finished
+        assert max(overlaps) == 1
+
+    def test_07_ga_serial_timeout_native_block(self):
+        def f(X):
+            if X[0] > 9:
+                # blocked in native code, where the thread cannot be stopped
+                threading.Event().wait(3)
+            return np.sum(X)
+
+        model = ga(
+            function=f,
+            dim=3,
+            var_type="int",
+            boundaries=np.array([[0, 10]] * 3),
+            function_timeout=0.3,
+            progress_bar=False,
+        )
+        start = time.time()
+        # the blocked evaluation is abandoned after a second timeout
+        assert model.evaluate_population(np.array([[10, 0, 0], [2, 2, 2]])) == [1e10, 6]
+        assert time.time() - start < 2
@@ -27,25 +27,63 @@ from pyaedt.generic.general_methods import settings
 
 from pyaedt.aedt_logger import pyaedt_logger  # isort:skip
 
-try:
-    from pyaedt.generic.design_types import Hfss3dLayout
-except:
-    from pyaedt.generic.design_types import Hfss3dLayout
-
-from pyaedt.generic.design_types import Circuit
-from pyaedt.generic.design_types import Desktop
-from pyaedt.generic.design_types import Edb
-from pyaedt.generic.design_types import Emit
-from pyaedt.generic.design_types import Hfss
-from pyaedt.generic.design_types import Icepak
-from pyaedt.generic.design_types import Maxwell2d
-from pyaedt.generic.design_types import Maxwell3d
-from pyaedt.generic.design_types import MaxwellCircuit
-from pyaedt.generic.design_types import Mechanical
-from pyaedt.generic.design_types import Q2d
-from pyaedt.generic.design_types import Q3d
-from pyaedt.generic.design_types import Rmxprt
-from pyaedt.generic.design_types import Simplorer
-from pyaedt.generic.design_types import Siwave
-from pyaedt.generic.design_types import TwinBuilder
-from pyaedt.generic.design_types import get_pyaedt_app
+# The application classes are exposed through functions of ``design_types`` that import the
+# application modules when they are called. On CPython ``design_types`` itself is imported on
+# first access to one of these names.
+_design_types = [
+    "Circuit",
+    "Desktop",
+    "Edb",
+    "Emit",
+    "Hfss",
+    "Hfss3dLayout",
+    "Icepak",
+    "Maxwell2d",
+    "Maxwell3d",
+    "MaxwellCircuit",
+    "Mechanical",
+    "Q2d",
+    "Q3d",
+    "Rmxprt",
+    "Simplorer",
+    "Siwave",
+    "TwinBuilder",
+    "get_pyaedt_app",
+]
+
+if is_ironpython:
+    try:
+        from pyaedt.generic.design_types import Hfss3dLayout
+    except:
+        from pyaedt.generic.design_types import Hfss3dLayout
+
+    from pyaedt.generic.design_types import Circuit
+    from pyaedt.generic.design_types import Desktop
+    from pyaedt.generic.design_types import Edb
+    from pyaedt.generic.design_types import Emit
+    from pyaedt.generic.design_types import Hfss
+    from pyaedt.generic.design_types import Icepak
+    from pyaedt.generic.design_types import Maxwell2d
+    from pyaedt.generic.design_types import Maxwell3d
+    from pyaedt.generic.design_types import MaxwellCircuit
+    from pyaedt.generic.design_types import Mechanical
+    from pyaedt.generic.design_types import Q2d
+    from pyaedt.generic.design_types import Q3d
+    from pyaedt.generic.design_types import Rmxprt
+    from pyaedt.generic.design_types import Simplorer
+    from pyaedt.generic.design_types import Siwave
+    from pyaedt.generic.design_types import TwinBuilder
+    from pyaedt.generic.design_types import get_pyaedt_app
+else:
+
+    def __getattr__(name):
+        if name in _design_types:
+            from pyaedt.generic import design_types
+
+            value = getattr(design_types, name)
+            globals()[name] = value
+            return value
+        raise AttributeError("module 'pyaedt' has no attribute '{}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_design_types))
@@ -10,13 +10,13 @@ from __future__ import absolute_import  # noreorder
 import os
 import shutil
 import tempfile
-import threading
 import time
 import warnings
 from collections import OrderedDict
 
 from pyaedt import settings
 from pyaedt.application.Design import Design
+from pyaedt.application.JobManager import BatchSolveQueue
 from pyaedt.application.JobManager import update_hpc_option
 from pyaedt.application.Variables import Variable
 from pyaedt.application.Variables import decompose_variable_value
@@ -1761,64 +1761,74 @@ class Analysis(Design, object):
         return True
 
     @pyaedt_function_handler()
-    def solve_in_batch(self, filename=None, machine="local", run_in_thread=False):
+    def solve_in_batch(
+        self, filename=None, machine="local", run_in_thread=False, num_cores=None, num_tasks=1, setup_name=None
+    ):
         """Analyze a design setup in batch mode.
 
         .. note::
            To use this function, the project must be closed.
 
+        To solve many projects with a controlled number of concurrent jobs, timeouts, and retries,
+        use the :class:`pyaedt.application.JobManager.BatchSolveQueue` class.
+
         Parameters
         ----------
         filename : str, optional
-            Name of the setup. The default is ``None``, which means that the active project
+            Full path to the project. The default is ``None``, which means that the active project
             is to be solved.
         machine : str, optional
             Name of the machine if remote.  The default is ``"local"``.
         run_in_thread : bool, optional
-            Whether to submit the batch command as a thread. The default is
-            ``False``.
+            Whether to submit the batch command as a thread and return without waiting
+            for the solve. The default is ``False``. The queue running the job is returned,
+            so that the job can be waited for, checked, or cancelled.
+        num_cores : int, optional
+            Number of cores. The default is ``None``, in which case the active HPC
+            configuration of AEDT is used.
+        num_tasks : int, optional
+            Number of tasks. The default is ``1``.
+        setup_name : str, optional
+            Setup to solve, for example ``"HFSSDesign1:Nominal:Setup1"``. The default is ``None``,
+            in which case all setups of the project are solved.
 
         Returns
         -------
-         bool
-           ``True`` when successful, ``False`` when failed.
+        bool or :class:`pyaedt.application.JobManager.BatchSolveQueue`
+            ``True`` when successful, ``False`` when failed. When ``run_in_thread=True``,
+            the queue running the job is returned.
+
+        Notes
+        -----
+        The AEDT log of the solve is written to ``<project_name>_job1.log`` and the output of
+        the AEDT process to ``<project_name>_job1_stdout.txt``, in the directory of the project.
+
+        Examples
+        --------
+        >>> queue = hfss.solve_in_batch(run_in_thread=True)
+        >>> job = queue.jobs[0]
+        >>> queue.wait()
+        >>> job.status
+        'success'
         """
         if not filename:
             filename = self.project_file
             self.close_project()
-        if machine == "local":
-            # -Monitor option used as workaround for R2 BatchSolve not exiting properly at the end of the Batch job
-            options = " -ng -BatchSolve -Monitor "
-        else:
-            options = " -ng -distribute -machinelist list=" + machine + " -Batchsolve "
-
-        self.logger.info("Batch Solve Options: " + options)
         if os.name == "posix":
-            batch_run = os.path.join(
-                self.desktop_install_dir + "/ansysedt" + chr(34) + options + chr(34) + filename + chr(34)
-            )
+            executable = os.path.join(self.desktop_install_dir, "ansysedt")
         else:
-            batch_run = (
-                chr(34) + self.desktop_install_dir + "/ansysedt.exe" + chr(34) + options + chr(34) + filename + chr(34)
-            )
-
-        """
-        check for existing solution directory and delete if present so we
-        dont have old .asol files etc
-        """
+            executable = os.path.join(self.desktop_install_dir, "ansysedt.exe")
+        queue = BatchSolveQueue(executable, num_cores=num_cores, num_tasks=num_tasks)
+        job = queue.add_job(filename, machine=machine, setup=setup_name)
 
         self.logger.info("Solving model in batch mode on " + machine)
-        self.logger.info("Batch Job command:" + batch_run)
+        self.logger.info("Batch Job command:" + " ".join(job.command))
+        queue.start()
         if run_in_thread:
-
-            def thread_run():
-                """ """
-                os.system(batch_run)
-
-            x = threading.Thread(target=thread_run)
-            x.start()
-        else:
-            os.system(batch_run)
+            return queue
+        if not queue.wait():
+            self.logger.error("Batch job failed. Check the log file {}.".format(job.stdout_file))
+            return False
         self.logger.info("Batch job finished.")
         return True
 
@@ -50,6 +50,7 @@ from pyaedt.generic.general_methods import read_tab
 from pyaedt.generic.general_methods import read_xlsx
 from pyaedt.generic.general_methods import settings
 from pyaedt.generic.general_methods import write_csv
+from pyaedt.generic.LoadAEDTFile import _clear_incremental_state
 from pyaedt.generic.LoadAEDTFile import load_entire_aedt_file
 from pyaedt.modules.Boundary import BoundaryObject
 from pyaedt.modules.Boundary import MaxwellParameters
@@ -160,7 +161,7 @@ class Design(AedtObjects):
     ):
         def load_aedt_thread(path):
             start = time.time()
-            settings._project_properties[path] = load_entire_aedt_file(path)
+            settings._project_properties[path] = load_entire_aedt_file(path, use_cache=True, incremental=True)
             settings._project_time_stamp = os.path.getmtime(project_name)
             pyaedt_logger.info("AEDT file load (threaded) time: {}".format(time.time() - start))
 
@@ -301,6 +302,11 @@ class Design(AedtObjects):
         self.optimizations = None
         self._native_components = None
         self._mesh = None
+        self._design_generation = 0
+
+    def _design_changed(self):
+        """Mark a change of the design or project variables or of the coordinate systems."""
+        self._design_generation += 1
 
     @property
     def logger(self):
@@ -327,7 +333,9 @@ class Design(AedtObjects):
             or os.path.exists(self.project_file)
             and os.path.normpath(self.project_file) not in settings._project_properties
         ):
-            settings._project_properties[os.path.normpath(self.project_file)] = load_entire_aedt_file(self.project_file)
+            settings._project_properties[os.path.normpath(self.project_file)] = load_entire_aedt_file(
+                self.project_file, use_cache=True, incremental=True
+            )
             self._logger.info("aedt file load time {}".format(time.time() - start))
         if os.path.normpath(self.project_file) in settings._project_properties:
             return settings._project_properties[os.path.normpath(self.project_file)]
@@ -2827,6 +2835,7 @@ class Design(AedtObjects):
 
         if os.path.normpath(proj_file) in settings._project_properties:
             del settings._project_properties[os.path.normpath(proj_file)]
+        _clear_incremental_state(proj_file)
         return True
 
     @pyaedt_function_handler()
@@ -1,3 +1,44 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from pyaedt.generic.general_methods import is_ironpython
+from pyaedt.generic.general_methods import settings
+
+if os.name == "posix" and is_ironpython:
+    import subprocessdotnet as subprocess
+else:
+    import subprocess
+
+if not is_ironpython:
+    from pyaedt.generic.general_methods import psutil
+
+
+def _kill_process_tree(process):
+    """Kill a process and all its descendants, like the solver processes started by AEDT.
+
+    Parameters
+    ----------
+    process : :class:`subprocess.Popen`
+        Process to kill.
+    """
+    children = []
+    if not is_ironpython:
+        try:
+            # the descendants are listed before the parent is killed, as they are reparented after
+            children = psutil.Process(process.pid).children(recursive=True)
+        except Exception:
+            children = []
+    for child in children:
+        try:
+            child.kill()
+        except Exception:
+            pass
+    process.kill()
+
+
 def get_hpc_info(filename):
     """Retrieve HPC information.
 
@@ -199,3 +240,575 @@ def update_hpc_template(file_name, param_name, param_val):
         new_line = f.read().replace(old_line, replacement_line)
     with open(file_name, "w") as f:
         f.write(new_line)
+
+
+class BatchJob(object):
+    """Batch solve job of a :class:`pyaedt.application.JobManager.BatchSolveQueue` queue.
+
+    The status of the job is one of ``"queued"``, ``"running"``, ``"success"``, ``"failed"``,
+    ``"timeout"``, and ``"cancelled"``.
+
+    Parameters
+    ----------
+    job_id : int
+        ID of the job in the queue.
+    project_file : str
+        Full path to the AEDT project to solve.
+    num_cores : int, optional
+        Number of cores allocated to the job. The default is ``None``, in which case
+        the cores are set by the active HPC configuration of AEDT.
+    num_tasks : int, optional
+        Number of tasks of the job. The default is ``1``.
+    machine : str, optional
+        Name of the machine, or machine list, solving the job. The default is ``"local"``.
+    setup : str, optional
+        Setup to solve, for example ``"HFSSDesign1:Nominal:Setup1"``. The default is ``None``,
+        in which case all setups of the project are solved.
+    options : list, optional
+        Additional command line options for AEDT. The default is ``None``.
+    timeout : float, optional
+        Maximum duration in seconds of an attempt. The default is ``None``, in which case
+        the job is never stopped.
+    retries : int, optional
+        Number of times that a failed or timed out job is run again. The default is ``0``.
+    """
+
+    finished_statuses = ["success", "failed", "timeout", "cancelled"]
+
+    def __init__(
+        self,
+        job_id,
+        project_file,
+        num_cores=None,
+        num_tasks=1,
+        machine="local",
+        setup=None,
+        options=None,
+        timeout=None,
+        retries=0,
+    ):
+        self.job_id = job_id
+        self.project_file = project_file
+        self.num_cores = num_cores
+        self.num_tasks = num_tasks
+        self.machine = machine
+        self.setup = setup
+        self.options = list(options) if options else []
+        self.timeout = timeout
+        self.retries = retries
+        self.status = "queued"
+        self.attempts = 0
+        self.returncode = None
+        self.start_time = None
+        self.end_time = None
+        self.command = None
+        self.log_file = None
+        self.stdout_file = None
+        self._process = None
+        self._stdout = None
+        self._cancel = False
+
+    @property
+    def is_finished(self):
+        """Whether the job is finished, successfully or not.
+
+        Returns
+        -------
+        bool
+        """
+        return self.status in self.finished_statuses
+
+    @property
+    def elapsed_time(self):
+        """Duration in seconds of the last attempt.
+
+        Returns
+        -------
+        float
+            Duration or ``None`` if the job has not started.
+        """
+        if self.start_time is None:
+            return None
+        return (self.end_time or time.time()) - self.start_time
+
+    def to_dict(self):
+        """Get the state of the job as a dictionary that can be saved to a JSON file.
+
+        Returns
+        -------
+        dict
+        """
+        keys = [
+            "job_id",
+            "project_file",
+            "num_cores",
+            "num_tasks",
+            "machine",
+            "setup",
+            "options",
+            "timeout",
+            "retries",
+            "status",
+            "attempts",
+            "returncode",
+            "start_time",
+            "end_time",
+            "command",
+            "log_file",
+            "stdout_file",
+        ]
+        return OrderedDict((key, getattr(self, key)) for key in keys)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a job from a dictionary returned by the ``to_dict()`` method.
+
+        Parameters
+        ----------
+        data : dict
+            State of the job.
+
+        Returns
+        -------
+        :class:`pyaedt.application.JobManager.BatchJob`
+        """
+        job = cls(data["job_id"], data["project_file"])
+        for key, value in data.items():
+            setattr(job, key, value)
+        return job
+
+
+class BatchSolveQueue(object):
+    """Queue of AEDT batch solve jobs run on the local machine.
+
+    The jobs are run in the order that they are added, as subprocesses of the Python
+    session, with at most ``max_workers`` jobs at a time and at most ``total_cores`` cores
+    allocated to the running jobs. The output of every job is saved to a file, and the
+    state of the queue can be saved to a JSON file so that an interrupted queue can be
+    resumed.
+
+    Parameters
+    ----------
+    executable : str or list
+        Full path to the AEDT executable, for example ``"C:/AnsysEM/v222/Win64/ansysedt.exe"``.
+        A list can be provided to run the executable through another program, for example
+        a Python script that replaces AEDT in tests.
+    max_workers : int, optional
+        Maximum number of jobs running at the same time. The default is ``1``.
+    total_cores : int, optional
+        Maximum number of cores allocated to the running jobs. The default is ``None``, in
+        which case the number of cores of the machine is used. A job needing more cores
+        than this value is run alone.
+    num_cores : int, optional
+        Default number of cores of the jobs. The default is ``None``, in which case the
+        cores are set by the active HPC configuration of AEDT.
+    num_tasks : int, optional
+        Default number of tasks of the jobs. The default is ``1``.
+    timeout : float, optional
+        Default maximum duration in seconds of a job. The default is ``None``.
+    retries : int, optional
+        Default number of times that a failed or timed out job is run again. The default is ``0``.
+    log_directory : str, optional
+        Directory of the log files of the jobs. The default is ``None``, in which case
+        the log files are saved in the directory of the projects.
+    state_file : str, optional
+        JSON file where the state of the queue is saved every time that a job changes status.
+        If the file exists, the jobs are loaded from it. Jobs that were running are queued again.
+        The default is ``None``.
+    poll_interval : float, optional
+        Time in seconds between two checks of the running jobs. The default is ``0.5``.
+
+    Examples
+    --------
+    >>> from pyaedt.application.JobManager import BatchSolveQueue
+    >>> queue = BatchSolveQueue("/ansys_inc/v222/Linux64/ansysedt", max_workers=4, num_cores=8,
+    ...                         state_file="/projects/queue.json")
+    >>> for project in ["/projects/variant1.aedt", "/projects/variant2.aedt"]:
+    ...     queue.add_job(project)
+    >>> queue.run()
+    """
+
+    def __init__(
+        self,
+        executable,
+        max_workers=1,
+        total_cores=None,
+        num_cores=None,
+        num_tasks=1,
+        timeout=None,
+        retries=0,
+        log_directory=None,
+        state_file=None,
+        poll_interval=0.5,
+    ):
+        self.executable = executable
+        self.max_workers = max_workers
+        if total_cores is None:
+            import multiprocessing
+
+            total_cores = multiprocessing.cpu_count()
+        self.total_cores = total_cores
+        self.num_cores = num_cores
+        self.num_tasks = num_tasks
+        self.timeout = timeout
+        self.retries = retries
+        self.log_directory = log_directory
+        self.state_file = state_file
+        self.poll_interval = poll_interval
+        self.logger = settings.logger
+        self._jobs = OrderedDict()
+        self._lock = threading.RLock()
+        self._thread = None
+        if state_file and os.path.exists(state_file):
+            self.load_state()
+
+    @property
+    def jobs(self):
+        """Jobs of the queue.
+
+        Returns
+        -------
+        list of :class:`pyaedt.application.JobManager.BatchJob`
+        """
+        return list(self._jobs.values())
+
+    @property
+    def is_running(self):
+        """Whether the queue is running jobs.
+
+        Returns
+        -------
+        bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_job(self, job_id):
+        """Get a job from its ID.
+
+        Parameters
+        ----------
+        job_id : int
+            ID of the job.
+
+        Returns
+        -------
+        :class:`pyaedt.application.JobManager.BatchJob`
+        """
+        return self._jobs[job_id]
+
+    def add_job(
+        self,
+        project_file,
+        num_cores=None,
+        num_tasks=None,
+        machine="local",
+        setup=None,
+        options=None,
+        timeout=None,
+        retries=None,
+    ):
+        """Add a job to the queue.
+
+        Parameters
+        ----------
+        project_file : str
+            Full path to the AEDT project to solve. The project must be closed.
+        num_cores : int, optional
+            Number of cores allocated to the job. The default is ``None``, in which case
+            the default of the queue is used.
+        num_tasks : int, optional
+            Number of tasks of the job. The default is ``None``, in which case
+            the default of the queue is used.
+        machine : str, optional
+            Name of the machine, or machine list, solving the job. The default is ``"local"``.
+        setup : str, optional
+            Setup to solve, for example ``"HFSSDesign1:Nominal:Setup1"``. The default is ``None``,
+            in which case all setups of the project are solved.
+        options : list, optional
+            Additional command line options for AEDT. The default is ``None``.
+        timeout : float, optional
+            Maximum duration in seconds of the job. The default is ``None``, in which case
+            the default of the queue is used.
+        retries : int, optional
+            Number of times that a failed or timed out job is run again. The default is ``None``,
+            in which case the default of the queue is used.
+
+        Returns
+        -------
+        :class:`pyaedt.application.JobManager.BatchJob`
+        """
+        with self._lock:
+            job_id = max(self._jobs) + 1 if self._jobs else 1
+            job = BatchJob(
+                job_id,
+                os.path.abspath(project_file),
+                num_cores=self.num_cores if num_cores is None else num_cores,
+                num_tasks=self.num_tasks if num_tasks is None else num_tasks,
+                machine=machine,
+                setup=setup,
+                options=options,
+                timeout=self.timeout if timeout is None else timeout,
+                retries=self.retries if retries is None else retries,
+            )
+            log_directory = self.log_directory or os.path.dirname(job.project_file)
+            name = "{}_job{}".format(os.path.splitext(os.path.basename(job.project_file))[0], job_id)
+            job.log_file = os.path.join(log_directory, name + ".log")
+            job.stdout_file = os.path.join(log_directory, name + "_stdout.txt")
+            job.command = self.get_command(job)
+            self._jobs[job_id] = job
+            self.save_state()
+        return job
+
+    def get_command(self, job):
+        """Get the command line running a job.
+
+        Parameters
+        ----------
+        job : :class:`pyaedt.application.JobManager.BatchJob`
+            Job.
+
+        Returns
+        -------
+        list of str
+        """
+        if isinstance(self.executable, (list, tuple)):
+            command = list(self.executable)
+        else:
+            command = [self.executable]
+        command += ["-ng", "-logfile", job.log_file]
+        if job.machine != "local":
+            command += ["-distributed", "-machinelist", "list=" + job.machine]
+        elif job.num_cores or job.num_tasks > 1:
+            # -Monitor option used as workaround for R2 BatchSolve not exiting properly at the end of the Batch job
+            command.append("-Monitor")
+            if job.num_tasks > 1:
+                command.append("-distributed")
+            num_cores = job.num_cores or job.num_tasks
+            command += ["-machinelist", "list=localhost:{}:{}".format(job.num_tasks, num_cores)]
+        else:
+            command.append("-Monitor")
+        command += job.options
+        command.append("-BatchSolve")
+        if job.setup:
+            command.append(job.setup)
+        command.append(job.project_file)
+        return command
+
+    def start(self):
+        """Start running the queued jobs in a background thread.
+
+        The thread is not a daemon thread, so the Python interpreter waits for the jobs
+        to finish before exiting. Use the ``cancel`` method to stop them.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the queue is already running.
+        """
+        with self._lock:
+            if self.is_running:
+                return False
+            self._thread = threading.Thread(target=self._dispatch)
+            self._thread.start()
+        return True
+
+    def wait(self, timeout=None):
+        """Wait for the jobs of the queue to finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait. The default is ``None``, in which case
+            the method waits for all jobs.
+
+        Returns
+        -------
+        bool
+            ``True`` when all jobs are successful, ``False`` otherwise.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return all(job.status == "success" for job in self.jobs)
+
+    def run(self):
+        """Run the queued jobs and wait for them to finish.
+
+        Returns
+        -------
+        bool
+            ``True`` when all jobs are successful, ``False`` otherwise.
+        """
+        self.start()
+        return self.wait()
+
+    def cancel(self, job_id=None):
+        """Cancel a job or all unfinished jobs.
+
+        Queued jobs are not run, and running jobs are stopped.
+
+        Parameters
+        ----------
+        job_id : int, optional
+            ID of the job. The default is ``None``, in which case all jobs are cancelled.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the job is already finished.
+        """
+        with self._lock:
+            jobs = [self._jobs[job_id]] if job_id is not None else self.jobs
+            cancelled = False
+            for job in jobs:
+                if job.status == "queued":
+                    job.status = "cancelled"
+                    cancelled = True
+                elif job.status == "running":
+                    job._cancel = True
+                    cancelled = True
+            self.save_state()
+        return cancelled
+
+    def requeue(self, job_id=None):
+        """Queue again a finished job or all jobs that did not succeed.
+
+        Parameters
+        ----------
+        job_id : int, optional
+            ID of the job. The default is ``None``, in which case all failed, timed out,
+            and cancelled jobs are queued again.
+
+        Returns
+        -------
+        bool
+            ``True`` when at least one job is queued again, ``False`` otherwise.
+        """
+        with self._lock:
+            if job_id is not None:
+                jobs = [self._jobs[job_id]] if self._jobs[job_id].is_finished else []
+            else:
+                jobs = [job for job in self.jobs if job.is_finished and job.status != "success"]
+            for job in jobs:
+                job.status = "queued"
+                job.attempts = 0
+                job._cancel = False
+            self.save_state()
+        return len(jobs) > 0
+
+    def save_state(self):
+        """Save the state of the jobs to the ``state_file`` JSON file.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when no state file is defined.
+        """
+        if not self.state_file:
+            return False
+        with self._lock:
+            temp_file = self.state_file + ".tmp"
+            with open(temp_file, "w") as f:
+                json.dump({"jobs": [job.to_dict() for job in self.jobs]}, f, indent=4)
+            if os.path.exists(self.state_file):
+                os.remove(self.state_file)
+            os.rename(temp_file, self.state_file)
+        return True
+
+    def load_state(self):
+        """Load the jobs from the ``state_file`` JSON file.
+
+        Jobs that were running when the state was saved are queued again.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the queue is running.
+        """
+        if self.is_running:
+            return False
+        with open(self.state_file, "r") as f:
+            data = json.load(f)
+        with self._lock:
+            self._jobs = OrderedDict()
+            for job_data in data["jobs"]:
+                job = BatchJob.from_dict(job_data)
+                if job.status == "running":
+                    job.status = "queued"
+                self._jobs[job.job_id] = job
+        return True
+
+    def _dispatch(self):
+        while True:
+            with self._lock:
+                running = [job for job in self.jobs if job.status == "running"]
+                for job in running:
+                    self._poll(job)
+                running = [job for job in self.jobs if job.status == "running"]
+                queued = [job for job in self.jobs if job.status == "queued"]
+                used_cores = sum(job.num_cores or 1 for job in running)
+                for job in queued:
+                    num_cores = job.num_cores or 1
+                    if len(running) >= self.max_workers or (running and used_cores + num_cores > self.total_cores):
+                        break
+                    if self._launch(job):
+                        running.append(job)
+                        used_cores += num_cores
+                if not running and not any(job.status == "queued" for job in self.jobs):
+                    return
+            time.sleep(self.poll_interval)
+
+    def _launch(self, job):
+        job.attempts += 1
+        job.command = self.get_command(job)
+        job.returncode = None
+        job.start_time = time.time()
+        job.end_time = None
+        self.logger.info("Batch job {} started: {}".format(job.job_id, " ".join(job.command)))
+        try:
+            job._stdout = open(job.stdout_file, "a")
+            job._process = subprocess.Popen(
+                job.command,
+                stdout=job._stdout,
+                stderr=subprocess.STDOUT,
+                cwd=os.path.dirname(job.project_file),
+            )
+        except (IOError, OSError) as e:
+            self.logger.error("Batch job {} failed to start: {}".format(job.job_id, e))
+            if job._stdout:
+                job._stdout.close()
+                job._stdout = None
+            job.end_time = time.time()
+            job.status = "failed"
+            self.save_state()
+            return False
+        job.status = "running"
+        self.save_state()
+        return True
+
+    def _poll(self, job):
+        returncode = job._process.poll()
+        if returncode is None:
+            if job._cancel:
+                status = "cancelled"
+            elif job.timeout and time.time() - job.start_time > job.timeout:
+                status = "timeout"
+            else:
+                return
+            _kill_process_tree(job._process)
+            returncode = job._process.wait()
+        else:
+            status = "success" if returncode == 0 else "failed"
+        job.returncode = returncode
+        job.end_time = time.time()
+        job._stdout.close()
+        job._stdout = None
+        job._process = None
+        if status in ["failed", "timeout"] and job.attempts <= job.retries:
+            self.logger.warning("Batch job {} {} after {:.1f}s. Retrying.".format(job.job_id, status, job.elapsed_time))
+            job.status = "queued"
+        else:
+            self.logger.info(
+                "Batch job {} finished with status {} in {:.1f}s.".format(job.job_id, status, job.elapsed_time)
+            )
+            job.status = status
+        self.save_state()
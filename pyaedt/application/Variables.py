@@ -849,6 +849,7 @@ class VariableManager(object):
         else:
             raise Exception("Unhandled input type to the design property or project variable.")  # pragma: no cover
 
+        self._app._design_changed()
         # Get all design and project variables in lower case for a case-sensitive comparison
         var_list = self._get_var_list_from_aedt(desktop_object)
         lower_case_vars = [var_name.lower() for var_name in var_list]
@@ -1002,6 +1003,7 @@ class VariableManager(object):
         """
         desktop_object = self.aedt_object(var_name)
         var_type = "Project" if desktop_object == self._oproject else "Local"
+        self._app._design_changed()
         var_list = self._get_var_list_from_aedt(desktop_object)
         lower_case_vars = [var_name.lower() for var_name in var_list]
         if var_name.lower() in lower_case_vars:
@@ -40,6 +40,7 @@ else:
     import subprocess
 
 from pyaedt import __version__
+from pyaedt import profiling
 from pyaedt import pyaedt_function_handler
 from pyaedt import settings
 from pyaedt.generic.general_methods import _pythonver
@@ -427,6 +428,9 @@ class Desktop:
         self._logger.info("pyaedt v%s", self._main.pyaedt_version)
         if not settings.remote_api:
             self._logger.info("Python version %s", sys.version)
+        if settings.enable_profiling:
+            # Count the AEDT API calls of the profiled methods.
+            self._main.oDesktop = profiling.wrap_aedt_object(self._main.oDesktop)
         self.odesktop = self._main.oDesktop
         settings.aedt_version = self.odesktop.GetVersion()[0:6]
         settings.machine = self.machine
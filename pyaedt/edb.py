@@ -217,6 +217,7 @@ class Edb(object):
         self.simsetupdata = None
         self._setups = {}
         self._layout_instance = None
+        self._layout_generation = 0
         # time.sleep(2)
         # gc.collect()
 
@@ -235,6 +236,35 @@ class Edb(object):
 
         self.logger.info("Objects Initialized")
 
+    def _layout_changed(self):
+        """Record a change of the layout made with PyAEDT.
+
+        The generation of the layout is incremented, so that the cached nets, primitives,
+        padstack instances, and their indexes are built again on the next access.
+        """
+        self._layout_generation += 1
+
+    @pyaedt_function_handler()
+    def refresh(self):
+        """Refresh the cached layout objects.
+
+        Nets, primitives, and padstack instances are cached until the layout is changed with PyAEDT.
+        Call this method after changing the layout directly with the EDB API.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+
+        Examples
+        --------
+        >>> edb = Edb(r"C:/myproject.aedb")
+        >>> edb.active_layout.Primitives[0].Delete()
+        >>> edb.refresh()
+        """
+        self._layout_changed()
+        return True
+
     @property
     def logger(self):
         """Logger for EDB.
@@ -1279,6 +1309,7 @@ class Edb(object):
         for i in self.core_nets.nets.values():
             if i.name not in all_list:
                 i.net_object.Delete()
+        self._layout_changed()
         self.logger.info_timer("Net clean up")
         self.logger.reset_timer()
 
@@ -1305,7 +1336,6 @@ class Edb(object):
         _poly_list = convert_py_list_to_net_list([_poly])
         prims_to_delete = []
         poly_to_create = []
-        pins_to_delete = []
 
         def get_polygon_data(prim):
             return prim.primitive_object.GetPolygonData()
@@ -1354,12 +1384,12 @@ class Edb(object):
 
                 prims_to_delete.append(prim_1)
 
-        def pins_clean(pinst):
-            if not pinst.in_polygon(_poly, simple_check=True):
-                pins_to_delete.append(pinst)
-
-        with ThreadPoolExecutor(number_of_threads) as pool:
-            pool.map(lambda item: pins_clean(item), reference_pinsts)
+        pins_to_keep = self.core_padstack.get_padstack_instances_in_polygon(_poly, reference_pinsts, simple_check=True)
+        if pins_to_keep is False:
+            self.logger.error("Failed to find the padstack instances inside the extent.")
+            return False
+        pins_to_keep = set(id(pin) for pin in pins_to_keep)
+        pins_to_delete = [pin for pin in reference_pinsts if id(pin) not in pins_to_keep]
 
         for pin in pins_to_delete:
             pin.delete()
@@ -1383,6 +1413,8 @@ class Edb(object):
             if val.numpins == 0:
                 val.edbcomponent.Delete()
                 i += 1
+        if i:
+            self._layout_changed()
         self.logger.info("Deleted {} additional components".format(i))
         if remove_single_pin_components:
             self.core_components.delete_single_pin_rlc()
@@ -1519,9 +1551,10 @@ class Edb(object):
                 ]
             else:
                 pinst = [i for i in list(self.core_padstack.padstack_instances.values())]
-            for p in pinst:
-                if p.in_polygon(polygonData):
-                    pinstance_to_add.append(p)
+            pinstance_to_add = self.core_padstack.get_padstack_instances_in_polygon(polygonData, pinst)
+            if pinstance_to_add is False:
+                self.logger.error("Failed to find the padstack instances overlapping the cutout.")
+                return False
         # validate references in layout
         for _ref in self.core_nets.nets:
             if nets_to_include:
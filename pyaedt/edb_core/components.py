@@ -247,6 +247,7 @@ class Components(object):
             for l in self._active_layout.Groups
             if l.ToString() == "Ansys.Ansoft.Edb.Cell.Hierarchy.Component"
         }
+        self._pedb._layout_changed()
         return True
 
     @property
@@ -1113,6 +1114,7 @@ class Components(object):
         ):
             return False  # pragma no cover
         new_cmp.SetTransform(hosting_component_location)
+        self._pedb._layout_changed()
         return new_cmp
 
     @pyaedt_function_handler()
@@ -1169,6 +1171,7 @@ class Components(object):
         # cmp_transform = System.Activator.CreateInstance(self._edb.Utility.)
         # new_cmp.SetTransform(cmp_transform)
         self._cmp[new_cmp.GetName()] = EDBComponent(self, new_cmp)
+        self._pedb._layout_changed()
         return new_cmp
         # except:
         #    return (False, None)
@@ -1329,6 +1332,7 @@ class Components(object):
             if val.numpins < 2 and val.type in ["Resistor", "Capacitor", "Inductor"]:
                 val.edbcomponent.Delete()
                 deleted_comps.append(comp)
+        self._pedb._layout_changed()
         self.refresh_components()
         self._pedb._logger.info("Deleted {} components".format(len(deleted_comps)))
 
@@ -1359,6 +1363,7 @@ class Components(object):
         edb_cmp = self.get_component_by_name(component_name)
         if edb_cmp is not None:
             edb_cmp.Delete()
+            self._pedb._layout_changed()
             if edb_cmp in list(self.components.keys()):
                 del self.components[edb_cmp]
             return True
@@ -1397,6 +1402,7 @@ class Components(object):
             pin_pair_model.SetPinPairRlc(list(pin_pair_model.PinPairs)[0], pprlc)
             rlc_property.SetModel(pin_pair_model)
             edb_cmp.SetComponentProperty(rlc_property)
+            self._pedb._layout_changed()
             return True
         return False
 
@@ -1570,6 +1576,7 @@ class Components(object):
                 componentname,
             )
             return False
+        self._pedb._layout_changed()
         self._logger.warning("RLC properties for Component %s has been assigned.", componentname)
         return True
 
@@ -2001,11 +2008,7 @@ class Components(object):
         >>> edbapp.core_components.get_rats()
 
         """
-        df_list = []
-        for refdes in self.components.keys():
-            df = self.get_component_net_connection_info(refdes)
-            df_list.append(df)
-        return df_list
+        return self._pedb.core_nets.connectivity_graph.get_rats()
 
     def get_through_resistor_list(self, threshold=1):
         """Retrieve through resistors.
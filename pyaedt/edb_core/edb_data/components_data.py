@@ -170,7 +170,7 @@ class EDBComponent(object):
         def is_parallel(self, value):
             rlc = self._pin_pair_rlc
             rlc.IsParallel = value
-            self._set_comp_prop()  # pragma: no cover
+            self._set_comp_prop(rlc)  # pragma: no cover
 
         @property
         def _pin_pair_rlc(self):
@@ -187,7 +187,7 @@ class EDBComponent(object):
             rlc.REnabled = value[0]
             rlc.LEnabled = value[1]
             rlc.CEnabled = value[2]
-            self._set_comp_prop()  # pragma: no cover
+            self._set_comp_prop(rlc)  # pragma: no cover
 
         @property
         def resistance(self):
@@ -195,8 +195,9 @@ class EDBComponent(object):
 
         @resistance.setter
         def resistance(self, value):
-            self._pin_pair_rlc.R = value
-            self._set_comp_prop(self._pin_pair_rlc)  # pragma: no cover
+            rlc = self._pin_pair_rlc
+            rlc.R = self._edb_value(value)
+            self._set_comp_prop(rlc)  # pragma: no cover
 
         @property
         def inductance(self):
@@ -204,8 +205,9 @@ class EDBComponent(object):
 
         @inductance.setter
         def inductance(self, value):
-            self._pin_pair_rlc.L = value
-            self._set_comp_prop(self._pin_pair_rlc)  # pragma: no cover
+            rlc = self._pin_pair_rlc
+            rlc.L = self._edb_value(value)
+            self._set_comp_prop(rlc)  # pragma: no cover
 
         @property
         def capacitance(self):
@@ -213,8 +215,9 @@ class EDBComponent(object):
 
         @capacitance.setter
         def capacitance(self, value):
-            self._pin_pair_rlc.C = value
-            self._set_comp_prop(self._pin_pair_rlc)  # pragma: no cover
+            rlc = self._pin_pair_rlc
+            rlc.C = self._edb_value(value)
+            self._set_comp_prop(rlc)  # pragma: no cover
 
         @property
         def rlc_values(self):  # pragma: no cover
@@ -227,12 +230,13 @@ class EDBComponent(object):
             rlc.R = self._edb_value(values[0])
             rlc.L = self._edb_value(values[1])
             rlc.C = self._edb_value(values[2])
-            self._set_comp_prop()  # pragma: no cover
+            self._set_comp_prop(rlc)  # pragma: no cover
 
-        def _set_comp_prop(self):  # pragma: no cover
-            self._edb_model.SetPinPairRlc(self._edb_pin_pair, self._pin_pair_rlc)
+        def _set_comp_prop(self, rlc):  # pragma: no cover
+            self._edb_model.SetPinPairRlc(self._edb_pin_pair, rlc)
             self._edb_comp_prop.SetModel(self._edb_model)
             self._edb_comp.SetComponentProperty(self._edb_comp_prop)
+            self._pedb_comp._pedb._layout_changed()
 
     class _SpiceModel(object):  # pragma: no cover
         def __init__(self, edb_model):
@@ -386,6 +390,7 @@ class EDBComponent(object):
             component_property = self.component_property
             component_property.SetEnabled(enabled)
             self.edbcomponent.SetComponentProperty(component_property)
+            self._pedb._layout_changed()
 
     @property
     def model_type(self):
@@ -536,6 +541,7 @@ class EDBComponent(object):
             comp_prop = self.component_property
             comp_prop.SetModel(pin_pair_model)
             self.edbcomponent.SetComponentProperty(comp_prop)
+            self._pedb._layout_changed()
 
     @property
     def center(self):
@@ -668,6 +674,7 @@ class EDBComponent(object):
         else:
             return
         self.edbcomponent.SetComponentType(type_id)
+        self._pedb._layout_changed()
 
     @property
     def numpins(self):
@@ -778,6 +785,7 @@ class EDBComponent(object):
         if not self.edbcomponent.SetComponentProperty(comp_prop):
             logging.error("Fail to assign model on {}.".format(self.refdes))
             return False
+        self._pedb._layout_changed()
         return True
 
     @pyaedt_function_handler
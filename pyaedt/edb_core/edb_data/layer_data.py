@@ -1198,6 +1198,7 @@ class EDBLayers(object):
         if not lcNew.AddLayers(newLayers) or not self._pedbstackup._active_layout.SetLayerCollection(lcNew):
             self._logger.error("Failed to set new layers when updating the stackup information.")
             return False
+        self._pedbstackup._pedb._layout_changed()
         self._update_edb_objects()
         return True
 
@@ -1264,6 +1265,7 @@ class LayerEdbClass(object):
         layer_clone.SetName(name)
         self._pclass._set_layout_stackup(layer_clone, "change_name", self._name)
         self._name = name
+        self._pclass._pedb._layout_changed()
 
     @property
     def type(self):
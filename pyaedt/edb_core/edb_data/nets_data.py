@@ -44,6 +44,7 @@ class EDBNetsData(object):
     @name.setter
     def name(self, val):
         self.net_object.SetName(val)
+        self._app._layout_changed()
 
     @property
     def primitives(self):
@@ -102,6 +103,7 @@ class EDBNetsData(object):
     def delete(self):
         """Delete this net from layout."""
         self.net_object.Delete()
+        self._app._layout_changed()
 
     @pyaedt_function_handler()
     def plot(
@@ -1136,6 +1136,7 @@ class EDBPadstackInstance(object):
 
     @net_name.setter
     def net_name(self, val):
+        self._pedb._layout_changed()
         if not isinstance(val, str):
             try:
                 self._edb_padstackinstance.SetNet(val)
@@ -1189,6 +1190,8 @@ class EDBPadstackInstance(object):
 
     @position.setter
     def position(self, value):
+        self._pedb._layout_changed()
+        self._bounding_box = []
         pos = []
         for v in value:
             if isinstance(v, (float, int, str)):
@@ -1306,12 +1309,14 @@ class EDBPadstackInstance(object):
            Use :func:`delete` property instead.
         """
         warnings.warn("`delete_padstack_instance` is deprecated. Use `delete` instead.", DeprecationWarning)
+        self._pedb._layout_changed()
         self._edb_padstackinstance.Delete()
         return True
 
     @pyaedt_function_handler()
     def delete(self):
         """Delete this padstack instance."""
+        self._pedb._layout_changed()
         self._edb_padstackinstance.Delete()
         return True
 
@@ -273,6 +273,7 @@ class EDBPrimitives(object):
 
     @net_name.setter
     def net_name(self, val):
+        self._app._layout_changed()
         if not isinstance(val, str):
             try:
                 self.primitive_object.SetNet(val)
@@ -301,6 +302,7 @@ class EDBPrimitives(object):
 
     @layer_name.setter
     def layer_name(self, val):
+        self._app._layout_changed()
         if val in self._core_stackup.stackup_layers.layers:
             lay = self._core_stackup.stackup_layers.layers[val]._edb_layer
             self.primitive_object.SetLayer(lay)
@@ -315,6 +317,7 @@ class EDBPrimitives(object):
     @pyaedt_function_handler()
     def delete(self):
         """Delete this primtive."""
+        self._app._layout_changed()
         return self.primitive_object.Delete()
 
     @pyaedt_function_handler()
@@ -367,6 +370,7 @@ class EDBPrimitives(object):
         prim = self._app.edb.Cell.Primitive.Polygon.Create(
             self._app.active_layout, self.layer_name, self.primitive_object.GetNet(), _poly
         )
+        self._app._layout_changed()
         return self.primitive_object.AddVoid(prim)
 
     @pyaedt_function_handler()
@@ -1,3 +1,9 @@
+import math
+from array import array
+
+from pyaedt.generic.general_methods import write_csv
+
+
 class EDBStatistics(object):
     """Statistics object
 
@@ -152,3 +158,508 @@ class EDBStatistics(object):
     def num_resistors(self, value):
         if isinstance(value, int):
             self._nb_resistors = value
+
+
+class _UniformGrid(object):
+    """Uniform grid of bounding boxes.
+
+    The grid has about one cell per bounding box. A box is stored in all the cells it overlaps,
+    except the boxes overlapping more than ``max_cells`` cells, like planes, that are always checked.
+
+    Parameters
+    ----------
+    items : list
+        Positions of the bounding boxes in ``bounding_boxes``.
+    bounding_boxes : list
+        List of ``[x_min, y_min, x_max, y_max]`` bounding boxes.
+    max_cells : int, optional
+        Maximum number of cells in which a bounding box is stored. The default is ``16``.
+    """
+
+    def __init__(self, items, bounding_boxes, max_cells=16):
+        self._bounding_boxes = bounding_boxes
+        self.cells = {}
+        self.large = []
+        self.x_min = min(bounding_boxes[i][0] for i in items)
+        self.y_min = min(bounding_boxes[i][1] for i in items)
+        self.x_max = max(bounding_boxes[i][2] for i in items)
+        self.y_max = max(bounding_boxes[i][3] for i in items)
+        self.size = max(1, int(math.sqrt(len(items))))
+        self.dx = (self.x_max - self.x_min) / self.size or 1.0
+        self.dy = (self.y_max - self.y_min) / self.size or 1.0
+        for item in items:
+            i0, j0, i1, j1 = self._cell_range(bounding_boxes[item])
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > max_cells:
+                self.large.append(item)
+                continue
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    self.cells.setdefault((i, j), []).append(item)
+
+    def _cell_range(self, bounding_box):
+        last = self.size - 1
+        i0 = min(max(int((bounding_box[0] - self.x_min) / self.dx), 0), last)
+        j0 = min(max(int((bounding_box[1] - self.y_min) / self.dy), 0), last)
+        i1 = min(max(int((bounding_box[2] - self.x_min) / self.dx), 0), last)
+        j1 = min(max(int((bounding_box[3] - self.y_min) / self.dy), 0), last)
+        return i0, j0, i1, j1
+
+    def query(self, bounding_box):
+        """Get the bounding boxes overlapping a bounding box.
+
+        Parameters
+        ----------
+        bounding_box : list
+            ``[x_min, y_min, x_max, y_max]`` bounding box.
+
+        Returns
+        -------
+        set
+            Positions of the overlapping bounding boxes.
+        """
+        x0, y0, x1, y1 = bounding_box
+        candidates = set(self.large)
+        if x0 <= self.x_max and x1 >= self.x_min and y0 <= self.y_max and y1 >= self.y_min:
+            i0, j0, i1, j1 = self._cell_range(bounding_box)
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):
+                for (i, j), items in self.cells.items():
+                    if i0 <= i <= i1 and j0 <= j <= j1:
+                        candidates.update(items)
+            else:
+                for i in range(i0, i1 + 1):
+                    for j in range(j0, j1 + 1):
+                        candidates.update(self.cells.get((i, j), ()))
+        bbs = self._bounding_boxes
+        return set(i for i in candidates if bbs[i][0] <= x1 and bbs[i][2] >= x0 and bbs[i][1] <= y1 and bbs[i][3] >= y0)
+
+
+class LayoutIndex(object):
+    """Spatial and attribute index of layout objects.
+
+    The objects are grouped by net and by layer when the index is created. The bounding boxes
+    are read the first time that a spatial query is made and are stored in a uniform grid per
+    layer, so that bounding box and point queries only check the objects close to the query.
+
+    Parameters
+    ----------
+    objects : list
+        Layout objects, like :class:`pyaedt.edb_core.edb_data.primitives_data.EDBPrimitives`.
+    net_names : list
+        Net name of each object.
+    layer_names : list, optional
+        Layer name of each object. The default is ``None``, in which case the objects are not grouped by layer.
+    bounding_box_function : optional
+        Function returning the ``[x_min, y_min, x_max, y_max]`` bounding box of an object or an empty list
+        when the object has no geometry. The default is ``None``, in which case spatial queries are
+        not available.
+    """
+
+    def __init__(self, objects, net_names, layer_names=None, bounding_box_function=None):
+        self.objects = list(objects)
+        self._net_names = list(net_names)
+        self._layer_names = list(layer_names) if layer_names is not None else [None] * len(self.objects)
+        self._bounding_box_function = bounding_box_function
+        self._bounding_boxes = None
+        self._grids = None
+        self.by_net = {}
+        self.by_layer = {}
+        for i, (net_name, layer_name) in enumerate(zip(self._net_names, self._layer_names)):
+            self.by_net.setdefault(net_name, []).append(i)
+            self.by_layer.setdefault(layer_name, []).append(i)
+
+    def _build_grids(self):
+        self._bounding_boxes = [self._bounding_box_function(obj) or None for obj in self.objects]
+        self._grids = {}
+        for layer_name, items in self.by_layer.items():
+            items = [i for i in items if self._bounding_boxes[i]]
+            if items:
+                self._grids[layer_name] = _UniformGrid(items, self._bounding_boxes)
+
+    def _select(self, items, net_name=None):
+        if net_name is not None:
+            items = [i for i in items if self._net_names[i] == net_name]
+        return [self.objects[i] for i in sorted(items)]
+
+    def get_by_net(self, net_name):
+        """Get the objects of a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        list
+        """
+        return self._select(self.by_net.get(net_name, []))
+
+    def get_by_layer(self, layer_name, net_name=None):
+        """Get the objects of a layer.
+
+        Parameters
+        ----------
+        layer_name : str
+            Name of the layer.
+        net_name : str, optional
+            Name of the net of the objects. The default is ``None``, in which case all the nets are used.
+
+        Returns
+        -------
+        list
+        """
+        return self._select(self.by_layer.get(layer_name, []), net_name)
+
+    def get_in_bounding_box(self, bounding_box, layer_name=None, net_name=None):
+        """Get the objects whose bounding box overlaps a bounding box.
+
+        Parameters
+        ----------
+        bounding_box : list
+            ``[x_min, y_min, x_max, y_max]`` bounding box.
+        layer_name : str, optional
+            Name of the layer of the objects. The default is ``None``, in which case all the layers are used.
+        net_name : str, optional
+            Name of the net of the objects. The default is ``None``, in which case all the nets are used.
+
+        Returns
+        -------
+        list
+        """
+        if self._grids is None:
+            self._build_grids()
+        if layer_name is None:
+            grids = list(self._grids.values())
+        else:
+            grids = [self._grids[layer_name]] if layer_name in self._grids else []
+        items = set()
+        for grid in grids:
+            items.update(grid.query(bounding_box))
+        return self._select(items, net_name)
+
+    def get_at_point(self, point, layer_name=None, net_name=None):
+        """Get the objects whose bounding box contains a point.
+
+        Parameters
+        ----------
+        point : list
+            ``[x, y]`` coordinates.
+        layer_name : str, optional
+            Name of the layer of the objects. The default is ``None``, in which case all the layers are used.
+        net_name : str, optional
+            Name of the net of the objects. The default is ``None``, in which case all the nets are used.
+
+        Returns
+        -------
+        list
+        """
+        return self.get_in_bounding_box([point[0], point[1], point[0], point[1]], layer_name, net_name)
+
+
+class ConnectivityGraph(object):
+    """Connectivity graph of the nets and of the component pins of a layout.
+
+    The pins are stored in flat arrays, ordered by component, together with an index of the
+    pins of each net. The nets connected in DC through two-pin components are grouped with a
+    union-find, so that power tree, DC group, and rats queries do not query EDB again.
+
+    Parameters
+    ----------
+    components : list
+        List of ``(refdes, component_type, part_name, resistance, pins)`` tuples, where ``resistance``
+        is the resistance in ohms of a resistor or ``None`` and ``pins`` is a list of
+        ``(pin_name, net_name)`` tuples.
+    """
+
+    columns = ["refdes", "pin_name", "net_name", "component_type", "component_partname", "dc_group"]
+
+    def __init__(self, components):
+        self.refdes = []
+        self.component_types = []
+        self.part_names = []
+        self.resistances = []
+        self.net_names = []
+        self._net_ids = {}
+        self._component_ids = {}
+        self.pin_names = []
+        self.pin_components = array("i")
+        self.pin_nets = array("i")
+        self.component_offsets = array("i", [0])
+        for refdes, component_type, part_name, resistance, pins in components:
+            self._component_ids[refdes] = len(self.refdes)
+            self.refdes.append(refdes)
+            self.component_types.append(component_type)
+            self.part_names.append(part_name)
+            self.resistances.append(resistance)
+            for pin_name, net_name in pins:
+                self.pin_names.append(pin_name)
+                self.pin_components.append(self._component_ids[refdes])
+                self.pin_nets.append(self._get_net_id(net_name))
+            self.component_offsets.append(len(self.pin_names))
+
+        # Pins of each net, sorted with a counting sort to keep the order of the components.
+        n_nets = len(self.net_names)
+        self.net_offsets = array("i", [0] * (n_nets + 1))
+        for net_id in self.pin_nets:
+            self.net_offsets[net_id + 1] += 1
+        for i in range(n_nets):
+            self.net_offsets[i + 1] += self.net_offsets[i]
+        self.net_pins = array("i", [0] * len(self.pin_names))
+        fill = array("i", self.net_offsets[:-1])
+        for pin_id, net_id in enumerate(self.pin_nets):
+            self.net_pins[fill[net_id]] = pin_id
+            fill[net_id] += 1
+        self._dc_groups = {}
+
+    def _get_net_id(self, net_name):
+        net_id = self._net_ids.get(net_name)
+        if net_id is None:
+            net_id = self._net_ids[net_name] = len(self.net_names)
+            self.net_names.append(net_name)
+        return net_id
+
+    def _component_pins(self, component_id):
+        return range(self.component_offsets[component_id], self.component_offsets[component_id + 1])
+
+    def _net_pins(self, net_name):
+        net_id = self._net_ids.get(net_name)
+        if net_id is None:
+            return []
+        return self.net_pins[self.net_offsets[net_id] : self.net_offsets[net_id + 1]]
+
+    def get_component_nets(self, refdes):
+        """Get the nets connected to a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        list
+            Names of the nets in the order of the pins.
+        """
+        nets = []
+        if refdes in self._component_ids:
+            for pin_id in self._component_pins(self._component_ids[refdes]):
+                net_name = self.net_names[self.pin_nets[pin_id]]
+                if net_name not in nets:
+                    nets.append(net_name)
+        return nets
+
+    def get_net_components(self, net_name):
+        """Get the components connected to a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        list
+            Reference designators of the components.
+        """
+        components = []
+        for pin_id in self._net_pins(net_name):
+            refdes = self.refdes[self.pin_components[pin_id]]
+            if not components or components[-1] != refdes:
+                components.append(refdes)
+        return components
+
+    def get_dc_groups(self, ground_nets=None, res_value=0.001):
+        """Get the groups of nets connected in DC through two-pin components.
+
+        The nets are connected through inductors and through resistors whose resistance is lower than
+        or equal to ``res_value``, which includes the 0-ohm jumpers. Resistors whose resistance is
+        unknown do not connect nets.
+
+        Parameters
+        ----------
+        ground_nets : list, optional
+            Names of the ground nets. Components connected to a ground net are not used.
+            The default is ``None``.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets. The default is ``0.001``.
+            ``None`` only uses the inductors.
+
+        Returns
+        -------
+        list of set
+            Groups of nets, in the order of the components.
+        """
+        ground_nets = set(ground_nets or [])
+        key = (tuple(sorted(ground_nets)), res_value)
+        if key in self._dc_groups:
+            return [set(group) for group in self._dc_groups[key]]
+        parent = array("i", range(len(self.net_names)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        roots = []
+        for component_id, component_type in enumerate(self.component_types):
+            pins = self._component_pins(component_id)
+            if len(pins) != 2:
+                continue
+            if component_type == "Inductor":
+                pass
+            elif component_type == "Resistor" and res_value is not None:
+                resistance = self.resistances[component_id]
+                if resistance is None or resistance > res_value:
+                    continue
+            else:
+                continue
+            net_ids = [self.pin_nets[pin_id] for pin_id in pins]
+            if ground_nets.intersection(self.net_names[i] for i in net_ids):
+                continue
+            root_a, root_b = find(net_ids[0]), find(net_ids[1])
+            if root_a != root_b:
+                parent[root_b] = root_a
+            roots.extend(net_ids)
+
+        groups = {}
+        order = []
+        for net_id in roots:
+            root = find(net_id)
+            if root not in groups:
+                groups[root] = set()
+                order.append(root)
+            groups[root].add(self.net_names[net_id])
+        self._dc_groups[key] = [groups[root] for root in order]
+        return [set(group) for group in self._dc_groups[key]]
+
+    def get_dc_group(self, net_name, ground_nets=None, res_value=0.001):
+        """Get the nets connected in DC to a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+        ground_nets : list, optional
+            Names of the ground nets. The default is ``None``.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets. The default is ``0.001``.
+
+        Returns
+        -------
+        list
+            Names of the nets, including ``net_name``.
+        """
+        for group in self.get_dc_groups(ground_nets, res_value):
+            if net_name in group:
+                return list(group)
+        return [net_name]
+
+    def get_rats(self):
+        """Get the pin names and the net names of every component.
+
+        Returns
+        -------
+        list
+            List of dictionaries with the ``"refdes"``, ``"pin_name"``, and ``"net_name"`` keys.
+        """
+        rats = []
+        for component_id, refdes in enumerate(self.refdes):
+            pins = self._component_pins(component_id)
+            rats.append(
+                {
+                    "refdes": [refdes] * len(pins),
+                    "pin_name": [self.pin_names[i] for i in pins],
+                    "net_name": [self.net_names[self.pin_nets[i]] for i in pins],
+                }
+            )
+        return rats
+
+    def get_pins_on_nets(self, net_names):
+        """Get the component pins connected to nets.
+
+        Parameters
+        ----------
+        net_names : list
+            Names of the nets.
+
+        Returns
+        -------
+        list
+            List of ``[refdes, pin_name, net_name, component_type, component_partname, pin_list]`` rows,
+            where ``pin_list`` contains the names of the pins of the component on the same net.
+        """
+        rows = []
+        for net_name in net_names:
+            pins = self._net_pins(net_name)
+            component_pins = {}
+            for pin_id in pins:
+                component_pins.setdefault(self.pin_components[pin_id], []).append(self.pin_names[pin_id])
+            for pin_id in pins:
+                component_id = self.pin_components[pin_id]
+                rows.append(
+                    [
+                        self.refdes[component_id],
+                        self.pin_names[pin_id],
+                        net_name,
+                        self.component_types[component_id],
+                        self.part_names[component_id],
+                        "-".join(component_pins[component_id]),
+                    ]
+                )
+        return rows
+
+    def to_table(self, ground_nets=None, res_value=0.001):
+        """Get the connectivity as a table with one row per pin.
+
+        Parameters
+        ----------
+        ground_nets : list, optional
+            Names of the ground nets. The default is ``None``.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets. The default is ``0.001``.
+
+        Returns
+        -------
+        list
+            Rows with the values of the :attr:`columns` columns. The ``dc_group`` column contains
+            the index of the DC group of the net or ``-1``.
+        """
+        net_groups = {}
+        for index, group in enumerate(self.get_dc_groups(ground_nets, res_value)):
+            for net_name in group:
+                net_groups[net_name] = index
+        rows = []
+        for pin_id, pin_name in enumerate(self.pin_names):
+            component_id = self.pin_components[pin_id]
+            net_name = self.net_names[self.pin_nets[pin_id]]
+            rows.append(
+                [
+                    self.refdes[component_id],
+                    pin_name,
+                    net_name,
+                    self.component_types[component_id],
+                    self.part_names[component_id],
+                    net_groups.get(net_name, -1),
+                ]
+            )
+        return rows
+
+    def export_csv(self, file_path, ground_nets=None, res_value=0.001):
+        """Export the connectivity table to a CSV file.
+
+        Parameters
+        ----------
+        file_path : str
+            Full path to the CSV file.
+        ground_nets : list, optional
+            Names of the ground nets. The default is ``None``.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets. The default is ``0.001``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+        """
+        return write_csv(file_path, [self.columns] + self.to_table(ground_nets, res_value))
@@ -1463,7 +1463,7 @@ class EdbHfss(object):
                             setup_info=simulation_setup, poly=void_data
                         )
                         void.SetPolygonData(new_void_data)
-
+        self._pedb._layout_changed()
         return True
 
     @pyaedt_function_handler()
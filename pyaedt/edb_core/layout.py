@@ -5,6 +5,7 @@ import math
 
 from pyaedt.edb_core.edb_data.primitives_data import EDBPrimitives
 from pyaedt.edb_core.edb_data.utilities import EDBStatistics
+from pyaedt.edb_core.edb_data.utilities import LayoutIndex
 from pyaedt.edb_core.general import convert_py_list_to_net_list
 from pyaedt.generic.clr_module import Tuple
 from pyaedt.generic.general_methods import pyaedt_function_handler
@@ -22,6 +23,10 @@ class EdbLayout(object):
 
     def __init__(self, p_edb):
         self._pedb = p_edb
+        self._primitives = []
+        self._primitives_generation = None
+        self._index = None
+        self._index_generation = None
 
     @property
     def _edb(self):
@@ -71,16 +76,37 @@ class EdbLayout(object):
     def primitives(self):
         """Primitives.
 
+        The primitives are cached until the layout is changed with PyAEDT. Use the
+        :func:`pyaedt.Edb.refresh` method after changing the layout directly with the EDB API.
+
         Returns
         -------
         list of :class:`pyaedt.edb_core.edb_data.primitives_data.EDBPrimitives`
             List of primitives.
         """
-        _prims = []
-        if self._active_layout:
-            for lay_obj in list(self._active_layout.Primitives):
-                _prims.append(EDBPrimitives(lay_obj, self._pedb))
-        return _prims
+        if self._primitives_generation != self._pedb._layout_generation:
+            _prims = []
+            if self._active_layout:
+                for lay_obj in list(self._active_layout.Primitives):
+                    _prims.append(EDBPrimitives(lay_obj, self._pedb))
+            self._primitives = _prims
+            self._primitives_generation = self._pedb._layout_generation
+            self._index = None
+        return list(self._primitives)
+
+    @property
+    def _layout_index(self):
+        """Spatial and attribute index of the primitives, built on first use after a change of the layout."""
+        if self._index is None or self._index_generation != self._pedb._layout_generation:
+            primitives = self.primitives
+            self._index = LayoutIndex(
+                primitives,
+                [i.net_name for i in primitives],
+                [i.layer_name for i in primitives],
+                self.get_polygon_bounding_box,
+            )
+            self._index_generation = self._pedb._layout_generation
+        return self._index
 
     @property
     def polygons_by_layer(self):
@@ -107,9 +133,7 @@ class EdbLayout(object):
         """
         _prim_by_net = {}
         for net in list(self._pedb.core_nets.nets.keys()):
-            _prim_by_net[net] = [
-                EDBPrimitives(i, self._pedb) for i in self._active_layout.Primitives if i.GetNet().GetName() == net
-            ]
+            _prim_by_net[net] = self._layout_index.get_by_net(net)
         return _prim_by_net
 
     @property
@@ -124,9 +148,8 @@ class EdbLayout(object):
         _primitives_by_layer = {}
         for lay in self.layers:
             _primitives_by_layer[lay] = []
-        for i in self._active_layout.Primitives:
-            lay = i.GetLayer().GetName()
-            _primitives_by_layer[lay].append(EDBPrimitives(i, self._pedb))
+        for lay in self._layout_index.by_layer:
+            _primitives_by_layer[lay] = self._layout_index.get_by_layer(lay)
         return _primitives_by_layer
 
     @property
@@ -203,8 +226,8 @@ class EdbLayout(object):
             List of primitive objects.
         """
         objinst = []
-        for el in self.polygons:
-            if el.GetLayer().GetName() == layer_name:
+        for el in self._layout_index.get_by_layer(layer_name):
+            if el.type == "Polygon":
                 if net_list and el.GetNet().GetName() in net_list:
                     objinst.append(el)
                 else:
@@ -287,6 +310,47 @@ class EdbLayout(object):
                 continue_iterate = False
         return points
 
+    @pyaedt_function_handler()
+    def get_polygon_data_points(self, polygon_data, arc_segments=6):
+        """Retrieve the points of a polygon data with the arcs converted to segments.
+
+        Parameters
+        ----------
+        polygon_data :
+            Edb PolygonData object.
+        arc_segments : int, optional
+            Number of points generated along an arc. The default is ``6``.
+
+        Returns
+        -------
+        list
+            ``[[x1, x2, ..., xn], [y1, y2, ..., yn]]`` list of points, in the format used by
+            :func:`pyaedt.modeler.GeometryOperators.GeometryOperators.points_in_polygon`.
+
+        Examples
+        --------
+
+        >>> poly = edb_core.core_primitives.get_polygons_by_layer("GND")
+        >>> x, y = edb_core.core_primitives.get_polygon_data_points(poly[0].GetPolygonData())
+
+        """
+        edb_points = list(polygon_data.Points)
+        coordinates = [[p.X.ToDouble(), p.Y.ToDouble()] for p in edb_points]
+        x = []
+        y = []
+        for i, point in enumerate(edb_points):
+            if not point.IsArc():
+                x.append(coordinates[i][0])
+                y.append(coordinates[i][1])
+            else:
+                arc_height = point.GetArcHeight().ToDouble()
+                x_arc, y_arc = EDBPrimitives._eval_arc_points(
+                    coordinates[i - 1], coordinates[(i + 1) % len(edb_points)], arc_height, arc_segments
+                )
+                x.extend(x_arc)
+                y.extend(y_arc)
+        return [x, y]
+
     @pyaedt_function_handler()
     def parametrize_polygon(self, polygon, selection_polygon, offset_name="offsetx", origin=None):
         """Parametrize pieces of a polygon based on another polygon.
@@ -368,6 +432,7 @@ class EdbLayout(object):
             except:
                 continue_iterate = False
         polygon.SetPolygonData(poligon_data)
+        self._pedb._layout_changed()
         return True
 
     @pyaedt_function_handler()
@@ -445,6 +510,7 @@ class EdbLayout(object):
             corner_style,
             polygonData,
         )
+        self._pedb._layout_changed()
         if polygon.IsNull():
             self._logger.error("Null path created")
             return False
@@ -541,6 +607,7 @@ class EdbLayout(object):
                 return False
             polygonData.AddHole(voidPolygonData)
         polygon = self._edb.Cell.Primitive.Polygon.Create(self._active_layout, layer_name, net, polygonData)
+        self._pedb._layout_changed()
         if polygon.IsNull() or polygonData is False:
             self._logger.error("Null polygon created")
             return False
@@ -571,6 +638,7 @@ class EdbLayout(object):
             self._logger.error("Failed to create main shape polygon data")
             return False
         polygon = self._edb.Cell.Primitive.Polygon.Create(self._active_layout, layer_name, net, _poly)
+        self._pedb._layout_changed()
         if polygon.IsNull():
             self._logger.error("Null polygon created")
             return False
@@ -651,6 +719,7 @@ class EdbLayout(object):
                 self._get_edb_value(corner_radius),
                 self._get_edb_value(rotation),
             )
+        self._pedb._layout_changed()
         if rect:
             return EDBPrimitives(rect, self._pedb)
         return False  # pragma: no cover
@@ -688,6 +757,7 @@ class EdbLayout(object):
             self._get_edb_value(y),
             self._get_edb_value(radius),
         )
+        self._pedb._layout_changed()
         if circle:
             return EDBPrimitives(circle, self._pedb)
         return False  # pragma: no cover
@@ -739,7 +809,13 @@ class EdbLayout(object):
             List of filtered primitives
         """
         prims = []
-        for el in self.primitives:
+        if layer_name:
+            primitives = self._layout_index.get_by_layer(layer_name, net_name)
+        elif net_name:
+            primitives = self._layout_index.get_by_net(net_name)
+        else:
+            primitives = self._layout_index.objects
+        for el in primitives:
             if not el.type:
                 continue
             if net_name:
@@ -756,6 +832,51 @@ class EdbLayout(object):
             prims.append(el)
         return prims
 
+    @pyaedt_function_handler()
+    def get_primitives_in_bounding_box(self, bounding_box, layer_name=None, net_name=None):
+        """Get the primitives whose bounding box overlaps a bounding box.
+
+        The bounding boxes of the primitives are stored in a spatial index the first time this
+        method is called and after every change of the layout made with PyAEDT.
+
+        Parameters
+        ----------
+        bounding_box : list
+            Bounding box in the format ``[-x, -y, +x, +y]``.
+        layer_name : str, optional
+            Set filter on layer_name. Default is `None"`.
+        net_name : str, optional
+            Set filter on net_name. Default is `None"`.
+
+        Returns
+        -------
+        list of :class:`pyaedt.edb_core.edb_data.primitives_data.EDBPrimitives`
+
+        Examples
+        --------
+        >>> prims = edb_core.core_primitives.get_primitives_in_bounding_box([0, 0, 1e-3, 1e-3], layer_name="TOP")
+        """
+        return self._layout_index.get_in_bounding_box(bounding_box, layer_name, net_name)
+
+    @pyaedt_function_handler()
+    def get_primitives_at_point(self, point, layer_name=None, net_name=None):
+        """Get the primitives whose bounding box contains a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        layer_name : str, optional
+            Set filter on layer_name. Default is `None"`.
+        net_name : str, optional
+            Set filter on net_name. Default is `None"`.
+
+        Returns
+        -------
+        list of :class:`pyaedt.edb_core.edb_data.primitives_data.EDBPrimitives`
+        """
+        return self._layout_index.get_at_point(point, layer_name, net_name)
+
     @pyaedt_function_handler()
     def fix_circle_void_for_clipping(self):
         """Fix issues when circle void are clipped due to a bug in EDB.
@@ -786,6 +907,7 @@ class EdbLayout(object):
             if res:
                 cloned_circle.SetIsNegative(True)
                 void_circle.Delete()
+        self._pedb._layout_changed()
         return True
 
     @pyaedt_function_handler()
@@ -809,6 +931,7 @@ class EdbLayout(object):
                 flag = shape.AddVoid(void.primitive_object)
             else:
                 flag = shape.AddVoid(void)
+            self._pedb._layout_changed()
             if not flag:
                 return flag
         return True
@@ -1056,6 +1179,7 @@ class EdbLayout(object):
                                 parameter_name, variable_value, is_parameter=True
                             )
                         p.SetWidth(self._pedb.edb_value(parameter_name))
+        self._pedb._layout_changed()
         return True
 
     @pyaedt_function_handler()
@@ -1118,6 +1242,7 @@ class EdbLayout(object):
                                     list_to_delete.pop(id)
 
                 [i.Delete() for i in list_to_delete]
+                self._pedb._layout_changed()
 
         if delete_padstack_gemometries:
             self._logger.info("Deleting Padstack Definitions")
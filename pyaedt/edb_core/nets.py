@@ -4,8 +4,10 @@ import math
 import os
 import time
 
+from pyaedt.edb_core.components import resistor_value_parser
 from pyaedt.edb_core.edb_data.nets_data import EDBNetsData
 from pyaedt.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+from pyaedt.edb_core.edb_data.utilities import ConnectivityGraph
 from pyaedt.edb_core.general import convert_py_list_to_net_list
 from pyaedt.generic.constants import CSS4_COLORS
 from pyaedt.generic.general_methods import generate_unique_name
@@ -27,6 +29,10 @@ class EdbNets(object):
 
     def __init__(self, p_edb):
         self._pedb = p_edb
+        self._nets = {}
+        self._nets_generation = None
+        self._connectivity_graph = None
+        self._connectivity_generation = None
 
     @property
     def _builder(self):
@@ -62,15 +68,21 @@ class EdbNets(object):
     def nets(self):
         """Nets.
 
+        The nets are cached until the layout is changed with PyAEDT. Use the
+        :func:`pyaedt.Edb.refresh` method after changing the layout directly with the EDB API.
+
         Returns
         -------
         dict[str, :class:`pyaedt.edb_core.edb_data.nets_data.EDBNetsData`]
             Dictionary of nets.
         """
-        nets = {}
-        for net in self._active_layout.Nets:
-            nets[net.GetName()] = EDBNetsData(net, self._pedb)
-        return nets
+        if self._nets_generation != self._pedb._layout_generation:
+            nets = {}
+            for net in self._active_layout.Nets:
+                nets[net.GetName()] = EDBNetsData(net, self._pedb)
+            self._nets = nets
+            self._nets_generation = self._pedb._layout_generation
+        return dict(self._nets)
 
     @property
     def signal_nets(self):
@@ -660,100 +672,101 @@ class EdbNets(object):
                 return True
         return False
 
-    @pyaedt_function_handler()
-    def get_dcconnected_net_list(self, ground_nets=["GND"]):
-        """Retrieve the nets connected to DC through inductors.
+    @staticmethod
+    def _get_resistance(comp_obj):
+        """Get the resistance in ohms of a resistor.
+
+        Returns ``None`` when the resistance is unknown, for example when the model of the resistor
+        has no pin pair or its resistance is not enabled, so that the resistor does not connect nets.
+        """
+        try:
+            model = comp_obj.edbcomponent.GetComponentProperty().GetModel().Clone()
+            pinpairs = list(model.PinPairs)
+            if not pinpairs:
+                return None
+            rlc = model.GetPinPairRlc(pinpairs[0])
+            if not rlc.REnabled:
+                return None
+            return resistor_value_parser(rlc.R.ToString())
+        except Exception:
+            return None
 
-        .. note::
-           Only inductors are considered.
+    @property
+    def connectivity_graph(self):
+        """Connectivity graph of the nets and of the component pins.
+
+        The graph is built once with a single pass on the components and their pins and is reused
+        until the layout is changed with PyAEDT.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.edb_data.utilities.ConnectivityGraph`
+
+        Examples
+        --------
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> graph = edbapp.core_nets.connectivity_graph
+        >>> graph.get_dc_groups(["GND"])
+        >>> graph.export_csv("C:/temp/connectivity.csv", ["GND"])
+        """
+        if self._connectivity_graph is None or self._connectivity_generation != self._pedb._layout_generation:
+            components = []
+            for refdes, comp_obj in self._pedb.core_components.components.items():
+                comp_type = comp_obj.type
+                resistance = None
+                if comp_type == "Resistor":
+                    resistance = self._get_resistance(comp_obj)
+                pins = [
+                    (pin.GetName(), pin.GetNet().GetName()) for pin in comp_obj.pinlist if pin.GetName() is not None
+                ]
+                components.append((refdes, comp_type, comp_obj.partname, resistance, pins))
+            self._connectivity_graph = ConnectivityGraph(components)
+            self._connectivity_generation = self._pedb._layout_generation
+        return self._connectivity_graph
+
+    @pyaedt_function_handler()
+    def get_dcconnected_net_list(self, ground_nets=["GND"], res_value=0.001):
+        """Retrieve the nets connected to DC through inductors and low value resistors.
 
         Parameters
         ----------
         ground_nets : list, optional
             List of ground nets. The default is ``["GND"]``.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets, which includes
+            the 0-ohm jumpers. The default is ``0.001``. ``None`` only uses the inductors.
 
         Returns
         -------
         list
-            List of nets connected to DC through inductors.
+            List of nets connected to DC through inductors and low value resistors.
         """
-        temp_list = []
-        for refdes, comp_obj in self._pedb.core_components.inductors.items():
-
-            numpins = comp_obj.numpins
-
-            if numpins == 2:
-                nets = comp_obj.nets
-                if not set(nets).intersection(set(ground_nets)):
-                    temp_list.append(set(nets))
-                else:
-                    pass
-
-        dcconnected_net_list = []
-
-        while not not temp_list:
-            s = temp_list.pop(0)
-            interseciton_flag = False
-            for i in temp_list:
-                if not not s.intersection(i):
-                    i.update(s)
-                    interseciton_flag = True
-
-            if not interseciton_flag:
-                dcconnected_net_list.append(s)
-
-        return dcconnected_net_list
+        return self.connectivity_graph.get_dc_groups(ground_nets, res_value)
 
     @pyaedt_function_handler()
-    def get_powertree(self, power_net_name, ground_nets):
+    def get_powertree(self, power_net_name, ground_nets, res_value=0.001):
         """Retrieve the power tree.
 
         Parameters
         ----------
         power_net_name : str
             Name of the power net.
-        ground_nets :
-
+        ground_nets : list
+            List of ground nets.
+        res_value : float, optional
+            Maximum resistance in ohms of the resistors connecting two nets of the power tree.
+            The default is ``0.001``.
 
         Returns
         -------
-
+        tuple
+            List of ``[refdes, pin_name, net_name, component_type, component_partname, pin_list]`` rows,
+            list of the column names, and list of the nets of the power tree.
         """
-        flag_in_ng = False
-        net_group = []
-        for ng in self.get_dcconnected_net_list(ground_nets):
-            if power_net_name in ng:
-                flag_in_ng = True
-                net_group.extend(ng)
-                break
-
-        if not flag_in_ng:
-            net_group.append(power_net_name)
-
-        component_list = []
-        rats = self._pedb.core_components.get_rats()
-        for net in net_group:
-            for el in rats:
-                if net in el["net_name"]:
-                    i = 0
-                    for n in el["net_name"]:
-                        if n == net:
-                            df = [el["refdes"][i], el["pin_name"][i], net]
-                            component_list.append(df)
-                        i += 1
-
-        component_type = []
-        for el in component_list:
-            refdes = el[0]
-            comp_type = self._pedb.core_components._cmp[refdes].type
-            component_type.append(comp_type)
-            el.append(comp_type)
-
-            comp_partname = self._pedb.core_components._cmp[refdes].partname
-            el.append(comp_partname)
-            pins = self._pedb.core_components.get_pin_from_component(component=refdes, netName=el[2])
-            el.append("-".join([i.GetName() for i in pins]))
-
+        graph = self.connectivity_graph
+        net_group = graph.get_dc_group(power_net_name, ground_nets, res_value)
+        component_list = graph.get_pins_on_nets(net_group)
         component_list_columns = [
             "refdes",
             "pin_name",
@@ -802,6 +815,7 @@ class EdbNets(object):
             if i.name in netlist:
                 i.net_object.Delete()
                 nets_deleted.append(i.name)
+        self._pedb._layout_changed()
         return nets_deleted
 
     @pyaedt_function_handler()
@@ -830,12 +844,14 @@ class EdbNets(object):
         if not net_name and not start_with and not contain and not end_with:
             net_name = generate_unique_name("NET_")
             net = self._edb.Cell.Net.Create(self._active_layout, net_name)
+            self._pedb._layout_changed()
             return net
         else:
             if not start_with and not contain and not end_with:
                 net = self._edb.Cell.Net.FindByName(self._active_layout, net_name)
                 if net.IsNull():
                     net = self._edb.Cell.Net.Create(self._active_layout, net_name)
+                    self._pedb._layout_changed()
                 return net
             elif start_with:
                 nets_found = [
@@ -1046,4 +1062,5 @@ class EdbNets(object):
                 for init_poly in list(list(connected_polygons)):
                     for _pp in list(init_poly):
                         _pp.Obj.Delete()
+        self._pedb._layout_changed()
         return returned_poly
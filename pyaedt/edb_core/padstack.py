@@ -5,10 +5,13 @@ import math
 
 from pyaedt.edb_core.edb_data.padstacks_data import EDBPadstack
 from pyaedt.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+from pyaedt.edb_core.edb_data.utilities import LayoutIndex
 from pyaedt.edb_core.general import convert_py_list_to_net_list
 from pyaedt.generic.clr_module import Array
 from pyaedt.generic.general_methods import generate_unique_name
+from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.modeler.GeometryOperators import GeometryOperators
 
 
 class EdbPadstacks(object):
@@ -23,6 +26,10 @@ class EdbPadstacks(object):
 
     def __init__(self, p_edb):
         self._pedb = p_edb
+        self._padstack_instances = {}
+        self._padstack_instances_generation = None
+        self._index = None
+        self._index_generation = None
 
     @property
     def _builder(self):
@@ -147,17 +154,43 @@ class EdbPadstacks(object):
     def padstack_instances(self):
         """List of padstack instances.
 
+        The padstack instances are cached until the layout is changed with PyAEDT. Use the
+        :func:`pyaedt.Edb.refresh` method after changing the layout directly with the EDB API.
+
         Returns
         -------
         dict[str, :class:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance`]
             List of padstack instances.
 
         """
-        padstack_instances = {}
-        edb_padstack_inst_list = list(self._active_layout.PadstackInstances)
-        for edb_padstack_instance in edb_padstack_inst_list:
-            padstack_instances[edb_padstack_instance.GetId()] = EDBPadstackInstance(edb_padstack_instance, self._pedb)
-        return padstack_instances
+        if self._padstack_instances_generation != self._pedb._layout_generation:
+            padstack_instances = {}
+            edb_padstack_inst_list = list(self._active_layout.PadstackInstances)
+            for edb_padstack_instance in edb_padstack_inst_list:
+                padstack_instances[edb_padstack_instance.GetId()] = EDBPadstackInstance(
+                    edb_padstack_instance, self._pedb
+                )
+            self._padstack_instances = padstack_instances
+            self._padstack_instances_generation = self._pedb._layout_generation
+            self._index = None
+        return dict(self._padstack_instances)
+
+    @property
+    def _layout_index(self):
+        """Spatial and attribute index of the padstack instances, built on first use after a change of the layout."""
+        if self._index is None or self._index_generation != self._pedb._layout_generation:
+            instances = list(self.padstack_instances.values())
+            self._index = LayoutIndex(instances, [i.net_name for i in instances], None, self._get_bounding_box)
+            self._index_generation = self._pedb._layout_generation
+        return self._index
+
+    @staticmethod
+    def _get_bounding_box(padstack_instance):
+        try:
+            bounding_box = padstack_instance.bounding_box
+            return [bounding_box[0][0], bounding_box[0][1], bounding_box[1][0], bounding_box[1][1]]
+        except:
+            return []
 
     @property
     def pingroups(self):
@@ -804,6 +837,7 @@ class EdbPadstacks(object):
                 None,
             )
             padstack_instance.SetIsLayoutPin(is_pin)
+            self._pedb._layout_changed()
             py_padstack_instance = EDBPadstackInstance(padstack_instance, self._pedb)
 
             return py_padstack_instance
@@ -958,7 +992,109 @@ class EdbPadstacks(object):
         list of Edb.Cell.Primitive.PadstackInstance
         """
         padstack_instances = {}
-        for inst_id, inst in self.padstack_instances.items():
-            if inst.net_name == net_name:
-                padstack_instances[inst_id] = inst
+        for inst in self._layout_index.get_by_net(net_name):
+            padstack_instances[inst.id] = inst
         return padstack_instances
+
+    @pyaedt_function_handler()
+    def get_padstack_instances_in_polygon(
+        self, polygon_data, padstack_instances=None, include_partial=True, simple_check=False
+    ):
+        """Get the padstack instances inside a polygon.
+
+        This is the batched version of
+        :func:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance.in_polygon`. The positions or the
+        bounding boxes of all the instances are read once and classified together with NumPy, with
+        the arcs and the holes of the polygon taken into account.
+
+        Parameters
+        ----------
+        polygon_data :
+            Edb PolygonData object.
+        padstack_instances : list, optional
+            List of :class:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance` to check.
+            The default is ``None``, in which case the padstack instances overlapping the bounding box
+            of the polygon are checked.
+        include_partial : bool, optional
+            Whether to include partial intersecting instances. The default is ``True``.
+        simple_check : bool, optional
+            Whether to check the position of the instances only instead of their bounding box.
+            The default is ``False``.
+
+        Returns
+        -------
+        list of :class:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance`
+        """
+        if padstack_instances is None:
+            bounding_box = polygon_data.GetBBox()
+            padstack_instances = self.get_padstack_instances_in_bounding_box(
+                [
+                    bounding_box.Item1.X.ToDouble(),
+                    bounding_box.Item1.Y.ToDouble(),
+                    bounding_box.Item2.X.ToDouble(),
+                    bounding_box.Item2.Y.ToDouble(),
+                ]
+            )
+        if not padstack_instances:
+            return []
+        if is_ironpython:
+            return [inst for inst in padstack_instances if inst.in_polygon(polygon_data, include_partial, simple_check)]
+        layout = self._pedb.core_primitives
+        outline = layout.get_polygon_data_points(polygon_data)
+        holes = [layout.get_polygon_data_points(hole) for hole in list(polygon_data.Holes)]
+        if simple_check:
+            positions = [inst.position for inst in padstack_instances]
+            inside = GeometryOperators.points_in_polygon(positions, outline) >= 0
+            for hole in holes:
+                inside &= GeometryOperators.points_in_polygon(positions, hole) <= 0
+            return [inst for inst, flag in zip(padstack_instances, inside) if flag]
+        bounding_boxes = [inst.bounding_box for inst in padstack_instances]
+        # Intersection type:
+        # 0 = objects do not intersect
+        # 1 = polygon fully inside the bounding box
+        # 2 = bounding box fully inside the polygon
+        # 3 = common contour points
+        int_val = GeometryOperators.bounding_boxes_in_polygon(bounding_boxes, outline)
+        for hole in holes:
+            hole_val = GeometryOperators.bounding_boxes_in_polygon(bounding_boxes, hole)
+            int_val[(int_val == 2) & (hole_val != 0)] = 3
+            int_val[hole_val == 2] = 0
+        inside = int_val != 0 if include_partial else (int_val == 1) | (int_val == 2)
+        return [inst for inst, flag in zip(padstack_instances, inside) if flag]
+
+    @pyaedt_function_handler()
+    def get_padstack_instances_in_bounding_box(self, bounding_box, net_name=None):
+        """Get the padstack instances whose bounding box overlaps a bounding box.
+
+        The bounding boxes of the padstack instances are stored in a spatial index the first time
+        this method is called and after every change of the layout made with PyAEDT.
+
+        Parameters
+        ----------
+        bounding_box : list
+            Bounding box in the format ``[-x, -y, +x, +y]``.
+        net_name : str, optional
+            The net name to be used for filtering padstack instances. The default is ``None``.
+
+        Returns
+        -------
+        list of :class:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance`
+        """
+        return self._layout_index.get_in_bounding_box(bounding_box, net_name=net_name)
+
+    @pyaedt_function_handler()
+    def get_padstack_instances_at_point(self, point, net_name=None):
+        """Get the padstack instances whose bounding box contains a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        net_name : str, optional
+            The net name to be used for filtering padstack instances. The default is ``None``.
+
+        Returns
+        -------
+        list of :class:`pyaedt.edb_core.edb_data.padstacks_data.EDBPadstackInstance`
+        """
+        return self._layout_index.get_at_point(point, net_name=net_name)
@@ -14,6 +14,7 @@ from collections import OrderedDict
 
 from pyaedt.edb_core.edb_data.layer_data import EDBLayers
 from pyaedt.edb_core.general import convert_py_list_to_net_list
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import pyaedt_function_handler
 
@@ -21,11 +22,13 @@ pd = None
 if not is_ironpython:
     try:
         import numpy as np
-        import pandas as pd
     except ImportError:
         warnings.warn(
-            "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
+            "The NumPy module is required to run some functionalities.\n" "Install with \n\npip install numpy\n"
         )
+    pd = LazyModule(
+        "pandas", "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
+    )
 
 
 logger = logging.getLogger(__name__)
@@ -143,6 +146,7 @@ class LayerEdbClass(object):
         layer_clone.SetName(name)
         self._pclass._set_layout_stackup(layer_clone, "change_name", self._name)
         self._name = name
+        self._pclass._pedb._layout_changed()
 
     @property
     def type(self):
@@ -1020,7 +1024,9 @@ class Stackup(object):
         for lyr in self._edb_layer_list:
             if not (lyr.GetName() == name):
                 new_layer_collection.AddLayerBottom(lyr)
-        return self._pedb._active_layout.SetLayerCollection(new_layer_collection)
+        result = self._pedb._active_layout.SetLayerCollection(new_layer_collection)
+        self._pedb._layout_changed()
+        return result
 
     @pyaedt_function_handler
     def import_stackup(self, fpath):
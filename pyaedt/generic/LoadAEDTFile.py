@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import os.path
+import pickle
 import re
+import threading
+from collections import OrderedDict
 
+from pyaedt.generic.general_methods import _check_cache_directory
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import settings
 
@@ -9,13 +14,20 @@ from pyaedt.generic.general_methods import settings
 # public interface
 
 
-def load_entire_aedt_file(filename):
+def load_entire_aedt_file(filename, use_cache=False, incremental=False):
     """Load the entire AEDT file and return the dictionary
 
     Parameters
     ----------
     filename :
         AEDT filename with path
+    use_cache : bool, optional
+        Whether to use the on-disk cache of decoded files when it is enabled
+        with ``settings.enable_aedt_file_cache``. The default is ``False``.
+    incremental : bool, optional
+        Whether to decode only the second-level blocks, such as the designs, that changed
+        since the previous incremental load of the same file and to reuse the others.
+        The default is ``False``.
 
     Returns
     -------
@@ -23,7 +35,20 @@ def load_entire_aedt_file(filename):
         dictionary containing the decoded AEDT file
 
     """
-    return _load_entire_aedt_file(os.path.normpath(filename))
+    filename = os.path.normpath(filename)
+    use_cache = use_cache and settings.enable_aedt_file_cache
+    if use_cache:
+        main_dict = _read_file_cache(filename)
+        if main_dict is not None:
+            return main_dict
+    main_dict = None
+    if incremental:
+        main_dict = _load_aedt_file_incremental(filename)
+    if main_dict is None:
+        main_dict = _load_entire_aedt_file(filename)
+    if use_cache:
+        _write_file_cache(filename, main_dict)
+    return main_dict
 
 
 def load_keyword_in_aedt_file(filename, keyword):
@@ -45,6 +70,135 @@ def load_keyword_in_aedt_file(filename, keyword):
     return _load_keyword_in_aedt_file(filename, keyword)
 
 
+def clear_aedt_file_cache():
+    """Remove all the files of the on-disk cache of decoded AEDT files.
+
+    Returns
+    -------
+    bool
+        ``True`` when successful, ``False`` when failed.
+    """
+    cache_dir = settings.aedt_file_cache_path
+    if not os.path.isdir(cache_dir):
+        return True
+    for cache_file in os.listdir(cache_dir):
+        if cache_file.endswith(_cache_extension):
+            try:
+                os.remove(os.path.join(cache_dir, cache_file))
+            except OSError:
+                return False
+    return True
+
+
+class AedtFileView(object):
+    """Lazy dictionary-like view of an AEDT file.
+
+    The top-level and second-level blocks are located with the block index of the file,
+    which is built once and shared with ``load_keyword_in_aedt_file``. A block is read
+    and decoded only the first time it is accessed.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+
+    Examples
+    --------
+    >>> from pyaedt.generic.LoadAEDTFile import AedtFileView
+    >>> project = AedtFileView("C:/Projects/project.aedt")
+    >>> design_info = project["ProjectPreview"]["DesignInfo"]
+
+    """
+
+    def __init__(self, filename):
+        self.filename = os.path.normpath(filename)
+        self._index = _get_file_index(self.filename)
+        if self._index is None:
+            self._data = load_entire_aedt_file(self.filename)
+            self._names = list(self._data.keys())
+        else:
+            self._data = {}
+            self._names = _unique_names(self._index, self._index.children.get(-1, []))
+
+    def __repr__(self):
+        return "AedtFileView({})".format(self.filename)
+
+    def __getitem__(self, key):
+        if key not in self._data:
+            if key not in self._names:
+                raise KeyError(key)
+            blocks = [i for i in self._index.children[-1] if self._index.blocks[i][0] == key]
+            if len(blocks) == 1 and _is_lazy_block(self._index, blocks[0]):
+                self._data[key] = _AedtBlockView(self.filename, self._index, blocks[0])
+            else:
+                self._data[key] = _load_blocks(self.filename, self._index, blocks)[key]
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def keys(self):
+        """Names of the top-level blocks.
+
+        Returns
+        -------
+        list
+        """
+        return list(self._names)
+
+    def values(self):
+        """Top-level blocks.
+
+        Returns
+        -------
+        list
+        """
+        return [self[k] for k in self._names]
+
+    def items(self):
+        """Names and values of the top-level blocks.
+
+        Returns
+        -------
+        list
+        """
+        return [(k, self[k]) for k in self._names]
+
+    def get(self, key, default=None):
+        """Get a top-level block.
+
+        Parameters
+        ----------
+        key : str
+            Name of the block.
+        default : optional
+            Value returned when the block does not exist. The default is ``None``.
+
+        Returns
+        -------
+        dict-like or list
+        """
+        if key in self._names:
+            return self[key]
+        return default
+
+    def to_dict(self):
+        """Decode the entire file.
+
+        Returns
+        -------
+        dict
+            Same dictionary as ``load_entire_aedt_file``.
+        """
+        return {k: _to_dict(v) for k, v in self.items()}
+
+
 # --------------------------------------------------------------------
 # internals
 
@@ -60,16 +214,33 @@ _key_parse = re.compile(r"(^'(?P<KEY1>.+?)')(?<=')=(?P<VAL1>.+$)|(?P<KEY2>^.+?)=
 _value_parse1 = re.compile(r"\s")
 _value_parse2 = re.compile(r"^'([^']*\s[^']*)(?=')")
 _begin_search = re.compile(r"\$begin '(.+)'")
+_binary_header = re.compile(b"^[ \\t]*BIN(\\d{12})\\r?$", re.M)
+
+_block_marker = re.compile(b"^[ \\t]*\\$(begin|end) '([^\\r\\n]+)'\\r?$", re.M)
+_block_marker_after_binary = re.compile(b"\\$(begin|end) '([^\\r\\n]+)'\\r?$", re.M)
+
+# size of the chunks read from the file
+_chunk_size = 4 * 1024 * 1024
+
+# extension of the files of the on-disk cache
+_cache_extension = ".aedtcache"
+
+# block indexes of the last files read, with their modification time and size
+_file_indexes = OrderedDict()
+_file_indexes_lock = threading.Lock()
+_file_indexes_max_size = 128
+
+# decoded second-level blocks of the last files loaded incrementally, by content, with the size
+# of their text in the file. The states are bounded by the total size of the text of their blocks
+_incremental_states = OrderedDict()
+_incremental_states_lock = threading.Lock()
+_incremental_states_max_size = 16
+_incremental_states_max_bytes = 256 * 1024 * 1024
 
 # set recognized keywords
 _recognized_keywords = ["CurvesInfo", "Sweep Operations"]
 _recognized_subkeys = ["simple("]
 
-# global variables
-_all_lines = []
-_len_all_lines = 0
-_count = 0
-
 
 def _parse_value(v):
     """
@@ -196,43 +367,6 @@ def _decode_value_and_save(k, v, d):
             d[k] = _parse_value(v)
 
 
-def _decode_recognized_key(keyword, line, d):
-    """Special decodings for keys belonging to  _recognized_keywords
-
-    Parameters
-    ----------
-    keyword : str
-        dictionary key recognized
-
-    line : str
-        Line.
-
-    d : dict
-        Active dictionary.
-
-    -------
-
-    """
-    if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
-        m = re.search(r"\'(\d+)\'\((.*)\)$", line)
-        if m:
-            k = m.group(1)
-            v = m.group(2)
-            v2 = v.replace("\\'", '"')
-            v3 = _separate_list_elements(v2)
-            d[k] = v3
-    elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
-        d["add"] = []
-        global _count
-        line = _all_lines[_count + 1]
-        while line.startswith("add("):
-            d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
-            _count += 1
-            line = _all_lines[_count + 1]
-    else:  # pragma: no cover
-        raise AttributeError("Keyword {} is supposed to be in the recognized_keywords list".format(keyword))
-
-
 def _decode_key(line, d):
     """
 
@@ -283,88 +417,306 @@ def _decode_key(line, d):
         _decode_value_and_save(key, value, d)
 
 
-def _walk_through_structure(keyword, save_dict):
-    """
+def _decode_lines(raw):
+    """Decode a block of raw bytes into ASCII lines.
 
     Parameters
     ----------
-    keyword :
+    raw : bytes
+        Raw content made of entire lines.
 
-    save_dict :
+    Returns
+    -------
+    tuple
+        List of lines stripped on the left and ``True`` if the lines must be split again
+        on the line boundaries that only exist in decoded strings.
+    """
+    try:
+        lines = raw.decode("utf-8").splitlines()
+        # decoded strings are also split on unicode line breaks
+        if len(lines) == len(raw.splitlines()):
+            return [line.lstrip(" \t") for line in lines], False
+    except UnicodeDecodeError:
+        pass
+    # some lines are binary or contain unicode line breaks: decode them one by one
+    lines = []
+    for raw_line in raw.splitlines():
+        try:
+            lines.append(raw_line.decode("utf-8").lstrip(" \t"))
+        except UnicodeDecodeError:
+            continue
+    return lines, True
 
 
+def _merge_continued_lines(lines, pending):
+    """Merge the lines ending with ``\\`` with the following line.
+
+    Parameters
+    ----------
+    lines : list
+        Lines to merge.
+    pending : str
+        Continued line left over from the previous block of lines.
+
     Returns
     -------
-
+    tuple
+        Merged lines and the continued line left over at the end of ``lines``.
     """
-    global _count
-    begin_key = "$begin '{}'".format(keyword)
-    end_key = "$end '{}'".format(keyword)
-    found = False
-    saved_value = None
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        # begin_key is found
-        if begin_key == line:
-            found = True
-            saved_value = save_dict.get(keyword)  # if the keyword is already present
-            # makes the value a list, if it's not already
-            if saved_value and type(saved_value) is not list:
-                saved_value = [saved_value]
-            save_dict[keyword] = {}
-            _count += 1
-            continue
-        # end_key is found
-        if end_key == line:
-            break
-        # between begin_key and end_key
-        if found:
-            b = _begin_search.search(line)
-            if b:  # walk down a level
-                nextlvl_begin_key = b.group(1)
-                _walk_through_structure(nextlvl_begin_key, save_dict[keyword])
-            elif keyword in _recognized_keywords:
-                _decode_recognized_key(keyword, line, save_dict[keyword])
-            else:  # decode key
-                _decode_key(line, save_dict[keyword])
-        _count += 1
-    # recompose value if list
-    if saved_value:
-        saved_value.append(save_dict[keyword])
-        save_dict[keyword] = saved_value
-    return _count
+    merged = []
+    for line in lines:
+        if line.endswith("\\"):
+            pending += line[:-1]
+        elif pending:
+            merged.append(pending + line)
+            pending = ""
+        else:
+            merged.append(line)
+    return merged, pending
 
 
-def _read_aedt_file(filename):
-    """Read the entire AEDT file discard binary and put ascii line in a list
+def _read_aedt_lines(aedt_fh, chunk_size=_chunk_size):
+    """Read an opened AEDT file by chunks and yield its ASCII lines.
+
+    Binary blocks declared with a ``BINxxxxxxxxxxxx`` header are skipped without being decoded.
+    Any other line that cannot be decoded is discarded.
 
     Parameters
     ----------
-    filename :
-        AEDT filename with path
+    aedt_fh :
+        AEDT file handle opened in binary mode.
+    chunk_size : int, optional
+        Number of bytes read at a time.
 
     Returns
     -------
+    generator
+        Lists of ASCII lines of the AEDT file.
+    """
+    pending = ""
+    rest = b""
+    previous = []
+    while True:
+        data = aedt_fh.read(chunk_size)
+        if data:
+            data = rest + data
+            cut = data.rfind(b"\n") + 1
+            if not cut:
+                rest = data
+                continue
+            data, rest = data[:cut], data[cut:]
+        elif rest:
+            data, rest = rest, b""
+        else:
+            break
+        pos = 0
+        while pos < len(data):
+            m = _binary_header.search(data, pos)
+            end = m.end() if m else len(data)
+            raw = data[pos:end]
+            lines, split_again = _decode_lines(raw)
+            if pending or split_again or b"\\\n" in raw or b"\\\r" in raw:
+                lines, pending = _merge_continued_lines(lines, pending)
+            if split_again:
+                lines = [split_line for line in lines for split_line in (line + "\n").splitlines()]
+            if lines:
+                # the last block is held back until the end of the file is reached
+                if previous:
+                    yield previous
+                previous = lines
+            if not m:
+                break
+            # jump over the end of line of the header and the binary content
+            pos = end + 1 + int(m.group(1))
+            if pos > len(data):
+                overflow = pos - len(data)
+                if overflow > len(rest):
+                    aedt_fh.seek(overflow - len(rest), 1)
+                rest = rest[overflow:]
+    if pending:
+        previous.append(pending + "\\")
+    elif previous and not previous[-1]:
+        # like str.splitlines, an empty last line is not a line
+        previous.pop()
+    if previous:
+        yield previous
+
+
+class _AedtFileParser(object):
+    """Streaming parser of an AEDT file.
+
+    The parser reads the file in a single pass and keeps its position in the instance,
+    so that several files can be loaded at the same time from different threads.
 
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
     """
-    global _all_lines
-    global _len_all_lines
-    global _count
 
-    # read the AEDT file
-    with open_file(filename, "rb") as aedt_fh:
-        raw_lines = aedt_fh.read().splitlines()
-    ascii_lines = []
-    for raw_line in raw_lines:
-        try:
-            ascii_lines.append(raw_line.decode("utf-8").lstrip(" \t"))
-        except UnicodeDecodeError:
-            continue
-    ascii_content = "\n".join(ascii_lines)
-    # combine subsequent lines when the line ends in \
-    _all_lines = ascii_content.replace("\\\n", "").splitlines()
-    _len_all_lines = len(_all_lines)
-    _count = 0
+    def __init__(self, filename):
+        self.filename = filename
+        self._blocks = None
+        self._block = []
+        self._index = 0
+        self._line = None
+
+    def load_entire_file(self):
+        """Load the entire AEDT file.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded AEDT file.
+        """
+        main_dict = {}
+        with open_file(self.filename, "rb") as aedt_fh:
+            self._start(aedt_fh)
+            while self._line is not None:
+                m = _begin_search.search(self._line)
+                if m:
+                    self._walk_through_structure(m.group(1), main_dict)
+                self._advance()
+        return main_dict
+
+    def load_keyword(self, keyword, offset=0, size=None, save_dict=None):
+        """Load the first block of the AEDT file matching a keyword.
+
+        Parameters
+        ----------
+        keyword : str
+            Keyword to search and load.
+        offset : int, optional
+            Position in bytes where the search starts. The default is ``0``.
+        size : int, optional
+            Expected size in bytes of the block, used to limit the amount of data read.
+            The default is ``None``.
+        save_dict : dict, optional
+            Dictionary where the block is added. The default is ``None``, in which
+            case a new dictionary is created.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded keyword.
+        """
+        main_dict = {} if save_dict is None else save_dict
+        with open_file(self.filename, "rb") as aedt_fh:
+            if offset:
+                aedt_fh.seek(offset)
+            self._start(aedt_fh, min(size, _chunk_size) if size else _chunk_size)
+            self._walk_through_structure(keyword, main_dict)
+        return main_dict
+
+    def _start(self, aedt_fh, chunk_size=_chunk_size):
+        self._blocks = _read_aedt_lines(aedt_fh, chunk_size)
+        self._block = []
+        self._index = -1
+        self._advance()
+
+    def _advance(self):
+        self._index += 1
+        while self._index >= len(self._block):
+            block = next(self._blocks, None)
+            if block is None:
+                self._line = None
+                return
+            self._block = block
+            self._index = 0
+        self._line = self._block[self._index]
+
+    def _peek(self):
+        if self._index + 1 >= len(self._block):
+            block = next(self._blocks, None)
+            if block is None:
+                return None
+            self._block = self._block[self._index :] + block
+            self._index = 0
+        return self._block[self._index + 1]
+
+    def _decode_recognized_key(self, keyword, line, d):
+        """Special decodings for keys belonging to  _recognized_keywords
+
+        Parameters
+        ----------
+        keyword : str
+            dictionary key recognized
+
+        line : str
+            Line.
+
+        d : dict
+            Active dictionary.
+
+        -------
+
+        """
+        if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
+            m = re.search(r"\'(\d+)\'\((.*)\)$", line)
+            if m:
+                k = m.group(1)
+                v = m.group(2)
+                v2 = v.replace("\\'", '"')
+                v3 = _separate_list_elements(v2)
+                d[k] = v3
+        elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
+            d["add"] = []
+            line = self._peek()
+            while line and line.startswith("add("):
+                d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
+                self._advance()
+                line = self._peek()
+        else:  # pragma: no cover
+            raise AttributeError("Keyword {} is supposed to be in the recognized_keywords list".format(keyword))
+
+    def _walk_through_structure(self, keyword, save_dict):
+        """
+
+        Parameters
+        ----------
+        keyword :
+
+        save_dict :
+
+
+        Returns
+        -------
+
+        """
+        begin_key = "$begin '{}'".format(keyword)
+        end_key = "$end '{}'".format(keyword)
+        found = False
+        saved_value = None
+        while self._line is not None:
+            line = self._line
+            # begin_key is found
+            if begin_key == line:
+                found = True
+                saved_value = save_dict.get(keyword)  # if the keyword is already present
+                # makes the value a list, if it's not already
+                if saved_value and type(saved_value) is not list:
+                    saved_value = [saved_value]
+                save_dict[keyword] = {}
+                self._advance()
+                continue
+            # end_key is found
+            if end_key == line:
+                break
+            # between begin_key and end_key
+            if found:
+                b = _begin_search.search(line)
+                if b:  # walk down a level
+                    nextlvl_begin_key = b.group(1)
+                    self._walk_through_structure(nextlvl_begin_key, save_dict[keyword])
+                elif keyword in _recognized_keywords:
+                    self._decode_recognized_key(keyword, line, save_dict[keyword])
+                else:  # decode key
+                    _decode_key(line, save_dict[keyword])
+            self._advance()
+        # recompose value if list
+        if saved_value:
+            saved_value.append(save_dict[keyword])
+            save_dict[keyword] = saved_value
 
 
 def _load_entire_aedt_file(filename):
@@ -381,17 +733,9 @@ def _load_entire_aedt_file(filename):
         dictionary containing the decoded AEDT file
 
     """
-    global _count
-    _read_aedt_file(filename)
-    main_dict = {}
-    # load the aedt file
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        m = _begin_search.search(line)
-        if m:
-            _walk_through_structure(m.group(1), main_dict)
-        _count += 1
-    if settings.aedt_version and settings.aedt_version > "2022.2":
+    main_dict = _AedtFileParser(filename).load_entire_file()
+    # the project preview is read on its own only if the main pass did not reach it
+    if "ProjectPreview" not in main_dict and settings.aedt_version and settings.aedt_version > "2022.2":
         project_preview = load_keyword_in_aedt_file(filename, "ProjectPreview")
         if project_preview and "ProjectPreview" in project_preview:
             main_dict["ProjectPreview"] = project_preview["ProjectPreview"]
@@ -414,8 +758,597 @@ def _load_keyword_in_aedt_file(filename, keyword):
         dictionary containing the decoded AEDT file
 
     """
-    _read_aedt_file(filename)
-    # load the aedt file
+    index = _get_file_index(filename)
+    if index is None:
+        return _AedtFileParser(filename).load_keyword(keyword)
+    if keyword not in index.first_blocks:
+        return {}
+    begin, end = index.first_blocks[keyword]
+    return _AedtFileParser(filename).load_keyword(keyword, begin, end - begin if end else None)
+
+
+class _AedtFileIndex(object):
+    """Byte offsets of the blocks of an AEDT file.
+
+    ``blocks`` lists the top-level and second-level blocks in file order as
+    ``[name, depth, parent, begin, content_begin, content_end, end]``, where ``parent``
+    is the position in ``blocks`` of the top-level block containing a second-level block,
+    or ``-1``. ``first_blocks`` gives the ``[begin, end]`` offsets of the first block of
+    every name, at any depth.
+    """
+
+    def __init__(self):
+        self.blocks = []
+        self.children = {}
+        self.first_blocks = {}
+
+
+def _index_aedt_file(aedt_fh, chunk_size=_chunk_size):
+    """Build the block index of an opened AEDT file in one pass.
+
+    Parameters
+    ----------
+    aedt_fh :
+        AEDT file handle opened in binary mode.
+    chunk_size : int, optional
+        Number of bytes read at a time.
+
+    Returns
+    -------
+    :class:`pyaedt.generic.LoadAEDTFile._AedtFileIndex`
+    """
+    index = _AedtFileIndex()
+    blocks = index.blocks
+    # names are kept as bytes until the end, open blocks are [name, position in blocks, first offsets]
+    first_blocks = {}
+    stack = []
+    rest = b""
+    base = 0
+    while True:
+        data = aedt_fh.read(chunk_size)
+        if data:
+            data = rest + data
+            cut = data.rfind(b"\n") + 1
+            if not cut:
+                rest = data
+                continue
+            data, rest = data[:cut], data[cut:]
+        elif rest:
+            data, rest = rest, b""
+        else:
+            break
+        pos = 0
+        after_binary = False
+        while pos < len(data):
+            header = _binary_header.search(data, pos)
+            end = header.start() if header else len(data)
+            markers = list(_block_marker.finditer(data, pos, end))
+            if after_binary:
+                # binary content is not always followed by an end of line
+                m = _block_marker_after_binary.match(data, pos, end)
+                if m and (not markers or markers[0].start() != pos):
+                    markers.insert(0, m)
+                after_binary = False
+            for m in markers:
+                name = m.group(2)
+                if m.group(1) == b"begin":
+                    start = base + m.start()
+                    record = None
+                    if len(stack) < 2:
+                        parent = stack[0][1] if stack else -1
+                        record = len(blocks)
+                        blocks.append([name, len(stack), parent, start, base + m.end() + 1, None, None])
+                    first = None
+                    if name not in first_blocks:
+                        first = first_blocks[name] = [start, None]
+                    stack.append([name, record, first])
+                elif stack and stack[-1][0] == name:
+                    _, record, first = stack.pop()
+                    if record is not None:
+                        blocks[record][5] = base + m.start()
+                        blocks[record][6] = base + m.end() + 1
+                    if first is not None:
+                        first[1] = base + m.end() + 1
+            if not header:
+                break
+            # jump over the end of line of the header and the binary content
+            pos = header.end() + 1 + int(header.group(1))
+            after_binary = True
+            if pos > len(data):
+                overflow = pos - len(data)
+                if overflow > len(rest):
+                    aedt_fh.seek(overflow - len(rest), 1)
+                rest = rest[overflow:]
+                base += overflow
+        base += len(data)
+    for i, block in enumerate(blocks):
+        block[0] = block[0].decode("utf-8", "replace")
+        index.children.setdefault(block[2], []).append(i)
+    for name, offsets in first_blocks.items():
+        index.first_blocks[name.decode("utf-8", "replace")] = offsets
+    return index
+
+
+def _get_file_index(filename):
+    """Get the block index of a file, building it only if the file changed since the last call.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+
+    Returns
+    -------
+    :class:`pyaedt.generic.LoadAEDTFile._AedtFileIndex`
+        Block index or ``None`` if the file is not on the local file system.
+    """
+    filename = os.path.normpath(filename)
+    if not os.path.isfile(filename):
+        return None
+    stamp = (os.path.getmtime(filename), os.path.getsize(filename))
+    with _file_indexes_lock:
+        cached = _file_indexes.pop(filename, None)
+        if cached and cached[0] == stamp:
+            _file_indexes[filename] = cached
+            return cached[1]
+    with open_file(filename, "rb") as aedt_fh:
+        index = _index_aedt_file(aedt_fh)
+    with _file_indexes_lock:
+        _file_indexes[filename] = (stamp, index)
+        while len(_file_indexes) > _file_indexes_max_size:
+            _file_indexes.popitem(last=False)
+    return index
+
+
+def _unique_names(index, blocks):
+    names = []
+    for i in blocks:
+        if index.blocks[i][0] not in names:
+            names.append(index.blocks[i][0])
+    return names
+
+
+def _load_blocks(filename, index, blocks, save_dict=None):
+    """Decode some indexed blocks in the same dictionary.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    index : :class:`pyaedt.generic.LoadAEDTFile._AedtFileIndex`
+        Block index of the file.
+    blocks : list
+        Positions of the blocks in ``index.blocks``.
+    save_dict : dict, optional
+        Dictionary where the blocks are added. The default is ``None``, in which
+        case a new dictionary is created.
+
+    Returns
+    -------
+    dict
+    """
+    save_dict = {} if save_dict is None else save_dict
+    parser = _AedtFileParser(filename)
+    for i in blocks:
+        name, _, _, begin, _, _, end = index.blocks[i]
+        parser.load_keyword(name, begin, end - begin if end else None, save_dict)
+    return save_dict
+
+
+def _read_lines_in_ranges(filename, ranges):
+    """Read and decode the lines contained in some byte ranges of a file.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    ranges : list
+        List of ``[begin, end]`` byte offsets.
+
+    Returns
+    -------
+    list
+    """
+    lines = []
+    pending = ""
+    with open_file(filename, "rb") as aedt_fh:
+        for begin, end in ranges:
+            if end <= begin:
+                continue
+            aedt_fh.seek(begin)
+            range_lines, split_again = _decode_lines(aedt_fh.read(end - begin))
+            range_lines, pending = _merge_continued_lines(range_lines, pending)
+            if split_again:
+                range_lines = [split_line for line in range_lines for split_line in (line + "\n").splitlines()]
+            lines.extend(range_lines)
+    return lines
+
+
+def _is_lazy_block(index, block):
+    """Check if a top-level block can be decoded one second-level block at a time.
+
+    Parameters
+    ----------
+    index : :class:`pyaedt.generic.LoadAEDTFile._AedtFileIndex`
+        Block index of the file.
+    block : int
+        Position of the block in ``index.blocks``.
+
+    Returns
+    -------
+    bool
+    """
+    name = index.blocks[block][0]
+    if name in _recognized_keywords or index.blocks[block][6] is None:
+        return False
+    for i in index.children.get(block, []):
+        # the walk handles in a special way a block with the same name as its parent
+        if index.blocks[i][0] == name or index.blocks[i][6] is None:
+            return False
+    return True
+
+
+def _add_block_value(name, value, save_dict):
+    # same merge of blocks with the same name as _AedtFileParser._walk_through_structure
+    saved_value = save_dict.get(name)
+    if saved_value and type(saved_value) is not list:
+        saved_value = [saved_value]
+    save_dict[name] = value
+    if saved_value:
+        saved_value.append(value)
+        save_dict[name] = saved_value
+
+
+def _copy_value(value):
+    """Copy the dictionaries and lists of a decoded value."""
+    if isinstance(value, dict):
+        new_value = type(value)()
+        for key, item in value.items():
+            new_value[key] = _copy_value(item)
+        return new_value
+    elif isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def _load_aedt_file_incremental(filename):
+    """Load the entire AEDT file decoding only the second-level blocks that changed.
+
+    The second-level blocks are identified by their name, size and checksum. The blocks
+    that were already decoded by the previous call on the same file are reused, even if
+    they moved in the file, while the keys that are not in a second-level block are always
+    decoded again. The returned blocks are copies of the stored ones.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the decoded AEDT file or ``None`` if the file cannot be
+        decoded incrementally.
+    """
+    index = _get_file_index(filename)
+    if index is None:
+        return None
+    top_blocks = index.children.get(-1, [])
+    if len(_unique_names(index, top_blocks)) != len(top_blocks):
+        return None
+    for block in top_blocks:
+        if not _is_lazy_block(index, block):
+            return None
+    with _incremental_states_lock:
+        # the lists are copied because the reused values are popped from them
+        previous = dict((key, list(values)) for key, values in _incremental_states.get(filename, ({}, 0))[0].items())
+    state = {}
+    state_size = 0
     main_dict = {}
-    _walk_through_structure(keyword, main_dict)
+    parser = _AedtFileParser(filename)
+    with open_file(filename, "rb") as aedt_fh:
+        for block in top_blocks:
+            name, _, _, _, begin, content_end, _ = index.blocks[block]
+            block_dict = {}
+            for i in index.children.get(block, []) + [None]:
+                if i is None:
+                    end = content_end
+                else:
+                    child_name, _, _, child_begin, _, _, child_end = index.blocks[i]
+                    end = child_begin
+                # keys between two second-level blocks
+                if end > begin:
+                    aedt_fh.seek(begin)
+                    lines, split_again = _decode_lines(aedt_fh.read(end - begin))
+                    lines, pending = _merge_continued_lines(lines, "")
+                    if pending:
+                        return None
+                    if split_again:
+                        lines = [split_line for line in lines for split_line in (line + "\n").splitlines()]
+                    for line in lines:
+                        if _begin_search.search(line):
+                            return None
+                        _decode_key(line, block_dict)
+                if i is None:
+                    break
+                aedt_fh.seek(child_begin)
+                key = (name, child_name, hashlib.sha1(aedt_fh.read(child_end - child_begin)).hexdigest())
+                values = previous.get(key)
+                if values:
+                    value = values.pop()
+                else:
+                    value = parser.load_keyword(child_name, child_begin, child_end - child_begin, {})[child_name]
+                state.setdefault(key, []).append(value)
+                state_size += child_end - child_begin
+                # the stored values are never returned, so that editing the result does not affect the next load
+                _add_block_value(child_name, _copy_value(value), block_dict)
+                begin = child_end
+            main_dict[name] = block_dict
+    with _incremental_states_lock:
+        _incremental_states.pop(filename, None)
+        if state_size <= _incremental_states_max_bytes:
+            _incremental_states[filename] = (state, state_size)
+        total_size = sum(size for _, size in _incremental_states.values())
+        while len(_incremental_states) > _incremental_states_max_size or total_size > _incremental_states_max_bytes:
+            total_size -= _incremental_states.popitem(last=False)[1][1]
     return main_dict
+
+
+def _clear_incremental_state(filename):
+    """Remove the decoded blocks stored for the incremental load of a file.
+
+    It is called when the project of the file is closed.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    """
+    with _incremental_states_lock:
+        _incremental_states.pop(os.path.normpath(filename), None)
+
+
+def _to_dict(value):
+    if isinstance(value, _AedtBlockView):
+        return value.to_dict()
+    return value
+
+
+class _AedtBlockView(object):
+    """Lazy dictionary-like view of a top-level block of an AEDT file.
+
+    The keys of the block are decoded on first access, and every second-level
+    block is decoded the first time it is accessed.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    index : :class:`pyaedt.generic.LoadAEDTFile._AedtFileIndex`
+        Block index of the file.
+    block : int
+        Position of the block in ``index.blocks``.
+    """
+
+    def __init__(self, filename, index, block):
+        self.filename = filename
+        self._index = index
+        self._block = block
+        self._children = index.children.get(block, [])
+        self._child_names = _unique_names(index, self._children)
+        self._keys = None
+        self._data = {}
+        self._name = index.blocks[block][0]
+
+    def __repr__(self):
+        return "<AEDT block '{}'>".format(self._name)
+
+    def _ranges(self):
+        # byte ranges of the block content that are not in a second-level block
+        begin = self._index.blocks[self._block][4]
+        ranges = []
+        for i in self._children:
+            ranges.append([begin, self._index.blocks[i][3]])
+            begin = self._index.blocks[i][6] or self._index.blocks[i][3]
+        ranges.append([begin, self._index.blocks[self._block][5]])
+        return ranges
+
+    def _own_keys(self):
+        if self._keys is None:
+            self._keys = {}
+            for line in _read_lines_in_ranges(self.filename, self._ranges()):
+                _decode_key(line, self._keys)
+        return self._keys
+
+    def __getitem__(self, key):
+        if key in self._child_names:
+            if key not in self._data:
+                blocks = [i for i in self._children if self._index.blocks[i][0] == key]
+                self._data[key] = _load_blocks(self.filename, self._index, blocks)[key]
+            return self._data[key]
+        return self._own_keys()[key]
+
+    def __contains__(self, key):
+        return key in self._child_names or key in self._own_keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        """Names of the keys and of the second-level blocks.
+
+        Returns
+        -------
+        list
+        """
+        return list(self._own_keys().keys()) + [k for k in self._child_names if k not in self._own_keys()]
+
+    def values(self):
+        """Values of the keys and of the second-level blocks.
+
+        Returns
+        -------
+        list
+        """
+        return [self[k] for k in self.keys()]
+
+    def items(self):
+        """Keys and values of the block.
+
+        Returns
+        -------
+        list
+        """
+        return [(k, self[k]) for k in self.keys()]
+
+    def get(self, key, default=None):
+        """Get a key or a second-level block.
+
+        Parameters
+        ----------
+        key : str
+            Name of the key or of the block.
+        default : optional
+            Value returned when the key does not exist. The default is ``None``.
+
+        Returns
+        -------
+        object
+        """
+        if key in self:
+            return self[key]
+        return default
+
+    def to_dict(self):
+        """Decode the entire block.
+
+        Returns
+        -------
+        dict
+        """
+        d = dict(self._own_keys())
+        for key in self._child_names:
+            d[key] = self[key]
+        return d
+
+
+def _cache_file_name(filename):
+    """Get the name of the cache file of an AEDT file.
+
+    The name depends on the path, the size and the modification time of the AEDT file,
+    so that a modified file never matches an old cache file.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+
+    Returns
+    -------
+    str
+        Cache filename with path or ``None`` if the AEDT file is not on the local file system.
+    """
+    if not os.path.isfile(filename):
+        return None
+    stat = os.stat(filename)
+    key = "{}|{}|{!r}".format(os.path.normcase(os.path.abspath(filename)), stat.st_size, stat.st_mtime)
+    return os.path.join(settings.aedt_file_cache_path, hashlib.sha1(key.encode("utf-8")).hexdigest() + _cache_extension)
+
+
+def _read_file_cache(filename):
+    """Read a decoded AEDT file from the on-disk cache.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the decoded AEDT file or ``None`` if it is not in the cache.
+    """
+    cache_file = _cache_file_name(filename)
+    if not cache_file or not os.path.exists(cache_file):
+        return None
+    if not _check_cache_directory(settings.aedt_file_cache_path):
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            cached_filename, main_dict = pickle.load(f)
+        if cached_filename != os.path.normcase(os.path.abspath(filename)):
+            return None
+        # mark the file as recently used for the eviction
+        os.utime(cache_file, None)
+    except Exception:
+        settings.logger.debug("Failed to read the cache file {}.".format(cache_file))
+        return None
+    return main_dict
+
+
+def _write_file_cache(filename, main_dict):
+    """Write a decoded AEDT file in the on-disk cache and evict the least recently used files.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    main_dict : dict
+        Dictionary containing the decoded AEDT file.
+
+    Returns
+    -------
+    bool
+        ``True`` when successful, ``False`` when failed.
+    """
+    cache_file = _cache_file_name(filename)
+    if not cache_file:
+        return False
+    if not _check_cache_directory(settings.aedt_file_cache_path):
+        return False
+    temp_file = "{}.{}.{}".format(cache_file, os.getpid(), threading.current_thread().ident)
+    try:
+        with open(temp_file, "wb") as f:
+            pickle.dump((os.path.normcase(os.path.abspath(filename)), main_dict), f, pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+        os.rename(temp_file, cache_file)
+    except Exception:
+        settings.logger.debug("Failed to write the cache file {}.".format(cache_file))
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return False
+    _evict_file_cache(settings.aedt_file_cache_path, settings.aedt_file_cache_size * 1024 * 1024)
+    return True
+
+
+def _evict_file_cache(cache_dir, max_size):
+    """Remove the least recently used cache files until the cache is not bigger than a given size.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Folder of the cache.
+    max_size : int
+        Maximum size of the cache in bytes.
+    """
+    cache_files = []
+    for cache_file in os.listdir(cache_dir):
+        if cache_file.endswith(_cache_extension):
+            try:
+                stat = os.stat(os.path.join(cache_dir, cache_file))
+            except OSError:
+                continue
+            cache_files.append((stat.st_mtime, stat.st_size, cache_file))
+    total_size = sum(i[1] for i in cache_files)
+    for _, size, cache_file in sorted(cache_files):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, cache_file))
+            total_size -= size
+        except OSError:
+            pass
@@ -1,8 +1,25 @@
 import math
 import os
 import re
+import warnings
+from collections import OrderedDict
 
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import is_ironpython
+from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.generic.general_methods import settings
+
+pd = None
+if not is_ironpython:
+    try:
+        import numpy as np
+    except ImportError:
+        warnings.warn(
+            "The NumPy module is required to read and write Touchstone files.\n"
+            "Install with \n\npip install numpy\n\nRequires CPython."
+        )
+    pd = LazyModule("pandas")
 
 REAL_IMAG = "RI"
 MAG_ANGLE = "MA"
@@ -192,61 +209,150 @@ class ParseError(Exception):
         return "{0}: {1}".format(__class__, self.message)
 
 
-class TouchstoneData(object):
-    """Data Class containing information from Touchstone Read call"""
+class _ExpressionData(object):
+    """Read-only dictionary-like access to the curves of a Touchstone data set.
 
-    def __init__(self, freqs, matrix, portnames):
-        self._sweeps_names = ["Freq"]
-        self.sweeps = {"Freq": freqs}
-        self.ports = portnames
-        self.expressions = []
-        for el in portnames:
-            for el1 in portnames:
-                self.expressions.append("S({},{})".format(el, el1))
+    The curve of an expression is computed from the network data matrix when it is accessed.
 
-        self._primary_sweep = "Freq"
-        self.solutions_data_real, self.solutions_data_imag = self._solutions_data(matrix)
-        self.solutions_data_mag = {}
-        self.units_data = {}
-        for expr in self.expressions:
-            self.solutions_data_mag[expr] = [
-                abs(complex(self.solutions_data_real[expr][i], self.solutions_data_imag[expr][i]))
-                for i in range(len(self.solutions_data_real[expr]))
-            ]
+    Parameters
+    ----------
+    touchstone_data : :class:`pyaedt.generic.TouchstoneParser.TouchstoneData`
+        Touchstone data.
+    function :
+        Function applied to the complex curve.
+    """
+
+    def __init__(self, touchstone_data, function):
+        self._touchstone_data = touchstone_data
+        self._function = function
+
+    def __getitem__(self, expression):
+        i, j = self._touchstone_data._expression_index[expression]
+        return self._function(self._touchstone_data.matrix[:, i, j])
+
+    def __contains__(self, expression):
+        return expression in self._touchstone_data._expression_index
+
+    def __iter__(self):
+        return iter(self._touchstone_data.expressions)
+
+    def __len__(self):
+        return len(self._touchstone_data.expressions)
+
+    def keys(self):
+        """Expressions.
+
+        Returns
+        -------
+        list
+        """
+        return list(self._touchstone_data.expressions)
+
+    def values(self):
+        """Curves of all the expressions.
 
-    def _solutions_data(self, matrix):
+        Returns
+        -------
+        list
+        """
+        return [self[k] for k in self.keys()]
+
+    def items(self):
+        """Expressions and their curves.
+
+        Returns
+        -------
+        list
         """
+        return [(k, self[k]) for k in self.keys()]
+
+    def get(self, expression, default=None):
+        """Get the curve of an expression.
 
         Parameters
         ----------
-        matrix :
-
+        expression : str
+            Expression name.
+        default : optional
+            Value returned when the expression does not exist. The default is ``None``.
 
         Returns
         -------
+        :class:`numpy.ndarray`
+        """
+        if expression in self:
+            return self[expression]
+        return default
+
+
+class TouchstoneData(object):
+    """Data Class containing information from Touchstone Read call.
+
+    The network data is stored in a single complex array of shape ``(nfreq, nport, nport)``,
+    where ``matrix[k, i, j]`` is the parameter from port ``j`` to port ``i`` at the
+    frequency ``k``.
+
+    Parameters
+    ----------
+    freqs : list or :class:`numpy.ndarray`
+        Frequencies in ``frequency_unit``.
+    matrix : :class:`numpy.ndarray` or list
+        Complex network data with shape ``(nfreq, nport, nport)``. A list with the
+        flattened matrix of each frequency is also accepted.
+    portnames : list
+        Names of the ports.
+    z0 : float or list, optional
+        Reference impedance of all the ports or of each port in ohms. The default is ``50``.
+    parameter : str, optional
+        Type of network parameter. Options are ``"S"``, ``"Y"``, ``"Z"``, ``"H"``,
+        and ``"G"``. The default is ``"S"``.
+    frequency_unit : str, optional
+        Unit of the frequencies. Options are ``"Hz"``, ``"kHz"``, ``"MHz"``, and ``"GHz"``.
+        The default is ``"GHz"``.
+    """
+
+    def __init__(self, freqs, matrix, portnames, z0=50, parameter="S", frequency_unit="GHz"):
+        self.matrix = np.asarray(matrix, dtype=complex)
+        nport = len(portnames)
+        self.matrix = self.matrix.reshape((len(freqs), nport, nport))
+        self._sweeps_names = ["Freq"]
+        self.sweeps = {"Freq": [float(i) for i in freqs]}
+        self.ports = list(portnames)
+        self.z0 = np.broadcast_to(np.asarray(z0, dtype=float), (nport,)).copy()
+        self.parameter = parameter.upper()
+        self.frequency_unit = _frequency_units[frequency_unit.upper()][0]
+        self.expressions = []
+        self._expression_index = {}
+        for i, el in enumerate(self.ports):
+            for j, el1 in enumerate(self.ports):
+                expression = "{}({},{})".format(self.parameter, el, el1)
+                self.expressions.append(expression)
+                self._expression_index.setdefault(expression, (i, j))
+        self._primary_sweep = "Freq"
+        self.solutions_data_real = _ExpressionData(self, np.real)
+        self.solutions_data_imag = _ExpressionData(self, np.imag)
+        self.solutions_data_mag = _ExpressionData(self, np.abs)
+        self.units_data = {}
+
+    @property
+    def n_ports(self):
+        """Number of ports.
 
+        Returns
+        -------
+        int
         """
-        sols_data_real = {}
-        sols_data_imag = {}
-        i = 0
-        expression = ""
-        for element in matrix:
-            k = 0
-            for expression in self.expressions:
-                values = []
-                for el in reversed(self._sweeps_names):
-                    values.append(self.sweeps[el])
-                t = tuple([self.sweeps["Freq"][i]])
-                if expression in sols_data_real:
-                    sols_data_real[expression].append(element[k].real)
-                    sols_data_imag[expression].append(element[k].imag)
-                else:
-                    sols_data_real[expression] = [element[k].real]
-                    sols_data_imag[expression] = [element[k].imag]
-                k += 1
-            i += 1
+        return self.matrix.shape[1]
 
-        return sols_data_real, sols_data_imag
+    @property
+    def frequencies(self):
+        """Frequencies in hertz.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return np.asarray(self.sweeps["Freq"]) * _frequency_units[self.frequency_unit.upper()][1]
 
     def data_magnitude(self, expression=None):
         """Return the data magnitude of the given expression. if no expression is provided, first expression is provided
@@ -264,7 +370,7 @@ class TouchstoneData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        return list(self.solutions_data_mag[expression])
+        return self.solutions_data_mag[expression].tolist()
 
     def data_db(self, expression=None):
         """Return the data in db of the given expression. if no expression is provided, first expression is provided
@@ -282,11 +388,11 @@ class TouchstoneData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        try:
-            return [10 * math.log10(i) for i in self.data_magnitude(expression)]
-        except:
+        magnitude = self.solutions_data_mag[expression]
+        if not np.all(magnitude > 0):
             print("Error in DB Computation")
             return None
+        return (10 * np.log10(magnitude)).tolist()
 
     def data_real(self, expression=None):
         """Return the real part of data of the given expression.
@@ -306,7 +412,7 @@ class TouchstoneData(object):
 
         if not expression:
             expression = self.expressions[0]
-        return list(self.solutions_data_real[expression])
+        return self.solutions_data_real[expression].tolist()
 
     def data_imag(self, expression=None):
         """Return the imaginary part of data  of the given expression.
@@ -326,7 +432,245 @@ class TouchstoneData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        return list(self.solutions_data_imag[expression])
+        return self.solutions_data_imag[expression].tolist()
+
+    @pyaedt_function_handler()
+    def get_curves(self, expressions=None):
+        """Get the complex curves of some expressions with a single indexing of the network data.
+
+        Parameters
+        ----------
+        expressions : list, optional
+            Expression names. The default is ``None``, in which case all the expressions are used.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Complex array with shape ``(nfreq, nexpressions)``.
+        """
+        if expressions is None:
+            expressions = self.expressions
+        rows, columns = self._expression_indices(expressions)
+        return self.matrix[:, rows, columns]
+
+    def _expression_indices(self, expressions):
+        indices = np.array([self._expression_index[i] for i in expressions], dtype=int).reshape((-1, 2))
+        return indices[:, 0], indices[:, 1]
+
+    def _band(self, freq_min=None, freq_max=None):
+        freqs = np.asarray(self.sweeps["Freq"])
+        band = np.ones(len(freqs), dtype=bool)
+        if freq_min is not None:
+            band &= freqs >= freq_min
+        if freq_max is not None:
+            band &= freqs <= freq_max
+        return band
+
+    @pyaedt_function_handler()
+    def get_si_metrics(self, tx_prefix="", rx_prefix="", freq_min=None, freq_max=None, skip_same_index_couples=True):
+        """Compute the return losses, insertion losses and crosstalks of a channel at once.
+
+        Transmitters are the ports containing ``tx_prefix`` and receivers are the ports containing
+        ``rx_prefix``. The transmitter and the receiver with the same index form a channel.
+        All the curves are sliced from the network data in a single operation and reduced over
+        the frequency band. The worst value is the highest magnitude for return losses and
+        crosstalks and the lowest magnitude for insertion losses.
+
+        Parameters
+        ----------
+        tx_prefix : str, optional
+            Prefix of the transmitters. The default is ``""``, in which case all ports are transmitters.
+        rx_prefix : str, optional
+            Prefix of the receivers. The default is ``""``, in which case there is no receiver and
+            only return losses and near end crosstalks are computed.
+        freq_min : float, optional
+            Minimum frequency of the band in the frequency unit of the data. The default is ``None``.
+        freq_max : float, optional
+            Maximum frequency of the band in the frequency unit of the data. The default is ``None``.
+        skip_same_index_couples : bool, optional
+            Whether to exclude the transmitter and receiver with the same index from the far end
+            crosstalks. The default is ``True``.
+
+        Returns
+        -------
+        dict or :class:`pandas.DataFrame`
+            Table with the ``"Expression"``, ``"Type"``, ``"Mean"``, ``"Mean (dB)"``, ``"Worst"``,
+            ``"Worst (dB)"``, and ``"Worst Frequency"`` columns. The ``"Type"`` is ``"RL"``, ``"IL"``,
+            ``"NEXT"``, or ``"FEXT"``. A ``pandas.DataFrame`` is returned when
+            ``settings.enable_pandas_output`` is ``True``.
+        """
+        tx = np.array([i for i, port in enumerate(self.ports) if tx_prefix in port], dtype=int)
+        rx = np.array([i for i, port in enumerate(self.ports) if rx_prefix in port] if rx_prefix else [], dtype=int)
+        if len(rx) and len(rx) != len(tx):
+            raise ValueError("TX and RX should be same length lists")
+        ports = np.concatenate([tx, rx])
+        next_rows, next_columns = np.triu_indices(len(tx), 1)
+        fext_rows, fext_columns = np.meshgrid(np.arange(len(tx)), np.arange(len(rx)), indexing="ij")
+        fext = (fext_rows != fext_columns) if skip_same_index_couples else np.ones(fext_rows.shape, dtype=bool)
+        rows = np.concatenate([ports, tx[: len(rx)], tx[next_rows], tx[fext_rows[fext]]])
+        columns = np.concatenate([ports, rx, tx[next_columns], rx[fext_columns[fext]]])
+        types = ["RL"] * len(ports) + ["IL"] * len(rx) + ["NEXT"] * len(next_rows) + ["FEXT"] * int(fext.sum())
+
+        band = self._band(freq_min, freq_max)
+        magnitude = np.abs(self.matrix[band][:, rows, columns])
+        worst_is_higher = np.array([i != "IL" for i in types])
+        worst_index = np.where(worst_is_higher, magnitude.argmax(axis=0), magnitude.argmin(axis=0))
+        mean = magnitude.mean(axis=0)
+        worst = magnitude[worst_index, np.arange(len(types))]
+        with np.errstate(divide="ignore"):
+            table = OrderedDict(
+                [
+                    (
+                        "Expression",
+                        [
+                            "{}({},{})".format(self.parameter, self.ports[i], self.ports[j])
+                            for i, j in zip(rows, columns)
+                        ],
+                    ),
+                    ("Type", types),
+                    ("Mean", mean),
+                    ("Mean (dB)", 20 * np.log10(mean)),
+                    ("Worst", worst),
+                    ("Worst (dB)", 20 * np.log10(worst)),
+                    ("Worst Frequency", np.asarray(self.sweeps["Freq"])[band][worst_index]),
+                ]
+            )
+        if settings.enable_pandas_output and pd:
+            return pd.DataFrame(table)
+        return table
+
+    @pyaedt_function_handler()
+    def get_mixed_mode(self, differential_pairs, pair_names=None):
+        """Convert single-ended S-parameters to mixed-mode S-parameters.
+
+        The ports of the new data are the differential modes of all the pairs, followed by their
+        common modes and by the ports that are not in a pair.
+
+        Parameters
+        ----------
+        differential_pairs : list
+            List of ``[positive, negative]`` port names.
+        pair_names : list, optional
+            Names of the pairs. The default is ``None``, in which case the pairs are named
+            ``"Pair1"``, ``"Pair2"``, and so on.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.TouchstoneParser.TouchstoneData`
+            Mixed-mode data, with ports named ``"Diff_<pair name>"`` and ``"Comm_<pair name>"``.
+        """
+        if self.parameter != "S":
+            raise ValueError("Only S-parameters can be converted to mixed mode.")
+        if not pair_names:
+            pair_names = ["Pair{}".format(i + 1) for i in range(len(differential_pairs))]
+        positive = [self.ports.index(i[0]) for i in differential_pairs]
+        negative = [self.ports.index(i[1]) for i in differential_pairs]
+        single = [i for i in range(self.n_ports) if i not in positive + negative]
+        npair = len(differential_pairs)
+        # orthonormal transformation, so that the inverse is the transpose
+        transformation = np.zeros((self.n_ports, self.n_ports))
+        pairs = np.arange(npair)
+        transformation[pairs, positive] = 1 / np.sqrt(2)
+        transformation[pairs, negative] = -1 / np.sqrt(2)
+        transformation[npair + pairs, positive] = 1 / np.sqrt(2)
+        transformation[npair + pairs, negative] = 1 / np.sqrt(2)
+        transformation[2 * npair + np.arange(len(single)), single] = 1
+        matrix = np.matmul(np.matmul(transformation, self.matrix), transformation.T)
+        ports = ["Diff_{}".format(i) for i in pair_names] + ["Comm_{}".format(i) for i in pair_names]
+        ports += [self.ports[i] for i in single]
+        z0 = np.concatenate([2 * self.z0[positive], self.z0[positive] / 2, self.z0[single]])
+        return TouchstoneData(self.sweeps["Freq"], matrix, ports, z0, self.parameter, self.frequency_unit)
+
+    @pyaedt_function_handler()
+    def check_passivity(self, tolerance=1e-6):
+        """Check the passivity of the S-parameters.
+
+        The network is passive at a frequency when the largest singular value of the S-matrix
+        is not greater than one.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Tolerance on the largest singular value. The default is ``1e-6``.
+
+        Returns
+        -------
+        list
+            Frequencies where the network is not passive. The list is empty when the network is passive.
+        """
+        singular_values = np.linalg.svd(self.matrix, compute_uv=False)
+        return np.asarray(self.sweeps["Freq"])[singular_values.max(axis=1) > 1 + tolerance].tolist()
+
+    @pyaedt_function_handler()
+    def check_causality(self, tolerance=0.1, guard=2):
+        """Check the causality of the curves from their impulse responses.
+
+        The curves are resampled on a uniform frequency grid starting at DC, windowed and
+        transformed to the time domain all at once. The last quarter of each periodic impulse
+        response corresponds to negative times, where a causal curve has no energy. The
+        ``guard`` samples just before the time origin are skipped, because the window spreads
+        the response around the origin, and the energy that the window itself leaves at negative
+        times, which is the one of an ideal thru, is subtracted. Delays up to three quarters of
+        the period of the impulse responses are allowed.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Largest ratio of the energy at negative times over the total energy of a causal
+            curve. The default is ``0.1``.
+        guard : int, optional
+            Number of samples before the time origin that are not checked. The default is ``2``.
+
+        Returns
+        -------
+        list
+            Expressions of the curves that are not causal. The list is empty when all curves are causal.
+        """
+        freqs = np.asarray(self.sweeps["Freq"], dtype=float)
+        npoints = len(freqs)
+        grid = np.linspace(0, freqs[-1], npoints)
+        upper = np.clip(np.searchsorted(freqs, grid), 1, npoints - 1)
+        weight = np.clip((grid - freqs[upper - 1]) / (freqs[upper] - freqs[upper - 1]), 0, 1)[:, None, None]
+        matrix = self.matrix[upper - 1] * (1 - weight) + self.matrix[upper] * weight
+        matrix[0] = matrix[0].real
+        window = np.hanning(2 * npoints)[npoints:]
+        impulse = np.fft.irfft(matrix * window[:, None, None], axis=0)
+        # impulse response of an ideal thru, that is the leakage of the window alone
+        kernel = np.fft.irfft(window)
+        nsamples = len(kernel)
+        negative = slice(nsamples - nsamples // 4, max(nsamples - guard, nsamples - nsamples // 4))
+        leakage = (kernel[negative] ** 2).sum() / (kernel**2).sum()
+        energy = (impulse**2).sum(axis=0)
+        negative_energy = (impulse[negative] ** 2).sum(axis=0)
+        ratio = negative_energy / np.maximum(energy, np.finfo(float).tiny) - leakage
+        return [self.expressions[i] for i in np.flatnonzero(ratio.ravel() > tolerance)]
+
+    @pyaedt_function_handler()
+    def renormalize(self, z0):
+        """Refer the S-parameters to new real reference impedances.
+
+        Parameters
+        ----------
+        z0 : float or list
+            New reference impedance of all the ports or of each port in ohms.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.TouchstoneParser.TouchstoneData`
+            New Touchstone data.
+        """
+        if self.parameter != "S":
+            raise ValueError("Only S-parameters can be renormalized.")
+        new_z0 = np.broadcast_to(np.asarray(z0, dtype=float), (self.n_ports,))
+        # S' = A^-1 (S - G) (I - G S)^-1 A, with G the reflection coefficients of the new impedances
+        # and A = diag(sqrt(1 - G^2))
+        gamma = (new_z0 - self.z0) / (new_z0 + self.z0)
+        a = np.sqrt(1 - gamma**2)
+        identity = np.eye(self.n_ports)
+        lhs = np.swapaxes(identity - gamma[:, None] * self.matrix, 1, 2)
+        rhs = np.swapaxes(self.matrix - np.diag(gamma), 1, 2)
+        matrix = np.swapaxes(np.linalg.solve(lhs, rhs), 1, 2) * (a[None, :] / a[:, None])
+        return TouchstoneData(self.sweeps["Freq"], matrix, self.ports, new_z0, self.parameter, self.frequency_unit)
 
 
 @pyaedt_function_handler()
@@ -351,12 +695,9 @@ def get_return_losses(excitation_names, excitation_name_prefix=""):
         list of string representing Return Losses of excitations
 
     """
-    spar = []
     if excitation_name_prefix:
         excitation_names = [i for i in excitation_names if excitation_name_prefix.lower() in i.lower()]
-    for i in excitation_names:
-        spar.append("S({},{})".format(i, i))
-    return spar
+    return _s_expressions(excitation_names, excitation_names)
 
 
 @pyaedt_function_handler()
@@ -378,15 +719,12 @@ def get_insertion_losses_from_prefix(expressions, tx_prefix, rx_prefix):
         List of string representing Insertion Losses of excitations.
 
     """
-    spar = []
     trlist = [i for i in expressions if tx_prefix in i]
     receiver_list = [i for i in expressions if rx_prefix in i]
     if len(trlist) != len(receiver_list):
         print("TX and RX should be same length lists")
         return False
-    for i, j in zip(trlist, receiver_list):
-        spar.append("S({},{})".format(i, j))
-    return spar
+    return _s_expressions(trlist, receiver_list)
 
 
 @pyaedt_function_handler()
@@ -408,13 +746,10 @@ def get_insertion_losses_from_lists(txlist, reclist):
         list of string representing Insertion Losses of excitations
 
     """
-    spar = []
     if len(txlist) != len(reclist):
         print("TX and RX should be same length lists")
         return False
-    for i, j in zip(txlist, reclist):
-        spar.append("S({},{})".format(i, j))
-    return spar
+    return _s_expressions(txlist, reclist)
 
 
 @pyaedt_function_handler()
@@ -436,17 +771,15 @@ def get_next_xtalk(expressions, tx_prefix=""):
         list of string representing Near End XTalks
 
     """
-    next = []
     if tx_prefix:
         trlist = [i for i in expressions if tx_prefix in i]
     else:
-        trlist = expressions
-    for i in trlist:
-        k = trlist.index(i) + 1
-        while k < len(trlist):
-            next.append("S({},{})".format(i, trlist[k]))
-            k += 1
-    return next
+        trlist = list(expressions)
+    # all the couples of drivers at once. A driver is coupled to the ones after its first occurrence
+    first = _first_indices(trlist)
+    rows, columns = np.meshgrid(np.arange(len(trlist)), np.arange(len(trlist)), indexing="ij")
+    kept = columns > first[rows]
+    return _s_expressions([trlist[i] for i in rows[kept]], [trlist[i] for i in columns[kept]])
 
 
 @pyaedt_function_handler()
@@ -472,12 +805,7 @@ def get_fext_xtalk_from_list(trlist, reclist, skip_same_index_couples=True):
         list of string representing Far End XTalks
 
     """
-    fext = []
-    for i in trlist:
-        for k in reclist:
-            if not skip_same_index_couples or reclist.index(k) != trlist.index(i):
-                fext.append("S({},{})".format(i, k))
-    return fext
+    return _fext_expressions(trlist, reclist, skip_same_index_couples)
 
 
 @pyaedt_function_handler()
@@ -505,14 +833,34 @@ def get_fext_xtalk_from_prefix(expressions, tx_prefix, rx_prefix, skip_same_inde
         List of string representing Far End XTalks.
 
     """
-    fext = []
     trlist = [i for i in expressions if tx_prefix in i]
     reclist = [i for i in expressions if rx_prefix in i]
-    for i in trlist:
-        for k in reclist:
-            if not skip_same_index_couples or reclist.index(k) != trlist.index(i):
-                fext.append("S({},{})".format(i, k))
-    return fext
+    return _fext_expressions(trlist, reclist, skip_same_index_couples)
+
+
+def _s_expressions(rows, columns):
+    """Format the S-parameter expressions of couples of excitations."""
+    return ["S({},{})".format(i, j) for i, j in zip(rows, columns)]
+
+
+def _first_indices(names):
+    """Get the index of the first occurrence of each name of a list."""
+    first = {}
+    for i, name in enumerate(names):
+        first.setdefault(name, i)
+    return np.array([first[name] for name in names], dtype=int)
+
+
+def _fext_expressions(trlist, reclist, skip_same_index_couples):
+    """Get the far end crosstalk expressions of all the couples of drivers and receivers at once."""
+    trlist = list(trlist)
+    reclist = list(reclist)
+    rows, columns = np.meshgrid(np.arange(len(trlist)), np.arange(len(reclist)), indexing="ij")
+    if skip_same_index_couples:
+        # the index of the first occurrence of a name is used, as in the list based implementation
+        kept = _first_indices(trlist)[rows] != _first_indices(reclist)[columns]
+        rows, columns = rows[kept], columns[kept]
+    return _s_expressions([trlist[i] for i in rows.ravel()], [reclist[i] for i in columns.ravel()])
 
 
 @pyaedt_function_handler()
@@ -558,17 +906,25 @@ def get_worst_curve_from_solution_data(
             higher_id = next(x[0] for x in enumerate(return_loss_freq) if x[1] >= freq_max)
 
     dict_means = {}
-    for el in curve_list:
-        data1 = solution_data.data_magnitude(el)[lower_id:higher_id]
-        mean1 = sum(data1) / len(data1)
-        dict_means[el] = mean1
+    if isinstance(solution_data, TouchstoneData):
+        # all the curves are sliced at once from the network data
+        means = np.abs(solution_data.get_curves(curve_list)[lower_id:higher_id]).mean(axis=0)
+        dict_means = dict(zip(curve_list, means.tolist()))
+    else:
+        for el in curve_list:
+            data1 = solution_data.data_magnitude(el)[lower_id:higher_id]
+            mean1 = sum(data1) / len(data1)
+            dict_means[el] = mean1
     dict_means = dict(sorted(dict_means.items(), key=lambda item: item[1], reverse=worst_is_higher))
     worst_el = next(iter(dict_means))
     return worst_el, dict_means
 
 
 def read_touchstone(file_path, verbose=False):
-    """Load the contents of a Touchstone file into an NPort
+    """Load the contents of a Touchstone file.
+
+    Touchstone version 1 and version 2 files are supported. The data section is read in
+    large chunks and converted to a NumPy array without decoding one value at a time.
 
     Parameters
     ----------
@@ -580,40 +936,156 @@ def read_touchstone(file_path, verbose=False):
 
     Returns
     -------
-    class:`nport.NPort`
-        NPort holding data contained in the touchstone file.
+    :class:`pyaedt.generic.TouchstoneParser.TouchstoneData`
+        Data contained in the touchstone file.
 
     """
-    re_filename = re.compile(r"\.s(?P<ports>\d+)+p", re.I)
-    m = re_filename.search(file_path)
-    ports = int(m.group("ports"))
-    if verbose:
-        print("File '%s'" % file_path)
-        print("  Number of ports (based on file extension) = %d" % ports)
     file_path = os.path.abspath(file_path)
-    file = open(file_path, "r")
-    (frequnit, type, format, z0) = _parse_option_line(file, verbose)
-    freqs = []
-    matrices = []
-    try:
-        while True:
-            freq, matrix = _parse_next_sample(file, ports, format)
-            freqs.append(freq)
-            matrices.append(matrix)
-    except EOFError:
-        pass
-    finally:
-        file.close()
-    file = open(file_path, "r")
-    port_names = _parse_ports_name(file)
-    file.close()
-    data = TouchstoneData(freqs, matrices, port_names)
-    return data
-
-
-_re_comment = re.compile(r"^\s*!")
-_re_options = re.compile(r"^\s*#")
-_re_empty = re.compile(r"^\s*$")
+    with open_file(file_path, "r") as file:
+        header, first_line = _parse_header(file)
+        ports = header["ports"]
+        if ports is None:
+            m = _re_filename.search(file_path)
+            if not m:
+                raise ParseError("the number of ports cannot be found in the file extension")
+            ports = int(m.group("ports"))
+        if verbose:
+            print("File '%s'" % file_path)
+            print("  Number of ports (based on file extension) = %d" % ports)
+            print("  Frequency unit: %g Hz" % _frequency_units[header["frequency_unit"]][1])
+            print("  Parameter:      %s" % header["parameter"])
+            print("  Format:         %s" % header["format"])
+            print("  Reference R:    %s" % " ".join("%g" % i for i in header["z0"]))
+        lower = header["matrix_format"] == "LOWER"
+        upper = header["matrix_format"] == "UPPER"
+        n_values = ports * (ports + 1) // 2 if lower or upper else ports * ports
+        # version 1 two-port files can end with noise parameters, on lines of 5 values
+        values = _read_network_data(file, first_line, ports == 2 and header["version"] == 1)
+    record_size = 2 * n_values + 1
+    if values.size % record_size:
+        raise ParseError("the number of values does not match {} ports".format(ports))
+    values = values.reshape((-1, record_size))
+    freqs = values[:, 0]
+    pairs = values[:, 1::2] + 1j * values[:, 2::2]
+    if header["format"] == MAG_ANGLE:
+        pairs = values[:, 1::2] * np.exp(1j * np.deg2rad(values[:, 2::2]))
+    elif header["format"] == DB_ANGLE:
+        pairs = 10 ** (values[:, 1::2] / 20.0) * np.exp(1j * np.deg2rad(values[:, 2::2]))
+    if lower or upper:
+        matrix = np.zeros((len(freqs), ports, ports), dtype=complex)
+        rows, columns = np.tril_indices(ports) if lower else np.triu_indices(ports)
+        matrix[:, rows, columns] = pairs
+        matrix[:, columns, rows] = pairs
+    else:
+        matrix = pairs.reshape((len(freqs), ports, ports))
+        if ports == 2 and header["two_port_order"] == "21_12":
+            matrix = matrix.transpose((0, 2, 1))
+    if header["version"] == 1 and header["parameter"] in ("Y", "Z"):
+        # version 1 Y and Z parameters are normalized to the reference impedance
+        r = header["z0"][0]
+        matrix = matrix * r if header["parameter"] == "Z" else matrix / r
+    port_names = header["port_names"]
+    if len(port_names) != ports:
+        port_names = ["Port{}".format(i + 1) for i in range(ports)]
+    return TouchstoneData(
+        freqs,
+        matrix,
+        port_names,
+        header["z0"],
+        header["parameter"],
+        _frequency_units[header["frequency_unit"]][0],
+    )
+
+
+@pyaedt_function_handler()
+def write_touchstone(file_path, data, data_format=REAL_IMAG, version=1, precision=15):
+    """Write network data to a Touchstone file.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path of the Touchstone file.
+    data : :class:`pyaedt.generic.TouchstoneParser.TouchstoneData`
+        Data to write.
+    data_format : str, optional
+        Format of the values. Options are ``"RI"``, ``"MA"``, and ``"DB"``.
+        The default is ``"RI"``.
+    version : int, optional
+        Version of the Touchstone file format. Options are ``1`` and ``2``.
+        The default is ``1``.
+    precision : int, optional
+        Number of significant digits of the values. The default is ``15``.
+
+    Returns
+    -------
+    bool
+        ``True`` when successful, ``False`` when failed.
+    """
+    data_format = data_format.upper()
+    nport = data.n_ports
+    matrix = data.matrix
+    if version == 1 and data.parameter in ("Y", "Z"):
+        r = data.z0[0]
+        matrix = matrix / r if data.parameter == "Z" else matrix * r
+    if nport == 2 and version == 1:
+        matrix = matrix.transpose((0, 2, 1))
+    matrix = matrix.reshape((len(data.sweeps["Freq"]), -1))
+    values = np.empty((matrix.shape[0], 2 * matrix.shape[1] + 1))
+    values[:, 0] = data.sweeps["Freq"]
+    if data_format == REAL_IMAG:
+        values[:, 1::2] = matrix.real
+        values[:, 2::2] = matrix.imag
+    elif data_format in (MAG_ANGLE, DB_ANGLE):
+        magnitude = np.abs(matrix)
+        if data_format == DB_ANGLE:
+            with np.errstate(divide="ignore"):
+                magnitude = 20 * np.log10(magnitude)
+        values[:, 1::2] = magnitude
+        values[:, 2::2] = np.angle(matrix, deg=True)
+    else:
+        raise ValueError("Unknown data format {}.".format(data_format))
+    # a row of the matrix starts on a new line and a line holds at most 4 pairs of values
+    value_format = "%.{}g".format(precision)
+    if nport == 2:
+        lines = [[value_format] * 9]
+    else:
+        lines = []
+        for _ in range(nport):
+            for first in range(0, nport, 4):
+                lines.append([value_format] * (2 * min(4, nport - first)))
+        lines[0].insert(0, value_format)
+    record_format = "\n".join(" ".join(line) for line in lines) + "\n"
+    with open_file(file_path, "w") as f:
+        if version == 2:
+            f.write("[Version] 2.0\n")
+        f.write("# {} {} {} R {}\n".format(data.frequency_unit, data.parameter, data_format, value_format % data.z0[0]))
+        for i, port in enumerate(data.ports):
+            f.write("! Port[{}] = {}\n".format(i + 1, port))
+        if version == 2:
+            f.write("[Number of Ports] {}\n".format(nport))
+            if nport == 2:
+                f.write("[Two-Port Data Order] 12_21\n")
+            f.write("[Number of Frequencies] {}\n".format(values.shape[0]))
+            f.write("[Reference] {}\n".format(" ".join(value_format % i for i in data.z0)))
+            f.write("[Network Data]\n")
+        for start in range(0, values.shape[0], 1024):
+            f.write("".join(record_format % tuple(row) for row in values[start : start + 1024].tolist()))
+        if version == 2:
+            f.write("[End]\n")
+    return True
+
+
+_re_filename = re.compile(r"\.s(?P<ports>\d+)+p", re.I)
+_re_comment = re.compile(r"!.*")
+_re_options = re.compile(r"^\s*#.*$", re.M)
+_re_keyword = re.compile(r"^\s*\[", re.M)
+_re_noise_line = re.compile(r"^[ \t]*(?:\S+[ \t]+){4}\S+[ \t]*\r?$", re.M)
+_re_port_name = re.compile(r"^!\s*Port\[(\d+)\]\s*=\s*(.+?)\s*$")
+
+# size of the chunks read from the data section
+_chunk_size = 16 * 1024 * 1024
+
+_frequency_units = {"HZ": ("Hz", 1.0), "KHZ": ("kHz", 1e3), "MHZ": ("MHz", 1e6), "GHZ": ("GHz", 1e9)}
 
 
 def _parse_ports_name(file):
@@ -631,7 +1103,7 @@ def _parse_ports_name(file):
     """
     portnames = []
     line = file.readline()
-    while not line.startswith("! Port"):
+    while line and not line.startswith("! Port"):
         line = file.readline()
     while line.startswith("! Port"):
         portnames.append(line.split(" = ")[1].strip())
@@ -639,41 +1111,35 @@ def _parse_ports_name(file):
     return portnames
 
 
-def _parse_option_line(file, verbose=False):
+def _parse_option_line(line):
     """Parse and interpret the option line in the touchstone file
 
     Parameters
     ----------
-    file :
-
-    verbose :
-         (Default value = False)
+    line : str
+        Option line, starting with ``#``.
 
     Returns
     -------
-
+    tuple
+        Frequency unit, parameter, format and reference resistance.
     """
-    prefix = {"": 1, "K": 1e3, "M": 1e6, "G": 1e9}
-
     # defaults
-    frequnit = 1e9
+    frequnit = "GHZ"
+    parameter = "S"
     format = MAG_ANGLE
-    z0 = 50
+    z0 = 50.0
 
     # format of the options line (order is unimportant)
     # <frequency unit> <parameter> <format> R <n>
-    line = file.readline()
-    while not line.startswith("#"):
-        line = file.readline()
-
-    options = line[1:].upper().split()
+    options = line.split("!")[0].strip()[1:].upper().split()
 
     i = 0
     while i < len(options):
         option = options[i]
-        if option in ("GHZ", "MHZ", "KHZ", "HZ"):
-            frequnit = prefix[option[:-2]]
-        elif option in ("DB", "MA", "RI"):
+        if option in _frequency_units:
+            frequnit = option
+        elif option in (DB_ANGLE, MAG_ANGLE, REAL_IMAG):
             format = option
         elif option in ("S", "Y", "Z", "H", "G"):
             parameter = option
@@ -683,94 +1149,129 @@ def _parse_option_line(file, verbose=False):
         else:
             raise ParseError("unrecognized option: {0}".format(option))
         i += 1
+    return frequnit, parameter, format, z0
 
-    if verbose:
-        print("  Frequency unit: %g Hz" % frequnit)
-        print("  Parameter:      %s" % parameter)
-        print("  Format:         %s" % format)
-        print("  Reference R:    %g" % z0)
-
-    return (frequnit, parameter, format, z0)
 
-
-def _get_next_line_data(file):
-    """Returns the data on the next line of the input file as an array
-    of floats, skipping comment, option and empty lines.
+def _parse_header(file):
+    """Parse the header of a Touchstone file until the network data.
 
     Parameters
     ----------
     file :
-
+        Touchstone file opened in text mode.
 
     Returns
     -------
-
+    tuple
+        Dictionary of the header values and first line of network data.
     """
-    line = "!"
-    while _re_comment.search(line) or _re_options.search(line) or _re_empty.search(line):
+    header = {
+        "version": 1,
+        "ports": None,
+        "port_names": [],
+        "two_port_order": "21_12",
+        "matrix_format": "FULL",
+    }
+    header["frequency_unit"], header["parameter"], header["format"], z0 = _parse_option_line("#")
+    reference = None
+    keyword = None
+    options_found = False
+    line = file.readline()
+    while line:
+        text = _re_comment.sub("", line).strip()
+        if not text:
+            m = _re_port_name.match(line.strip())
+            if m:
+                header["port_names"].append(m.group(2))
+        elif text.startswith("#"):
+            # only the first option line is used
+            if not options_found:
+                header["frequency_unit"], header["parameter"], header["format"], z0 = _parse_option_line(text)
+                options_found = True
+        elif text.startswith("["):
+            keyword, _, value = text[1:].partition("]")
+            keyword = keyword.strip().upper()
+            value = value.strip()
+            if keyword == "VERSION":
+                header["version"] = int(float(value))
+            elif keyword == "NUMBER OF PORTS":
+                header["ports"] = int(value)
+            elif keyword == "TWO-PORT DATA ORDER":
+                header["two_port_order"] = value
+            elif keyword == "REFERENCE":
+                reference = value.split()
+            elif keyword == "MATRIX FORMAT":
+                header["matrix_format"] = value.upper()
+            elif keyword == "NETWORK DATA":
+                line = ""
+                break
+        elif header["version"] == 1:
+            break
+        elif keyword == "REFERENCE":
+            # the reference impedances can continue on the following lines
+            reference.extend(text.split())
         line = file.readline()
-        if not line:  # end of data
-            raise EOFError
-    data = []
-    line = line.split("!")[0]
-    for number in line.split():
-        data.append(float(number))
-    return data
+    if header["version"] == 2 and header["ports"] == 2 and header["matrix_format"] == "FULL":
+        header["two_port_order"] = header["two_port_order"].replace(" ", "")
+    else:
+        header["two_port_order"] = "21_12" if header["version"] == 1 else "12_21"
+    header["z0"] = [float(i) for i in reference] if reference else [z0]
+    return header, line
 
 
-def _parse_next_sample(file, ports, format):
-    """Parse the parameters for the next frequency point
+def _read_network_data(file, first_line="", two_port_noise=False):
+    """Read all the values of the network data section of a Touchstone file.
 
     Parameters
     ----------
     file :
-
-    ports :
-
-    format :
-
+        Touchstone file opened in text mode, after the header.
+    first_line : str, optional
+        First line of network data, already read from the file.
+    two_port_noise : bool, optional
+        Whether the data can end with the noise parameters of a two-port file.
+        The default is ``False``.
 
     Returns
     -------
-
+    :class:`numpy.ndarray`
+        Values of the network data.
     """
-    data = _get_next_line_data(file)
-    # data lines always contain an even number of values (2 values
-    #  per parameter), *unless* a frequency value is included in
-    #  front
-    assert len(data) % 2 == 1
-    freq = data[0]
-    data = data[1:]
-    count = 0
-
-    port1 = port2 = 1
-    list_data = [None for i in range(ports * ports)]
-
-    while True:
-        for i in range(int(len(data) / 2)):
-            index = 2 * i
-            args = {}
-            args[keys[format][0]] = data[index]
-            args[keys[format][1]] = data[index + 1]
-            try:
-                if ports == 2:
-                    list_data[(port1 - 1) * ports + (port2 - 1)] = parameter(**args)
-                else:
-                    list_data[(port2 - 1) * ports + (port1 - 1)] = parameter(**args)
-            except IndexError:
-                raise Exception("more ports than reported in the file " "extension")
-
-            port1 += 1
-            if port1 > ports:
-                port2 += 1
-                port1 = 1
-
-        count += len(data) / 2
-        if port2 > ports:
+    chunks = []
+    rest = first_line
+    end_found = False
+    while not end_found:
+        data = file.read(_chunk_size)
+        if data:
+            data = rest + data
+            cut = data.rfind("\n") + 1
+            if not cut:
+                rest = data
+                continue
+            data, rest = data[:cut], data[cut:]
+        elif rest:
+            data, rest = rest, ""
+        else:
             break
-        data = _get_next_line_data(file)
-        if len(data) % 2 != 0:
-            raise Exception("less ports than reported in the file extension")
-
-    assert count == ports**2
-    return (freq, list_data)
+        # the regular expressions are used only when needed, since they are slower than the conversion
+        if "!" in data:
+            data = _re_comment.sub("", data)
+        if "#" in data:
+            data = _re_options.sub("", data)
+        m = _re_keyword.search(data) if "[" in data else None
+        if m:
+            data = data[: m.start()]
+            end_found = True
+        m = _re_noise_line.search(data) if two_port_noise else None
+        if m:
+            data = data[: m.start()]
+            end_found = True
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                chunks.append(np.fromstring(data, sep=" "))
+            except (ValueError, DeprecationWarning):
+                raise ParseError("invalid value in the network data")
+    if not chunks:
+        return np.zeros(0)
+    return np.concatenate(chunks)
@@ -2,7 +2,6 @@ import os
 import random
 import shutil
 import string
-from distutils.dir_util import copy_tree
 from glob import glob
 
 
@@ -117,6 +116,8 @@ class Scratch:
         -------
 
         """
+        from distutils.dir_util import copy_tree
+
         copy_tree(src_folder, destfolder)
         return True
 
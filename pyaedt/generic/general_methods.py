@@ -4,6 +4,7 @@ import csv
 import datetime
 import difflib
 import fnmatch
+import importlib
 import inspect
 import itertools
 import json
@@ -21,6 +22,7 @@ import warnings
 from collections import OrderedDict
 from functools import update_wrapper
 
+from pyaedt import profiling
 from pyaedt.generic.constants import CSS4_COLORS
 
 is_ironpython = "IronPython" in sys.version or ".NETFramework" in sys.version
@@ -34,25 +36,87 @@ except:
     inside_desktop = False
 
 
+class LazyModule(object):
+    """Module imported the first time one of its attributes is accessed.
+
+    Heavy optional dependencies like Pandas, PyVista, or Matplotlib take a large part of the
+    import time of PyAEDT while most scripts use them in a few methods only. The module is
+    imported on first use, and the object is ``False`` in a boolean context when the module
+    cannot be imported, so that ``if pd:`` checks keep working.
+
+    Parameters
+    ----------
+    name : str
+        Full name of the module, for example ``"matplotlib.pyplot"``.
+    message : str, optional
+        Warning shown when the module cannot be imported. The default is ``None``.
+
+    Examples
+    --------
+    >>> pd = LazyModule("pandas")
+    >>> pd.DataFrame({"a": [1, 2]})  # pandas is imported here
+    """
+
+    def __init__(self, name, message=None):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_message"] = message
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_failed"] = False
+
+    def _load(self):
+        if self._lazy_module is None and not self._lazy_failed:
+            try:
+                self.__dict__["_lazy_module"] = importlib.import_module(self._lazy_name)
+            except ImportError:
+                self.__dict__["_lazy_failed"] = True
+                if self._lazy_message:
+                    warnings.warn(self._lazy_message)
+        return self._lazy_module
+
+    def __getattr__(self, item):
+        module = self._load()
+        if module is None:
+            raise ImportError("The {} module is not available.".format(self._lazy_name))
+        value = getattr(module, item)
+        # next accesses are plain attribute lookups
+        self.__dict__[item] = value
+        return value
+
+    def __setattr__(self, key, value):
+        module = self._load()
+        if module is None:
+            raise ImportError("The {} module is not available.".format(self._lazy_name))
+        setattr(module, key, value)
+        self.__dict__.pop(key, None)
+
+    def __bool__(self):
+        return self._load() is not None
+
+    __nonzero__ = __bool__
+
+    def __dir__(self):
+        module = self._load()
+        return dir(module) if module is not None else []
+
+    def __repr__(self):
+        if self._lazy_module is None:
+            return "<lazy module '{}'>".format(self._lazy_name)
+        return repr(self._lazy_module)
+
+
 if not is_ironpython:
-    import psutil
+    psutil = LazyModule("psutil")
 
 pd = None
 if not is_ironpython:
-    try:
-        import pandas as pd
-    except ImportError:
-        warnings.warn(
-            "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
-        )
-        pd = None
-    try:
-        import numpy as np
-    except ImportError:
-        warnings.warn(
-            "The NumPy module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install numpy\n"
-        )
+    pd = LazyModule(
+        "pandas", "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
+    )
+    np = LazyModule(
+        "numpy",
+        "The NumPy module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install numpy\n",
+    )
 
 try:
     import xml.etree.cElementTree as ET
@@ -224,13 +288,11 @@ def open_file(file_path, file_options="r"):
 def _log_method(func, new_args, new_kwargs):
     if not settings.enable_debug_internal_methods_logger and str(func.__name__)[0] == "_":
         return
-    if not settings.enable_debug_geometry_operator_logger and "GeometryOperators" in str(func):
+    func_string = str(func)
+    if not settings.enable_debug_geometry_operator_logger and "GeometryOperators" in func_string:
         return
-    if (
-        not settings.enable_debug_edb_logger
-        and "Edb" in str(func) + str(new_args)
-        or "edb_core" in str(func) + str(new_args)
-    ):
+    func_args_string = func_string + str(new_args)
+    if not settings.enable_debug_edb_logger and "Edb" in func_args_string or "edb_core" in func_args_string:
         return
     line_begin = "    Implicit Arguments: "
     line_begin2 = "    Explicit Arguments: "
@@ -295,55 +357,71 @@ def pyaedt_function_handler(direct_func=None):
     return decorating_function
 
 
+# Flags of ``settings._function_handler_mode`` read by the wrapper of ``pyaedt_function_handler``.
+_ERROR_HANDLER = 1
+_DEBUG_LOGGER = 2
+_PROFILING = 4
+
+_exception_messages = [
+    (TypeError, "Type Error"),
+    (ValueError, "Value Error"),
+    (AttributeError, "Attribute Error"),
+    (KeyError, "Key Error"),
+    (IndexError, "Index Error"),
+    (AssertionError, "Assertion Error"),
+    (NameError, "Name Error"),
+    (IOError, "IO Error"),
+]
+
+
+def _handle_exception(user_function, args, kwargs):
+    ex_info = sys.exc_info()
+    if isinstance(ex_info[1], MethodNotSupportedError):
+        message = "This Method is not supported in current AEDT Design Type."
+        if settings.enable_screen_logs:
+            print("**************************************************************")
+            print("pyaedt error on Method {}:  {}. Please Check again".format(user_function.__name__, message))
+            print("**************************************************************")
+            print("")
+        if settings.enable_file_logs:
+            settings.logger.error(message)
+        return False
+    for error_type, message in _exception_messages:
+        if isinstance(ex_info[1], error_type):
+            break
+    else:
+        message = "General or AEDT Error"
+    _exception(ex_info, user_function, args, kwargs, message)
+    return False
+
+
 def _function_handler_wrapper(user_function):
     def wrapper(*args, **kwargs):
-        if not settings.enable_error_handler:
-            result = user_function(*args, **kwargs)
-            return result
-        else:
+        # The settings are read once per call. The default mode only catches the exceptions.
+        mode = settings._function_handler_mode
+        if mode == _ERROR_HANDLER:
             try:
-                settings.time_tick = time.time()
-                out = user_function(*args, **kwargs)
-                if settings.enable_debug_logger:
-                    _log_method(user_function, args, kwargs)
-                return out
-            except TypeError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Type Error")
-                return False
-            except ValueError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Value Error")
-                return False
-            except AttributeError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Attribute Error")
-                return False
-            except KeyError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Key Error")
-                return False
-            except IndexError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Index Error")
-                return False
-            except AssertionError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Assertion Error")
-                return False
-            except NameError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "Name Error")
-                return False
-            except IOError:
-                _exception(sys.exc_info(), user_function, args, kwargs, "IO Error")
-                return False
-            except MethodNotSupportedError:
-                message = "This Method is not supported in current AEDT Design Type."
-                if settings.enable_screen_logs:
-                    print("**************************************************************")
-                    print("pyaedt error on Method {}:  {}. Please Check again".format(user_function.__name__, message))
-                    print("**************************************************************")
-                    print("")
-                if settings.enable_file_logs:
-                    settings.logger.error(message)
-                return False
+                return user_function(*args, **kwargs)
             except BaseException:
-                _exception(sys.exc_info(), user_function, args, kwargs, "General or AEDT Error")
-                return False
+                return _handle_exception(user_function, args, kwargs)
+        elif not mode:
+            return user_function(*args, **kwargs)
+        start = time.time()
+        frame = profiling._enter(user_function) if mode & _PROFILING else None
+        try:
+            try:
+                out = user_function(*args, **kwargs)
+            finally:
+                if frame is not None:
+                    profiling._exit(frame)
+        except BaseException:
+            if not mode & _ERROR_HANDLER:
+                raise
+            return _handle_exception(user_function, args, kwargs)
+        if mode & _DEBUG_LOGGER:
+            settings.time_tick = start
+            _log_method(user_function, args, kwargs)
+        return out
 
     return wrapper
 
@@ -566,6 +644,37 @@ def generate_unique_project_name(rootname=None, folder_name=None, project_name=N
     return prj
 
 
+def _check_cache_directory(path):
+    """Create a cache directory that only the current user can access, or check an existing one.
+
+    Cache files are loaded with ``pickle``, so a directory that is not owned by the current user
+    or that other users can write to is not used.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the directory.
+
+    Returns
+    -------
+    bool
+        ``True`` when the directory can be used, ``False`` otherwise.
+    """
+    try:
+        if not os.path.isdir(path):
+            os.makedirs(path, 0o700)
+        if os.name == "posix":
+            stat = os.stat(path)
+            if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+                settings.logger.warning(
+                    "The cache directory {} is not used because other users can write to it.".format(path)
+                )
+                return False
+    except OSError:
+        return False
+    return True
+
+
 def _retry_ntimes(n, function, *args, **kwargs):
     """
 
@@ -1263,6 +1372,8 @@ class Settings(object):
         self._enable_debug_internal_methods_logger = False
         self._enable_debug_logger = False
         self._enable_error_handler = True
+        self._enable_profiling = False
+        self._function_handler_mode = _ERROR_HANDLER
         self._non_graphical = False
         self.aedt_version = None
         self.remote_api = False
@@ -1275,6 +1386,14 @@ class Settings(object):
         self.remote_rpc_service_manager_port = 17878
         self._project_properties = {}
         self._project_time_stamp = 0
+        self._enable_aedt_file_cache = False
+        self._aedt_file_cache_path = os.path.join(
+            tempfile.gettempdir(), "pyaedt_file_cache_{}".format(os.path.split(os.path.expanduser("~"))[-1])
+        )
+        self._aedt_file_cache_size = 2048
+        self._enable_lazy_solution_data = False
+        self._solution_data_cache_size = 512
+        self._enable_ffd_fields_cache = False
         self._disable_bounding_box_sat = False
         self._force_error_on_missing_project = False
         self._enable_pandas_output = False
@@ -1298,6 +1417,108 @@ class Settings(object):
     def global_log_file_size(self, value):
         self._global_log_file_size = value
 
+    @property
+    def enable_aedt_file_cache(self):
+        """Enable/Disable the on-disk cache of the decoded AEDT project files. Default is `False`.
+
+        When enabled, the project properties decoded from an AEDT file are saved in
+        ``aedt_file_cache_path`` and reused by any Python session as long as the file path,
+        size and modification time do not change.
+
+        Returns
+        -------
+        bool
+        """
+        return self._enable_aedt_file_cache
+
+    @enable_aedt_file_cache.setter
+    def enable_aedt_file_cache(self, value):
+        self._enable_aedt_file_cache = value
+
+    @property
+    def aedt_file_cache_path(self):
+        """Get/Set the folder of the on-disk cache of the decoded AEDT project files.
+        Default is the ``pyaedt_file_cache_<user>`` folder in the temp directory.
+        The folder is created with access for the current user only, and it is not used
+        if it belongs to another user or if other users can write to it.
+
+        Returns
+        -------
+        str
+        """
+        return self._aedt_file_cache_path
+
+    @aedt_file_cache_path.setter
+    def aedt_file_cache_path(self, value):
+        self._aedt_file_cache_path = value
+
+    @property
+    def aedt_file_cache_size(self):
+        """Get/Set the maximum size in Mbytes of the on-disk cache of the decoded AEDT project files.
+        The least recently used files are removed when the cache is bigger. The default value is ``2048``.
+
+        Returns
+        -------
+        int
+        """
+        return self._aedt_file_cache_size
+
+    @aedt_file_cache_size.setter
+    def aedt_file_cache_size(self, value):
+        self._aedt_file_cache_size = value
+
+    @property
+    def enable_lazy_solution_data(self):
+        """Enable/Disable the lazy loading of the solution data. Default is `False`.
+
+        When enabled, the values of an expression are read from AEDT only the first time
+        that the expression is requested, so the AEDT session must remain open while the
+        solution data is used.
+
+        Returns
+        -------
+        bool
+        """
+        return self._enable_lazy_solution_data
+
+    @enable_lazy_solution_data.setter
+    def enable_lazy_solution_data(self, value):
+        self._enable_lazy_solution_data = value
+
+    @property
+    def solution_data_cache_size(self):
+        """Get/Set the maximum size in Mbytes of the magnitude, dB, and phase arrays cached
+        by each solution data. The least recently used arrays are released when the cache
+        is bigger. The default value is ``512``.
+
+        Returns
+        -------
+        int
+        """
+        return self._solution_data_cache_size
+
+    @solution_data_cache_size.setter
+    def solution_data_cache_size(self, value):
+        self._solution_data_cache_size = value
+
+    @property
+    def enable_ffd_fields_cache(self):
+        """Enable/Disable the binary cache of the embedded element patterns. Default is `False`.
+
+        When enabled, the fields read from the ``.ffd`` files of a far field solution data are
+        saved in an ``eep_fields.npy`` file next to them. The next loads of the same files
+        memory-map this file instead of parsing the text files.
+
+        Returns
+        -------
+        bool
+        """
+        return self._enable_ffd_fields_cache
+
+    @enable_ffd_fields_cache.setter
+    def enable_ffd_fields_cache(self, value):
+        self._enable_ffd_fields_cache = value
+
     @property
     def enable_global_log_file(self):
         """Enable/Disable the global pyaedt log file logging in global temp folder. Default is `True`.
@@ -1441,6 +1662,7 @@ class Settings(object):
     @enable_error_handler.setter
     def enable_error_handler(self, val):
         self._enable_error_handler = val
+        self._update_function_handler_mode()
 
     @property
     def enable_desktop_logs(self):
@@ -1549,6 +1771,36 @@ class Settings(object):
     @enable_debug_logger.setter
     def enable_debug_logger(self, val):
         self._enable_debug_logger = val
+        self._update_function_handler_mode()
+
+    @property
+    def enable_profiling(self):
+        """Get/Set the profiling of the methods decorated with ``pyaedt_function_handler``.
+
+        When enabled, the calls, the wall time, and the AEDT API calls of the methods are recorded.
+        Use :func:`pyaedt.profiling.report` to get the results. AEDT API calls are counted for the
+        AEDT sessions started after enabling the profiling. The default value is ``False``.
+
+        Returns
+        -------
+        bool
+        """
+        return self._enable_profiling
+
+    @enable_profiling.setter
+    def enable_profiling(self, val):
+        self._enable_profiling = val
+        self._update_function_handler_mode()
+
+    def _update_function_handler_mode(self):
+        mode = 0
+        if self._enable_error_handler:
+            mode |= _ERROR_HANDLER
+            if self._enable_debug_logger:
+                mode |= _DEBUG_LOGGER
+        if self._enable_profiling:
+            mode |= _PROFILING
+        self._function_handler_mode = mode
 
 
 settings = Settings()
@@ -1,8 +1,29 @@
 import os
+import re
+from collections import OrderedDict
 
 import pyaedt
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 
+if not is_ironpython:
+    np = LazyModule(
+        "numpy",
+        "The NumPy module is required to read the tables of IBIS models.\n" "Install with \n\npip install numpy\n",
+    )
+
+# Maximum number of indexed IBIS files kept in memory.
+IBIS_FILE_CACHE_SIZE = 16
+_ibis_file_cache = OrderedDict()
+
+# Keywords ending the data of a model.
+_TOP_LEVEL_KEYWORDS = ["component", "model selector", "model", "submodel", "define package model", "end"]
+_IV_TABLE_KEYWORDS = ["pulldown", "pullup", "gnd clamp", "power clamp"]
+_WAVEFORM_KEYWORDS = ["rising waveform", "falling waveform"]
+_IBIS_SCALE_FACTORS = {"T": 1e12, "G": 1e9, "M": 1e6, "k": 1e3, "m": 1e-3, "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15}
+_IBIS_NUMBER = re.compile(r"^([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)([A-Za-z]?)")
+
 
 class Component:
     """Component extracted from ibis model."""
@@ -367,8 +388,11 @@ class Model:
     def __init__(self):
         self._description = []
         self._name = None
+        self._model_type = None
         self._clamp = None
         self._enable = None
+        self._ibis_file = None
+        self._keyword_indices = []
 
     @property
     def name(self):
@@ -406,6 +430,274 @@ class Model:
     def enable(self, value):
         self._enable = value
 
+    def get_tables(self, keyword):
+        """Get the tables of a keyword of the model.
+
+        The tables are read from the IBIS file the first time that they are requested.
+
+        Parameters
+        ----------
+        keyword : str
+            Name of the keyword, for example ``"Pulldown"`` or ``"Rising Waveform"``.
+
+        Returns
+        -------
+        list of :class:`pyaedt.generic.ibis_reader.IbisTable`
+        """
+        if not self._ibis_file:
+            return []
+        keyword = _normalize_keyword(keyword)
+        return [
+            self._ibis_file.get_table(i) for i in self._keyword_indices if self._ibis_file.keywords[i][0] == keyword
+        ]
+
+    def _get_table(self, keyword):
+        tables = self.get_tables(keyword)
+        return tables[0] if tables else None
+
+    @property
+    def pulldown(self):
+        """Pulldown I-V table.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+            Table or ``None`` if the model has no ``[Pulldown]`` keyword.
+        """
+        return self._get_table("Pulldown")
+
+    @property
+    def pullup(self):
+        """Pullup I-V table.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+            Table or ``None`` if the model has no ``[Pullup]`` keyword.
+        """
+        return self._get_table("Pullup")
+
+    @property
+    def gnd_clamp(self):
+        """GND clamp I-V table.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+            Table or ``None`` if the model has no ``[GND Clamp]`` keyword.
+        """
+        return self._get_table("GND Clamp")
+
+    @property
+    def power_clamp(self):
+        """POWER clamp I-V table.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+            Table or ``None`` if the model has no ``[POWER Clamp]`` keyword.
+        """
+        return self._get_table("POWER Clamp")
+
+    @property
+    def ramp(self):
+        """Ramp table.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+            Table or ``None`` if the model has no ``[Ramp]`` keyword.
+        """
+        return self._get_table("Ramp")
+
+    @property
+    def rising_waveforms(self):
+        """Rising V-t tables, one for each test fixture.
+
+        Returns
+        -------
+        list of :class:`pyaedt.generic.ibis_reader.IbisTable`
+        """
+        return self.get_tables("Rising Waveform")
+
+    @property
+    def falling_waveforms(self):
+        """Falling V-t tables, one for each test fixture.
+
+        Returns
+        -------
+        list of :class:`pyaedt.generic.ibis_reader.IbisTable`
+        """
+        return self.get_tables("Falling Waveform")
+
+
+class IbisTable(object):
+    """Table of an IBIS model with typical, minimum, and maximum values.
+
+    I-V tables contain the voltages in ``x`` and the currents in ``typ``, ``min``, and ``max``.
+    V-t tables contain the times in ``x`` and the voltages in ``typ``, ``min``, and ``max``.
+    Ramp tables contain the ``"dV/dt_r"`` and ``"dV/dt_f"`` names in ``x`` and
+    ``[dV, dt]`` rows in ``typ``, ``min``, and ``max``. Values are in SI units, and ``NA``
+    values are ``nan``. Columns are NumPy arrays, or lists on IronPython.
+
+    Parameters
+    ----------
+    keyword : str
+        Name of the keyword.
+    parameters : dict
+        Parameters of the table, like ``{"R_fixture": "50.00Ohm"}``.
+    x : numpy.ndarray or list
+        First column of the table.
+    typ : numpy.ndarray or list
+        Typical values.
+    min : numpy.ndarray or list
+        Minimum values.
+    max : numpy.ndarray or list
+        Maximum values.
+    """
+
+    def __init__(self, keyword, parameters, x, typ, min, max):
+        self.keyword = keyword
+        self.parameters = parameters
+        self.x = x
+        self.typ = typ
+        self.min = min
+        self.max = max
+
+
+class IbisFile(object):
+    """Keyword index of an IBIS file.
+
+    The file is read once to locate the keywords. The content of the keywords is kept in memory,
+    except for the I-V, ramp, and waveform tables of the models, which are read and converted to
+    NumPy arrays the first time that they are requested.
+
+    Parameters
+    ----------
+    filename : str
+        Full path to the IBIS file.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.comment_char = "|"
+        # Keyword name, argument, and content or ``(start, end)`` byte offsets for model tables.
+        self.keywords = []
+        self._tables = {}
+        with open_file(filename, "rb") as f:
+            data = f.read()
+        matches = list(re.finditer(b"(?m)^\\[([^\\]\\r\\n]+)\\]([^\\r\\n]*)", data))
+        for i, match in enumerate(matches):
+            keyword = _normalize_keyword(match.group(1).decode("latin-1"))
+            argument = match.group(2).decode("latin-1").strip()
+            start = match.end()
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+            if keyword in _IV_TABLE_KEYWORDS or keyword in _WAVEFORM_KEYWORDS or keyword == "ramp":
+                content = (start, end)
+            else:
+                content = data[start:end].decode("latin-1")
+            if keyword == "comment char" and argument:
+                self.comment_char = argument[0]
+            self.keywords.append((keyword, argument, content))
+
+    def find(self, keyword, start=0, stop=None):
+        """Find the indices of a keyword.
+
+        Parameters
+        ----------
+        keyword : str
+            Name of the keyword, for example ``"Model"``.
+        start : int, optional
+            First index to search. The default is ``0``.
+        stop : int, optional
+            Index where the search stops. The default is ``None``, in which case the search
+            stops at the end of the file.
+
+        Returns
+        -------
+        list of int
+        """
+        keyword = _normalize_keyword(keyword)
+        stop = len(self.keywords) if stop is None else stop
+        return [i for i in range(start, stop) if self.keywords[i][0] == keyword]
+
+    def get_block_end(self, index):
+        """Get the index of the keyword ending the block of a component, a model, or a model selector.
+
+        Parameters
+        ----------
+        index : int
+            Index of the keyword starting the block.
+
+        Returns
+        -------
+        int
+        """
+        for i in range(index + 1, len(self.keywords)):
+            if self.keywords[i][0] in _TOP_LEVEL_KEYWORDS:
+                return i
+        return len(self.keywords)
+
+    def get_lines(self, index):
+        """Get the lines of a keyword without the comments and the empty lines.
+
+        Parameters
+        ----------
+        index : int
+            Index of the keyword.
+
+        Returns
+        -------
+        list of str
+        """
+        content = self.keywords[index][2]
+        if isinstance(content, tuple):
+            with open_file(self.filename, "rb") as f:
+                f.seek(content[0])
+                content = f.read(content[1] - content[0]).decode("latin-1")
+        lines = []
+        for line in content.splitlines():
+            line = line.split(self.comment_char, 1)[0].strip()
+            if line:
+                lines.append(line)
+        return lines
+
+    def get_table(self, index):
+        """Get the table of a keyword of a model.
+
+        Parameters
+        ----------
+        index : int
+            Index of the keyword.
+
+        Returns
+        -------
+        :class:`pyaedt.generic.ibis_reader.IbisTable`
+        """
+        if index not in self._tables:
+            keyword = self.keywords[index][0]
+            parameters = {}
+            rows = []
+            for line in self.get_lines(index):
+                if "=" in line:
+                    name, value = line.split("=", 1)
+                    parameters[name.strip()] = value.strip()
+                else:
+                    rows.append(line.split())
+            if keyword == "ramp":
+                dv_dt = []
+                for row in rows:
+                    for value in (row[1:] + ["NA", "NA"])[:3]:
+                        dv_dt.extend((value.split("/") + ["NA"])[:2])
+                columns = _split_columns(ibis_values_to_array(dv_dt), 3, 2)
+                names = [row[0] for row in rows]
+                table = IbisTable(keyword, parameters, names, *columns)
+            else:
+                values = ibis_values_to_array([i for row in rows for i in (row + ["NA", "NA"])[:4]])
+                table = IbisTable(keyword, parameters, *_split_columns(values, 4))
+            self._tables[index] = table
+        return self._tables[index]
+
 
 class Ibis:
     """Ibis model with all data extracted: name, components, models.
@@ -525,18 +817,19 @@ class IbisReader(object):
         ibis = Ibis(ibis_name, self._circuit)
 
         # Read *.ibis file.
-        with open_file(self._filename, "r") as ibis_file:
-            while True:
-                current_line = ibis_file.readline()
-                if not current_line:
-                    break
-
-                if is_started_with(current_line, "[Component] "):
-                    self.read_component(ibis, current_line, ibis_file)
-                elif is_started_with(current_line, "[Model] "):
-                    self.read_model(ibis, current_line, ibis_file)
-                elif is_started_with(current_line, "[Model Selector] "):
-                    self.read_model_selector(ibis, current_line, ibis_file)
+        ibis_file = load_ibis_file(self._filename)
+        for index, (keyword, argument, _) in enumerate(ibis_file.keywords):
+            if not argument:
+                continue
+            if keyword == "component":
+                self._read_indexed_component(ibis, ibis_file, index)
+            elif keyword == "model":
+                self._read_indexed_model(ibis, ibis_file, index)
+            elif keyword == "model selector":
+                model_selector = ModelSelector()
+                model_selector.name = argument
+                model_selector.model_selector_items = [self.make_model(i) for i in ibis_file.get_lines(index)]
+                ibis.model_selectors.append(model_selector)
 
         buffers = {}
         for model_selector in ibis.model_selectors:
@@ -584,6 +877,39 @@ class IbisReader(object):
 
         self._ibis_model = ibis
 
+    def _read_indexed_component(self, ibis, ibis_file, index):
+        component = Component()
+        component.name = ibis_file.keywords[index][1]
+        for i in range(index + 1, ibis_file.get_block_end(index)):
+            keyword, argument, _ = ibis_file.keywords[i]
+            if keyword == "manufacturer":
+                component.manufacturer = argument
+            elif keyword == "package":
+                for line in ibis_file.get_lines(i):
+                    name = line.split()[0].lower()
+                    if name in ["r_pkg", "l_pkg", "c_pkg"]:
+                        setattr(component, name[0].upper() + name[1:], line)
+            elif keyword == "pin":
+                for line in ibis_file.get_lines(i):
+                    pin = self.make_pin_object(line, component.name, ibis)
+                    component.pins[pin.name] = pin
+        ibis.components[component.name] = component
+
+    def _read_indexed_model(self, ibis, ibis_file, index):
+        model = Model()
+        model.name = ibis_file.keywords[index][1]
+        for line in ibis_file.get_lines(index):
+            values = line.split(None, 1)
+            if len(values) == 2 and values[0].lower() == "model_type":
+                model.model_type = values[1].strip()
+            elif len(values) == 2 and values[0].lower() == "enable":
+                model.enable = values[1].strip()
+        model._ibis_file = ibis_file
+        model._keyword_indices = list(range(index + 1, ibis_file.get_block_end(index)))
+        if any(ibis_file.keywords[i][0] == "gnd clamp" for i in model._keyword_indices):
+            model.clamp = True
+        ibis.models.append(model)
+
     # Model
     def read_model(self, ibis, current_line, ibis_file):
         """Extracts model's info.
@@ -685,7 +1011,7 @@ class IbisReader(object):
         i_start = current_line.index(" ", 1)
 
         if i_start > 0:
-            item.name = current_line[i_start:].strip()
+            item.name = current_line[:i_start].strip()
             item.description = current_line[i_start:].strip()
 
         return item
@@ -876,3 +1202,96 @@ def is_started_with(src, find, ignore_case=True):
     if ignore_case:
         return src.lower().startswith(find.lower())
     return src.startswith(find)
+
+
+def _normalize_keyword(keyword):
+    """Normalize an IBIS keyword, which is case insensitive and where underscores and spaces are equivalent."""
+    return " ".join(keyword.replace("_", " ").lower().split())
+
+
+def ibis_values_to_array(values):
+    """Convert IBIS numbers to a NumPy array.
+
+    The numbers can have a scaling suffix and units, like ``"1.2mA"`` or ``"50.00Ohm"``.
+    ``NA`` values are converted to ``nan``.
+
+    Parameters
+    ----------
+    values : list of str
+        IBIS numbers.
+
+    Returns
+    -------
+    numpy.ndarray or list
+        Array of the numbers. A list of floats is returned on IronPython, where NumPy is not available.
+    """
+    if is_ironpython:
+        result = []
+        for value in values:
+            match = _IBIS_NUMBER.match(value)
+            if match:
+                result.append(float(match.group(1)) * _IBIS_SCALE_FACTORS.get(match.group(2), 1.0))
+            else:
+                result.append(float("nan"))
+        return result
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        pass
+    result = np.empty(len(values))
+    for i, value in enumerate(values):
+        match = _IBIS_NUMBER.match(value)
+        if match:
+            result[i] = float(match.group(1)) * _IBIS_SCALE_FACTORS.get(match.group(2), 1.0)
+        else:
+            result[i] = np.nan
+    return result
+
+
+def _split_columns(values, columns, width=1):
+    """Split the values of a table, given row by row, into columns.
+
+    Each row has ``columns`` columns of ``width`` values. Columns with more than one value
+    per row contain one ``[value1, value2, ...]`` item per row.
+    """
+    if is_ironpython:
+        step = columns * width
+        if width == 1:
+            return [values[i::step] for i in range(columns)]
+        return [
+            [values[row + i * width : row + (i + 1) * width] for row in range(0, len(values), step)]
+            for i in range(columns)
+        ]
+    values = values.reshape((-1, columns, width) if width > 1 else (-1, columns))
+    return [values[:, i] for i in range(columns)]
+
+
+def load_ibis_file(filename):
+    """Get the keyword index of an IBIS file.
+
+    Indexes are kept in memory for the last ``IBIS_FILE_CACHE_SIZE`` files, so that opening
+    again a file that did not change does not read it again.
+
+    Parameters
+    ----------
+    filename : str
+        Full path to the IBIS file.
+
+    Returns
+    -------
+    :class:`pyaedt.generic.ibis_reader.IbisFile`
+    """
+    key = os.path.normcase(os.path.abspath(filename))
+    stat = os.stat(filename)
+    cached = _ibis_file_cache.pop(key, None)
+    if cached is None or cached[0] != (stat.st_size, stat.st_mtime):
+        cached = ((stat.st_size, stat.st_mtime), IbisFile(filename))
+    _ibis_file_cache[key] = cached
+    while len(_ibis_file_cache) > IBIS_FILE_CACHE_SIZE:
+        _ibis_file_cache.popitem(last=False)
+    return cached[1]
+
+
+def clear_ibis_file_cache():
+    """Remove all the IBIS file indexes from memory."""
+    _ibis_file_cache.clear()
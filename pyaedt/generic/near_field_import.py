@@ -3,8 +3,26 @@ import glob
 import os
 import re
 
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 
+if not is_ironpython:
+    from concurrent.futures import ThreadPoolExecutor
+
+    np = LazyModule(
+        "numpy",
+        "The NumPy module is required to convert large near field data folders.\n"
+        "Install with \n\npip install numpy\n",
+    )
+else:
+    np = None
+
+FIELD_COMPONENTS = ["Ex", "Ey", "Ez", "Hx", "Hy", "Hz"]
+BOX_FACES = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
+# Number of rows of the ``.nfd`` file formatted and written at once.
+NFD_CHUNK_SIZE = 100000
+
 
 class BoxFacePointsAndFields(object):
     """Data model class containing field component and coordinates."""
@@ -44,111 +62,195 @@ class BoxFacePointsAndFields(object):
                 self.im[el] = zero_field_z_faces
 
 
-def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces=True, output_folder=None):
-    """Convert a near field data folder to hfss `nfd` file and link it to `and` file.
+def _read_plain_dat_data(data):
+    """Split the content of a ``.dat`` file made of space separated values with NumPy.
+
+    Returns the ``x``, ``y``, ``z``, ``real``, and ``imag`` columns as arrays of bytes, or ``None``
+    when the content has other characters than printable ASCII characters, spaces, and new lines or
+    has consecutive spaces between two values of a line.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_space = buf == 32
+    is_newline = buf == 10
+    if ((buf < 32) & ~is_newline).any() or (buf > 126).any():
+        return None
+    is_separator = is_space | is_newline
+    starts = np.flatnonzero(~is_separator & np.concatenate(([True], is_separator[:-1])))
+    newlines = np.flatnonzero(is_newline)
+    start_lines = np.searchsorted(newlines, starts)
+    values_per_line = np.bincount(start_lines, minlength=newlines.size + 1)
+    doubles = np.flatnonzero(is_space[:-1] & is_space[1:])
+    if doubles.size and starts.size:
+        double_lines = np.searchsorted(newlines, doubles)
+        first = np.searchsorted(start_lines, double_lines, "left")
+        last = np.searchsorted(start_lines, double_lines, "right") - 1
+        inner = (values_per_line[double_lines] > 1) & (
+            (starts[np.minimum(first, starts.size - 1)] < doubles) & (starts[np.maximum(last, 0)] > doubles)
+        )
+        if inner.any():
+            return None
+    values = np.array(data.split(), dtype="S")
+    keep = np.repeat(values_per_line == 5, values_per_line)
+    if not keep.all():
+        values = values[keep]
+    table = values.reshape(-1, 5)
+    return [table[:, i] for i in range(5)]
 
-    Parameters
-    ----------
-    dat_folder : str
-        Full path to the folder containing near fields data.
-        Folder will contain 24 files in the following format: `data_Ex_ymin.dat`. Same for H Fields.
-    frequency : float, int, str
-        Frequency in `GHz`.
-    invert_phase_for_lower_faces : bool
-        Add 180 deg for all fields at 'negative' faces (xmin, ymin, zmin).
-    output_folder : str, optional
-        Output folder where files will be saved.
+
+def _read_dat_file(file_name):
+    """Read the ``x``, ``y``, ``z``, ``real``, and ``imag`` columns of a ``.dat`` file.
+
+    Only the lines with five values separated by spaces are read. The values are kept as text,
+    so that they are written unchanged to the ``.nfd`` file.
 
     Returns
     -------
-    str
-        Full path to `.and` file.
+    tuple
+        List of the five columns and whether one of the values contains a character that
+        the CSV writer quotes.
     """
-    file_keys = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
-    components = {
-        "xmin": BoxFacePointsAndFields(),
-        "ymin": BoxFacePointsAndFields(),
-        "zmin": BoxFacePointsAndFields(),
-        "xmax": BoxFacePointsAndFields(),
-        "ymax": BoxFacePointsAndFields(),
-        "zmax": BoxFacePointsAndFields(),
-    }
-
-    file_names = glob.glob(dat_folder + "/*.dat")
-    for data_file in file_names:
+    columns = None
+    if np:
+        with open_file(file_name, "rb") as f:
+            data = f.read()
+        columns = _read_plain_dat_data(data)
+        if columns is not None:
+            return columns, b"," in data or b'"' in data
+    columns = [[], [], [], [], []]
+    with open_file(file_name, "r") as f:
+        for line in f:
+            line = line.strip().split(" ")
+            if len(line) == 5:
+                for column, value in zip(columns, line):
+                    column.append(value)
+    quote = any("," in value or '"' in value for column in columns for value in column)
+    return columns, quote
+
+
+def _invert_phase(values):
+    if isinstance(values, list):
+        return [str(-float(i)) for i in values]
+    return -values.astype(float)
+
+
+def _load_face(face, file_data, invert_phase):
+    """Assemble the 15 columns of the ``.nfd`` file for a face of the box from its ``.dat`` files."""
+    xyz = []
+    fields = {}
+    quote = False
+    for field_component, (columns, quote_file) in file_data:
+        if not xyz or not len(xyz[0]):
+            xyz = columns[:3]
+        if field_component not in FIELD_COMPONENTS:
+            print("Error in set_field_component function.")
+            continue
+        quote = quote or quote_file
+        real, imag = columns[3], columns[4]
+        if invert_phase:
+            real, imag = _invert_phase(real), _invert_phase(imag)
+        fields[field_component] = [real, imag]
+    if not xyz:
+        xyz = [[], [], []]
+    face_columns = list(xyz)
+    for field_component in FIELD_COMPONENTS:
+        for values in fields.get(field_component, [None, None]):
+            if values is not None and len(values) < len(xyz[0]):
+                raise IndexError("Face {} has fewer {} values than points.".format(face, field_component))
+            face_columns.append(values)
+    return face_columns, quote
+
+
+def _format_values(values, start, stop):
+    """Format a chunk of a column of the ``.nfd`` file as a list of bytes."""
+    if stop <= start:
+        return []
+    if values is None:
+        return [b"0"] * (stop - start)
+    values = values[start:stop]
+    if not isinstance(values, list):
+        if values.dtype.kind == "S":
+            return values.tolist()
+        values = map(str, values.tolist())
+    return "\n".join(values).encode("utf-8").split(b"\n")
+
+
+def _write_face(file, face_columns, first_index, quote):
+    """Write the rows of a face to the ``.nfd`` file in chunks of ``NFD_CHUNK_SIZE`` rows."""
+    writer = csv.writer(file, delimiter=",", lineterminator="\n")
+    n_points = len(face_columns[0])
+    for start in range(0, n_points, NFD_CHUNK_SIZE):
+        stop = min(start + NFD_CHUNK_SIZE, n_points)
+        chunk = [_format_values([str(i) for i in range(first_index + start, first_index + stop)], 0, stop - start)]
+        chunk.extend(_format_values(values, start, stop) for values in face_columns)
+        if quote:
+            writer.writerows(zip(*[[value.decode("utf-8") for value in values] for values in chunk]))
+        else:
+            file.write(b"".join([b",".join(row) + b"\n" for row in zip(*chunk)]).decode("utf-8"))
+    return n_points
+
+
+def _and_file_name(dat_folder, output_folder):
+    """Get the full path of the ``.and`` file of a near field data folder."""
+    if not output_folder:
+        output_folder = os.path.dirname(dat_folder)
+    return os.path.join(output_folder, os.path.basename(dat_folder) + ".and")
+
+
+def _convert_nearfield_folder(dat_folder, frequency, invert_phase_for_lower_faces, output_folder, pool):
+    face_files = dict((face, []) for face in BOX_FACES)
+    for data_file in glob.glob(dat_folder + "/*.dat"):
         match = re.search(r"data_(\S+)_(\S+).dat", os.path.basename(data_file))
         field_component = match.group(1)
         face = match.group(2)
-
         if not os.path.exists(data_file):
             continue
-        # Read in all data for the current file
-        x, y, z = [], [], []
-        real, imag = [], []
-        with open_file(data_file, "r") as f:
-            for line in f:
-                line = line.strip().split(" ")
-                if len(line) == 5:
-                    x.append(line[0])
-                    y.append(line[1])
-                    z.append(line[2])
-                    real.append(line[3])
-                    imag.append(line[4])
-
-        assert face in components, "Wrong file name format. Face not found."
-        if not components[face].x:
-            components[face].set_xyz_points(x, y, z)
-            components[face].fill_empty_data()
-        if "min" in face:
-            components[face].set_field_component(field_component, real, imag, invert_phase_for_lower_faces)
-        else:
-            components[face].set_field_component(field_component, real, imag, False)
+        assert face in face_files, "Wrong file name format. Face not found."
+        face_files[face].append((field_component, data_file))
 
-    full_data = []
-    index = 1
-    for el in list(file_keys):
-        for k in range(index, index + len(components[el].x)):
-            row = []
-            row.append(k)
-            row.append(components[el].x[k - index])
-            row.append(components[el].y[k - index])
-            row.append(components[el].z[k - index])
-            for field in ["Ex", "Ey", "Ez", "Hx", "Hy", "Hz"]:
-                row.append(components[el].re[field][k - index])
-                row.append(components[el].im[field][k - index])
-            full_data.append(row)
-        index += len(components[el].x)
+    def submit(face):
+        files = face_files[face]
+        if pool:
+            return [(component, pool.submit(_read_dat_file, file_name)) for component, file_name in files]
+        return [(component, _read_dat_file(file_name)) for component, file_name in files]
 
     # WRITE .NFD FILE
     ####################################################################################################
     # .nfd file needs the following 16 columns where index starts with 1:
     # index, x, y, z, re_ex, im_ex, re_ey, im_ey, re_ez, im_ez, re_hx, im_hx, re_hy, im_hy, re_hz, im_hz
-    if not output_folder:
-        output_folder = os.path.dirname(dat_folder)
-    directory_name = os.path.basename(dat_folder)
-    nfd_name = directory_name + ".nfd"
-    nfd_full_file = os.path.join(output_folder, nfd_name)
-    and_full_file = os.path.join(output_folder, directory_name + ".and")
+    and_full_file = _and_file_name(dat_folder, output_folder)
+    nfd_full_file = os.path.splitext(and_full_file)[0] + ".nfd"
+    nfd_name = os.path.basename(nfd_full_file)
 
     commented_header_line = "#Index, X, Y, Z, Ex(real, imag), Ey(real, imag), Ez(real, imag), "
     commented_header_line += "Hx(real, imag), Hy(real, imag), Hz(real, imag)\n"
 
+    first_points = {}
+    index = 1
+    # The .dat files of the next face are read while the current face is written.
+    pending = submit(BOX_FACES[0])
     with open_file(nfd_full_file, "w") as file:
-        writer = csv.writer(file, delimiter=",", lineterminator="\n")
         file.write(commented_header_line)
         file.write("Frequencies 1\n")
         file.write("Frequency " + str(frequency) + "GHz\n")
-        writer.writerows(full_data)
+        for i, face in enumerate(BOX_FACES):
+            file_data = [(component, data.result() if pool else data) for component, data in pending]
+            if i + 1 < len(BOX_FACES):
+                pending = submit(BOX_FACES[i + 1])
+            invert = invert_phase_for_lower_faces and "min" in face
+            face_columns, quote = _load_face(face, file_data, invert)
+            first_points[face] = [values[:1] for values in face_columns[:3]]
+            del file_data
+            index += _write_face(file, face_columns, index, quote)
 
     print(".nfd file written to %s" % nfd_full_file)  # Prints if running ipy64 through external editor
 
-    size_x = float(components["xmax"].x[0]) - float(components["xmin"].x[0])
-    size_y = float(components["ymax"].y[0]) - float(components["ymin"].y[0])
-    size_z = float(components["zmax"].z[0]) - float(components["zmin"].z[0])
+    size_x = float(first_points["xmax"][0][0]) - float(first_points["xmin"][0][0])
+    size_y = float(first_points["ymax"][1][0]) - float(first_points["ymin"][1][0])
+    size_z = float(first_points["zmax"][2][0]) - float(first_points["zmin"][2][0])
 
-    center_x = float(components["xmin"].x[0]) + float(size_x / 2.0)
-    center_y = float(components["ymin"].y[0]) + float(size_y / 2.0)
-    center_z = float(components["zmin"].z[0]) + float(size_z / 2.0)
+    center_x = float(first_points["xmin"][0][0]) + float(size_x / 2.0)
+    center_y = float(first_points["ymin"][1][0]) + float(size_y / 2.0)
+    center_z = float(first_points["zmin"][2][0]) + float(size_z / 2.0)
 
     sx_mm = size_x * 1000
     sy_mm = size_y * 1000
@@ -170,3 +272,49 @@ def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces
         file.write('	FreqData("' + str(frequency) + 'GHz","' + nfd_name + '")\n')
         file.write("$end 'NearFieldData'\n")
     return and_full_file
+
+
+def convert_nearfield_data(dat_folder, frequency=6, invert_phase_for_lower_faces=True, output_folder=None):
+    """Convert a near field data folder to hfss `nfd` file and link it to `and` file.
+
+    The ``.dat`` files of a face of the box are read in parallel, while the previous face is
+    written to the ``.nfd`` file in chunks, so that only two faces are kept in memory.
+
+    Parameters
+    ----------
+    dat_folder : str, list
+        Full path to the folder containing near fields data.
+        Folder will contain 24 files in the following format: `data_Ex_ymin.dat`. Same for H Fields.
+        A list of folders, one for each frequency, can also be provided.
+    frequency : float, int, str, list
+        Frequency in `GHz`. A list with one frequency for each folder is required when ``dat_folder`` is a list.
+    invert_phase_for_lower_faces : bool
+        Add 180 deg for all fields at 'negative' faces (xmin, ymin, zmin).
+    output_folder : str, optional
+        Output folder where files will be saved. The files are named after the data folders, so
+        the data folders written to the same output folder must have different names.
+
+    Returns
+    -------
+    str, list
+        Full path to `.and` file or list of full paths to the `.and` files when ``dat_folder`` is a list.
+    """
+    folders = dat_folder if isinstance(dat_folder, (list, tuple)) else [dat_folder]
+    frequencies = frequency if isinstance(frequency, (list, tuple)) else [frequency]
+    if len(folders) != len(frequencies):
+        raise ValueError("One frequency is required for each near field data folder.")
+    and_files = [os.path.normcase(os.path.abspath(_and_file_name(folder, output_folder))) for folder in folders]
+    if len(set(and_files)) < len(and_files):
+        raise ValueError("Near field data folders with the same name cannot be written to the same output folder.")
+    pool = ThreadPoolExecutor() if not is_ironpython else None
+    try:
+        and_files = [
+            _convert_nearfield_folder(folder, freq, invert_phase_for_lower_faces, output_folder, pool)
+            for folder, freq in zip(folders, frequencies)
+        ]
+    finally:
+        if pool:
+            pool.shutdown()
+    if isinstance(dat_folder, (list, tuple)):
+        return and_files
+    return and_files[0]
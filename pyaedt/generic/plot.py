@@ -4,12 +4,12 @@ import os
 import tempfile
 import time
 import warnings
-from collections import defaultdict
 from datetime import datetime
 
 from pyaedt import pyaedt_function_handler
 from pyaedt.generic.constants import AEDT_UNITS
 from pyaedt.generic.constants import CSS4_COLORS
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 
@@ -22,28 +22,16 @@ if not is_ironpython:
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
 
-    try:
-        import pyvista as pv
-
-        pyvista_available = True
-    except ImportError:
-        warnings.warn(
-            "The PyVista module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install pyvista\n\nRequires CPython."
-        )
-
-    try:
-        import matplotlib.pyplot as plt
-        from matplotlib.patches import PathPatch
-        from matplotlib.path import Path
-
-    except ImportError:
-        warnings.warn(
-            "The Matplotlib module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install matplotlib\n\nRequires CPython."
-        )
-    except:
-        pass
+    pv = LazyModule(
+        "pyvista",
+        "The PyVista module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install pyvista\n\nRequires CPython.",
+    )
+    plt = LazyModule(
+        "matplotlib.pyplot",
+        "The Matplotlib module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install matplotlib\n\nRequires CPython.",
+    )
 
 
 @pyaedt_function_handler()
@@ -103,59 +91,69 @@ def is_float(istring):
         return 0
 
 
+# triangles of the faces of each element type, as positions of the element nodes
+_element_triangles = {
+    (10, True): [
+        [0, 1, 3],
+        [1, 2, 4],
+        [1, 4, 3],
+        [3, 4, 5],
+        [9, 6, 8],
+        [6, 0, 3],
+        [6, 3, 8],
+        [8, 3, 5],
+        [9, 7, 8],
+        [7, 2, 4],
+        [7, 4, 8],
+        [8, 4, 5],
+        [9, 7, 6],
+        [7, 2, 1],
+        [7, 1, 6],
+        [6, 1, 0],
+    ],
+    (10, False): [[0, 2, 5], [9, 0, 5], [9, 2, 0], [9, 2, 5]],
+    (6, True): [[0, 1, 3], [1, 2, 4], [1, 4, 3], [3, 4, 5]],
+    (6, False): [[0, 2, 5]],
+    (4, True): [[0, 1, 3], [1, 2, 3], [0, 1, 2], [0, 2, 3]],
+    (3, True): [[0, 1, 2]],
+    (3, False): [[0, 1, 2]],
+}
+
+
 def _triangle_vertex(elements_nodes, num_nodes_per_element, take_all_nodes=True):
-    trg_vertex = []
-    if num_nodes_per_element == 10 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[4]])
-            trg_vertex.append([e[1], e[4], e[3]])
-            trg_vertex.append([e[3], e[4], e[5]])
-
-            trg_vertex.append([e[9], e[6], e[8]])
-            trg_vertex.append([e[6], e[0], e[3]])
-            trg_vertex.append([e[6], e[3], e[8]])
-            trg_vertex.append([e[8], e[3], e[5]])
-
-            trg_vertex.append([e[9], e[7], e[8]])
-            trg_vertex.append([e[7], e[2], e[4]])
-            trg_vertex.append([e[7], e[4], e[8]])
-            trg_vertex.append([e[8], e[4], e[5]])
-
-            trg_vertex.append([e[9], e[7], e[6]])
-            trg_vertex.append([e[7], e[2], e[1]])
-            trg_vertex.append([e[7], e[1], e[6]])
-            trg_vertex.append([e[6], e[1], e[0]])
-
-    elif num_nodes_per_element == 10 and not take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[2], e[5]])
-            trg_vertex.append([e[9], e[0], e[5]])
-            trg_vertex.append([e[9], e[2], e[0]])
-            trg_vertex.append([e[9], e[2], e[5]])
-
-    elif num_nodes_per_element == 6 and not take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[2], e[5]])
-
-    elif num_nodes_per_element == 6 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[4]])
-            trg_vertex.append([e[1], e[4], e[3]])
-            trg_vertex.append([e[3], e[4], e[5]])
-
-    elif num_nodes_per_element == 4 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[3]])
-            trg_vertex.append([e[0], e[1], e[2]])
-            trg_vertex.append([e[0], e[2], e[3]])
-
-    elif num_nodes_per_element == 3:
-        trg_vertex = elements_nodes
-
-    return trg_vertex
+    """Split the elements of a field plot into triangles.
+
+    Parameters
+    ----------
+    elements_nodes : list or :class:`numpy.ndarray`
+        Nodes of each element, with shape ``(number of elements, num_nodes_per_element)``.
+    num_nodes_per_element : int
+        Number of nodes of each element.
+    take_all_nodes : bool, optional
+        Whether to split the faces in triangles using the mid-side nodes. The default is ``True``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Nodes of the triangles, with shape ``(number of triangles, 3)``.
+    """
+    elements_nodes = np.asarray(elements_nodes, dtype=int).reshape((-1, num_nodes_per_element))
+    triangles = _element_triangles.get((num_nodes_per_element, bool(take_all_nodes)))
+    if triangles is None:
+        return np.zeros((0, 3), dtype=int)
+    return elements_nodes[:, triangles].reshape((-1, 3))
+
+
+def _parse_aedtplt_values(line, dtype=float):
+    """Convert the comma-separated values between the brackets of a field plot line to an array."""
+    values = line[line.find("(") + 1 : line.rfind(")")]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(values, dtype=dtype, sep=",")
+        except (ValueError, DeprecationWarning):
+            # some values are not numbers
+            return np.array([is_float(value) for value in values.split(",")], dtype=dtype)
 
 
 def _parse_aedtplt(filepath):
@@ -178,98 +176,69 @@ def _parse_aedtplt(filepath):
                 l_tmp.append(line)
                 continue
     for drawing_lines in lines:
-        bounding = []
         elements = []
         nodes_list = []
-        solution = []
+        sols = None
         for l in drawing_lines:
-            if "BoundingBox(" in l:
-                bounding = l[l.find("(") + 1 : -2].split(",")
-                bounding = [i.strip() for i in bounding]
             if "Elements(" in l:
-                elements = l[l.find("(") + 1 : -2].split(",")
-                elements = [int(i.strip()) for i in elements]
+                elements = _parse_aedtplt_values(l, int)
             if "Nodes(" in l:
-                nodes_list = l[l.find("(") + 1 : -2].split(",")
-                nodes_list = [float(i.strip()) for i in nodes_list]
+                nodes_list = _parse_aedtplt_values(l)
             if "ElemSolution(" in l:
-                # convert list of strings to list of floats
-                sols = l[l.find("(") + 1 : -2].split(",")
-                sols = [is_float(value) for value in sols]
-                # sols = [float(i.strip()) for i in sols]
-                num_solution_per_element = int(sols[2])
-                num_elements = elements[1]
-                num_nodes = elements[6]
-                sols = sols[3:]
-                if num_nodes == num_solution_per_element or num_solution_per_element // num_nodes < 3:
-                    sols = [
-                        sols[i : i + num_solution_per_element] for i in range(0, len(sols), num_solution_per_element)
-                    ]
-                    solution = [sum(i) / num_solution_per_element for i in sols]
-                else:
-                    sols = [
-                        sols[i : i + num_solution_per_element] for i in range(0, len(sols), num_solution_per_element)
-                    ]
-                    solution = [
-                        [sum(i[::3]) / num_solution_per_element * 3 for i in sols],
-                        [sum(i[1::3]) / num_solution_per_element * 3 for i in sols],
-                        [sum(i[2::3]) / num_solution_per_element * 3 for i in sols],
-                    ]
-
-        nodes = [[nodes_list[i], nodes_list[i + 1], nodes_list[i + 2]] for i in range(0, len(nodes_list), 3)]
-        num_nodes = elements[0]
+                sols = _parse_aedtplt_values(l)
+
+        nodes = np.asarray(nodes_list).reshape((-1, 3))
         num_elements = elements[1]
-        elements = elements[2:]
-        element_type = elements[0]
-        num_nodes_per_element = elements[4]
+        num_nodes_per_element = elements[6]
         header_length = 5
-        elements_nodes = []
-        for i in range(0, len(elements), num_nodes_per_element + header_length):
-            elements_nodes.append([elements[i + header_length + n] for n in range(num_nodes_per_element)])
-        if solution:
+        elements_nodes = elements[2:].reshape((-1, num_nodes_per_element + header_length))[:, header_length:]
+        solution = []
+        if sols is not None:
+            num_solution_per_element = int(sols[2])
+            sols = sols[3 : 3 + num_elements * num_solution_per_element].reshape((-1, num_solution_per_element))
+            if (
+                num_nodes_per_element == num_solution_per_element
+                or num_solution_per_element // num_nodes_per_element < 3
+            ):
+                solution = sols.mean(axis=1)
+            else:
+                solution = [sols[:, i::3].sum(axis=1) / num_solution_per_element * 3 for i in range(3)]
+        if len(solution):
             take_all_nodes = True  # solution case
         else:
             take_all_nodes = False  # mesh case
         trg_vertex = _triangle_vertex(elements_nodes, num_nodes_per_element, take_all_nodes)
-        # remove duplicates
-        nodup_list = [list(i) for i in list(set([frozenset(t) for t in trg_vertex]))]
+        # remove duplicates, keeping the first occurrence of every triangle
+        sorted_vertex = np.sort(trg_vertex, axis=1).astype(np.int64)
+        size = int(sorted_vertex.max()) + 1 if len(sorted_vertex) else 1
+        if size < 2**21:
+            # a single integer key per triangle is much faster than unique rows
+            keys = (sorted_vertex[:, 0] * size + sorted_vertex[:, 1]) * size + sorted_vertex[:, 2]
+            _, first = np.unique(keys, return_index=True)
+        else:
+            _, first = np.unique(sorted_vertex, axis=0, return_index=True)
+        nodup_list = trg_vertex[np.sort(first)]
         log = True
-        if solution:
-            if isinstance(solution[0], list):
+        if len(solution):
+            # average on the nodes the values of the elements they belong to
+            used_nodes = elements_nodes.ravel()
+            count = np.bincount(used_nodes)
+            used = count > 0
+            if isinstance(solution, list):
                 temps = []
                 for sol in solution:
-                    sv = {}
-                    sv_i = {}
-                    sv = defaultdict(lambda: 0, sv)
-                    sv_i = defaultdict(lambda: 1, sv_i)
-                    for els, s in zip(elements_nodes, sol):
-                        for el in els:
-                            sv[el] = (sv[el] + s) / sv_i[el]
-                            sv_i[el] = 2
-                    temps.append(np.array([sv[v] for v in sorted(sv.keys())]))
+                    total = np.bincount(used_nodes, weights=np.repeat(sol, num_nodes_per_element))
+                    temps.append(total[used] / count[used])
             else:
-                sv = {}
-                sv_i = {}
-                sv = defaultdict(lambda: 0, sv)
-                sv_i = defaultdict(lambda: 1, sv_i)
-
-                for els, s in zip(elements_nodes, solution):
-                    for el in els:
-                        sv[el] = (sv[el] + s) / sv_i[el]
-                        sv_i[el] = 2
-                temps = np.array([sv[v] for v in sorted(sv.keys())])
+                total = np.bincount(used_nodes, weights=np.repeat(solution, num_nodes_per_element))
+                temps = total[used] / count[used]
             scalars.append(temps)
             if np.min(temps) <= 0:
                 log = False
-        array = [[3] + [j - 1 for j in i] for i in nodup_list]
-
-        faces.append(np.hstack(array))
-        vertices.append(np.array(nodes))
-        # surf = pv.PolyData(vertices, faces)
+        array = np.hstack([np.full((len(nodup_list), 1), 3, dtype=int), nodup_list - 1])
 
-        # surf.point_data[field.label] = temps
-    # field.log = log
-    # field._cached_polydata = surf
+        faces.append(array.ravel())
+        vertices.append(nodes)
     return vertices, faces, scalars, log
 
 
@@ -488,6 +457,9 @@ def plot_matplotlib(plot_data, size=(2000, 1000), show_legend=True, xlabel="", y
     """
     dpi = 100.0
     figsize = (size[0] / dpi, size[1] / dpi)
+    from matplotlib.patches import PathPatch
+    from matplotlib.path import Path
+
     fig, ax = plt.subplots(figsize=figsize)
     if isinstance(plot_data, str):
         plot_data = ast.literal_eval(plot_data)
@@ -1,8 +1,12 @@
+import os
 import sys
 import threading
+import time
 import warnings
+from collections import OrderedDict
 
 from pyaedt.generic.general_methods import is_ironpython
+from pyaedt.generic.general_methods import settings
 
 if not is_ironpython:
     try:
@@ -12,39 +16,24 @@ if not is_ironpython:
             "The NumPy module is required to run some functionalities of PostProcess.\n"
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
+    import ctypes
+    import multiprocessing
+    from concurrent.futures import ThreadPoolExecutor
 
+# objective value given to the individuals whose evaluation does not end in time
+_failed_objective = 1e10
 
-class ThreadTrace(threading.Thread):
-    """Control a thread with python"""
 
-    def __init__(self, *args, **keywords):
-        threading.Thread.__init__(self, *args, **keywords)
-        self.killed = False
+def _call_objective(function, x, reference_file=None):
+    """Call the objective function on one individual. It is a module function so that it can be pickled."""
+    if reference_file:
+        return function(x, reference_file)
+    return function(x)
 
-    def start(self):
-        self.__run_backup = self.run
-        self.run = self.__run
-        threading.Thread.start(self)
 
-    def __run(self):
-        sys.settrace(self.globaltrace)
-        self.__run_backup()
-        self.run = self.__run_backup
-
-    def globaltrace(self, frame, event, arg):
-        if event == "call":
-            return self.localtrace
-        else:
-            return None
-
-    def localtrace(self, frame, event, arg):
-        if self.killed:
-            if event == "line":
-                raise SystemExit()
-        return self.localtrace
-
-    def kill(self):
-        self.killed = True
+def _stop_thread(thread):
+    """Raise ``SystemExit`` in a thread so that it stops at its next Python instruction."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread.ident), ctypes.py_object(SystemExit))
 
 
 class GeneticAlgorithm(object):
@@ -96,6 +85,31 @@ class GeneticAlgorithm(object):
                 Successive iterations without improvement. If None it is ineffective
     progress_bar: bool
         Show progress bar. The default is True.
+    evaluation_backend: str or callable, optional
+        How the individuals of a generation are evaluated. The default is ``"serial"``, in which
+        case they are evaluated one after the other. Options are:
+
+        * ``"thread"``: the individuals are evaluated concurrently in a thread pool.
+        * ``"process"``: the individuals are evaluated concurrently in a process pool. The
+          objective function must be picklable, for example a module-level function.
+        * A callable that takes the array of the individuals of a generation, and the reference
+          file if any, and returns the list of their objective values.
+
+        The individuals whose evaluation does not end within ``function_timeout`` seconds from
+        its start are given an objective of ``1e10``. With a timeout, the ``"serial"`` backend
+        evaluates every individual in its own thread and stops a timed out evaluation before the
+        next one starts, so that evaluations do not overlap. A thread blocked in native code
+        cannot be stopped: if it has not stopped within another ``function_timeout`` seconds, a
+        warning is logged and it is abandoned in the background. The worker process of a timed out
+        evaluation is terminated with the ``"process"`` backend. The threads of the ``"thread"``
+        backend cannot be stopped, so timed out evaluations keep running in the background.
+    max_workers: int, optional
+        Maximum number of concurrent evaluations of the thread and process pools. The default
+        is ``None``, in which case the default of ``concurrent.futures`` is used.
+    memoize: bool, optional
+        Whether to store the objective of every evaluated individual and reuse it when the
+        same individual appears again. The default is ``False``, in which case every individual
+        is evaluated again, as needed by noisy or stateful objective functions.
 
     Examples
     --------
@@ -124,6 +138,9 @@ class GeneticAlgorithm(object):
         function_timeout=0,
         algorithm_parameters=None,
         progress_bar=True,
+        evaluation_backend="serial",
+        max_workers=None,
+        memoize=False,
     ):
         self.population_file = None
         self.goal = 1e10
@@ -163,6 +180,12 @@ class GeneticAlgorithm(object):
             self.var_bound = np.array([[0, 1]] * self.dim)
 
         self.timeout = float(function_timeout)
+        if not callable(evaluation_backend) and evaluation_backend not in ("serial", "thread", "process"):
+            raise ValueError("evaluation_backend must be 'serial', 'thread', 'process' or a callable")
+        self.evaluation_backend = evaluation_backend
+        self.max_workers = max_workers
+        self.memoize = memoize
+        self.evaluated = {}
         if progress_bar:
             self.progress_bar = True
         else:
@@ -265,10 +288,8 @@ class GeneticAlgorithm(object):
             for i in self.reals[0]:
                 var[i] = self.var_bound[i][0] + np.random.random() * (self.var_bound[i][1] - self.var_bound[i][0])
                 solo[i] = var[i].copy()
-
-            obj = self.sim(var)
-            solo[self.dim] = obj
             pop[p] = solo.copy()
+        pop[:, self.dim] = self.evaluate_population(pop[:, : self.dim])
 
         # Sort
         pop = pop[pop[:, self.dim].argsort()]
@@ -319,8 +340,10 @@ class GeneticAlgorithm(object):
             # Select parents
             par = np.array([np.zeros(self.dim + 1)] * self.par_s)
             # Elite
+            selected = set()
             for k in range(0, self.num_elit):
                 par[k] = pop[k].copy()
+                selected.add(tuple(par[k].tolist()))
             # Random population. Not repeated parents
             for k in range(self.num_elit, self.par_s):
                 repeated_parent = True
@@ -328,10 +351,11 @@ class GeneticAlgorithm(object):
                 while repeated_parent:
                     count += 1
                     index = np.searchsorted(cumprob, np.random.random())
-                    is_in_list = np.any(np.all(pop[index] == par, axis=1))
+                    is_in_list = tuple(pop[index].tolist()) in selected
                     if count >= 10 or not is_in_list:
                         repeated_parent = False
                         par[k] = pop[index].copy()
+                        selected.add(tuple(par[k].tolist()))
 
             ef_par_list = np.array([False] * self.par_s)
             par_count = 0
@@ -346,9 +370,11 @@ class GeneticAlgorithm(object):
             # New generation
             pop = np.array([np.zeros(self.dim + 1)] * self.population_size)
             # Parents
+            genomes = set()
             for k in range(0, self.par_s):
                 pop[k] = par[k].copy()
-            # Children. If children is repeated, try up to 10 times
+                genomes.add(tuple(pop[k, : self.dim].tolist()))
+            # Children. If children is repeated, try up to 1000 times
             for k in range(self.par_s, self.population_size, 2):
                 repeated_children = True
                 count = 0
@@ -365,23 +391,15 @@ class GeneticAlgorithm(object):
                     ch1 = self.mut(ch1)
                     ch2 = self.mutmiddle(ch2, pvar1, pvar2)
                     count += 1
-                    for population in pop:
-                        is_in_list_ch1 = np.all(ch1 == population[:-1])
-                        is_in_list_ch2 = np.all(ch2 == population[:-1])
-                        if count >= 1000 or (not is_in_list_ch1 and not is_in_list_ch2):
-                            repeated_children = False
-                        elif is_in_list_ch1 or is_in_list_ch2:
-                            repeated_children = True
-                            break
-
-                solo[: self.dim] = ch1.copy()
-                obj = self.sim(ch1)
-                solo[self.dim] = obj
-                pop[k] = solo.copy()
-                solo[: self.dim] = ch2.copy()
-                obj = self.sim(ch2)
-                solo[self.dim] = obj
-                pop[k + 1] = solo.copy()
+                    key1 = tuple(ch1.tolist())
+                    key2 = tuple(ch2.tolist())
+                    repeated_children = count < 1000 and (key1 in genomes or key2 in genomes)
+
+                genomes.add(key1)
+                genomes.add(key2)
+                pop[k, : self.dim] = ch1
+                pop[k + 1, : self.dim] = ch2
+            pop[self.par_s :, self.dim] = self.evaluate_population(pop[self.par_s :, : self.dim])
 
             t += 1
             if counter > self.stop_iterations or self.best_function == 0:
@@ -479,7 +497,7 @@ class GeneticAlgorithm(object):
         return x
 
     def evaluate(self):
-        self.goal = 1e10
+        self.goal = _failed_objective
         if not self.reference_file:
             self.goal = self.function(self.temp)
             return True
@@ -487,17 +505,148 @@ class GeneticAlgorithm(object):
             self.goal = self.function(self.temp, self.reference_file)
             return True
 
+    def evaluate_population(self, population):
+        """Evaluate the objective function on several individuals.
+
+        Parameters
+        ----------
+        population : :class:`numpy.ndarray`
+            Variables of the individuals, with one individual per row.
+
+        Returns
+        -------
+        list
+            Objective values of the individuals.
+        """
+        keys = [tuple(x) for x in population.tolist()]
+        objectives = [None] * len(keys)
+        # individuals to evaluate. With memoization, the duplicates and the ones already
+        # evaluated are skipped
+        to_evaluate = OrderedDict()
+        for i, key in enumerate(keys):
+            if not self.memoize:
+                to_evaluate[i] = [i]
+            elif key in self.evaluated:
+                objectives[i] = self.evaluated[key]
+            else:
+                to_evaluate.setdefault(key, []).append(i)
+        if not to_evaluate:
+            return objectives
+        variables = np.array([population[positions[0]] for positions in to_evaluate.values()])
+        if callable(self.evaluation_backend):
+            if self.reference_file:
+                results = list(self.evaluation_backend(variables, self.reference_file))
+            else:
+                results = list(self.evaluation_backend(variables))
+        elif self.evaluation_backend == "serial":
+            results = [self.sim(x) for x in variables]
+        else:
+            results = self._evaluate_in_pool(variables)
+        for (key, positions), result in zip(to_evaluate.items(), results):
+            if self.memoize and result != _failed_objective:
+                self.evaluated[key] = result
+            for i in positions:
+                objectives[i] = result
+        return objectives
+
+    def _evaluate_in_pool(self, variables):
+        """Evaluate individuals concurrently in a thread pool or in worker processes.
+
+        At most ``workers`` evaluations run at the same time, and the timeout of every evaluation
+        is measured from its start. The worker process of a timed out evaluation is terminated and
+        replaced. Threads cannot be stopped, so a timed out evaluation of the thread backend keeps
+        running in the background, but it does not hold one of the ``workers`` slots.
+        """
+        process = self.evaluation_backend == "process"
+        if process:
+            workers = self.max_workers or os.cpu_count() or 1
+            # one single-process pool for each worker, so that a worker can be terminated alone
+            idle_pools = []
+        else:
+            workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            # threads are created on demand, and timed out evaluations keep their thread
+            executor = ThreadPoolExecutor(max_workers=len(variables))
+        event = threading.Event()
+        results = [None] * len(variables)
+        pending = list(range(len(variables)))
+        pending.reverse()
+        running = {}
+        try:
+            while pending or running:
+                while pending and len(running) < workers:
+                    i = pending.pop()
+                    args = (self.function, variables[i], self.reference_file)
+                    if process:
+                        pool = idle_pools.pop() if idle_pools else multiprocessing.Pool(1)
+                        handle = pool.apply_async(
+                            _call_objective, args, callback=lambda _: event.set(), error_callback=lambda _: event.set()
+                        )
+                    else:
+                        pool = None
+                        handle = executor.submit(_call_objective, *args)
+                        handle.add_done_callback(lambda _: event.set())
+                    running[i] = (handle, pool, time.time())
+                wait = None
+                if self.timeout > 0:
+                    wait = max(min(start for _, _, start in running.values()) + self.timeout - time.time(), 0)
+                event.wait(wait)
+                event.clear()
+                for i, (handle, pool, start) in list(running.items()):
+                    if handle.ready() if process else handle.done():
+                        del running[i]
+                        if process:
+                            idle_pools.append(pool)
+                            results[i] = handle.get()
+                        else:
+                            results[i] = handle.result()
+                    elif self.timeout > 0 and time.time() - start >= self.timeout:
+                        print(
+                            "After "
+                            + str(self.timeout)
+                            + " seconds delay the given function does not provide any output"
+                        )
+                        del running[i]
+                        if process:
+                            pool.terminate()
+                        results[i] = _failed_objective
+        finally:
+            if process:
+                for pool in idle_pools + [pool for _, pool, _ in running.values()]:
+                    pool.terminate()
+            else:
+                executor.shutdown(wait=False)
+        return results
+
     def sim(self, X):
         self.temp = X.copy()
         if self.timeout > 0:
-            thread = ThreadTrace(target=self.evaluate, daemon=None)
+            outcome = []
+
+            def evaluate():
+                try:
+                    outcome.append((True, _call_objective(self.function, X, self.reference_file)))
+                except Exception as e:
+                    outcome.append((False, e))
+
+            thread = threading.Thread(target=evaluate)
+            thread.daemon = True
             thread.start()
             thread.join(timeout=self.timeout)
             if thread.is_alive():
                 print("After " + str(self.timeout) + " seconds delay the given function does not provide any output")
-                thread.kill()
-                # after the kill, you must call join to really kill it.
-                thread.join()
+                _stop_thread(thread)
+                # the next evaluation starts only once the timed out one has stopped
+                thread.join(timeout=self.timeout)
+                if thread.is_alive():
+                    settings.logger.warning(
+                        "The timed out evaluation cannot be stopped. It keeps running in the background."
+                    )
+            self.goal = _failed_objective
+            if outcome and not thread.is_alive():
+                succeeded, value = outcome[0]
+                if not succeeded:
+                    raise value
+                self.goal = value
         else:
             self.evaluate()
         return self.goal
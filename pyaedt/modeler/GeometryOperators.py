@@ -7,8 +7,16 @@ from pyaedt.generic.constants import AXIS
 from pyaedt.generic.constants import PLANE
 from pyaedt.generic.constants import SWEEPDRAFT
 from pyaedt.generic.constants import scale_units
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import pyaedt_function_handler
 
+np = None
+if not is_ironpython:
+    np = LazyModule(
+        "numpy", "The NumPy module is required to run some functionalities.\n" "Install with \n\npip install numpy\n"
+    )
+
 
 class GeometryOperators(object):
     """Manages geometry operators."""
@@ -1587,6 +1595,139 @@ class GeometryOperators(object):
         else:
             return True
 
+    @staticmethod
+    @pyaedt_function_handler()
+    def points_in_polygon(points, polygon, tol=1e-8):
+        """Determine if many points are inside or outside a polygon, both located on the same plane.
+
+        This is the vectorized version of :func:`point_in_polygon`. The winding number of all the points
+        is computed edge by edge. An edge only processes the points sorted in its ``y`` range.
+
+        Parameters
+        ----------
+        points : list or :class:`numpy.ndarray`
+            List of ``[x, y]`` coordinates.
+        polygon : list
+            [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+        tol : float, optional
+            Geometric tolerance. The default is ``1e-8``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of ``int`` with one value per point:
+
+            - ``-1`` When the point is outside the polygon.
+            - ``0`` When the point is exactly on one of the sides of the polygon.
+            - ``1`` When the point is inside the polygon.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        xs = np.asarray(polygon[0], dtype=float)
+        ys = np.asarray(polygon[1], dtype=float)
+        if len(xs) != len(ys):  # pragma: no cover
+            raise ValueError("Polygon x and y lists must be the same length")
+        order = np.argsort(points[:, 1], kind="stable")
+        px = points[order, 0]
+        py = points[order, 1]
+        winding = np.zeros(len(px), dtype=int)
+        on_side = np.zeros(len(px), dtype=bool)
+        for i in range(len(xs)):
+            x1, y1, x2, y2 = xs[i - 1], ys[i - 1], xs[i], ys[i]
+            first = np.searchsorted(py, min(y1, y2) - tol, "left")
+            last = np.searchsorted(py, max(y1, y2) + tol, "right")
+            if first >= last:
+                continue
+            bx = px[first:last]
+            by = py[first:last]
+            dx = x2 - x1
+            dy = y2 - y1
+            # distance of the points from the side
+            length2 = dx * dx + dy * dy
+            t = np.clip(((bx - x1) * dx + (by - y1) * dy) / length2, 0, 1) if length2 > 0 else 0.0
+            on_side[first:last] |= (x1 + t * dx - bx) ** 2 + (y1 + t * dy - by) ** 2 < tol * tol
+            # upward sides crossed with the point on the left count +1, downward sides on the right -1
+            cross = dx * (by - y1) - dy * (bx - x1)
+            if y1 <= y2:
+                winding[first:last] += (y1 <= by) & (by < y2) & (cross > 0)
+            else:
+                winding[first:last] -= (y2 <= by) & (by < y1) & (cross < 0)
+        result = np.empty(len(px), dtype=int)
+        result[order] = np.where(on_side, 0, np.where(winding != 0, 1, -1))
+        return result
+
+    @staticmethod
+    @pyaedt_function_handler()
+    def bounding_boxes_in_polygon(bounding_boxes, polygon, tol=1e-8):
+        """Determine the intersection of many axis-aligned bounding boxes with a polygon.
+
+        Parameters
+        ----------
+        bounding_boxes : list or :class:`numpy.ndarray`
+            List of ``[[x_min, y_min], [x_max, y_max]]`` bounding boxes.
+        polygon : list
+            [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+        tol : float, optional
+            Geometric tolerance. The default is ``1e-8``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of ``int`` with one value per bounding box, with the values of the EDB intersection type:
+
+            - ``0`` When the box and the polygon do not intersect.
+            - ``1`` When the polygon is fully inside the box.
+            - ``2`` When the box is fully inside the polygon.
+            - ``3`` When the box and the polygon sides intersect.
+        """
+        boxes = np.asarray(bounding_boxes, dtype=float).reshape((-1, 4))
+        xs = np.asarray(polygon[0], dtype=float)
+        ys = np.asarray(polygon[1], dtype=float)
+        x_min = np.minimum(boxes[:, 0], boxes[:, 2])
+        x_max = np.maximum(boxes[:, 0], boxes[:, 2])
+        y_min = np.minimum(boxes[:, 1], boxes[:, 3])
+        y_max = np.maximum(boxes[:, 1], boxes[:, 3])
+        corners = np.stack([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]).transpose((2, 0, 1))
+        corners_in = GeometryOperators.points_in_polygon(corners.reshape((-1, 2)), polygon, tol).reshape((-1, 4))
+
+        # boxes crossed by a side: the side and the box ranges overlap, and the corners are not all on the
+        # same side of the line. The boxes are sorted by y_min and a side only processes the boxes
+        # starting in its y range, extended by the highest box.
+        order = np.argsort(y_min, kind="stable")
+        sorted_y_min = y_min[order]
+        height = float(np.max(y_max - y_min)) if len(boxes) else 0.0
+        crossed = np.zeros(len(boxes), dtype=bool)
+        for i in range(len(xs)):
+            x1, y1, x2, y2 = xs[i - 1], ys[i - 1], xs[i], ys[i]
+            first = np.searchsorted(sorted_y_min, min(y1, y2) - height - tol, "left")
+            last = np.searchsorted(sorted_y_min, max(y1, y2) + tol, "right")
+            if first >= last:
+                continue
+            band = order[first:last]
+            overlap = (
+                (x_min[band] <= max(x1, x2) + tol)
+                & (x_max[band] >= min(x1, x2) - tol)
+                & (y_max[band] >= min(y1, y2) - tol)
+            )
+            band = band[overlap]
+            if not len(band):
+                continue
+            sides = (x2 - x1) * (corners[band, :, 1] - y1) - (y2 - y1) * (corners[band, :, 0] - x1)
+            crossed[band] |= ~(np.all(sides > 0, axis=1) | np.all(sides < 0, axis=1))
+
+        polygon_in_box = np.zeros(len(boxes), dtype=bool)
+        if len(xs):
+            polygon_in_box = (
+                (x_min < xs.min() - tol)
+                & (x_max > xs.max() + tol)
+                & (y_min < ys.min() - tol)
+                & (y_max > ys.max() + tol)
+            )
+        result = np.zeros(len(boxes), dtype=int)
+        result[crossed] = 3
+        result[~crossed & np.all(corners_in > 0, axis=1)] = 2
+        result[polygon_in_box] = 1
+        return result
+
     @staticmethod
     @pyaedt_function_handler()
     def are_segments_intersecting(a1, a2, b1, b2, include_collinear=True):
@@ -145,6 +145,7 @@ class BaseCoordinateSystem(PropsManager, object):
         """
         try:
             self._modeler.oeditor.Delete(["NAME:Selections", "Selections:=", self.name])
+            self._modeler._app._design_changed()
             if "ref_cs" in dir(self):
                 for cs in range(0, len(self._modeler.coordinate_systems)):
                     if self._modeler.coordinate_systems[cs].ref_cs == self.name:
@@ -189,6 +190,7 @@ class BaseCoordinateSystem(PropsManager, object):
 
         """
         arguments = ["NAME:AllTabs", ["NAME:Geometry3DCSTab", ["NAME:PropServers", name], arg]]
+        self._modeler._app._design_changed()
         _retry_ntimes(5, self._modeler.oeditor.ChangeProperty, arguments)
 
     @pyaedt_function_handler()
@@ -3681,6 +3683,7 @@ class GeometryModeler(Modeler, object):
         arg2.append(arg3)
         arg.append(arg2)
         self.oeditor.ChangeProperty(arg)
+        self._bounding_boxes.pop("Region", None)
         return True
 
     @pyaedt_function_handler()
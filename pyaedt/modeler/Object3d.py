@@ -1234,16 +1234,10 @@ class Object3d(object):
         >>> oEditor.GetModelBoundingBox
 
         """
-        if self.object_type == "Unclassified":
-            return [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        if not settings.disable_bounding_box_sat:
-            bounding = self._bounding_box_sat()
-            if bounding:
-                return bounding
-            else:
-                return self._bounding_box_unmodel()
-        else:
-            return self._bounding_box_unmodel()
+        bounding = self._primitives.bounding_boxes([self.name])
+        if bounding:
+            return bounding[self.name]
+        return self._bounding_box_unmodel()
 
     @property
     def bounding_dimension(self):
@@ -7,6 +7,7 @@ import copy
 import math
 import os
 import random
+import re
 import string
 import time
 from collections import OrderedDict
@@ -15,8 +16,11 @@ from pyaedt.application.Variables import Variable
 from pyaedt.application.Variables import decompose_variable_value
 from pyaedt.generic.constants import PLANE
 from pyaedt.generic.general_methods import _retry_ntimes
+from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import is_number
+from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.generic.general_methods import settings
 from pyaedt.modeler.GeometryOperators import GeometryOperators
 from pyaedt.modeler.Object3d import FacePrimitive
 from pyaedt.modeler.Object3d import Object3d
@@ -39,6 +43,96 @@ default_materials = {
 
 aedt_wait_time = 0.1
 
+_sat_token = re.compile(r"@(\d+) |#")
+
+
+def _sat_records(data):
+    """Split the data of an ACIS SAT file into records.
+
+    Strings (``@<length> <text>``) are removed from the record text, so that a ``#`` in an
+    object name does not end a record.
+
+    Returns
+    -------
+    list of tuple
+        Tokens and strings of each record. The position in the list is the record index
+        used by the ``$<index>`` pointers.
+    """
+    lines = data.split("\n", 3)
+    data = lines[3] if len(lines) > 3 else ""
+    records = []
+    text = []
+    strings = []
+    start = pos = 0
+    while True:
+        m = _sat_token.search(data, pos)
+        if not m:
+            break
+        text.append(data[start : m.start()])
+        if m.group(0) == "#":
+            tokens = " ".join(text).split()
+            if tokens and tokens[0] == "End-of-ACIS-data":
+                break
+            if tokens and tokens[0].startswith("-") and tokens[0][1:].isdigit():
+                tokens = tokens[1:]
+            records.append((tokens, strings))
+            text = []
+            strings = []
+            start = pos = m.end()
+        else:
+            start = pos = m.end() + int(m.group(1))
+            strings.append(data[m.end() : pos])
+    return records
+
+
+def parse_sat_bounding_boxes(data, names):
+    """Read the bounding boxes of the bodies of an ACIS SAT file exported by AEDT.
+
+    Bodies are mapped to the object names with their name attributes. A file without name
+    attributes is only used when a single object with a single body is exported, because
+    the order of the bodies in the file is not guaranteed.
+
+    Parameters
+    ----------
+    data : str
+        Content of the SAT file.
+    names : list
+        Names of the exported objects.
+
+    Returns
+    -------
+    dict
+        Bounding boxes ``[xmin, ymin, zmin, xmax, ymax, zmax]`` keyed by object name.
+        Objects whose body is not found are not in the dictionary.
+    """
+    records = _sat_records(data)
+    boxes = OrderedDict()
+    for index, (tokens, _) in enumerate(records):
+        if tokens and tokens[0] == "body":
+            try:
+                boxes[index] = [float(i) for i in tokens[-6:]]
+            except ValueError:
+                boxes[index] = None
+    bounding_boxes = {}
+    for tokens, strings in records:
+        if not tokens or "name_attrib" not in tokens[0]:
+            continue
+        name = [i for i in strings if i in names]
+        pointers = [int(i[1:]) for i in tokens[1:] if i.startswith("$") and i[1:].lstrip("-").isdigit()]
+        if not name or len(pointers) < 4:
+            continue
+        owner = pointers[3]
+        if owner not in boxes and 0 <= owner < len(records) and records[owner][0][:1] == ["lump"]:
+            # The last pointer of a lump is its body.
+            owner = [int(i[1:]) for i in records[owner][0][1:] if i.startswith("$")][-1]
+        if boxes.get(owner):
+            bounding_boxes[name[0]] = boxes[owner]
+    if not bounding_boxes and len(names) == 1 and len(boxes) == 1:
+        box = list(boxes.values())[0]
+        if box:
+            bounding_boxes[names[0]] = box
+    return bounding_boxes
+
 
 class PolylineSegment:
     """Creates and manipulates a segment of a polyline.
@@ -769,6 +863,7 @@ class Polyline(Object3d):
         arg2.append(arg3)
         arg1.append(arg2)
         self._primitives.oeditor.ChangeProperty(arg1)
+        self._primitives._bounding_boxes.pop(self._m_name, None)
         self._update()
         return True
 
@@ -927,6 +1022,7 @@ class Primitives(object):
 
     def __init__(self):
         self.points = {}
+        self._bounding_boxes = {}
         self.refresh()
 
     @property
@@ -1916,6 +2012,7 @@ class Primitives(object):
         cmd_tab.append(changed_props)
         vArg1.append(cmd_tab)
         self.oeditor.ChangeProperty(vArg1)
+        self._bounding_boxes.pop(object_name, None)
         return True
 
     @pyaedt_function_handler()
@@ -2023,6 +2120,109 @@ class Primitives(object):
         """
         return self._app.modeler.get_model_bounding_box()
 
+    @pyaedt_function_handler()
+    def bounding_boxes(self, objects=None, refresh=False):
+        """Retrieve the bounding boxes of multiple objects.
+
+        All objects are exported to one ACIS SAT file, and the bounding boxes of their bodies are
+        read in one pass. Bounding boxes are cached for each object until an operation is added to
+        or removed from its history, or until PyAEDT changes a design or project variable, a
+        coordinate system, or a parameter of the object. Use ``refresh=True`` after editing the
+        parameters of an operation in the AEDT user interface or with ``oEditor.ChangeProperty``.
+
+        Parameters
+        ----------
+        objects : list, optional
+            Objects given by names, IDs, or :class:`pyaedt.modeler.Object3d.Object3d` objects.
+            The default is ``None``, in which case all objects are used.
+        refresh : bool, optional
+            Whether to compute the bounding boxes again instead of using the cached ones.
+            The default is ``False``.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            Bounding boxes ``[xmin, ymin, zmin, xmax, ymax, zmax]`` keyed by object name.
+
+        References
+        ----------
+
+        >>> oEditor.Export
+        >>> oEditor.GetModelBoundingBox
+
+        Examples
+        --------
+        >>> from pyaedt import Hfss
+        >>> hfss = Hfss()
+        >>> boxes = hfss.modeler.bounding_boxes(["Box1", "Box2"])
+        >>> xmin, ymin, zmin, xmax, ymax, zmax = boxes["Box1"]
+        """
+        if objects is None:
+            names = self.object_names
+        else:
+            names = self._modeler.convert_to_selections(objects, True)
+        design_signature = self._app._design_generation
+        result = {}
+        to_compute = []
+        signatures = {}
+        for name in names:
+            obj = self[name]
+            if obj and obj.object_type == "Unclassified":
+                result[name] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                continue
+            signature = self._get_history_signature(name)
+            signatures[name] = signature
+            cached = self._bounding_boxes.get(name)
+            if not refresh and signature is not None and cached and cached[0] == (signature, design_signature):
+                result[name] = list(cached[1])
+            else:
+                to_compute.append(name)
+
+        boxes = {}
+        if to_compute and not settings.disable_bounding_box_sat:
+            boxes = self._bounding_boxes_sat(to_compute)
+        for name in to_compute:
+            box = boxes.get(name)
+            obj = self[name]
+            if not box and obj:
+                if len(to_compute) > 1 and not settings.disable_bounding_box_sat:
+                    box = obj._bounding_box_sat()
+                if not box:
+                    box = obj._bounding_box_unmodel()
+            result[name] = box
+            if box and signatures[name] is not None:
+                self._bounding_boxes[name] = ((signatures[name], design_signature), list(box))
+        return OrderedDict((name, result[name]) for name in names)
+
+    @pyaedt_function_handler()
+    def _bounding_boxes_sat(self, names):
+        """Export objects to one ACIS SAT file and read the bounding boxes of their bodies."""
+        tmp_path = self._app.working_directory
+        file_name = generate_unique_name("bounding_boxes")
+        filename = os.path.join(tmp_path, file_name + ".sat")
+        self._app.export_3d_model(file_name, tmp_path, ".sat", names)
+        if not os.path.isfile(filename):
+            self.logger.warning("Cannot export the ACIS SAT file for the bounding boxes.")
+            return {}
+        with open_file(filename, "r") as fh:
+            data = fh.read()
+        try:
+            os.remove(filename)
+        except:
+            self.logger.warning("Cannot remove temp file %s.", filename)
+        return parse_sat_bounding_boxes(data, names)
+
+    @pyaedt_function_handler()
+    def _get_history_signature(self, name):
+        """Get the names of the history operations of an object.
+
+        Returns ``None`` if the history is not available.
+        """
+        try:
+            return tuple(self.oeditor.GetChildObject(name).GetChildNames())
+        except:
+            return None
+
     @pyaedt_function_handler()
     def get_obj_id(self, objname):
         """Return the object ID from an object name.
@@ -2140,6 +2340,7 @@ class Primitives(object):
         self.objects = new_object_dict
         self.object_id_dict = new_object_id_dict
         self.points = new_points_dict
+        self._bounding_boxes = {}
 
     @pyaedt_function_handler()
     def find_new_objects(self):
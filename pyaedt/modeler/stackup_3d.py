@@ -1,24 +1,17 @@
 import os
 from collections import OrderedDict
 
-from pyaedt import is_ironpython
-
-if not is_ironpython:
-    try:
-        import joblib
-    except ImportError:
-        pass
-    try:
-        import numpy as np
-    except ImportError:
-        pass
-
 from pyaedt import constants
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import pyaedt_function_handler
 from pyaedt.modules.MaterialLib import Material
 
+if not is_ironpython:
+    joblib = LazyModule("joblib")
+    np = LazyModule("numpy")
+
 LAYERS = {"s": "signal", "g": "ground", "d": "dielectric"}
 
 
@@ -3326,9 +3319,7 @@ class MachineLearningPatch(Patch, object):
 
     def predict_length(self):
         if not is_ironpython:
-            try:
-                joblib
-            except NameError:  # pragma: no cover
+            if not joblib:  # pragma: no cover
                 raise ImportError("joblib package is needed to run ML.")
             path_file = os.path.dirname(__file__)
             path_folder = os.path.split(path_file)[0]
@@ -8,6 +8,7 @@ from __future__ import absolute_import  # noreorder
 import os
 import warnings
 
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
@@ -23,12 +24,7 @@ if not is_ironpython:
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
 
-    try:
-        from IPython.display import Image
-
-        ipython_available = True
-    except ImportError:
-        ipython_available = False
+    ipython_display = LazyModule("IPython.display")
 
 
 class PostProcessor(Post):
@@ -73,9 +69,9 @@ class PostProcessor(Post):
             Jupyter notebook image.
 
         """
-        if ipython_available:
+        if ipython_display:
             file_name = self.export_model_picture(show_axis=show_axis, show_grid=show_grid, show_ruler=show_ruler)
-            return Image(file_name, width=500)
+            return ipython_display.Image(file_name, width=500)
         else:
             warnings.warn("The Ipython package is missing and must be installed.")
 
@@ -10,11 +10,13 @@ import json
 import math
 import os
 import re
-import warnings
+import threading
 
 from pyaedt import is_ironpython
 from pyaedt import settings
 from pyaedt.generic.DataHandlers import _arg2dict
+from pyaedt.generic.general_methods import LazyModule
+from pyaedt.generic.general_methods import _check_cache_directory
 from pyaedt.generic.general_methods import _create_json_file
 from pyaedt.generic.general_methods import _retry_ntimes
 from pyaedt.generic.general_methods import generate_unique_name
@@ -26,12 +28,254 @@ from pyaedt.modules.Material import OrderedDict
 from pyaedt.modules.Material import SurfaceMaterial
 
 if not is_ironpython:
+    pd = LazyModule(
+        "pandas", "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
+    )
+
+# index of the material names of the .amat files, shared by all the applications of the session
+_material_index = None
+_material_index_lock = threading.Lock()
+_material_index_name = "material_library_index.json"
+_begin_search = re.compile(r"^\$begin '(.+)'")
+
+
+def _amat_material_names(file_name):
+    """Get the names of the blocks of a material library file.
+
+    Parameters
+    ----------
+    file_name : str
+        Full path of the ``.amat`` file.
+
+    Returns
+    -------
+    list
+    """
+    mats = []
+    with open_file(file_name, "r") as aedt_fh:
+        for line in aedt_fh:
+            b = _begin_search.search(line)
+            if b:  # walk down a level
+                mats.append(b.group(1))
+    return mats
+
+
+def _read_material_index():
+    # without the file cache, the index is only kept in memory for the session
+    if not settings.enable_aedt_file_cache:
+        return {"directories": {}, "files": {}}
+    index_file = os.path.join(settings.aedt_file_cache_path, _material_index_name)
+    if not os.path.exists(index_file) or not _check_cache_directory(settings.aedt_file_cache_path):
+        return {"directories": {}, "files": {}}
     try:
-        import pandas as pd
-    except ImportError:
-        warnings.warn(
-            "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
-        )
+        with open_file(index_file, "r") as f:
+            index = json.load(f)
+        if isinstance(index, dict) and "directories" in index and "files" in index:
+            return index
+    except Exception:
+        pass
+    return {"directories": {}, "files": {}}
+
+
+def _write_material_index(index):
+    if not settings.enable_aedt_file_cache:
+        return False
+    index_file = os.path.join(settings.aedt_file_cache_path, _material_index_name)
+    if not _check_cache_directory(settings.aedt_file_cache_path):
+        return False
+    temp_file = "{}.{}.{}".format(index_file, os.getpid(), threading.current_thread().ident)
+    try:
+        with open_file(temp_file, "w") as f:
+            json.dump(index, f)
+        if os.path.exists(index_file):
+            os.remove(index_file)
+        os.rename(temp_file, index_file)
+    except Exception:
+        settings.logger.debug("Failed to write the material library index {}.".format(index_file))
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return False
+    return True
+
+
+def _scan_library_directory(directory, index, found):
+    """Update the index entries of a library directory and of its subdirectories.
+
+    The content of a directory is listed again only when its modification time changed. Every
+    ``.amat`` file is checked, and it is read again only when its modification time or its size
+    changed, because editing a file in place does not change the modification time of its
+    directory.
+
+    Parameters
+    ----------
+    directory : str
+        Library directory.
+    index : dict
+        Material library index.
+    found : list
+        List to append the full paths of the directories and ``.amat`` files found to.
+
+    Returns
+    -------
+    bool
+        ``True`` when the index changed.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime
+    except OSError:
+        return False
+    found.append(directory)
+    changed = False
+    entry = index["directories"].get(directory)
+    listed = not entry or entry[0] != mtime
+    if listed:
+        subdirectories = []
+        filenames = []
+        for name in sorted(os.listdir(directory)):
+            if os.path.isdir(os.path.join(directory, name)):
+                subdirectories.append(name)
+            elif fnmatch.fnmatch(name, "*.amat"):
+                filenames.append(name)
+        entry = [mtime, subdirectories, filenames]
+        index["directories"][directory] = entry
+        changed = True
+    for filename in entry[2]:
+        amat = os.path.join(directory, filename)
+        try:
+            stat = os.stat(amat)
+        except OSError:
+            continue
+        stamp = [stat.st_mtime, stat.st_size]
+        file_entry = index["files"].get(amat)
+        if not file_entry or file_entry[:2] != stamp:
+            index["files"][amat] = stamp + [_amat_material_names(amat)]
+            changed = True
+        found.append(amat)
+    for subdirectory in entry[1]:
+        changed = _scan_library_directory(os.path.join(directory, subdirectory), index, found) or changed
+    return changed
+
+
+def _library_material_names(directories):
+    """Get the names of the materials of the ``.amat`` files in some library directories.
+
+    The names are stored in an index, together with the modification time of each directory and
+    the modification time and the size of each file. Only the directories whose modification time
+    changed since the last call are listed again, and only the files whose modification time or
+    size changed are read again. The index is saved in ``settings.aedt_file_cache_path`` when
+    ``settings.enable_aedt_file_cache`` is ``True``. Otherwise, it is only kept for the session.
+
+    Parameters
+    ----------
+    directories : list
+        Library directories, which are searched recursively.
+
+    Returns
+    -------
+    list
+    """
+    global _material_index
+    with _material_index_lock:
+        if _material_index is None:
+            _material_index = _read_material_index()
+        changed = False
+        mats = []
+        for directory in directories:
+            found = []
+            changed = _scan_library_directory(directory, _material_index, found) or changed
+            for amat in found:
+                if amat in _material_index["files"]:
+                    mats.extend(_material_index["files"][amat][2])
+            # remove the directories and files that do not exist anymore
+            prefix = os.path.join(directory, "")
+            found = set(found)
+            for entries in [_material_index["directories"], _material_index["files"]]:
+                for path in [i for i in entries if (i == directory or i.startswith(prefix)) and i not in found]:
+                    del entries[path]
+                    changed = True
+        if changed:
+            _write_material_index(_material_index)
+    return mats
+
+
+class _ProjectMaterial(object):
+    """Placeholder of a project material whose properties are read on first access."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _MaterialDict(dict):
+    """Dictionary of materials where the project materials are built on first access.
+
+    The keys, the length, and membership tests are served from the stored names without
+    building any material. A project material is built when it is read with ``[]`` or ``get``,
+    and it is removed if it cannot be built. ``items`` and ``values`` build the materials one
+    at a time while they are iterated.
+
+    Parameters
+    ----------
+    materials : :class:`pyaedt.modules.MaterialLib.Materials`
+        Materials database.
+    """
+
+    def __init__(self, materials):
+        dict.__init__(self)
+        self._materials = materials
+        self._building = set()
+
+    def _build(self, key, value):
+        if isinstance(value, _ProjectMaterial):
+            if key in self._building:
+                raise KeyError(key)
+            self._building.add(key)
+            try:
+                value = self._materials._aedmattolibrary(value.name)
+            except Exception:
+                value = None
+            finally:
+                self._building.discard(key)
+            if not value:
+                self._materials.logger.info("aedmattolibrary failed for material %s", key)
+                if isinstance(dict.get(self, key), _ProjectMaterial):
+                    dict.__delitem__(self, key)
+                raise KeyError(key)
+            # the material replaces the placeholder at the same position
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        return self._build(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *args):
+        try:
+            value = self[key]
+        except KeyError:
+            if args:
+                return args[0]
+            raise
+        dict.__delitem__(self, key)
+        return value
+
+    def values(self):
+        return (v for _, v in self.items())
+
+    def items(self):
+        for key in list(dict.keys(self)):
+            try:
+                value = self[key]
+            except KeyError:
+                continue
+            yield key, value
+
+    def __repr__(self):
+        return repr(dict(self.items()))
 
 
 class Materials(object):
@@ -61,7 +305,7 @@ class Materials(object):
         self.logger = self._app.logger
         self.logger.info("Successfully loaded project materials !")
         # self.material_keys = self._get_materials()
-        self.material_keys = {}
+        self.material_keys = _MaterialDict(self)
         self._surface_material_keys = {}
         self._load_from_project()
 
@@ -69,7 +313,7 @@ class Materials(object):
         return len(self.material_keys)
 
     def __iter__(self):
-        return self.material_keys.itervalues()
+        return iter(self.material_keys.values())
 
     def __getitem__(self, item):
         matobj = self.checkifmaterialexists(item)
@@ -145,41 +389,7 @@ class Materials(object):
 
     @pyaedt_function_handler()
     def _read_materials(self):
-        def get_mat_list(file_name):
-            mats = []
-            _begin_search = re.compile(r"^\$begin '(.+)'")
-            with open_file(file_name, "r") as aedt_fh:
-                raw_lines = aedt_fh.read().splitlines()
-                for line in raw_lines:
-                    b = _begin_search.search(line)
-                    if b:  # walk down a level
-                        mats.append(b.group(1))
-            return mats
-
-        amat_sys = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.syslib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_personal = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.personallib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_user = [
-            os.path.join(dirpath, filename)
-            for dirpath, _, filenames in os.walk(self._app.userlib)
-            for filename in filenames
-            if fnmatch.fnmatch(filename, "*.amat")
-        ]
-        amat_libs = amat_sys + amat_personal + amat_user
-        mats = []
-        for amat in amat_libs:
-            # m = load_entire_aedt_file(amat)
-            # mats.extend(list(m.keys()))
-            mats.extend(get_mat_list(amat))
+        mats = _library_material_names([self._app.syslib, self._app.personallib, self._app.userlib])
         try:
             mats.remove("$index$")
         except ValueError:
@@ -202,12 +412,11 @@ class Materials(object):
     @pyaedt_function_handler()
     def _get_materials(self):
         """Get materials."""
-        mats = {}
+        mats = _MaterialDict(self)
         try:
             for ds in self._app.project_properties["AnsoftProject"]["Definitions"]["Materials"]:
-                mats[ds.lower()] = Material(
-                    self, ds, self._app.project_properties["AnsoftProject"]["Definitions"]["Materials"][ds]
-                )
+                # the material properties are read from AEDT on first access
+                mats[ds.lower()] = _ProjectMaterial(ds)
         except:
             pass
         return mats
@@ -491,10 +700,10 @@ class Materials(object):
         >>> hfss.materials.duplicate_material("MyMaterial", "MyMaterial2")
 
         """
-        if material.lower() not in list(self.material_keys.keys()):
+        if material.lower() not in self.material_keys:
             self.logger.error("Material {} is not present".format(material))
             return False
-        if material.lower() not in list(self.material_keys.keys()):
+        if material.lower() not in self.material_keys:
             matobj = self._aedmattolibrary(material)
         else:
             matobj = self.material_keys[material.lower()]
@@ -573,7 +782,7 @@ class Materials(object):
 
         """
         mat = material.lower()
-        if mat not in list(self.material_keys.keys()):
+        if mat not in self.material_keys:
             self.logger.error("Material {} is not present".format(mat))
             return False
         self.odefinition_manager.RemoveMaterial(self._get_aedt_case_name(mat), True, "", library)
@@ -616,11 +825,8 @@ class Materials(object):
         if self.odefinition_manager:
             mats = self.odefinition_manager.GetProjectMaterialNames()
             for el in mats:
-                if el not in list(self.material_keys.keys()):
-                    try:
-                        self._aedmattolibrary(el)
-                    except Exception as e:
-                        self.logger.info("aedmattolibrary failed for material %s", el)
+                # the material properties are read from AEDT on first access
+                self.material_keys.setdefault(el.lower(), _ProjectMaterial(el))
 
     @pyaedt_function_handler()
     def _aedmattolibrary(self, matname):
@@ -757,7 +963,7 @@ class Materials(object):
                 )
 
         for el, val in data["materials"].items():
-            if el.lower() in list(self.material_keys.keys()):
+            if el.lower() in self.material_keys:
                 newname = generate_unique_name(el)
                 self.logger.warning("Material %s already exists. Renaming to %s", el, newname)
             else:
@@ -798,7 +1004,7 @@ class Materials(object):
         for el, val in df[::-1].iterrows():
             if isinstance(el, float):
                 break
-            if el.lower() in list(self.material_keys.keys()):
+            if el.lower() in self.material_keys:
                 newname = generate_unique_name(el)
                 self.logger.warning("Material %s already exists. Renaming to %s", el, newname)
             else:
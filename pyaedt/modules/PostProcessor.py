@@ -19,21 +19,25 @@ from pyaedt import settings
 from pyaedt.application.Variables import decompose_variable_value
 from pyaedt.generic.constants import unit_converter
 from pyaedt.generic.DataHandlers import json_to_dict
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import _retry_ntimes
 from pyaedt.generic.general_methods import check_and_download_file
 from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.modules.solutions import EyeDiagramData
 from pyaedt.modules.solutions import FieldPlot
 from pyaedt.modules.solutions import SolutionData
 
 if not is_ironpython:
-    try:
-        import pandas as pd
-    except ImportError:
-        warnings.warn(
-            "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
-        )
+    np = LazyModule(
+        "numpy",
+        "The NumPy module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install numpy\n",
+    )
+    pd = LazyModule(
+        "pandas", "The Pandas module is required to run some functionalities.\n" "Install with \n\npip install pandas\n"
+    )
 
 TEMPLATES_BY_DESIGN = {
     "HFSS": [
@@ -3868,50 +3872,125 @@ class CircuitPostProcessor(PostProcessorCommon, object):
 
         """
 
-        new_tic = []
-        for tic in clock_tics:
-            new_tic.append(unit_converter(tic, unit_system="Time", input_units="s", output_units=waveform_sweep_unit))
+        data = unit_converter(
+            np.asarray(waveform_data, dtype=float), unit_system="Voltage", input_units=waveform_unit, output_units="V"
+        )
+        new_tic = unit_converter(
+            np.asarray(clock_tics, dtype=float), unit_system="Time", input_units="s", output_units=waveform_sweep_unit
+        )
         new_ui = unit_converter(unit_interval, unit_system="Time", input_units="s", output_units=waveform_sweep_unit)
-
-        zipped_lists = zip(new_tic, [new_ui / 2] * len(new_tic))
-        extraction_tic = [x + y for (x, y) in zipped_lists]
-
-        if pandas_enabled:
-            sweep_filtered = waveform_sweep.values
-            filtered_tic = list(filter(lambda num: num >= waveform_sweep.values[0], extraction_tic))
+        extraction_tic = new_tic + new_ui / 2
+        sweep_values = np.asarray(waveform_sweep, dtype=float)
+        if sweep_values.size:
+            extraction_tic = extraction_tic[extraction_tic >= sweep_values[0]]
         else:
-            sweep_filtered = waveform_sweep
-            filtered_tic = list(filter(lambda num: num >= waveform_sweep[0], extraction_tic))
-
-        outputdata = []
-        new_voltage = []
-        tic_in_s = []
-        for tic in filtered_tic:
-            if tic >= sweep_filtered[0]:
-                sweep_filtered = list(filter(lambda num: num >= tic, sweep_filtered))
-                if sweep_filtered:
-                    if pandas_enabled:
-                        waveform_index = waveform_sweep[waveform_sweep.values == sweep_filtered[0]].index.values
-                    else:
-                        waveform_index = waveform_sweep.index(sweep_filtered[0])
-                    if not isinstance(waveform_data[waveform_index], float):
-                        voltage = waveform_data[waveform_index].values[0]
-                    else:
-                        voltage = waveform_data[waveform_index]
-                    new_voltage.append(
-                        unit_converter(voltage, unit_system="Voltage", input_units=waveform_unit, output_units="V")
-                    )
-                    tic_in_s.append(
-                        unit_converter(tic, unit_system="Time", input_units=waveform_sweep_unit, output_units="s")
-                    )
-                    if not pandas_enabled:
-                        outputdata.append([tic_in_s[-1:][0], new_voltage[-1:][0]])
-                    del sweep_filtered[0]
-                else:
-                    break
+            extraction_tic = extraction_tic[:0]
+
+        # each tic is sampled at the first sweep point after it. A sweep point is used once, and a tic
+        # between the last used point and the next one is skipped.
+        first_after = np.searchsorted(sweep_values, extraction_tic, side="left")
+        last_before = np.searchsorted(sweep_values, extraction_tic, side="right") - 1
+        available = first_after < len(sweep_values)
+        if not available.all():
+            stop = np.argmin(available)
+            first_after, last_before, extraction_tic = first_after[:stop], last_before[:stop], extraction_tic[:stop]
+        if len(first_after) > 1 and not (last_before[1:] > first_after[:-1]).all():
+            keep = np.zeros(len(first_after), dtype=bool)
+            used = -1
+            for i, (index, previous) in enumerate(zip(first_after.tolist(), last_before.tolist())):
+                if previous > used:
+                    keep[i] = True
+                    used = index
+            first_after, extraction_tic = first_after[keep], extraction_tic[keep]
+        tic_in_s = unit_converter(extraction_tic, unit_system="Time", input_units=waveform_sweep_unit, output_units="s")
+        new_voltage = data[first_after]
         if pandas_enabled:
             return pd.Series(new_voltage, index=tic_in_s)
-        return outputdata
+        return np.column_stack((tic_in_s, new_voltage)).tolist()
+
+    @pyaedt_function_handler()
+    def compute_eye_diagram(
+        self,
+        waveform_data,
+        waveform_sweep,
+        unit_interval,
+        waveform_unit="V",
+        waveform_sweep_unit="s",
+        ignore_bits=0,
+        offset=0.0,
+        threshold=None,
+        time_bins=100,
+        amplitude_bins=200,
+        chunk_size=1 << 20,
+    ):
+        """Compute the eye diagram of a transient waveform locally, without creating an eye diagram report.
+
+        The waveform is folded by unit interval into a 2D histogram. The eye height, eye width,
+        jitter, and BER contours are computed with NumPy. Long waveforms are processed in chunks.
+
+        Parameters
+        ----------
+        waveform_data : list or :class:`numpy.ndarray` or :class:`pandas.Series`
+            Waveform data.
+        waveform_sweep : list or :class:`numpy.ndarray` or :class:`pandas.Series`
+            Waveform time sweep.
+        unit_interval : float
+            Unit interval in seconds.
+        waveform_unit : str, optional
+            Waveform units. The default is ``"V"``.
+        waveform_sweep_unit : str, optional
+            Time units. The default is ``"s"``.
+        ignore_bits : int, optional
+            Number of initial unit intervals to ignore. The default is ``0``.
+        offset : float, optional
+            Time of the start of a unit interval in seconds. The default is ``0.0``.
+        threshold : float, optional
+            Decision threshold in volts. The default is ``None``, in which case the middle of the
+            waveform range is used.
+        time_bins : int, optional
+            Number of time columns per unit interval. The default is ``100``.
+        amplitude_bins : int, optional
+            Number of amplitude rows. The default is ``200``.
+        chunk_size : int, optional
+            Number of waveform points processed at once. The default is ``1048576``.
+
+        Returns
+        -------
+        :class:`pyaedt.modules.solutions.EyeDiagramData`
+            Eye diagram.
+
+        Examples
+        --------
+        >>> aedtapp = Circuit()
+        >>> data = aedtapp.post.get_solution_data("V(out)", "NexximTransient", domain="Time")
+        >>> eye = aedtapp.post.compute_eye_diagram(data.data_real(), data.primary_sweep_values, 1e-9,
+        ...                                        waveform_sweep_unit=data.units_sweeps["Time"])
+        >>> eye.eye_height, eye.eye_width, eye.jitter_rms
+        >>> time, lower, upper = eye.ber_contour(1e-12)
+        """
+        sweep = unit_converter(
+            np.asarray(waveform_sweep, dtype=float),
+            unit_system="Time",
+            input_units=waveform_sweep_unit,
+            output_units="s",
+        )
+        data = unit_converter(
+            np.asarray(waveform_data, dtype=float), unit_system="Voltage", input_units=waveform_unit, output_units="V"
+        )
+        low, high = float(np.min(data)), float(np.max(data))
+        margin = 0.1 * (high - low) or 1.0
+        eye = EyeDiagramData(
+            unit_interval,
+            time_bins=time_bins,
+            amplitude_bins=amplitude_bins,
+            amplitude_range=[low - margin, high + margin],
+            threshold=(low + high) / 2 if threshold is None else threshold,
+            offset=offset,
+            ignore_bits=ignore_bits,
+        )
+        for start in range(0, len(sweep), chunk_size):
+            eye.add_waveform(sweep[start : start + chunk_size], data[start : start + chunk_size])
+        return eye
 
     def sample_ami_waveform(
         self,
@@ -3981,16 +4060,17 @@ class CircuitPostProcessor(PostProcessorCommon, object):
             waveform_data = self.get_solution_data(
                 expressions=exp, setup_sweep_name=setupname, domain="Time", variations=variation_list_w_value
             )
-            samples_per_bit = 0
-            for sample in waveform_data.primary_sweep_values:
-                sample_seconds = unit_converter(
-                    sample, unit_system="Time", input_units=waveform_data.units_sweeps["Time"], output_units="s"
-                )
-                if sample_seconds > unit_interval:
-                    samples_per_bit -= 1
-                    break
-                else:
-                    samples_per_bit += 1
+            sweep_seconds = unit_converter(
+                np.asarray(waveform_data.primary_sweep_values, dtype=float),
+                unit_system="Time",
+                input_units=waveform_data.units_sweeps["Time"],
+                output_units="s",
+            )
+            after_first_bit = sweep_seconds > unit_interval
+            if after_first_bit.any():
+                samples_per_bit = int(np.argmax(after_first_bit)) - 1
+            else:
+                samples_per_bit = len(sweep_seconds)
             if samples_per_bit * ignore_bits > len(waveform_data.data_real()):
                 self._app.solution_type = initial_solution_type
                 self.logger.warning("Ignored bits are greater than generated bits.")
@@ -1,9 +1,10 @@
+import copy
 import itertools
+import json
 import math
 import os
 import sys
 import time
-import warnings
 from collections import OrderedDict
 
 from pyaedt import is_ironpython
@@ -12,6 +13,7 @@ from pyaedt import settings
 from pyaedt.generic.constants import AEDT_UNITS
 from pyaedt.generic.constants import db10
 from pyaedt.generic.constants import db20
+from pyaedt.generic.general_methods import LazyModule
 from pyaedt.generic.general_methods import check_and_download_folder
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import write_csv
@@ -27,27 +29,25 @@ pd = None
 np = None
 pv = None
 if not is_ironpython:
-    try:
-        import numpy as np
-    except ImportError:
-        warnings.warn(
-            "The NumPy module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install numpy\n"
-        )
-    try:
-        import pandas as pd
-    except ImportError:
-        warnings.warn(
-            "The Pandas module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install pandas\n"
-        )
-    try:
-        import pyvista as pv
-    except ImportError:
-        warnings.warn(
-            "The pyvista module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install pyvista\n"
-        )
+    np = LazyModule(
+        "numpy",
+        "The NumPy module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install numpy\n",
+    )
+    pd = LazyModule(
+        "pandas",
+        "The Pandas module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install pandas\n",
+    )
+    pv = LazyModule(
+        "pyvista",
+        "The pyvista module is required to run some functionalities of PostProcess.\n"
+        "Install with \n\npip install pyvista\n",
+    )
+    from concurrent.futures import ThreadPoolExecutor
+
+# alternative names of the formulas applied to the solution data
+_formula_aliases = {"real": "re", "imag": "im", "mag": "abs"}
 
 
 class SolutionData(object):
@@ -59,6 +59,7 @@ class SolutionData(object):
         self._enable_pandas_output = True if settings.enable_pandas_output and pd else False
 
         self._nominal_variation = None
+        self._intrinsics = {}
         self._nominal_variation = self._original_data[0]
         self.active_expression = self.expressions[0]
         self._sweeps_names = []
@@ -97,7 +98,6 @@ class SolutionData(object):
     def enable_pandas_output(self, val):
         if val != self._enable_pandas_output and pd:
             self._enable_pandas_output = val
-            self.init_solutions_data()
 
     @pyaedt_function_handler()
     def set_active_variation(self, var_id=0):
@@ -153,13 +153,15 @@ class SolutionData(object):
     @property
     def intrinsics(self):
         """Get intrinsics dictionary on active variation."""
-        _sweeps = OrderedDict({})
-        intrinsics = [i for i in self._sweeps_names if i not in self.nominal_variation.GetDesignVariableNames()]
-        for el in intrinsics:
-            values = list(self.nominal_variation.GetSweepValues(el, False))
-            _sweeps[el] = [i for i in values]
-            _sweeps[el] = list(OrderedDict.fromkeys(_sweeps[el]))
-        return _sweeps
+        key = (id(self.nominal_variation), len(self._sweeps_names))
+        if key not in self._intrinsics:
+            _sweeps = OrderedDict({})
+            intrinsics = [i for i in self._sweeps_names if i not in self.nominal_variation.GetDesignVariableNames()]
+            for el in intrinsics:
+                values = list(self.nominal_variation.GetSweepValues(el, False))
+                _sweeps[el] = list(OrderedDict.fromkeys(values))
+            self._intrinsics[key] = _sweeps
+        return OrderedDict((k, list(v)) for k, v in self._intrinsics[key].items())
 
     @property
     def nominal_variation(self):
@@ -234,100 +236,399 @@ class SolutionData(object):
 
     @pyaedt_function_handler()
     def init_solutions_data(self):
-        "Initialize the database and store info in variables."
-        self._solutions_real = self._init_solution_data_real()
-        self._solutions_imag = self._init_solution_data_imag()
-        self._solutions_mag = self._init_solution_data_mag()
-        self._solutions_phase = self._init_solution_data_phase()
+        """Initialize the database and store info in variables.
 
-    @pyaedt_function_handler()
-    def _init_solution_data_mag(self):
-        _solutions_mag = {}
+        The values of every expression are stored in a single complex array indexed by the
+        variation and by the intrinsic sweeps. Real, imaginary, magnitude, and phase values
+        are computed from this array when they are requested. If
+        ``settings.enable_lazy_solution_data`` is ``True``, the values of an expression are
+        read from AEDT only the first time that the expression is requested.
+        """
+        self._init_sweep_axes()
+        self._solutions = {}
+        self._complex_flags = {}
+        self._derived_data = OrderedDict()
+        self._derived_data_size = 0
         self.units_data = {}
+        for expression in self.expressions:
+            self.units_data[expression] = self.nominal_variation.GetDataUnits(expression)
+            if not settings.enable_lazy_solution_data:
+                self._get_solution(expression)
 
-        for expr in self.expressions:
-            _solutions_mag[expr] = {}
-            self.units_data[expr] = self.nominal_variation.GetDataUnits(expr)
-            if self.enable_pandas_output:
-                _solutions_mag[expr] = np.sqrt(
-                    self._solutions_real[expr]
-                    .mul(self._solutions_real[expr])
-                    .add(self._solutions_imag[expr].mul(self._solutions_imag[expr]))
-                )
+    @pyaedt_function_handler()
+    def _get_solution(self, expression):
+        """Get the complex values of an expression, reading them from AEDT on first access."""
+        if expression not in self._solutions:
+            if expression not in self.units_data:
+                raise KeyError(expression)
+            self._solutions[expression], self._complex_flags[expression] = self._init_solution_data(expression)
+        return self._solutions[expression]
+
+    @pyaedt_function_handler()
+    def _get_derived_data(self, expression, formula):
+        """Get a quantity derived from the values of an expression at all the solution points.
+
+        Magnitude, dB, and phase arrays are cached. The least recently used arrays are released
+        when the cache is bigger than ``settings.solution_data_cache_size``.
+        """
+        formula = _formula_aliases.get(formula, formula)
+        solution = self._get_solution(expression)
+        if formula in ("complex", "re", "im"):
+            return self._apply_formula(solution, formula)
+        key = (expression, formula)
+        values = self._derived_data.pop(key, None)
+        if values is None:
+            values = self._apply_formula(solution, formula)
+            self._derived_data_size += values.nbytes
+        self._derived_data[key] = values
+        while self._derived_data_size > settings.solution_data_cache_size * 1024 * 1024:
+            self._derived_data_size -= self._derived_data.popitem(last=False)[1].nbytes
+        return values
+
+    @pyaedt_function_handler()
+    def _init_sweep_axes(self):
+        """Build the intrinsic sweep axes shared by the solution arrays of all the variations."""
+        intrinsics = list(self.intrinsics.keys())
+        self._axes = OrderedDict((el, []) for el in intrinsics)
+        self._axes_index = OrderedDict((el, {}) for el in intrinsics)
+        self._variation_sweeps = []
+        for data in self._original_data:
+            values = [list(OrderedDict.fromkeys(data.GetSweepValues(el, False))) for el in intrinsics]
+            self._variation_sweeps.append(values)
+            for el, axis_values in zip(intrinsics, values):
+                for value in axis_values:
+                    if value not in self._axes_index[el]:
+                        self._axes_index[el][value] = len(self._axes[el])
+                        self._axes[el].append(value)
+        self._shape = tuple(len(values) for values in self._axes.values())
+        self._strides = []
+        stride = 1
+        for size in reversed(self._shape):
+            self._strides.insert(0, stride)
+            stride *= size
+        self._size = stride
+        # flat positions of the points of the variations that do not cover all the axes
+        self._variation_positions = []
+        for values in self._variation_sweeps:
+            if values == list(self._axes.values()):
+                self._variation_positions.append(None)
             else:
-                for i in self._solutions_real[expr]:
-                    _solutions_mag[expr][i] = abs(complex(self._solutions_real[expr][i], self._solutions_imag[expr][i]))
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(_solutions_mag)
+                indices = [[self._axes_index[el][i] for i in v] for el, v in zip(intrinsics, values)]
+                self._variation_positions.append([self._flat_position(i) for i in itertools.product(*indices)])
+        # variations with the same values of the variables share the same row
+        self._variation_index = OrderedDict()
+        self._variation_rows = []
+        for comb in self.variations:
+            self._variation_rows.append(
+                self._variation_index.setdefault(tuple(comb.values()), len(self._variation_index))
+            )
+        self._variable_positions = [i for i, el in enumerate(self._sweeps_names) if el not in self._axes]
+        self._axis_positions = [self._sweeps_names.index(el) for el in self._axes]
+
+    @pyaedt_function_handler()
+    def _init_solution_data(self, expression):
+        """Read the values of an expression for all the variations.
+
+        Returns
+        -------
+        tuple
+            Complex values of the expression and list of the variations with complex data.
+        """
+        flags = []
+        rows = len(self._variation_index)
+        if np:
+            solution = np.full((rows, self._size), np.nan, dtype=complex)
         else:
-            return _solutions_mag
+            solution = [[None] * self._size for _ in range(rows)]
+        for i, data in enumerate(self._original_data):
+            real = list(data.GetRealDataValues(expression, False))
+            flags.append(True if data.IsDataComplex(expression) else False)
+            imag = list(data.GetImagDataValues(expression, False)) if flags[-1] else [0.0] * len(real)
+            positions = self._variation_positions[i]
+            row = self._variation_rows[i]
+            if np:
+                values = np.array(real, dtype=complex)
+                values.imag = imag
+                if positions is None:
+                    solution[row] = values
+                else:
+                    solution[row, positions] = values
+            else:
+                values = [complex(r, im) for r, im in zip(real, imag)]
+                if positions is None:
+                    solution[row] = values
+                else:
+                    for position, value in zip(positions, values):
+                        solution[row][position] = value
+        if np:
+            solution = solution.reshape((rows,) + self._shape)
+        return solution, flags
+
+    def _flat_position(self, index):
+        return sum(i * stride for i, stride in zip(index, self._strides))
+
+    def _point_index(self, sweep_values):
+        """Get the index of a point in the solution arrays from the values of all the sweeps."""
+        variation = self._variation_index.get(tuple(sweep_values[i] for i in self._variable_positions))
+        if variation is None:
+            return None
+        index = [variation]
+        for el, i in zip(self._axes_index.values(), self._axis_positions):
+            axis_index = el.get(sweep_values[i])
+            if axis_index is None:
+                return None
+            index.append(axis_index)
+        return index
 
     @pyaedt_function_handler()
-    def _init_solution_data_real(self):
-        """ """
-        sols_data = {}
+    def _primary_sweep_index(self):
+        """Get the index of the points of the primary sweep for the active variation.
 
-        for expression in self.expressions:
-            solution_Data = {}
+        Returns
+        -------
+        tuple or list
+            Index of the solution arrays, when the points are a slice of the arrays, or list
+            of the index of every point, which is ``None`` for missing points.
+        """
+        temp = self._variation_tuple()
+        position = self._sweeps_names.index(self.primary_sweep)
+        sweep_values = self.variation_values(self.primary_sweep)
+        if np and self.primary_sweep in self._axes and sweep_values == self._axes[self.primary_sweep]:
+            index = self._point_index(temp)
+            if index is not None:
+                index[1 + list(self._axes).index(self.primary_sweep)] = slice(None)
+                return tuple(index)
+        points = []
+        for value in sweep_values:
+            temp[position] = value
+            points.append(self._point_index(temp))
+        return points
 
-            for data, comb in zip(self._original_data, self.variations):
-                solution = list(data.GetRealDataValues(expression, False))
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
+    @pyaedt_function_handler()
+    def _primary_sweep_data(self, expression, formula="complex", index=None):
+        """Get the values of an expression along the primary sweep for the active variation.
 
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
-            sols_data[expression] = solution_Data
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(sols_data)
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+        formula : str, optional
+            Formula to apply to the complex values. The default is ``"complex"``.
+        index : tuple or list, optional
+            Index returned by ``_primary_sweep_index``. The default is ``None``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list
+            Values. The array is a view of the stored data when the primary sweep
+            is an intrinsic sweep. Missing points are ``NaN``, or ``None`` if NumPy is not
+            available.
+        """
+        if index is None:
+            index = self._primary_sweep_index()
+        if not np:
+            solution = self._get_solution(expression)
+            values = [solution[p[0]][self._flat_position(p[1:])] if p is not None else None for p in index]
+            return self._apply_formula(values, formula)
+        data = self._get_derived_data(expression, formula)
+        if isinstance(index, tuple):
+            return data[index]
+        values = np.full(len(index), np.nan, dtype=data.dtype)
+        found = [i for i, point in enumerate(index) if point is not None]
+        if found:
+            values[found] = data[tuple(np.array([index[i] for i in found]).T)]
+        return values
+
+    @staticmethod
+    def _apply_formula(values, formula):
+        """Apply a formula to complex values.
+
+        Parameters
+        ----------
+        values : :class:`numpy.ndarray` or list
+            Complex values.
+        formula : str
+            Formula to apply. Options are ``"complex"``, ``"re"``, ``"im"``, ``"abs"``,
+            ``"db10"``, ``"db20"``, ``"phaserad"``, and ``"phasedeg"``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list
+        """
+        formula = _formula_aliases.get(formula, formula)
+        if np:
+            if formula == "complex":
+                return values
+            elif formula == "re":
+                return values.real
+            elif formula == "im":
+                return values.imag
+            elif formula == "phaserad":
+                return np.angle(values)
+            elif formula == "phasedeg":
+                return np.angle(values, deg=True)
+            elif formula in ("abs", "db10", "db20"):
+                magnitude = np.abs(values)
+                if formula == "abs":
+                    return magnitude
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    return (10 if formula == "db10" else 20) * np.log10(magnitude)
         else:
-            return sols_data
+            functions = {
+                "complex": lambda v: v,
+                "re": lambda v: v.real,
+                "im": lambda v: v.imag,
+                "abs": abs,
+                "db10": lambda v: db10(abs(v)),
+                "db20": lambda v: db20(abs(v)),
+                "phaserad": lambda v: math.atan2(v.imag, v.real),
+                "phasedeg": lambda v: math.degrees(math.atan2(v.imag, v.real)),
+            }
+            if formula in functions:
+                return [functions[formula](v) if v is not None else None for v in values]
+        raise ValueError("Unknown formula {}.".format(formula))
 
     @pyaedt_function_handler()
-    def _init_solution_data_imag(self):
-        """ """
-        sols_data = {}
-
-        for expression in self.expressions:
-            solution_Data = {}
-            for data, comb in zip(self._original_data, self.variations):
-                if data.IsDataComplex(expression):
-                    solution = list(data.GetImagDataValues(expression, False))
-                else:
-                    l = len(list(data.GetRealDataValues(expression, False)))
-                    solution = [0] * l
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
-            sols_data[expression] = solution_Data
+    def _get_curve(self, expression, formula, convert_to_SI=False):
+        """Get the values of an expression along the primary sweep as a list or a pandas series."""
+        index = self._primary_sweep_index()
+        values = self._primary_sweep_data(expression, formula, index)
+        if convert_to_SI and self._quantity(self.units_data[expression]):
+            values = self._convert_list_to_SI(
+                values, self._quantity(self.units_data[expression]), self.units_data[expression]
+            )
         if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(sols_data)
-        else:
-            return sols_data
+            return pd.Series(values)
+        if np:
+            missing = np.isnan(self._primary_sweep_data(expression, "complex", index))
+            values = values.tolist()
+            if missing.any():
+                values = [None if m else v for v, m in zip(values, missing.tolist())]
+        return values
+
+    @property
+    def sweep_axes(self):
+        """Values of the intrinsic sweeps used to index the solution arrays.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            Values of each intrinsic sweep for all the variations.
+        """
+        return OrderedDict((k, list(v)) for k, v in self._axes.items())
+
+    @pyaedt_function_handler()
+    def get_expression_array(self, expression=None, variation=None):
+        """Get the complex values of an expression as an array indexed by the sweeps.
+
+        The first axis of the array is the variation, in the order of ``variations``, where
+        variations with the same values of the variables share the same row. The other axes
+        are the intrinsic sweeps, in the order of ``sweep_axes``. Points that are not
+        available in a variation are ``NaN``.
+
+        Parameters
+        ----------
+        expression : str, optional
+            Name of the expression. The default is ``None``,
+            in which case the active expression is used.
+        variation : int, optional
+            Index of the variation. The default is ``None``, in which case all the
+            variations are returned.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Complex values. The array is a view of the stored data, so it must not be modified.
+        """
+        if is_ironpython:
+            return False
+        if not expression:
+            expression = self.active_expression
+        if variation is None:
+            return self._get_solution(expression)
+        return self._get_solution(expression)[self._variation_rows[variation]]
 
     @pyaedt_function_handler()
-    def _init_solution_data_phase(self):
-        data_phase = {}
-        for expr in self.expressions:
-            data_phase[expr] = {}
-            if self.enable_pandas_output:
-                data_phase[expr] = np.arctan2(self._solutions_imag[expr], self._solutions_real[expr])
+    def get_expression_data(self, expression=None, formula="re", convert_to_SI=False):
+        """Get the values of an expression along the primary sweep for the active variation.
+
+        Parameters
+        ----------
+        expression : str, optional
+            Name of the expression. The default is ``None``,
+            in which case the active expression is used.
+        formula : str, optional
+            Formula to apply to the data. Options are ``"complex"``, ``"re"``, ``"im"``,
+            ``"abs"``, ``"db10"``, ``"db20"``, ``"phaserad"``, and ``"phasedeg"``.
+            The default is ``"re"``.
+        convert_to_SI : bool, optional
+            Whether to convert the data to the SI unit system.
+            The default is ``False``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Values of the expression. The complex, real, and imaginary values are views
+            of the stored data when the primary sweep is an intrinsic sweep.
+        """
+        if is_ironpython:
+            return False
+        if not expression:
+            expression = self.active_expression
+        values = self._primary_sweep_data(expression, formula)
+        if convert_to_SI and self._quantity(self.units_data[expression]):
+            values = self._convert_list_to_SI(
+                values, self._quantity(self.units_data[expression]), self.units_data[expression]
+            )
+        return values
+
+    @pyaedt_function_handler()
+    def _solution_points(self):
+        """Get the keys of all the solution points and their position in the solution arrays.
+
+        Returns
+        -------
+        :class:`collections.OrderedDict`
+            Dictionary of the variation index and flat position of every point, whose key is
+            the tuple of the values of the variables followed by the values of the intrinsics.
+        """
+        points = OrderedDict()
+        for i, (comb, values) in enumerate(zip(self.variations, self._variation_sweeps)):
+            variables = list(comb.values())
+            positions = self._variation_positions[i]
+            for j, intrinsics in enumerate(itertools.product(*values)):
+                points[tuple(variables + list(intrinsics))] = (i, j if positions is None else positions[j])
+        return points
+
+    @pyaedt_function_handler()
+    def _full_matrix(self, formula, points=None):
+        """Get the values of all the expressions at all the solution points.
+
+        Returns
+        -------
+        dict
+            Dictionary of the values of each expression, whose keys are the solution points.
+        """
+        points = points or self._solution_points()
+        keys = list(points.keys())
+        variations = [i[0] for i in points.values()]
+        rows = [self._variation_rows[i] for i in variations]
+        positions = [i[1] for i in points.values()]
+        full_matrix = {}
+        for expression in self.expressions:
+            solution = self._get_solution(expression)
+            if np:
+                values = solution.reshape((solution.shape[0], -1))[rows, positions]
             else:
-                for i in self._solutions_real[expr]:
-                    data_phase[expr][i] = math.atan2(self._solutions_imag[expr][i], self._solutions_real[expr][i])
-        if self.enable_pandas_output:
-            return pd.DataFrame.from_dict(data_phase)
-        else:
-            return data_phase
+                values = [solution[i][j] for i, j in zip(rows, positions)]
+            values = self._apply_formula(values, formula)
+            if np:
+                values = values.tolist()
+            if formula == "im" and not all(self._complex_flags[expression]):
+                flags = self._complex_flags[expression]
+                values = [v if flags[i] else 0 for v, i in zip(values, variations)]
+            full_matrix[expression] = dict(zip(keys, values))
+        return full_matrix
 
     @property
     def full_matrix_real_imag(self):
@@ -338,7 +639,11 @@ class SolutionData(object):
         tuple of dicts
             (Real Dict, Imag Dict)
         """
-        return self._solutions_real, self._solutions_imag
+        points = self._solution_points()
+        real, imag = self._full_matrix("re", points), self._full_matrix("im", points)
+        if self.enable_pandas_output:
+            return pd.DataFrame.from_dict(real), pd.DataFrame.from_dict(imag)
+        return real, imag
 
     @property
     def full_matrix_mag_phase(self):
@@ -349,7 +654,11 @@ class SolutionData(object):
         tuple of dicts
             (Mag Dict, Phase Dict).
         """
-        return self._solutions_mag, self._solutions_phase
+        points = self._solution_points()
+        mag, phase = self._full_matrix("abs", points), self._full_matrix("phaserad", points)
+        if self.enable_pandas_output:
+            return pd.DataFrame.from_dict(mag), pd.DataFrame.from_dict(phase)
+        return mag, phase
 
     @staticmethod
     @pyaedt_function_handler()
@@ -426,24 +735,7 @@ class SolutionData(object):
             expression = self.active_expression
         elif expression not in self.expressions:
             return False
-        temp = self._variation_tuple()
-        solution_Data = self._solutions_mag[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        sw = self.variation_values(self.primary_sweep)
-        for el in sw:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
-        if self.enable_pandas_output:
-            return pd.Series(sol)
-        return sol
+        return self._get_curve(expression, "abs", convert_to_SI)
 
     @staticmethod
     @pyaedt_function_handler()
@@ -467,6 +759,8 @@ class SolutionData(object):
         """
         sol = datalist
         if dataunits in AEDT_UNITS and units in AEDT_UNITS[dataunits]:
+            if np and isinstance(datalist, np.ndarray):
+                return datalist * AEDT_UNITS[dataunits][units]
             sol = [i * AEDT_UNITS[dataunits][units] for i in datalist]
         return sol
 
@@ -494,9 +788,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        if self.enable_pandas_output:
-            return 10 * np.log10(self.data_magnitude(expression, convert_to_SI))
-        return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        return self._get_curve(expression, "db10", convert_to_SI)
 
     @pyaedt_function_handler()
     def data_db10(self, expression=None, convert_to_SI=False):
@@ -519,9 +811,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        if self.enable_pandas_output:
-            return 10 * np.log10(self.data_magnitude(expression, convert_to_SI))
-        return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        return self._get_curve(expression, "db10", convert_to_SI)
 
     @pyaedt_function_handler()
     def data_db20(self, expression=None, convert_to_SI=False):
@@ -544,9 +834,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        if self.enable_pandas_output:
-            return 20 * np.log10(self.data_magnitude(expression, convert_to_SI))
-        return [db20(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        return self._get_curve(expression, "db20", convert_to_SI)
 
     @pyaedt_function_handler()
     def data_phase(self, expression=None, radians=True):
@@ -569,12 +857,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        coefficient = 1
-        if not radians:
-            coefficient = 180 / math.pi
-        if self.enable_pandas_output:
-            return coefficient * np.arctan2(self.data_imag(expression), self.data_real(expression))
-        return [coefficient * math.atan2(k, i) for i, k in zip(self.data_real(expression), self.data_imag(expression))]
+        return self._get_curve(expression, "phaserad" if radians else "phasedeg")
 
     @property
     def primary_sweep_values(self):
@@ -600,16 +883,18 @@ class SolutionData(object):
             List of the primary sweep valid points for the expression.
 
         """
-        expression = self.active_expression
+        values = self._primary_sweep_data(self.active_expression)
+        if np:
+            found = (~np.isnan(values)).tolist()
+        else:
+            found = [v is not None for v in values]
         temp = self._variation_tuple()
-
-        solution_Data = list(self._solutions_real[expression].keys())
         sol = []
         position = list(self._sweeps_names).index(self.primary_sweep)
 
-        for el in self.primary_sweep_values:
+        for el, is_found in zip(self.variation_values(self.primary_sweep), found):
             temp[position] = el
-            if tuple(temp) in solution_Data:
+            if is_found:
                 sol_dict = OrderedDict({})
                 i = 0
                 for sn in self._sweeps_names:
@@ -643,26 +928,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_real[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
-        if self.enable_pandas_output:
-            return pd.Series(sol)
-        return sol
+        return self._get_curve(expression, "re", convert_to_SI)
 
     @pyaedt_function_handler()
     def data_imag(self, expression=None, convert_to_SI=False):
@@ -685,24 +951,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_imag[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
-        if self.enable_pandas_output:
-            return pd.Series(sol)
-        return sol
+        return self._get_curve(expression, "im", convert_to_SI)
 
     @pyaedt_function_handler()
     def is_real_only(self, expression=None):
@@ -721,12 +970,12 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-        if self.enable_pandas_output:
-            return True if self._solutions_imag[expression].abs().sum() > 0.0 else False
-        for v in list(self._solutions_imag[expression].values()):
-            if float(v) != 0.0:
-                return False
-        return True
+        solution = self._get_solution(expression)
+        if not any(self._complex_flags[expression]):
+            return True
+        if np:
+            return not np.any(solution.imag)
+        return not any(v.imag for row in solution for v in row if v is not None)
 
     @pyaedt_function_handler()
     def export_data_to_csv(self, output, delimiter=";"):
@@ -751,17 +1000,20 @@ class SolutionData(object):
             else:
                 header.append(el)
 
+        points = self._solution_points()
+        real = self._full_matrix("re", points)
+        imag = self._full_matrix("im", points)
         list_full = [header]
-        for e, v in self._solutions_real[self.active_expression].items():
+        for e in points:
             list_full.append(list(e))
         for el in self.expressions:
             i = 1
-            for e, v in self._solutions_real[el].items():
+            for v in real[el].values():
                 list_full[i].extend([v])
                 i += 1
             i = 1
             if not self.is_real_only(el):
-                for e, v in self._solutions_imag[el].items():
+                for v in imag[el].values():
                     list_full[i].extend([v])
                     i += 1
 
@@ -937,9 +1189,12 @@ class SolutionData(object):
         return plot_3d_chart(data_plot, size, xlabel, ylabel, title, snapshot_path)
 
     @pyaedt_function_handler()
-    def ifft(self, curve_header="NearE", u_axis="_u", v_axis="_v", window=False):
+    def ifft(self, curve_header="NearE", u_axis="_u", v_axis="_v", window=False, output_file=None, tile_size=4096):
         """Create IFFT of given complex data.
 
+        The grid is transformed in tiles of points, so that the memory used for the
+        intermediate complex arrays does not depend on the size of the grid.
+
         Parameters
         ----------
         curve_header : curve header. Solution data must contain 3 curves with X, Y and Z components of curve header.
@@ -949,6 +1204,12 @@ class SolutionData(object):
             V Axis name. Default is Hfss name "_v"
         window : bool, optional
             Either if Hanning windowing has to be applied.
+        output_file : str, optional
+            Full path of a ``.npy`` file where the IFFT matrix is written. The matrix is
+            then returned as a memory-mapped array. The default is ``None``, in which case
+            the matrix is kept in memory.
+        tile_size : int, optional
+            Number of points of the UV grid transformed at a time. The default is ``4096``.
 
         Returns
         -------
@@ -961,56 +1222,29 @@ class SolutionData(object):
         v = self.variation_values(v_axis)
 
         freq = self.variation_values("Freq")
-        if self.enable_pandas_output:
-            E_realx = np.reshape(self._solutions_real[curve_header + "X"].copy().values, (len(freq), len(v), len(u)))
-            E_imagx = np.reshape(self._solutions_imag[curve_header + "X"].copy().values, (len(freq), len(v), len(u)))
-            E_realy = np.reshape(self._solutions_real[curve_header + "Y"].copy().values, (len(freq), len(v), len(u)))
-            E_imagy = np.reshape(self._solutions_imag[curve_header + "Y"].copy().values, (len(freq), len(v), len(u)))
-            E_realz = np.reshape(self._solutions_real[curve_header + "Z"].copy().values, (len(freq), len(v), len(u)))
-            E_imagz = np.reshape(self._solutions_imag[curve_header + "Z"].copy().values, (len(freq), len(v), len(u)))
-        else:
-            vals_real_Ex = [j for j in self._solutions_real[curve_header + "X"].values()]
-            vals_imag_Ex = [j for j in self._solutions_imag[curve_header + "X"].values()]
-            vals_real_Ey = [j for j in self._solutions_real[curve_header + "Y"].values()]
-            vals_imag_Ey = [j for j in self._solutions_imag[curve_header + "Y"].values()]
-            vals_real_Ez = [j for j in self._solutions_real[curve_header + "Z"].values()]
-            vals_imag_Ez = [j for j in self._solutions_imag[curve_header + "Z"].values()]
-
-            E_realx = np.reshape(vals_real_Ex, (len(freq), len(v), len(u)))
-            E_imagx = np.reshape(vals_imag_Ex, (len(freq), len(v), len(u)))
-            E_realy = np.reshape(vals_real_Ey, (len(freq), len(v), len(u)))
-            E_imagy = np.reshape(vals_imag_Ey, (len(freq), len(v), len(u)))
-            E_realz = np.reshape(vals_real_Ez, (len(freq), len(v), len(u)))
-            E_imagz = np.reshape(vals_imag_Ez, (len(freq), len(v), len(u)))
-
-        Temp_E_compx = E_realx + 1j * E_imagx  # Here is the complex FD data matrix, ready for transforming
-        Temp_E_compy = E_realy + 1j * E_imagy
-        Temp_E_compz = E_realz + 1j * E_imagz
-
-        E_compx = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
-        E_compy = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
-        E_compz = np.zeros((len(freq), len(v), len(u)), dtype="complex_")
-        if window:
-            timewin = np.hanning(len(freq))
-
-            for row in range(0, len(v)):
-                for col in range(0, len(u)):
-                    E_compx[:, row, col] = np.multiply(Temp_E_compx[:, row, col], timewin)
-                    E_compy[:, row, col] = np.multiply(Temp_E_compy[:, row, col], timewin)
-                    E_compz[:, row, col] = np.multiply(Temp_E_compz[:, row, col], timewin)
+        shape = (len(freq), len(v), len(u))
+        # complex FD data matrices of the first variation, as (frequency, point) views
+        components = [
+            np.reshape(self._get_solution(curve_header + i)[0], shape).reshape((len(freq), -1)) for i in "XYZ"
+        ]
+        if output_file:
+            E_time = np.lib.format.open_memmap(output_file, mode="w+", dtype=float, shape=shape)
         else:
-            E_compx = Temp_E_compx
-            E_compy = Temp_E_compy
-            E_compz = Temp_E_compz
-
-        E_time_x = np.fft.ifft(np.fft.fftshift(E_compx, 0), len(freq), 0, None)
-        E_time_y = np.fft.ifft(np.fft.fftshift(E_compy, 0), len(freq), 0, None)
-        E_time_z = np.fft.ifft(np.fft.fftshift(E_compz, 0), len(freq), 0, None)
-        E_time = np.zeros((np.size(freq), np.size(v), np.size(u)))
-        for i in range(0, len(freq)):
-            E_time[i, :, :] = np.abs(
-                np.sqrt(np.square(E_time_x[i, :, :]) + np.square(E_time_y[i, :, :]) + np.square(E_time_z[i, :, :]))
-            )
+            E_time = np.empty(shape)
+        E_time_points = E_time.reshape((len(freq), -1))
+        timewin = np.hanning(len(freq))[:, None] if window else None
+        tile_size = max(int(tile_size), 1)
+        for start in range(0, E_time_points.shape[1], tile_size):
+            tile = slice(start, start + tile_size)
+            E_time_tile = np.zeros((len(freq), E_time_points[:, tile].shape[1]), dtype=complex)
+            for component in components:
+                E_comp = component[:, tile]
+                if timewin is not None:
+                    E_comp = E_comp * timewin
+                E_time_tile += np.square(np.fft.ifft(np.fft.fftshift(E_comp, 0), len(freq), 0, None))
+            E_time_points[:, tile] = np.abs(np.sqrt(E_time_tile))
+        if output_file:
+            E_time.flush()
         self._ifft = E_time
 
         return self._ifft
@@ -1025,8 +1259,12 @@ class SolutionData(object):
         num_frames=None,
         csv_dir=None,
         name_str="res_",
+        file_format="csv",
     ):
-        """Save IFFT Matrix to a list of csv files (one per time step).
+        """Save IFFT Matrix to a list of files (one per time step).
+
+        Each frame is written as soon as it is computed, so that only one frame is held in memory
+        when the IFFT matrix is memory-mapped.
 
         Parameters
         ----------
@@ -1044,12 +1282,21 @@ class SolutionData(object):
             Output path
         name_str : str, optional
             csv file header.
+        file_format : str, optional
+            Format of the frame files. Options are ``"csv"`` and ``"npy"``. A ``"npy"`` file
+            contains a NumPy array with the ``x``, ``y``, ``z`` and ``val`` columns.
+            The default is ``"csv"``, which is the format read by
+            :func:`pyaedt.modules.AdvancedPostProcessing.PostProcessor.plot_scene`.
 
         Returns
         -------
         str
-            Path to file containing the list of csv files.
+            Path to file containing the list of frame files.
         """
+        file_format = file_format.lower()
+        if file_format not in ("csv", "npy"):
+            raise ValueError("Unknown file format {}.".format(file_format))
+        extension = "." + file_format
         if not coord_system_center:
             coord_system_center = [0, 0, 0]
         t_matrix = self._ifft
@@ -1065,28 +1312,28 @@ class SolutionData(object):
             frames = t_matrix.shape[0]
         csv_list = []
         if os.path.exists(csv_dir):
-            files = [os.path.join(csv_dir, f) for f in os.listdir(csv_dir) if name_str in f and ".csv" in f]
+            files = [os.path.join(csv_dir, f) for f in os.listdir(csv_dir) if name_str in f and extension in f]
             for file in files:
                 os.remove(file)
         else:
             os.mkdir(csv_dir)
 
+        # coordinates of the points in the (v, u) order of the frames
+        x_coords = np.tile(np.asarray(x_c_list, dtype=float) + adj_x, len(y_c_list))
+        y_coords = np.repeat(np.asarray(y_c_list, dtype=float) + adj_y, len(x_c_list))
         for frame in range(frames):
-            output = os.path.join(csv_dir, name_str + str(frame) + ".csv")
-            list_full = [["x", "y", "z", "val"]]
-            for i, y in enumerate(y_c_list):
-
-                for j, x in enumerate(x_c_list):
-                    y_coord = y + adj_y
-                    x_coord = x + adj_x
-                    z_coord = adj_z
-                    if db_val:
-                        val = 10.0 * np.log10(np.abs(t_matrix[frame, i, j]))
-                    else:
-                        val = t_matrix[frame, i, j]
-                    row_lst = [x_coord, y_coord, z_coord, val]
-                    list_full.append(row_lst)
-            write_csv(output, list_full, delimiter=",")
+            output = os.path.join(csv_dir, name_str + str(frame) + extension)
+            values = np.asarray(t_matrix[frame], dtype=float).ravel()
+            if db_val:
+                values = 10.0 * np.log10(np.abs(values))
+            if file_format == "npy":
+                np.save(output, np.column_stack((x_coords, y_coords, np.full(values.shape, adj_z, float), values)))
+            else:
+                list_full = [["x", "y", "z", "val"]]
+                list_full.extend(
+                    [x, y, adj_z, val] for x, y, val in zip(x_coords.tolist(), y_coords.tolist(), values.tolist())
+                )
+                write_csv(output, list_full, delimiter=",")
             csv_list.append(output)
 
         txt_file_name = csv_dir + "fft_list.txt"
@@ -1098,6 +1345,487 @@ class SolutionData(object):
         return txt_file_name
 
 
+def _q_factor(ber):
+    """Number of standard deviations of a Gaussian tail with a given probability.
+
+    Parameters
+    ----------
+    ber : float
+        Probability of the tail, between ``0`` and ``0.5``.
+
+    Returns
+    -------
+    float
+    """
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        q = (low + high) / 2
+        if 0.5 * math.erfc(q / math.sqrt(2)) > ber:
+            low = q
+        else:
+            high = q
+    return (low + high) / 2
+
+
+class EyeDiagramData(object):
+    """Eye diagram of a transient waveform computed with NumPy, without creating a report in AEDT.
+
+    The waveform is folded by unit interval. It is resampled on a uniform grid of ``time_bins``
+    points per unit interval and accumulated in a 2D histogram of amplitude versus time. The
+    threshold crossings give the jitter and the eye width. Every unit interval, centered on the
+    eye center, is classified as a one or a zero by the mean of the middle half of it. The mean and
+    standard deviation of the ones and of the zeros in each time column give the eye height and
+    the BER contours, with a Gaussian extrapolation of the tails.
+
+    Long waveforms are streamed: call :func:`add_waveform` with consecutive chunks of the
+    waveform. Only the histogram and per-column statistics are kept in memory.
+
+    Parameters
+    ----------
+    unit_interval : float
+        Unit interval in seconds.
+    time_bins : int, optional
+        Number of time columns per unit interval. The default is ``100``.
+    amplitude_bins : int, optional
+        Number of amplitude rows of the histogram. The default is ``200``.
+    amplitude_range : list, optional
+        Minimum and maximum amplitude of the histogram in volts. The default is ``None``, in which
+        case the range of the first chunk is used with a 10% margin. Values outside of the range
+        are counted in the first or last row.
+    threshold : float, optional
+        Decision threshold in volts. The default is ``None``, in which case the center of
+        the amplitude range of the first chunk is used.
+    offset : float, optional
+        Time of the start of a unit interval in seconds. The default is ``0.0``.
+    ignore_bits : int, optional
+        Number of initial unit intervals, counted from ``offset``, to ignore. The default is ``0``.
+
+    Examples
+    --------
+    >>> eye = EyeDiagramData(unit_interval=1e-9)
+    >>> for time, voltage in chunks:
+    ...     eye.add_waveform(time, voltage)
+    >>> eye.eye_height, eye.eye_width, eye.jitter_rms
+    """
+
+    # resolution of the crossing histogram, in fractions of a time column
+    _crossing_resolution = 32
+
+    def __init__(
+        self,
+        unit_interval,
+        time_bins=100,
+        amplitude_bins=200,
+        amplitude_range=None,
+        threshold=None,
+        offset=0.0,
+        ignore_bits=0,
+    ):
+        self.unit_interval = float(unit_interval)
+        self.time_bins = int(time_bins)
+        self.amplitude_bins = int(amplitude_bins)
+        self.amplitude_range = list(amplitude_range) if amplitude_range is not None else None
+        self.threshold = threshold
+        self.offset = float(offset)
+        self.start_time = self.offset + ignore_bits * self.unit_interval
+        self._counts = np.zeros(self.amplitude_bins * self.time_bins, dtype=np.int64)
+        self._crossings = np.zeros(self.time_bins * self._crossing_resolution, dtype=np.int64)
+        # per column statistics of the ones and of the zeros
+        self._n = np.zeros((2, self.time_bins), dtype=np.int64)
+        self._sum = np.zeros((2, self.time_bins))
+        self._sum2 = np.zeros((2, self.time_bins))
+        self._inner = np.array([np.full(self.time_bins, -np.inf), np.full(self.time_bins, np.inf)])
+        self._last = None
+        # samples of the last unit interval, waiting for the next chunk to complete it
+        self._pending = None
+        self.n_samples = 0
+
+    @property
+    def _dt(self):
+        return self.unit_interval / self.time_bins
+
+    @pyaedt_function_handler()
+    def add_waveform(self, time, values, chunk_size=1 << 20):
+        """Add a chunk of the waveform.
+
+        The chunks must be added in time order. The last point of a chunk is kept, so that the
+        waveform is continuous between chunks.
+
+        Parameters
+        ----------
+        time : list or :class:`numpy.ndarray`
+            Increasing times in seconds.
+        values : list or :class:`numpy.ndarray`
+            Amplitudes in volts.
+        chunk_size : int, optional
+            Maximum number of grid points resampled at once. The default is ``1048576``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        time = np.asarray(time, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if not time.size:
+            return True
+        if self.amplitude_range is None:
+            low, high = float(values.min()), float(values.max())
+            margin = 0.1 * (high - low) or 1.0
+            self.amplitude_range = [low - margin, high + margin]
+        if self.threshold is None:
+            self.threshold = (self.amplitude_range[0] + self.amplitude_range[1]) / 2
+        if self._last is not None:
+            time = np.concatenate(([self._last[0]], time))
+            values = np.concatenate(([self._last[1]], values))
+            first = math.floor((time[0] - self.offset) / self._dt) + 1
+        else:
+            first = math.ceil((time[0] - self.offset) / self._dt)
+        first = max(first, int(math.ceil((self.start_time - self.offset) / self._dt)))
+        last = math.floor((time[-1] - self.offset) / self._dt)
+        self._last = (time[-1], values[-1])
+        self._add_crossings(time, values)
+        for start in range(first, last + 1, chunk_size):
+            grid = np.arange(start, min(start + chunk_size, last + 1))
+            grid_values = np.interp(self.offset + grid * self._dt, time, values)
+            self._add_samples(grid % self.time_bins, grid_values)
+            self._add_levels(grid, grid_values)
+        return True
+
+    def _add_samples(self, columns, values):
+        low, high = self.amplitude_range
+        rows = np.floor((values - low) / (high - low) * self.amplitude_bins).astype(np.int64)
+        np.clip(rows, 0, self.amplitude_bins - 1, out=rows)
+        self._counts += np.bincount(rows * self.time_bins + columns, minlength=self._counts.size)
+        self.n_samples += len(values)
+
+    def _add_levels(self, grid, values):
+        if self._pending is not None:
+            grid = np.concatenate((self._pending[0], grid))
+            values = np.concatenate((self._pending[1], values))
+            self._pending = None
+        # unit intervals centered on the eye center, and position of the samples in them
+        center = self._center_column
+        bits = (grid - center + self.time_bins // 2) // self.time_bins
+        position = grid - bits * self.time_bins - center
+        # the samples of a unit interval that is not complete yet wait for the next chunk
+        late = bits * self.time_bins + center + self.time_bins - self.time_bins // 2 - 1 > grid[-1]
+        if late.any():
+            self._pending = (grid[late], values[late])
+            grid, values, bits, position = grid[~late], values[~late], bits[~late], position[~late]
+        if not grid.size:
+            return
+        # the bit decision of a unit interval is the mean of the middle half of it, so that
+        # the noise of the samples at the eye center does not decide their own level
+        index = bits - bits[0]
+        middle = np.abs(position) <= self.time_bins // 4
+        count = np.bincount(index[middle], minlength=index[-1] + 1)
+        total = np.bincount(index[middle], values[middle], minlength=index[-1] + 1)
+        # unit intervals cut by the start time, without samples in their middle half
+        partial = count == 0
+        count[partial] = np.bincount(index, minlength=index[-1] + 1)[partial]
+        total[partial] = np.bincount(index, values, minlength=index[-1] + 1)[partial]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ones = (total / count > self.threshold)[index]
+        columns = grid % self.time_bins
+        for level, mask in enumerate([~ones, ones]):
+            level_columns = columns[mask]
+            level_values = values[mask]
+            self._n[level] += np.bincount(level_columns, minlength=self.time_bins)
+            self._sum[level] += np.bincount(level_columns, level_values, minlength=self.time_bins)
+            self._sum2[level] += np.bincount(level_columns, level_values**2, minlength=self.time_bins)
+            # highest zero and lowest one of each column
+            if level:
+                np.minimum.at(self._inner[1], level_columns, level_values)
+            else:
+                np.maximum.at(self._inner[0], level_columns, level_values)
+
+    def _add_crossings(self, time, values):
+        above = values > self.threshold
+        index = np.nonzero(above[1:] != above[:-1])[0]
+        if not index.size:
+            return
+        t0, t1 = time[index], time[index + 1]
+        v0, v1 = values[index], values[index + 1]
+        crossing_time = t0 + (t1 - t0) * (self.threshold - v0) / (v1 - v0)
+        crossing_time = crossing_time[crossing_time >= self.start_time]
+        phase = np.mod((crossing_time - self.offset) / self.unit_interval, 1.0)
+        bins = np.minimum((phase * self._crossings.size).astype(np.int64), self._crossings.size - 1)
+        self._crossings += np.bincount(bins, minlength=self._crossings.size)
+
+    @property
+    def n_crossings(self):
+        """Number of threshold crossings.
+
+        Returns
+        -------
+        int
+        """
+        return int(self._crossings.sum())
+
+    def _crossing_deviations(self):
+        # crossing phases relative to their circular mean, in fractions of unit interval
+        phase = (np.arange(self._crossings.size) + 0.5) / self._crossings.size
+        mean = np.angle(np.sum(self._crossings * np.exp(2j * np.pi * phase))) / (2 * np.pi)
+        deviation = np.mod(phase - mean + 0.5, 1.0) - 0.5
+        return mean % 1.0, deviation
+
+    @property
+    def eye_center(self):
+        """Time of the center of the eye from the start of the unit interval in seconds.
+
+        The center is half a unit interval after the mean crossing time.
+
+        Returns
+        -------
+        float
+        """
+        if not self.n_crossings:
+            return self.unit_interval / 2
+        mean, _ = self._crossing_deviations()
+        return ((mean + 0.5) % 1.0) * self.unit_interval
+
+    @property
+    def _center_column(self):
+        return int(round(self.eye_center / self._dt)) % self.time_bins
+
+    @property
+    def _column_order(self):
+        # raw columns in display order, with the eye center in the middle
+        shift = self._center_column - self.time_bins // 2
+        return np.mod(np.arange(self.time_bins) + shift, self.time_bins)
+
+    @property
+    def jitter_rms(self):
+        """RMS jitter of the threshold crossings in seconds.
+
+        Returns
+        -------
+        float
+        """
+        if not self.n_crossings:
+            return 0.0
+        _, deviation = self._crossing_deviations()
+        weights = self._crossings / float(self.n_crossings)
+        mean = np.sum(weights * deviation)
+        return float(np.sqrt(np.sum(weights * (deviation - mean) ** 2)) * self.unit_interval)
+
+    @property
+    def jitter_pp(self):
+        """Peak-to-peak jitter of the threshold crossings in seconds.
+
+        Returns
+        -------
+        float
+        """
+        if not self.n_crossings:
+            return 0.0
+        _, deviation = self._crossing_deviations()
+        deviation = deviation[self._crossings > 0]
+        return float((deviation.max() - deviation.min()) * self.unit_interval)
+
+    @property
+    def eye_width(self):
+        """Eye width in seconds, that is the unit interval minus the peak-to-peak jitter.
+
+        Returns
+        -------
+        float
+        """
+        return max(self.unit_interval - self.jitter_pp, 0.0)
+
+    @property
+    def eye_height(self):
+        """Eye height at the eye center in volts.
+
+        This is the distance between the lowest one and the highest zero, where ones and zeros
+        are the unit intervals whose mean over their middle half is above or below the
+        threshold. A negative value means that the eye is closed.
+
+        Returns
+        -------
+        float
+        """
+        column = self._center_column
+        return float(self._inner[1][column] - self._inner[0][column])
+
+    @property
+    def histogram(self):
+        """Number of samples of each amplitude row and time column.
+
+        The array has shape ``(amplitude_bins, time_bins)``. The columns are ordered so that the
+        eye center is in the middle.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return self._counts.reshape((self.amplitude_bins, self.time_bins))[:, self._column_order]
+
+    @property
+    def time_edges(self):
+        """Edges of the time columns in seconds, relative to the eye center.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return (np.arange(self.time_bins + 1) - self.time_bins // 2 - 0.5) * self._dt
+
+    @property
+    def amplitude_edges(self):
+        """Edges of the amplitude rows in volts.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return np.linspace(self.amplitude_range[0], self.amplitude_range[1], self.amplitude_bins + 1)
+
+    @pyaedt_function_handler()
+    def ber_contour(self, ber=1e-12):
+        """Compute the inner eye contour at a bit error rate.
+
+        The ones and the zeros of each time column are modeled by Gaussian distributions.
+
+        Parameters
+        ----------
+        ber : float, optional
+            Bit error rate. The default is ``1e-12``.
+
+        Returns
+        -------
+        tuple
+            Times relative to the eye center in seconds, lower and upper amplitudes of the
+            contour in volts. The amplitudes are ``NaN`` where the eye is closed.
+        """
+        q = _q_factor(ber)
+        order = self._column_order
+        n = self._n[:, order].astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self._sum[:, order] / n
+            std = np.sqrt(np.maximum(self._sum2[:, order] / n - mean**2, 0.0))
+        lower = mean[0] + q * std[0]
+        upper = mean[1] - q * std[1]
+        closed = ~(upper > lower)
+        lower[closed] = np.nan
+        upper[closed] = np.nan
+        time = (np.arange(self.time_bins) - self.time_bins // 2) * self._dt
+        return time, lower, upper
+
+    @pyaedt_function_handler()
+    def eye_opening(self, ber=1e-12):
+        """Compute the eye height and the eye width at a bit error rate.
+
+        Parameters
+        ----------
+        ber : float, optional
+            Bit error rate. The default is ``1e-12``.
+
+        Returns
+        -------
+        tuple
+            Eye height in volts and eye width in seconds. Both are ``0.0`` when the eye is closed.
+        """
+        _, lower, upper = self.ber_contour(ber)
+        center = self.time_bins // 2
+        if np.isnan(upper[center]):
+            return 0.0, 0.0
+        # contiguous open columns around the center
+        closed = np.nonzero(np.isnan(upper))[0]
+        left = closed[closed < center]
+        right = closed[closed > center]
+        first = left[-1] + 1 if left.size else 0
+        last = right[0] - 1 if right.size else self.time_bins - 1
+        return float(upper[center] - lower[center]), float((last - first + 1) * self._dt)
+
+
+def _read_ffd_fields(filename, out):
+    """Read the fields of an embedded element pattern file into a preallocated array.
+
+    Parameters
+    ----------
+    filename : str
+        Full path of the ``.ffd`` file.
+    out : :class:`numpy.ndarray`
+        Complex array of ``2 * n`` values, where the ``rETheta`` values are written in the first
+        half and the ``rEPhi`` values in the second half.
+
+    Returns
+    -------
+    bool
+        ``True`` when the file has the expected number of values, ``False`` otherwise.
+    """
+    with open_file(filename, "r") as reader:
+        for _ in range(4):
+            reader.readline()
+        values = np.fromstring(reader.read(), sep=" ")
+    if values.size != 2 * out.size:
+        return False
+    values = values.reshape((-1, 4))
+    # the real and imaginary parts are interleaved like in a complex array
+    out_values = out.view(float)
+    out_values[: out.size] = values[:, :2].ravel()
+    out_values[out.size :] = values[:, 2:].ravel()
+    return True
+
+
+def _load_ffd_fields(filenames, num_samples):
+    """Load the embedded element patterns of all the ports in a single array.
+
+    The files are read concurrently. When ``settings.enable_ffd_fields_cache`` is ``True``,
+    the array is saved in an ``eep_fields.npy`` file next to the first file and memory-mapped
+    by the next loads, as long as the ``.ffd`` files do not change.
+
+    Parameters
+    ----------
+    filenames : list
+        Full paths of the ``.ffd`` files, one per port.
+    num_samples : int
+        Number of theta and phi samples of each file.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Complex array of shape ``(number of ports, 2 * num_samples)`` with the ``rETheta``
+        values followed by the ``rEPhi`` values of each port, or ``None`` when a file is invalid.
+    """
+    shape = (len(filenames), 2 * num_samples)
+    fields = None
+    if settings.enable_ffd_fields_cache:
+        cache_file = os.path.join(os.path.dirname(filenames[0]), "eep_fields.npy")
+        stamps = [[os.path.abspath(f), os.path.getmtime(f), os.path.getsize(f)] for f in filenames]
+        try:
+            with open(cache_file + ".json", "r") as f:
+                cached_stamps = json.load(f)
+            if cached_stamps == stamps:
+                fields = np.load(cache_file, mmap_mode="r")
+                if fields.shape == shape and fields.dtype == complex:
+                    return fields
+        except (IOError, OSError, ValueError):
+            pass
+        try:
+            if os.path.exists(cache_file + ".json"):
+                os.remove(cache_file + ".json")
+            fields = np.lib.format.open_memmap(cache_file, mode="w+", dtype=complex, shape=shape)
+        except (IOError, OSError):
+            fields = None
+    if fields is None:
+        fields = np.zeros(shape, dtype=complex)
+    with ThreadPoolExecutor() as pool:
+        loaded = list(pool.map(_read_ffd_fields, filenames, list(fields)))
+    if not all(loaded):
+        return None
+    if isinstance(fields, np.memmap):
+        fields.flush()
+        try:
+            with open(cache_file + ".json", "w") as f:
+                json.dump(stamps, f)
+        except (IOError, OSError):
+            pass
+    return fields
+
+
 class FfdSolutionData(object):
     """Class containing Hfss Far Field Solution Data (ffd)."""
 
@@ -1119,44 +1847,48 @@ class FfdSolutionData(object):
         self.lattice_vectors = self.get_lattice_vectors()
         self.taper = taper
         self.data_dict = {}
+        self._beam_cache = OrderedDict()
         self._init_ffd()
         self._phase_offset = [0] * len(self.all_port_names)
 
+    # number of scan results kept by ``beamform`` and ``beamform_many``
+    beam_cache_size = 16
+
     @pyaedt_function_handler()
     def _init_ffd(self):
         all_ports = list(self.ffd_dict.keys())
         valid_ffd = True
+        self._beam_cache = OrderedDict()
+        self._weights_cache = None
 
         if os.path.exists(self.ffd_dict[all_ports[0]]):
             with open(self.ffd_dict[all_ports[0]], "r") as reader:
                 theta = [int(i) for i in reader.readline().split()]
                 phi = [int(i) for i in reader.readline().split()]
             reader.close()
-            for port in self.ffd_dict.keys():
-                if ":" in port:
-                    port = port.split(":")[0]
-                temp_dict = {}
-                theta_range = np.linspace(*theta)
-                phi_range = np.linspace(*phi)
-                if os.path.exists(self.ffd_dict[port]):
-                    eep_txt = np.loadtxt(self.ffd_dict[port], skiprows=4)
-                    Etheta = np.vectorize(complex)(eep_txt[:, 0], eep_txt[:, 1])
-                    Ephi = np.vectorize(complex)(eep_txt[:, 2], eep_txt[:, 3])
-                    # eep=np.column_stack((etheta, ephi))
-                    temp_dict["Theta"] = theta_range
-                    temp_dict["Phi"] = phi_range
-                    temp_dict["rETheta"] = Etheta
-                    temp_dict["rEPhi"] = Ephi
-                    self.data_dict[port] = temp_dict
-                else:
-                    valid_ffd = False
+            theta_range = np.linspace(*theta)
+            phi_range = np.linspace(*phi)
+            ports = [port.split(":")[0] if ":" in port else port for port in all_ports]
+            valid_ffd = all(os.path.exists(self.ffd_dict[port]) for port in ports)
+            if valid_ffd:
+                num_samples = len(theta_range) * len(phi_range)
+                fields = _load_ffd_fields([self.ffd_dict[port] for port in ports], num_samples)
+                valid_ffd = fields is not None
             if valid_ffd:
+                self._fields = fields
+                for n, port in enumerate(ports):
+                    self.data_dict[port] = {
+                        "Theta": theta_range,
+                        "Phi": phi_range,
+                        "rETheta": fields[n, :num_samples],
+                        "rEPhi": fields[n, num_samples:],
+                    }
                 # differential area of sphere, based on observation angle
                 self.d_theta = np.abs(theta_range[1] - theta_range[0])
                 self.d_phi = np.abs(phi_range[1] - phi_range[0])
                 self.diff_area = np.radians(self.d_theta) * np.radians(self.d_phi) * np.sin(np.radians(theta_range))
-                self.num_samples = len(temp_dict["rETheta"])
-                self.all_port_names = list(self.data_dict.keys())
+                self.num_samples = num_samples
+                self.all_port_names = ports
                 self.solution_type = "DrivenModal"
                 self.unique_beams = None
                 self.renormalize = False
@@ -1209,6 +1941,7 @@ class FfdSolutionData(object):
             for phase in phases:
                 phases_to_rad.append(math.radians(phase))
             self._phase_offset = phases_to_rad
+            self._beam_cache.clear()
             self.beamform()
 
     @staticmethod
@@ -1449,89 +2182,140 @@ class FfdSolutionData(object):
         dict
             Updated quantities dictionary.
         """
-        num_ports = len(self.all_port_names)
-        self.array_center_and_edge()
+        # copy of the cached result, so that the caller can modify it
+        self.all_qtys = {}
+        for name, value in self.beamform_many([[phi_scan, theta_scan]])[0].items():
+            if isinstance(value, np.ndarray):
+                value = np.array(value)
+            elif isinstance(value, (list, dict)):
+                value = copy.deepcopy(value)
+            self.all_qtys[name] = value
+        pin = self.all_qtys["Pincident"]
+        self._app.logger.info("Incident Power: %s", pin)
+        self.max_gain = np.max(self.all_qtys["RealizedGain_dB"])
+        self.min_gain = np.min(self.all_qtys["RealizedGain_dB"])
+        self._app.logger.info("Peak Realized Gain: %s dB", self.max_gain)
+        return self.all_qtys
 
-        c = 299792458
-        k = (2 * math.pi * self.frequency) / c
+    @pyaedt_function_handler()
+    def beamform_many(self, scan_angles):
+        """Compute the far field patterns of several scan angles at once.
+
+        The weights of all the scan angles are applied to the embedded element patterns in a
+        single matrix product. The results of the last scan angles are kept in a cache of
+        ``beam_cache_size`` entries, which is cleared when the frequency or the phase offsets change.
 
-        theta_scan = math.radians(theta_scan)
-        phi_scan = math.radians(phi_scan)
+        Parameters
+        ----------
+        scan_angles : list
+            List of ``[phi_scan, theta_scan]`` scan angles in degrees.
 
+        Returns
+        -------
+        list of dict
+            Quantities dictionary of each scan angle, with the same keys as the dictionary
+            returned by :func:`beamform`. The dictionaries are cached, so their arrays are
+            read-only. Use :func:`beamform` to get a copy that can be modified.
+
+        Examples
+        --------
+        >>> ffdata = hfss.get_antenna_ffd_solution_data(frequencies=[3.5e9])
+        >>> results = ffdata.beamform_many([[0, theta] for theta in range(0, 60, 5)])
+        >>> peak_gains = [np.max(result["RealizedGain_dB"]) for result in results]
+        """
+        keys = [
+            (self.frequency, self.taper, float(phi_scan), float(theta_scan)) for phi_scan, theta_scan in scan_angles
+        ]
+        missing = [key for key in OrderedDict.fromkeys(keys) if key not in self._beam_cache]
+        if missing:
+            scans = np.radians(np.array([key[2:] for key in missing], dtype=float))
+            for key, quantities in zip(missing, self._beam_quantities(self._beam_weights(scans[:, 0], scans[:, 1]))):
+                self._beam_cache[key] = quantities
+        results = []
+        for key in keys:
+            self._beam_cache.move_to_end(key)
+            results.append(self._beam_cache[key])
+        while len(self._beam_cache) > self.beam_cache_size:
+            self._beam_cache.popitem(last=False)
+        return results
+
+    def _port_weights(self):
+        # taper magnitudes, indices, and locations of the elements, which depend only on the taper
+        if self._weights_cache is None or self._weights_cache[0] != self.taper:
+            self.array_center_and_edge()
+            a = []
+            b = []
+            magnitudes = []
+            array_positions = {}
+            for port_name in self.all_port_names:
+                index_str = self.get_array_index(port_name)
+                a.append(index_str[0] - 1)
+                b.append(index_str[1] - 1)
+                magnitudes.append(np.round(np.abs(self.assign_weight(a[-1], b[-1], taper=self.taper)), 3))
+                array_positions[port_name] = self.element_location(a[-1], b[-1])
+            self._weights_cache = (self.taper, np.array(a), np.array(b), np.array(magnitudes), array_positions)
+        return self._weights_cache[1:]
+
+    def _beam_weights(self, phi_scan, theta_scan):
+        """Compute the weights of the ports for arrays of scan angles in radians.
+
+        The phase shifts between array elements in A and B directions are computed from the
+        wave vector (k), the lattice vectors (Ax, Ay, Bx, By) and the scan angles (theta, phi):
+        Phase Shift A = - (Ax*k*sin(theta)*cos(phi) + Ay*k*sin(theta)*sin(phi))
+        Phase Shift B = - (Bx*k*sin(theta)*cos(phi) + By*k*sin(theta)*sin(phi)).
+        """
+        a, b, magnitudes, _ = self._port_weights()
+        c = 299792458
+        k = (2 * math.pi * self.frequency) / c
         phase_shift_A_rad = -1 * (
-            (self.Ax * k * math.sin(theta_scan) * math.cos(phi_scan))
-            + (self.Ay * k * math.sin(theta_scan) * math.sin(phi_scan))
+            (self.Ax * k * np.sin(theta_scan) * np.cos(phi_scan))
+            + (self.Ay * k * np.sin(theta_scan) * np.sin(phi_scan))
         )
         phase_shift_B_rad = -1 * (
-            (self.Bx * k * math.sin(theta_scan) * math.cos(phi_scan))
-            + (self.By * k * math.sin(theta_scan) * math.sin(phi_scan))
+            (self.Bx * k * np.sin(theta_scan) * np.cos(phi_scan))
+            + (self.By * k * np.sin(theta_scan) * np.sin(phi_scan))
         )
-
-        w_dict = {}
-        w_dict_ang = {}
-        w_dict_mag = {}
-        array_positions = {}
-        port_cont = 0
-        for port_name in self.all_port_names:
-            index_str = self.get_array_index(port_name)
-            a = index_str[0] - 1
-            b = index_str[1] - 1
-            w_mag = np.round(np.abs(self.assign_weight(a, b, taper=self.taper)), 3)
-            w_ang = self.phase_offset[port_cont] + (a * phase_shift_A_rad + b * phase_shift_B_rad)
-            w_dict[port_name] = np.sqrt(w_mag) * np.exp(1j * w_ang)
-            w_dict_ang[port_name] = w_ang
-            w_dict_mag[port_name] = w_mag
-            array_positions[port_name] = self.element_location(a, b)
-            port_cont += 1
-
-        length_of_ff_data = len(self.data_dict[self.all_port_names[0]]["rETheta"])
-
-        rEtheta_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        rEphi_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        w = np.zeros((1, num_ports), dtype=complex)
-        # create port mapping
-        for n, port in enumerate(self.all_port_names):
-            re_theta = self.data_dict[port]["rETheta"]  # this is re_theta index of loaded data
-            re_phi = self.data_dict[port]["rEPhi"]  # this is re_ohi index of loaded data
-
-            w[0][n] = w_dict[port]  # build 1xNumPorts array of weights
-
-            rEtheta_fields[n] = re_theta
-            rEphi_fields[n] = re_phi
-
-            theta_range = self.data_dict[port]["Theta"]
-            phi_range = self.data_dict[port]["Phi"]
-            Ntheta = len(theta_range)
-            Nphi = len(phi_range)
-
-        rEtheta_fields_sum = np.dot(w, rEtheta_fields)
-        rEtheta_fields_sum = np.reshape(rEtheta_fields_sum, (Ntheta, Nphi))
-
-        rEphi_fields_sum = np.dot(w, rEphi_fields)
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (Ntheta, Nphi))
-
-        self.all_qtys = {}
-        self.all_qtys["rEPhi"] = rEphi_fields_sum
-        self.all_qtys["rETheta"] = rEtheta_fields_sum
-        self.all_qtys["rETotal"] = np.sqrt(
-            np.power(np.abs(rEphi_fields_sum), 2) + np.power(np.abs(rEtheta_fields_sum), 2)
+        angles = (
+            np.array(self.phase_offset, dtype=float)[None, :]
+            + a[None, :] * phase_shift_A_rad[:, None]
+            + b[None, :] * phase_shift_B_rad[:, None]
         )
-        self.all_qtys["Theta"] = theta_range
-        self.all_qtys["Phi"] = phi_range
-        self.all_qtys["nPhi"] = Nphi
-        self.all_qtys["nTheta"] = Ntheta
-        pin = np.sum(np.power(np.abs(w), 2))
-        self.all_qtys["Pincident"] = pin
-        self._app.logger.info("Incident Power: %s", pin)
-        real_gain = 2 * np.pi * np.abs(np.power(self.all_qtys["rETotal"], 2)) / pin / 377
-        self.all_qtys["RealizedGain"] = real_gain
-        self.all_qtys["RealizedGain_dB"] = 10 * np.log10(real_gain)
-        self.max_gain = np.max(10 * np.log10(real_gain))
-        self.min_gain = np.min(10 * np.log10(real_gain))
-        self._app.logger.info("Peak Realized Gain: %s dB", self.max_gain)
-        self.all_qtys["Element_Location"] = array_positions
-
-        return self.all_qtys
+        return np.sqrt(magnitudes)[None, :] * np.exp(1j * angles)
+
+    def _beam_quantities(self, weights):
+        # far field quantities of each row of weights
+        theta_range = self.data_dict[self.all_port_names[0]]["Theta"]
+        phi_range = self.data_dict[self.all_port_names[0]]["Phi"]
+        Ntheta = len(theta_range)
+        Nphi = len(phi_range)
+        fields = np.dot(weights, self._fields)
+        rEtheta_fields_sum = fields[:, : self.num_samples].reshape((-1, Ntheta, Nphi))
+        rEphi_fields_sum = fields[:, self.num_samples :].reshape((-1, Ntheta, Nphi))
+        rETotal = np.sqrt(np.power(np.abs(rEphi_fields_sum), 2) + np.power(np.abs(rEtheta_fields_sum), 2))
+        pin = np.sum(np.power(np.abs(weights), 2), axis=1)
+        real_gain = 2 * np.pi * np.abs(np.power(rETotal, 2)) / pin[:, None, None] / 377
+        with np.errstate(divide="ignore"):
+            real_gain_db = 10 * np.log10(real_gain)
+        array_positions = self._port_weights()[3]
+        results = []
+        for i in range(weights.shape[0]):
+            all_qtys = {}
+            all_qtys["rEPhi"] = rEphi_fields_sum[i]
+            all_qtys["rETheta"] = rEtheta_fields_sum[i]
+            all_qtys["rETotal"] = rETotal[i]
+            all_qtys["Theta"] = theta_range
+            all_qtys["Phi"] = phi_range
+            all_qtys["nPhi"] = Nphi
+            all_qtys["nTheta"] = Ntheta
+            all_qtys["Pincident"] = pin[i]
+            all_qtys["RealizedGain"] = real_gain[i]
+            all_qtys["RealizedGain_dB"] = real_gain_db[i]
+            all_qtys["Element_Location"] = array_positions
+            # the results are cached and shared by the callers
+            for name in ["rEPhi", "rETheta", "rETotal", "RealizedGain", "RealizedGain_dB"]:
+                all_qtys[name].setflags(write=False)
+            results.append(all_qtys)
+        return results
 
     @pyaedt_function_handler()
     def beamform_2beams(self, phi_scan1=0, theta_scan1=0, phi_scan2=0, theta_scan2=0):
@@ -1555,7 +2339,6 @@ class FfdSolutionData(object):
         dict
             Updated quantities dictionary.
         """
-        num_ports = len(self.all_port_names)
         self.array_center_and_edge()
 
         c = 299792458
@@ -1613,30 +2396,15 @@ class FfdSolutionData(object):
 
             array_positions[port_name] = self.element_location(a, b)
 
-        length_of_ff_data = len(self.data_dict[self.all_port_names[0]]["rETheta"])
-        rEtheta_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        rEphi_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        w = np.zeros((1, num_ports), dtype=complex)
-        # create port mapping
-        for n, port in enumerate(self.all_port_names):
-            re_theta = self.data_dict[port]["rETheta"]  # this is re_theta index of loaded data
-            re_phi = self.data_dict[port]["rEPhi"]  # this is re_ohi index of loaded data
-
-            w[0][n] = w_dict[port]  # build 1xNumPorts array of weights
-
-            rEtheta_fields[n] = re_theta
-            rEphi_fields[n] = re_phi
-
-            theta_range = self.data_dict[port]["Theta"]
-            phi_range = self.data_dict[port]["Phi"]
-            Ntheta = len(theta_range)
-            Nphi = len(phi_range)
-
-        rEtheta_fields_sum = np.dot(w, rEtheta_fields)
-        rEtheta_fields_sum = np.reshape(rEtheta_fields_sum, (Ntheta, Nphi))
+        w = np.array([[w_dict[port] for port in self.all_port_names]])  # build 1xNumPorts array of weights
+        theta_range = self.data_dict[self.all_port_names[0]]["Theta"]
+        phi_range = self.data_dict[self.all_port_names[0]]["Phi"]
+        Ntheta = len(theta_range)
+        Nphi = len(phi_range)
 
-        rEphi_fields_sum = np.dot(w, rEphi_fields)
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (Ntheta, Nphi))
+        fields_sum = np.dot(w, self._fields)
+        rEtheta_fields_sum = np.reshape(fields_sum[:, : self.num_samples], (Ntheta, Nphi))
+        rEphi_fields_sum = np.reshape(fields_sum[:, self.num_samples :], (Ntheta, Nphi))
 
         self.all_qtys = {}
         self.all_qtys["rEPhi"] = rEphi_fields_sum
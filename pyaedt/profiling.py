@@ -0,0 +1,318 @@
+"""
+Profiling of PyAEDT methods.
+
+When ``settings.enable_profiling`` is ``True``, every call of a method decorated with
+``pyaedt_function_handler`` is recorded with its wall time and the number of AEDT API calls
+(COM or gRPC round trips) that it makes.
+
+Examples
+--------
+>>> from pyaedt import Hfss
+>>> from pyaedt import profiling
+>>> from pyaedt import settings
+>>> settings.enable_profiling = True
+>>> hfss = Hfss()
+>>> hfss.modeler.create_box([0, 0, 0], [1, 2, 3])
+>>> print(profiling.report())
+>>> profiling.export_csv("C:/temp/profile.csv")
+>>> profiling.export_flame_graph("C:/temp/profile.folded")
+"""
+import csv
+import threading
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+_lock = threading.Lock()
+_local = threading.local()
+
+# Statistics of each method: calls, cumulative time, self time, self AEDT calls, and cumulative AEDT calls.
+_stats = {}
+# Self time of each call stack, for flame graphs.
+_stacks = {}
+# AEDT calls made outside the profiled methods.
+_untracked_round_trips = [0]
+_names = {}
+
+columns = ["name", "calls", "cumulative_time", "self_time", "self_aedt_calls", "cumulative_aedt_calls"]
+_primitive_types = (str, bytes, int, float, bool, type(None), complex)
+
+
+def _get_name(function):
+    name = _names.get(function)
+    if name is None:
+        name = "{}.{}".format(function.__module__, getattr(function, "__qualname__", function.__name__))
+        _names[function] = name
+    return name
+
+
+def _enter(function):
+    """Start recording a call.
+
+    The frame holds the name of the method, the time of the child calls, the AEDT calls of the method,
+    the AEDT calls of the child calls, and the start time.
+    """
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    frame = [_get_name(function), 0.0, 0, 0, _timer()]
+    stack.append(frame)
+    return frame
+
+
+def _exit(frame):
+    """Stop recording a call."""
+    elapsed = _timer() - frame[4]
+    stack = _local.stack
+    stack.pop()
+    name = frame[0]
+    round_trips = frame[2] + frame[3]
+    if stack:
+        parent = stack[-1]
+        parent[1] += elapsed
+        parent[3] += round_trips
+    # Recursive calls are counted once in the cumulative values.
+    recursive = any(f[0] == name for f in stack)
+    path = tuple(f[0] for f in stack) + (name,)
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = [0, 0.0, 0.0, 0, 0]
+        stats[0] += 1
+        stats[2] += elapsed - frame[1]
+        stats[3] += frame[2]
+        if not recursive:
+            stats[1] += elapsed
+            stats[4] += round_trips
+        _stacks[path] = _stacks.get(path, 0.0) + elapsed - frame[1]
+
+
+def _count_round_trip():
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1][2] += 1
+    else:
+        _untracked_round_trips[0] += 1
+
+
+def reset():
+    """Delete the recorded statistics."""
+    with _lock:
+        _stats.clear()
+        _stacks.clear()
+        _untracked_round_trips[0] = 0
+
+
+def get_stats(sort_by="cumulative_time"):
+    """Get the statistics of the profiled methods.
+
+    Parameters
+    ----------
+    sort_by : str, optional
+        Column used to sort the methods in descending order. Options are the names in
+        ``pyaedt.profiling.columns``. The default is ``"cumulative_time"``.
+
+    Returns
+    -------
+    list of list
+        One row for each method with the values of the ``pyaedt.profiling.columns`` columns.
+        Times are in seconds.
+    """
+    with _lock:
+        rows = [[name] + list(stats) for name, stats in _stats.items()]
+    index = columns.index(sort_by)
+    return sorted(rows, key=lambda row: row[index], reverse=index > 0)
+
+
+def report(sort_by="cumulative_time", max_rows=30):
+    """Get a text report of the profiled methods.
+
+    Parameters
+    ----------
+    sort_by : str, optional
+        Column used to sort the methods in descending order. Options are the names in
+        ``pyaedt.profiling.columns``. The default is ``"cumulative_time"``.
+    max_rows : int, optional
+        Maximum number of methods in the report. The default is ``30``.
+
+    Returns
+    -------
+    str
+    """
+    rows = get_stats(sort_by)
+    lines = [
+        "{:>10} {:>12} {:>12} {:>12} {:>12}  {}".format(
+            "calls", "cumul [s]", "self [s]", "self AEDT", "cumul AEDT", "method"
+        )
+    ]
+    for name, calls, cumulative_time, self_time, self_round_trips, round_trips in rows[:max_rows]:
+        lines.append(
+            "{:>10} {:>12.4f} {:>12.4f} {:>12} {:>12}  {}".format(
+                calls, cumulative_time, self_time, self_round_trips, round_trips, name
+            )
+        )
+    if len(rows) > max_rows:
+        lines.append("... {} more methods.".format(len(rows) - max_rows))
+    if _untracked_round_trips[0]:
+        lines.append("{} AEDT calls made outside the profiled methods.".format(_untracked_round_trips[0]))
+    return "\n".join(lines)
+
+
+def export_csv(filename, sort_by="cumulative_time"):
+    """Export the statistics of the profiled methods to a CSV file.
+
+    Parameters
+    ----------
+    filename : str
+        Full path to the CSV file.
+    sort_by : str, optional
+        Column used to sort the methods in descending order. The default is ``"cumulative_time"``.
+
+    Returns
+    -------
+    str
+        Full path to the CSV file.
+    """
+    with open(filename, "w") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(get_stats(sort_by))
+    return filename
+
+
+def export_flame_graph(filename):
+    """Export the self time of the profiled call stacks in the folded stack format.
+
+    The file can be opened with ``flamegraph.pl``, `speedscope <https://www.speedscope.app>`_,
+    or other flame graph viewers. Every line has the methods of a call stack, separated by
+    ``;``, and the self time in microseconds.
+
+    Parameters
+    ----------
+    filename : str
+        Full path to the file.
+
+    Returns
+    -------
+    str
+        Full path to the file.
+    """
+    with _lock:
+        stacks = sorted(_stacks.items())
+    with open(filename, "w") as f:
+        for path, self_time in stacks:
+            f.write("{} {}\n".format(";".join(path), int(round(self_time * 1e6))))
+    return filename
+
+
+def _unwrap(value):
+    if isinstance(value, AedtObjectProxy):
+        return object.__getattribute__(value, "_pyaedt_object")
+    elif isinstance(value, list):
+        return [_unwrap(i) for i in value]
+    elif isinstance(value, tuple):
+        return tuple(_unwrap(i) for i in value)
+    return value
+
+
+def _wrap(value):
+    if isinstance(value, _primitive_types) or isinstance(value, AedtObjectProxy):
+        return value
+    elif isinstance(value, (list, tuple)):
+        if all(isinstance(i, _primitive_types) for i in value):
+            return value
+        return type(value)(_wrap(i) for i in value)
+    elif isinstance(value, dict):
+        return value
+    return AedtObjectProxy(value)
+
+
+class AedtObjectProxy(object):
+    """Proxy of an AEDT API object counting the calls of its methods.
+
+    Objects returned by the methods are wrapped in proxies, so that wrapping ``oDesktop``
+    counts all AEDT API calls of a session. Iteration, length, indexing, membership tests,
+    comparisons, and the ``str`` and ``repr`` representations are forwarded to the AEDT
+    object without being counted.
+
+    Parameters
+    ----------
+    aedt_object : object
+        AEDT API object, like ``oDesktop``, ``oProject``, ``oDesign``, or ``oEditor``.
+    """
+
+    def __init__(self, aedt_object):
+        object.__setattr__(self, "_pyaedt_object", aedt_object)
+
+    def __getattr__(self, name):
+        value = getattr(object.__getattribute__(self, "_pyaedt_object"), name)
+        if not callable(value):
+            return _wrap(value)
+
+        def method(*args, **kwargs):
+            _count_round_trip()
+            if args:
+                args = _unwrap(args)
+            if kwargs:
+                kwargs = dict((key, _unwrap(item)) for key, item in kwargs.items())
+            return _wrap(value(*args, **kwargs))
+
+        return method
+
+    def __setattr__(self, name, value):
+        setattr(object.__getattribute__(self, "_pyaedt_object"), name, _unwrap(value))
+
+    # Special methods are looked up on the type and bypass ``__getattr__``, so the ones of
+    # collections and arrays returned by AEDT are forwarded explicitly.
+    def __iter__(self):
+        for item in object.__getattribute__(self, "_pyaedt_object"):
+            yield _wrap(item)
+
+    def __len__(self):
+        return len(object.__getattribute__(self, "_pyaedt_object"))
+
+    def __getitem__(self, key):
+        return _wrap(object.__getattribute__(self, "_pyaedt_object")[_unwrap(key)])
+
+    def __setitem__(self, key, value):
+        object.__getattribute__(self, "_pyaedt_object")[_unwrap(key)] = _unwrap(value)
+
+    def __contains__(self, item):
+        return _unwrap(item) in object.__getattribute__(self, "_pyaedt_object")
+
+    def __str__(self):
+        return str(object.__getattribute__(self, "_pyaedt_object"))
+
+    def __repr__(self):
+        return repr(object.__getattribute__(self, "_pyaedt_object"))
+
+    def __dir__(self):
+        return dir(object.__getattribute__(self, "_pyaedt_object"))
+
+    def __eq__(self, other):
+        return object.__getattribute__(self, "_pyaedt_object") == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(object.__getattribute__(self, "_pyaedt_object"))
+
+    def __bool__(self):
+        return bool(object.__getattribute__(self, "_pyaedt_object"))
+
+    __nonzero__ = __bool__
+
+
+def wrap_aedt_object(aedt_object):
+    """Wrap an AEDT API object so that its calls are counted by the profiler.
+
+    Parameters
+    ----------
+    aedt_object : object
+        AEDT API object, like ``oDesktop``.
+
+    Returns
+    -------
+    :class:`pyaedt.profiling.AedtObjectProxy`
+    """
+    return _wrap(aedt_object)
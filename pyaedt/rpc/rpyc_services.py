@@ -2,12 +2,14 @@ import socket
 import os
 import random
 import tempfile
-import shutil
 import site
 import logging
 import signal
 import sys
 import time
+import threading
+import hashlib
+import zlib
 
 from pyaedt import generate_unique_name
 from pyaedt.generic.general_methods import env_path
@@ -20,6 +22,8 @@ else:
     import subprocess
 
 if not is_ironpython:
+    from concurrent.futures import ThreadPoolExecutor
+
     import rpyc
     from rpyc import ThreadedServer
 
@@ -39,11 +43,189 @@ from pyaedt import Mechanical
 from pyaedt.misc import list_installed_ansysem
 
 
+# Size of the chunks read and written by the file transfers.
+FILE_TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+# Number of parallel connections used by the file transfers.
+FILE_TRANSFER_STREAMS = 4
+
+
+def _compress(data, compression):
+    if compression == "zlib":
+        return zlib.compress(data, 1)
+    elif compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    return data
+
+
+def _decompress(data, compression):
+    if compression == "zlib":
+        return zlib.decompress(data)
+    elif compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    return data
+
+
+def _combine_checksums(checksums):
+    return hashlib.sha256("".join(checksums).encode("ascii")).hexdigest()
+
+
+class FileTransferEndpoint(object):
+    """File operations used by :class:`FileManagement` to transfer files in chunks.
+
+    The same operations run on the client and, through the ``transfer_*`` methods of
+    :class:`GlobalService`, on the server. Arguments and return values are tuples, strings,
+    and bytes so that RPyC sends them by value instead of by reference.
+    The checksum of a file is the SHA-256 hash of the SHA-256 hashes of its chunks.
+    """
+
+    @staticmethod
+    def transfer_walk(path):
+        """Get the subdirectories and the files of a directory.
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory.
+
+        Returns
+        -------
+        tuple
+            Tuple of the relative paths of the subdirectories and tuple of ``(relative_path, size)``
+            tuples of the files. Paths use ``"/"`` as the separator.
+        """
+        dirs = []
+        files = []
+        for root, dirnames, filenames in os.walk(path):
+            relative_root = os.path.relpath(root, path).replace("\\", "/")
+            prefix = "" if relative_root == "." else relative_root + "/"
+            dirs.extend(prefix + dirname for dirname in dirnames)
+            for filename in filenames:
+                files.append((prefix + filename, os.path.getsize(os.path.join(root, filename))))
+        return tuple(dirs), tuple(files)
+
+    @staticmethod
+    def transfer_sizes(paths):
+        """Get the sizes of files. The size of a missing file is ``-1``."""
+        return tuple(os.path.getsize(path) if os.path.isfile(path) else -1 for path in paths)
+
+    @staticmethod
+    def transfer_chunk_checksums(path, chunk_size):
+        """Get the checksums of the chunks of a file."""
+        checksums = []
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                checksums.append(hashlib.sha256(data).hexdigest())
+        return tuple(checksums)
+
+    @staticmethod
+    def transfer_checksums(paths, chunk_size):
+        """Get the checksums of files. The checksum of a missing file is ``None``."""
+        return tuple(
+            _combine_checksums(FileTransferEndpoint.transfer_chunk_checksums(path, chunk_size))
+            if os.path.isfile(path)
+            else None
+            for path in paths
+        )
+
+    @staticmethod
+    def transfer_read(path, offset, size, compression=None):
+        """Read a chunk of a file.
+
+        Returns
+        -------
+        tuple
+            Checksum of the chunk, compression of the data, and data. The data is not compressed
+            when compression does not reduce its size.
+        """
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        checksum = hashlib.sha256(data).hexdigest()
+        if compression:
+            compressed = _compress(data, compression)
+            if len(compressed) < len(data):
+                return checksum, compression, compressed
+        return checksum, None, data
+
+    @staticmethod
+    def transfer_write(path, offset, data, compression=None):
+        """Write a chunk of a file created with ``transfer_allocate()`` and return its checksum."""
+        data = _decompress(data, compression)
+        with open(path, "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def transfer_write_file(path, data, compression=None):
+        """Write a whole file and return its checksum. The file is replaced only when the data is written."""
+        data = _decompress(data, compression)
+        temp_file = path + ".part"
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        FileTransferEndpoint.transfer_finalize(temp_file, path)
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def transfer_allocate(path, size):
+        """Create a file of a given size."""
+        with open(path, "wb") as f:
+            f.truncate(size)
+        return True
+
+    @staticmethod
+    def transfer_finalize(temp_file, path):
+        """Rename a transferred file to its final name."""
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_file, path)
+        return True
+
+    @staticmethod
+    def transfer_makedirs(paths):
+        """Create directories."""
+        for path in paths:
+            if not os.path.isdir(path):
+                os.makedirs(path)
+        return True
+
+
 class FileManagement(object):
-    """Class to manage file transfer."""
+    """Class to manage file transfer.
+
+    Files are transferred in chunks of ``chunk_size`` bytes over ``streams`` parallel connections
+    to the server. The checksum of every chunk is verified. Large files are written to a ``.part``
+    file first, so that an interrupted transfer resumes from the chunks already transferred.
+    Existing files with the same size and checksum as the source file are not transferred again.
 
-    def __init__(self, client):
+    Parameters
+    ----------
+    client : rpyc.core.protocol.Connection
+        Connection to the server.
+    chunk_size : int, optional
+        Size of the chunks in bytes. The default is ``FILE_TRANSFER_CHUNK_SIZE``.
+    streams : int, optional
+        Number of parallel connections. The default is ``FILE_TRANSFER_STREAMS``.
+    compression : str, optional
+        Compression of the chunks, either ``"zlib"`` or ``"lz4"``. The ``lz4`` package must be
+        installed on both machines. The default is ``None``, which is the fastest on local networks.
+    """
+
+    def __init__(self, client, chunk_size=FILE_TRANSFER_CHUNK_SIZE, streams=FILE_TRANSFER_STREAMS, compression=None):
         self.client = client
+        self.chunk_size = chunk_size
+        self.streams = streams
+        self.compression = compression
+        self.resume = True
+        self.skip_identical = True
+        self._local = FileTransferEndpoint()
 
     def upload(self, localpath, remotepath, overwrite=False):
         """Upload a file or a directory to the given remote path.
@@ -56,11 +238,17 @@ class FileManagement(object):
             Remote path.
         overwrite : bool, optional
             Either if overwrite the local file or not.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
         """
         if os.path.isdir(localpath):
-            self._upload_dir(localpath, remotepath)
+            return self._upload_dir(localpath, remotepath, overwrite=overwrite)
         elif os.path.isfile(localpath):
-            self._upload_file(localpath, remotepath)
+            return self._upload_file(localpath, remotepath, overwrite=overwrite)
+        return False
 
     def download_folder(self, remotepath, localpath, overwrite=True):
         """Download a directory from a given remote path to the local path.
@@ -73,8 +261,13 @@ class FileManagement(object):
             Path to the local file or directory.
         overwrite : bool, optional
             Either if overwrite the local file or not.
-            """
-        self._download_dir(remotepath, localpath, overwrite=True)
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        return self._download_dir(remotepath, localpath, overwrite=overwrite)
 
     def download_file(self, remotepath, localpath, overwrite=True):
         """Download a file from a given remote path to the local path.
@@ -87,64 +280,175 @@ class FileManagement(object):
             Path to the local file or directory.
         overwrite : bool, optional
             Either if overwrite the local file or not.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
         """
-        self._download_file(remotepath, localpath, overwrite=overwrite)
+        return self._download_file(remotepath, localpath, overwrite=overwrite)
 
     def _upload_file(self, local_file, remote_file, overwrite=False):
-        if self.client.root.pathexists(remote_file):
-            if overwrite:
-                logger.warning("File already exists on server. Overwriting it.")
-            else:
-                logger.error("File already exists on the server. Skipping it")
-                return False
-        new_file = self.client.root.create(remote_file)
-        local = open(local_file, "rb")
-        shutil.copyfileobj(local, new_file)
-        new_file.close()
-        logger.info("File %s uploaded to %s", local_file, remote_file)
+        source_size = os.path.getsize(local_file)
+        if self._transfer([(local_file, remote_file, source_size)], True, overwrite):
+            logger.info("File %s uploaded to %s", local_file, remote_file)
+            return True
+        return False
 
     def _upload_dir(self, localpath, remotepath, overwrite=False):
         if self.client.root.pathexists(remotepath):
             logger.warning("Folder already exists on the server.")
-        self.client.root.makedirs(remotepath)
-        i = 0
-        for fn in os.listdir(localpath):
-            lfn = os.path.join(localpath, fn)
-            rfn = remotepath + "/" + fn
-            if os.path.isdir(rfn):
-                self._upload_dir(lfn, rfn, overwrite=overwrite)
-            else:
-                self._upload_file(lfn, rfn, overwrite=overwrite)
-            i += 1
-        logger.info("Directory %s uploaded. %s files copied", localpath, i)
+        dirs, files = self._local.transfer_walk(localpath)
+        self.client.root.transfer_makedirs(tuple([remotepath] + [remotepath + "/" + i for i in dirs]))
+        items = [(os.path.join(localpath, *name.split("/")), remotepath + "/" + name, size) for name, size in files]
+        if self._transfer(items, True, overwrite):
+            logger.info("Directory %s uploaded. %s files copied", localpath, len(items))
+            return True
+        return False
 
     def _download_file(self, remote_file, local_file, overwrite=True):
-        if self.client.root.pathexists(local_file):
-            if overwrite:
-                logger.warning("File already exists on the client. Overwriting it.")
-            else:
-                logger.warning("File already exists on the client, skipping it.")
-                return
-        remote = self.client.root.open(remote_file)
-        new_file = open(local_file, "wb")
-        shutil.copyfileobj(remote, new_file)
-        logger.info("File %s downloaded to %s", remote_file, local_file)
+        source_size = self.client.root.transfer_sizes((remote_file,))[0]
+        if source_size < 0:
+            logger.error("File %s does not exist on the server.", remote_file)
+            return False
+        if self._transfer([(remote_file, local_file, source_size)], False, overwrite):
+            logger.info("File %s downloaded to %s", remote_file, local_file)
+            return True
+        return False
 
     def _download_dir(self, remotepath, localpath, overwrite=True):
         if os.path.exists(localpath):
             logger.warning("Folder already exists on the local machine.")
-        if not os.path.isdir(localpath):
-            os.makedirs(localpath)
-        i = 0
-        for fn in self.client.root.listdir(remotepath):
-            lfn = os.path.join(localpath, fn)
-            rfn = remotepath + "/" + fn
-            if self.client.root.isdir(rfn):
-                self._download_dir(rfn, lfn, overwrite=overwrite)
+        dirs, files = self.client.root.transfer_walk(remotepath)
+        self._local.transfer_makedirs([localpath] + [os.path.join(localpath, *i.split("/")) for i in dirs])
+        items = [(remotepath + "/" + name, os.path.join(localpath, *name.split("/")), size) for name, size in files]
+        if self._transfer(items, False, overwrite):
+            logger.info("Directory %s downloaded. %s files copied", localpath, len(items))
+            return True
+        return False
+
+    def _connect_stream(self):
+        """Open another connection to the server, or return ``None`` if it is not possible."""
+        try:
+            host, port = self.client._channel.stream.sock.getpeername()[:2]
+            return rpyc.connect(host, port, config={"allow_public_attrs": True, "sync_request_timeout": None})
+        except Exception:
+            return None
+
+    def _transfer(self, items, upload, overwrite):
+        """Transfer files.
+
+        Parameters
+        ----------
+        items : list
+            List of ``(source_path, destination_path, source_size)`` tuples.
+        upload : bool
+            Whether the files are uploaded to the server or downloaded from it.
+        overwrite : bool
+            Whether to overwrite the destination files that differ from the source files.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        remote = self.client.root
+        source, destination = (self._local, remote) if upload else (remote, self._local)
+        chunk_size = self.chunk_size
+        targets = tuple(i[1] for i in items)
+        sizes = destination.transfer_sizes(targets + tuple(i + ".part" for i in targets))
+        existing = [i for i, item in enumerate(items) if sizes[i] >= 0]
+        skipped = set()
+        if existing and self.skip_identical:
+            same_size = [i for i in existing if sizes[i] == items[i][2]]
+            if same_size:
+                source_checksums = source.transfer_checksums(tuple(items[i][0] for i in same_size), chunk_size)
+                target_checksums = destination.transfer_checksums(tuple(items[i][1] for i in same_size), chunk_size)
+                for i, source_checksum, target_checksum in zip(same_size, source_checksums, target_checksums):
+                    if source_checksum == target_checksum:
+                        logger.debug("File %s is identical to %s. Skipping it.", items[i][0], items[i][1])
+                        skipped.add(i)
+        result = True
+        for i in existing:
+            if i not in skipped and not overwrite:
+                logger.error("File %s already exists. Skipping it.", items[i][1])
+                skipped.add(i)
+                result = False
+
+        # Small files are transferred in one task. Large files are transferred in chunks to a .part file.
+        tasks = []
+        chunked_files = {}
+        for i, (source_file, target_file, size) in enumerate(items):
+            if i in skipped:
+                continue
+            if size <= chunk_size:
+                tasks.append((i, None, 0, size))
+                continue
+            temp_file = target_file + ".part"
+            chunks = list(range(0, size, chunk_size))
+            if self.resume and sizes[len(items) + i] == size:
+                source_checksums = source.transfer_chunk_checksums(source_file, chunk_size)
+                target_checksums = destination.transfer_chunk_checksums(temp_file, chunk_size)
+                chunks = [c for c, a, b in zip(chunks, source_checksums, target_checksums) if a != b]
+                logger.info("Resuming transfer of %s. %s chunks left.", source_file, len(chunks))
+            else:
+                destination.transfer_allocate(temp_file, size)
+            if chunks:
+                chunked_files[i] = len(chunks)
+                tasks.extend((i, temp_file, offset, min(chunk_size, size - offset)) for offset in chunks)
+            else:
+                destination.transfer_finalize(temp_file, target_file)
+
+        compression = self.compression
+        lock = threading.Lock()
+        local_data = threading.local()
+        connections = []
+
+        def get_remote():
+            if not hasattr(local_data, "root"):
+                connection = self._connect_stream()
+                if connection is None:
+                    local_data.root = remote
+                else:
+                    with lock:
+                        connections.append(connection)
+                    local_data.root = connection.root
+            return local_data.root
+
+        def run_task(task):
+            i, temp_file, offset, size = task
+            source_file, target_file = items[i][:2]
+            task_source, task_destination = (self._local, get_remote()) if upload else (get_remote(), self._local)
+            checksum, data_compression, data = task_source.transfer_read(source_file, offset, size, compression)
+            if temp_file is None:
+                written = task_destination.transfer_write_file(target_file, data, data_compression)
+            else:
+                written = task_destination.transfer_write(temp_file, offset, data, data_compression)
+            if written != checksum:
+                raise IOError("Checksum of {} does not match at offset {}.".format(target_file, offset))
+            if temp_file is not None:
+                with lock:
+                    chunked_files[i] -= 1
+                    finished = chunked_files[i] == 0
+                if finished:
+                    task_destination.transfer_finalize(temp_file, target_file)
+
+        try:
+            if self.streams > 1 and len(tasks) > 1:
+                with ThreadPoolExecutor(min(self.streams, len(tasks))) as executor:
+                    for _ in executor.map(run_task, tasks):
+                        pass
             else:
-                self._download_file(rfn, lfn, overwrite=overwrite)
-            i += 1
-        logger.info("Directory %s downloaded. %s files copied", localpath, i)
+                local_data.root = remote
+                for task in tasks:
+                    run_task(task)
+        except Exception as e:
+            logger.error("File transfer failed: %s", e)
+            result = False
+        finally:
+            for connection in connections:
+                connection.close()
+        return result
 
     def open_file(self, remote_file, open_options="r"):
         return self.client.root.open(remote_file, open_options=open_options)
@@ -833,7 +1137,8 @@ class GlobalService(rpyc.Service):
     def on_disconnect(self, connection):
         # code that runs after the connection has already closed
         # (to finalize the service, if needed)
-        if os.name != "posix":
+        # Connections opened for parallel file transfers do not redirect the output.
+        if os.name != "posix" and getattr(self, "_redirected", False):
             sys.stdout = sys.__stdout__
 
     @staticmethod
@@ -842,6 +1147,7 @@ class GlobalService(rpyc.Service):
         os.kill(pid, signal.SIGTERM)
 
     def exposed_redirect(self, stdout):
+        self._redirected = True
         sys.stdout = stdout
 
     def exposed_restore(self):
@@ -1010,6 +1316,18 @@ class GlobalService(rpyc.Service):
     def normpath(remotepath):
         return os.path.normpath(remotepath)
 
+    # Chunked file transfers used by FileManagement.
+    exposed_transfer_walk = staticmethod(FileTransferEndpoint.transfer_walk)
+    exposed_transfer_sizes = staticmethod(FileTransferEndpoint.transfer_sizes)
+    exposed_transfer_chunk_checksums = staticmethod(FileTransferEndpoint.transfer_chunk_checksums)
+    exposed_transfer_checksums = staticmethod(FileTransferEndpoint.transfer_checksums)
+    exposed_transfer_read = staticmethod(FileTransferEndpoint.transfer_read)
+    exposed_transfer_write = staticmethod(FileTransferEndpoint.transfer_write)
+    exposed_transfer_write_file = staticmethod(FileTransferEndpoint.transfer_write_file)
+    exposed_transfer_allocate = staticmethod(FileTransferEndpoint.transfer_allocate)
+    exposed_transfer_finalize = staticmethod(FileTransferEndpoint.transfer_finalize)
+    exposed_transfer_makedirs = staticmethod(FileTransferEndpoint.transfer_makedirs)
+
 class ServiceManager(rpyc.Service):
     """Global class to manage rpyc Server of PyAEDT."""
 